@@ -3,3 +3,6 @@ from griptape.loaders import WebLoader
 WebLoader().load("https://www.griptape.ai")
 
 WebLoader().load_collection(["https://www.griptape.ai", "https://docs.griptape.ai"])
+
+for key, artifacts in WebLoader().stream_collection(["https://www.griptape.ai", "https://docs.griptape.ai"]):
+    print(key, artifacts)
@@ -0,0 +1,11 @@
+from griptape.drivers import CachedEmbeddingDriver, OpenAiEmbeddingDriver
+
+embedding_driver = CachedEmbeddingDriver(
+    embedding_driver=OpenAiEmbeddingDriver(),
+    persist_file="embeddings.db",
+)
+
+embeddings = embedding_driver.embed_strings(["Hello Griptape!", "Hello Griptape!"])
+
+print(embeddings[0][:3])
+print(embedding_driver.hits, embedding_driver.misses)
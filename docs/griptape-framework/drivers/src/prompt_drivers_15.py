@@ -0,0 +1,15 @@
+from griptape.structures import Workflow
+from griptape.tasks import PromptTask
+from griptape.utils import RateLimiter, RateLimiters
+
+# Every OpenAiChatPromptDriver that uses gpt-4o shares this Rate Limiter.
+rate_limiter = RateLimiters.set_rate_limiter(
+    "OpenAiChatPromptDriver",
+    RateLimiter(requests_per_minute=500, tokens_per_minute=30_000),
+    model="gpt-4o",
+)
+
+workflow = Workflow(tasks=[PromptTask(f"Write a haiku about the number {i}") for i in range(20)])
+workflow.run()
+
+print(rate_limiter.metrics)
@@ -0,0 +1,7 @@
+from griptape.drivers import MarkdownifyWebScraperDriver
+
+driver = MarkdownifyWebScraperDriver(max_pages=4, blocked_resource_types=["image", "font", "media", "stylesheet"])
+
+artifacts = driver.scrape_urls(["https://griptape.ai", "https://docs.griptape.ai"])
+
+driver.close()
@@ -0,0 +1,14 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from griptape.drivers import TrafilaturaWebScraperDriver
+from griptape.loaders import WebLoader
+
+if __name__ == "__main__":
+    with ProcessPoolExecutor() as executor:
+        loader = WebLoader(
+            web_scraper_driver=TrafilaturaWebScraperDriver(extraction_executor=executor, max_connections_per_host=4)
+        )
+
+        # Pages are yielded as soon as they're scraped.
+        for key, artifacts in loader.stream_collection(["https://www.griptape.ai", "https://docs.griptape.ai"]):
+            print(key, len(artifacts))
@@ -0,0 +1,22 @@
+from typing import cast
+
+from griptape.drivers import OpenAiChatPromptDriver
+from griptape.events import CompletionChunkEvent, EventBus, EventListener
+from griptape.structures import Agent
+
+event_listener = EventBus.add_event_listener(
+    EventListener(
+        lambda e: print(cast(CompletionChunkEvent, e).token, end="", flush=True),
+        event_types=[CompletionChunkEvent],
+        asynchronous=True,
+        max_queue_size=100,
+        overflow_policy="coalesce",
+    )
+)
+
+agent = Agent(prompt_driver=OpenAiChatPromptDriver(model="gpt-4o", stream=True))
+agent.run("Write me a poem.")
+
+# Wait for the worker thread to handle the queued Events.
+EventBus.drain()
+print(f"\nAverage latency: {event_listener.metrics.average_latency * 1000:.2f}ms")
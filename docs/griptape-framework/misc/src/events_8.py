@@ -0,0 +1,32 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import cast
+
+from griptape.drivers import OpenAiChatPromptDriver
+from griptape.events import CompletionChunkEvent, EventBus, EventListener
+from griptape.structures import Agent
+
+
+def run_agent(topic: str) -> str:
+    agent = Agent(prompt_driver=OpenAiChatPromptDriver(model="gpt-4o", stream=True))
+    tokens = []
+
+    # Only receives the Events of this Agent, even while the other Agents are running.
+    event_listener = EventBus.add_event_listener(
+        EventListener(
+            lambda e: tokens.append(cast(CompletionChunkEvent, e).token),
+            event_types=[CompletionChunkEvent],
+            structure_id=agent.id,
+        )
+    )
+
+    try:
+        agent.run(f"Write me a haiku about {topic}.")
+    finally:
+        EventBus.remove_event_listener(event_listener)
+
+    return "".join(tokens)
+
+
+with ThreadPoolExecutor() as executor:
+    for haiku in executor.map(run_agent, ["the sea", "the mountains", "the city"]):
+        print(haiku)
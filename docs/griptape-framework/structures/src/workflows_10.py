@@ -0,0 +1,19 @@
+import asyncio
+
+from griptape.structures import Workflow
+from griptape.tasks import PromptTask
+
+workflow = Workflow()
+
+animal_task = PromptTask("Name an animal", id="animal")
+for index in range(5):
+    animal_task.add_child(PromptTask(f"Write fact #{index + 1} about {{{{ parent_outputs['animal'] }}}}"))
+workflow.add_tasks(animal_task, *animal_task.children)
+
+
+async def main() -> None:
+    # Runs the five facts concurrently as asyncio tasks on a single event loop.
+    await workflow.arun()
+
+
+asyncio.run(main())
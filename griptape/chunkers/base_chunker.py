@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import bisect
 from abc import ABC
 from typing import Optional
 
@@ -37,17 +38,14 @@ class BaseChunker(ABC):
 
         return [TextArtifact(c) for c in self._chunk_recursively(text)]
 
-    def _chunk_recursively(self, chunk: str, current_separator: Optional[ChunkSeparator] = None) -> list[str]:
-        token_count = self.tokenizer.count_tokens(chunk)
+    def _chunk_recursively(
+        self, chunk: str, current_separator: Optional[ChunkSeparator] = None, *, token_count: Optional[int] = None
+    ) -> list[str]:
+        token_count = self.tokenizer.count_tokens(chunk) if token_count is None else token_count
 
         if token_count <= self.max_tokens:
             return [chunk]
         else:
-            balance_index = -1
-            balance_diff = float("inf")
-            tokens_count = 0
-            half_token_count = token_count // 2
-
             # If a separator is provided, only use separators after it.
             separators = (
                 self.separators[self.separators.index(current_separator) :] if current_separator else self.separators
@@ -60,48 +58,99 @@ class BaseChunker(ABC):
 
                 # Check if the split resulted in more than one subchunk.
                 if len(subchunks) > 1:
-                    # Iterate through the subchunks and calculate token counts.
-                    for index, subchunk in enumerate(subchunks):
-                        if index < len(subchunks):
-                            subchunk = separator.value + subchunk if separator.is_prefix else subchunk + separator.value
-
-                        tokens_count += self.tokenizer.count_tokens(subchunk)
-
-                        # Update the best split if the current one is more balanced.
-                        if abs(tokens_count - half_token_count) < balance_diff:
-                            balance_index = index
-                            balance_diff = abs(tokens_count - half_token_count)
-
-                    # Create the two subchunks based on the best separator.
-                    first_subchunk, second_subchunk = self.__get_subchunks(separator, subchunks, balance_index)
-
-                    # Continue recursively chunking the subchunks.
-                    first_subchunk_rec = self._chunk_recursively(first_subchunk.strip(), separator)
-                    second_subchunk_rec = self._chunk_recursively(second_subchunk.strip(), separator)
-
-                    # Return the concatenated results of the subchunks if both are non-empty.
-                    if first_subchunk_rec and second_subchunk_rec:
-                        return first_subchunk_rec + second_subchunk_rec
-                    # If only one subchunk is non-empty, return it.
-                    elif first_subchunk_rec:
-                        return first_subchunk_rec
-                    elif second_subchunk_rec:
-                        return second_subchunk_rec
-                    else:
-                        return []
+                    # Count the tokens of every subchunk once. Every later split of this chunk is balanced with
+                    # prefix sums of these counts instead of tokenizing the same text again.
+                    prefix_sums = [0]
+                    token_counts = self.tokenizer.count_tokens_many(
+                        [
+                            separator.value + subchunk if separator.is_prefix else subchunk + separator.value
+                            for subchunk in subchunks
+                        ]
+                    )
+
+                    for subchunk_token_count in token_counts:
+                        prefix_sums.append(prefix_sums[-1] + subchunk_token_count)
+
+                    # Subchunks tokenized on their own don't add up to the tokens of the whole chunk, so scale the
+                    # prefix sums to estimate the token count of joined subchunks.
+                    token_ratio = token_count / prefix_sums[-1] if prefix_sums[-1] else 1.0
+
+                    return self.__chunk_subchunks(
+                        separator, subchunks, prefix_sums, token_ratio, 0, len(subchunks), token_count
+                    )
             # If none of the separators result in a balanced split, split the chunk in half.
             midpoint = len(chunk) // 2
             return self._chunk_recursively(chunk[:midpoint]) + self._chunk_recursively(chunk[midpoint:])
 
-    def __get_subchunks(self, separator: ChunkSeparator, subchunks: list[str], balance_index: int) -> tuple[str, str]:
-        # Create the two subchunks based on the best separator.
-        if separator.is_prefix:
-            # If the separator is a prefix, append it before this subchunk.
-            first_subchunk = separator.value + separator.value.join(subchunks[: balance_index + 1])
-            second_subchunk = separator.value + separator.value.join(subchunks[balance_index + 1 :])
+    def __chunk_subchunks(
+        self,
+        separator: ChunkSeparator,
+        subchunks: list[str],
+        prefix_sums: list[int],
+        token_ratio: float,
+        start: int,
+        end: int,
+        token_count: Optional[int] = None,
+    ) -> list[str]:
+        """Chunks `subchunks[start:end]`, estimating token counts from the prefix sums of the subchunk token counts.
+
+        Args:
+            separator: Separator the subchunks were split on.
+            subchunks: Subchunks of the chunk being split.
+            prefix_sums: Running token counts of `subchunks`, starting with 0.
+            token_ratio: Ratio of the token count of the chunk to the sum of its subchunk token counts.
+            start: Index of the first subchunk to chunk.
+            end: Index after the last subchunk to chunk.
+            token_count: Exact token count of the joined subchunks, if already known.
+
+        Returns:
+            Chunks of the joined subchunks.
+        """
+        chunk = None
+
+        if token_count is None:
+            estimated_token_count = round((prefix_sums[end] - prefix_sums[start]) * token_ratio)
+
+            # Only tokenize the joined subchunks when the estimate is too close to call or the chunk would be emitted.
+            if end - start == 1 or estimated_token_count - self.max_tokens <= end - start:
+                chunk = self.__join_subchunks(separator, subchunks, start, end)
+                token_count = self.tokenizer.count_tokens(chunk)
+        else:
+            estimated_token_count = token_count
+
+        if token_count is not None and token_count <= self.max_tokens:
+            chunk = self.__join_subchunks(separator, subchunks, start, end) if chunk is None else chunk
+
+            return [chunk] if chunk else []
+        elif end - start == 1:
+            # A single subchunk is too big, so split it on the next separators.
+            chunk = self.__join_subchunks(separator, subchunks, start, end) if chunk is None else chunk
+
+            return self._chunk_recursively(chunk, separator, token_count=token_count)
         else:
-            # If the separator is not a prefix, append it after this subchunk.
-            first_subchunk = separator.value.join(subchunks[: balance_index + 1]) + separator.value
-            second_subchunk = separator.value.join(subchunks[balance_index + 1 :])
+            # Find the most balanced split, keeping at least one subchunk on each side.
+            half_token_count = prefix_sums[start] + (token_count or estimated_token_count) // 2
+            split_index = min(
+                max(bisect.bisect_left(prefix_sums, half_token_count, start + 1, end), start + 1), end - 1
+            )
+
+            if split_index > start + 1 and abs(prefix_sums[split_index - 1] - half_token_count) <= abs(
+                prefix_sums[split_index] - half_token_count
+            ):
+                split_index -= 1
+
+            return self.__chunk_subchunks(
+                separator, subchunks, prefix_sums, token_ratio, start, split_index
+            ) + self.__chunk_subchunks(separator, subchunks, prefix_sums, token_ratio, split_index, end)
 
-        return first_subchunk, second_subchunk
+    def __join_subchunks(self, separator: ChunkSeparator, subchunks: list[str], start: int, end: int) -> str:
+        joined = separator.value.join(subchunks[start:end])
+
+        if separator.is_prefix:
+            # If the separator is a prefix, add it before the subchunks.
+            return (separator.value + joined).strip()
+        elif end < len(subchunks):
+            # If the separator is not a prefix, add it after the subchunks unless they end the chunk.
+            return (joined + separator.value).strip()
+        else:
+            return joined.strip()
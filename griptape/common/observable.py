@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import copy
 import functools
-from inspect import isfunction
+from inspect import iscoroutinefunction, isfunction
 from typing import Any, Callable, Optional, TypeVar, cast
 
 from attrs import Factory, define, field
@@ -50,24 +51,35 @@ class Observable:
             self.decorator_kwargs = kwargs
 
     def __get__(self, obj: Any, objtype: Any = None) -> Observable:
-        self._instance = obj
-        return self
+        if obj is None:
+            return self
+
+        # Bind a copy rather than this descriptor, which is shared by every instance of the class, so that concurrent
+        # calls on different instances don't overwrite each other's instance.
+        bound = copy.copy(self)
+        bound._instance = obj
+
+        return bound
 
     def __call__(self, *args, **kwargs) -> Any:
         if self._func:
             # Parameterless call (self._func was a set in __init__)
             from griptape.observability.observability import Observability
 
-            return Observability.observe(
-                Observable.Call(
-                    func=self._func,
-                    instance=self._instance,
-                    args=args,
-                    kwargs=kwargs,
-                    decorator_args=self.decorator_args,
-                    decorator_kwargs=self.decorator_kwargs,
-                )
+            call = Observable.Call(
+                func=self._func,
+                instance=self._instance,
+                args=args,
+                kwargs=kwargs,
+                decorator_args=self.decorator_args,
+                decorator_kwargs=self.decorator_kwargs,
             )
+
+            # Coroutine functions are observed until their coroutine finishes, rather than until it's created.
+            if iscoroutinefunction(self._func):
+                return Observability.aobserve(call)
+            else:
+                return Observability.observe(call)
         else:
             # Parameterized call, create and return the "real" observable decorator
             func = args[0]
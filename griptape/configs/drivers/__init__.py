@@ -1,20 +1,47 @@
-from .base_drivers_config import BaseDriversConfig
-from .drivers_config import DriversConfig
-
-from .openai_drivers_config import OpenAiDriversConfig
-from .azure_openai_drivers_config import AzureOpenAiDriversConfig
-from .amazon_bedrock_drivers_config import AmazonBedrockDriversConfig
-from .anthropic_drivers_config import AnthropicDriversConfig
-from .google_drivers_config import GoogleDriversConfig
-from .cohere_drivers_config import CohereDriversConfig
-
-__all__ = [
-    "BaseDriversConfig",
-    "DriversConfig",
-    "OpenAiDriversConfig",
-    "AzureOpenAiDriversConfig",
-    "AmazonBedrockDriversConfig",
-    "AnthropicDriversConfig",
-    "GoogleDriversConfig",
-    "CohereDriversConfig",
-]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base_drivers_config import BaseDriversConfig as BaseDriversConfig
+    from .drivers_config import DriversConfig as DriversConfig
+
+    from .openai_drivers_config import OpenAiDriversConfig as OpenAiDriversConfig
+    from .azure_openai_drivers_config import AzureOpenAiDriversConfig as AzureOpenAiDriversConfig
+    from .amazon_bedrock_drivers_config import AmazonBedrockDriversConfig as AmazonBedrockDriversConfig
+    from .anthropic_drivers_config import AnthropicDriversConfig as AnthropicDriversConfig
+    from .google_drivers_config import GoogleDriversConfig as GoogleDriversConfig
+    from .cohere_drivers_config import CohereDriversConfig as CohereDriversConfig
+
+# Drivers Configs are imported from their modules on first access, so that importing the package doesn't import
+# every Drivers Config and the third-party libraries that it depends on.
+_LAZY_IMPORTS = {
+    "BaseDriversConfig": ".base_drivers_config",
+    "DriversConfig": ".drivers_config",
+    "OpenAiDriversConfig": ".openai_drivers_config",
+    "AzureOpenAiDriversConfig": ".azure_openai_drivers_config",
+    "AmazonBedrockDriversConfig": ".amazon_bedrock_drivers_config",
+    "AnthropicDriversConfig": ".anthropic_drivers_config",
+    "GoogleDriversConfig": ".google_drivers_config",
+    "CohereDriversConfig": ".cohere_drivers_config",
+}
+
+# Type checkers get the exported names from the imports above, which re-export them explicitly.
+__all__ = list(_LAZY_IMPORTS)  # pyright: ignore[reportUnsupportedDunderAll]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -5,16 +5,6 @@ from typing import TYPE_CHECKING
 from attrs import define
 
 from griptape.configs.drivers import BaseDriversConfig
-from griptape.drivers import (
-    DummyAudioTranscriptionDriver,
-    DummyEmbeddingDriver,
-    DummyImageGenerationDriver,
-    DummyImageQueryDriver,
-    DummyPromptDriver,
-    DummyTextToSpeechDriver,
-    DummyVectorStoreDriver,
-    LocalConversationMemoryDriver,
-)
 from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
@@ -32,34 +22,51 @@ if TYPE_CHECKING:
 
 @define
 class DriversConfig(BaseDriversConfig):
+    # Drivers are imported when they're first used, so that importing a Drivers Config doesn't import every Driver.
     @lazy_property()
     def prompt_driver(self) -> BasePromptDriver:
+        from griptape.drivers import DummyPromptDriver
+
         return DummyPromptDriver()
 
     @lazy_property()
     def image_generation_driver(self) -> BaseImageGenerationDriver:
+        from griptape.drivers import DummyImageGenerationDriver
+
         return DummyImageGenerationDriver()
 
     @lazy_property()
     def image_query_driver(self) -> BaseImageQueryDriver:
+        from griptape.drivers import DummyImageQueryDriver
+
         return DummyImageQueryDriver()
 
     @lazy_property()
     def embedding_driver(self) -> BaseEmbeddingDriver:
+        from griptape.drivers import DummyEmbeddingDriver
+
         return DummyEmbeddingDriver()
 
     @lazy_property()
     def vector_store_driver(self) -> BaseVectorStoreDriver:
+        from griptape.drivers import DummyVectorStoreDriver
+
         return DummyVectorStoreDriver(embedding_driver=self.embedding_driver)
 
     @lazy_property()
     def conversation_memory_driver(self) -> BaseConversationMemoryDriver:
+        from griptape.drivers import LocalConversationMemoryDriver
+
         return LocalConversationMemoryDriver()
 
     @lazy_property()
     def text_to_speech_driver(self) -> BaseTextToSpeechDriver:
+        from griptape.drivers import DummyTextToSpeechDriver
+
         return DummyTextToSpeechDriver()
 
     @lazy_property()
     def audio_transcription_driver(self) -> BaseAudioTranscriptionDriver:
+        from griptape.drivers import DummyAudioTranscriptionDriver
+
         return DummyAudioTranscriptionDriver()
@@ -1,44 +1,66 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from attrs import define
 
 from griptape.configs.drivers import DriversConfig
-from griptape.drivers import (
-    LocalVectorStoreDriver,
-    OpenAiAudioTranscriptionDriver,
-    OpenAiChatPromptDriver,
-    OpenAiEmbeddingDriver,
-    OpenAiImageGenerationDriver,
-    OpenAiImageQueryDriver,
-    OpenAiTextToSpeechDriver,
-)
 from griptape.utils.decorators import lazy_property
 
+if TYPE_CHECKING:
+    from griptape.drivers import (
+        LocalVectorStoreDriver,
+        OpenAiAudioTranscriptionDriver,
+        OpenAiChatPromptDriver,
+        OpenAiEmbeddingDriver,
+        OpenAiImageGenerationDriver,
+        OpenAiImageQueryDriver,
+        OpenAiTextToSpeechDriver,
+    )
+
 
 @define
 class OpenAiDriversConfig(DriversConfig):
+    # This is the default Drivers Config, so Drivers are imported when they're first used instead of when `griptape` is
+    # imported.
     @lazy_property()
     def prompt_driver(self) -> OpenAiChatPromptDriver:
+        from griptape.drivers import OpenAiChatPromptDriver
+
         return OpenAiChatPromptDriver(model="gpt-4o")
 
     @lazy_property()
     def image_generation_driver(self) -> OpenAiImageGenerationDriver:
+        from griptape.drivers import OpenAiImageGenerationDriver
+
         return OpenAiImageGenerationDriver(model="dall-e-2", image_size="512x512")
 
     @lazy_property()
     def image_query_driver(self) -> OpenAiImageQueryDriver:
+        from griptape.drivers import OpenAiImageQueryDriver
+
         return OpenAiImageQueryDriver(model="gpt-4o")
 
     @lazy_property()
     def embedding_driver(self) -> OpenAiEmbeddingDriver:
+        from griptape.drivers import OpenAiEmbeddingDriver
+
         return OpenAiEmbeddingDriver(model="text-embedding-3-small")
 
     @lazy_property()
     def vector_store_driver(self) -> LocalVectorStoreDriver:
+        from griptape.drivers import LocalVectorStoreDriver, OpenAiEmbeddingDriver
+
         return LocalVectorStoreDriver(embedding_driver=OpenAiEmbeddingDriver(model="text-embedding-3-small"))
 
     @lazy_property()
     def text_to_speech_driver(self) -> OpenAiTextToSpeechDriver:
+        from griptape.drivers import OpenAiTextToSpeechDriver
+
         return OpenAiTextToSpeechDriver(model="tts-1")
 
     @lazy_property()
     def audio_transcription_driver(self) -> OpenAiAudioTranscriptionDriver:
+        from griptape.drivers import OpenAiAudioTranscriptionDriver
+
         return OpenAiAudioTranscriptionDriver(model="whisper-1")
@@ -1,241 +1,336 @@
-from .prompt.base_prompt_driver import BasePromptDriver
-from .prompt.openai_chat_prompt_driver import OpenAiChatPromptDriver
-from .prompt.azure_openai_chat_prompt_driver import AzureOpenAiChatPromptDriver
-from .prompt.cohere_prompt_driver import CoherePromptDriver
-from .prompt.huggingface_pipeline_prompt_driver import HuggingFacePipelinePromptDriver
-from .prompt.huggingface_hub_prompt_driver import HuggingFaceHubPromptDriver
-from .prompt.anthropic_prompt_driver import AnthropicPromptDriver
-from .prompt.amazon_sagemaker_jumpstart_prompt_driver import AmazonSageMakerJumpstartPromptDriver
-from .prompt.amazon_bedrock_prompt_driver import AmazonBedrockPromptDriver
-from .prompt.google_prompt_driver import GooglePromptDriver
-from .prompt.dummy_prompt_driver import DummyPromptDriver
-from .prompt.ollama_prompt_driver import OllamaPromptDriver
-
-from .memory.conversation.base_conversation_memory_driver import BaseConversationMemoryDriver
-from .memory.conversation.local_conversation_memory_driver import LocalConversationMemoryDriver
-from .memory.conversation.amazon_dynamodb_conversation_memory_driver import AmazonDynamoDbConversationMemoryDriver
-from .memory.conversation.redis_conversation_memory_driver import RedisConversationMemoryDriver
-from .memory.conversation.griptape_cloud_conversation_memory_driver import GriptapeCloudConversationMemoryDriver
-
-from .embedding.base_embedding_driver import BaseEmbeddingDriver
-from .embedding.openai_embedding_driver import OpenAiEmbeddingDriver
-from .embedding.azure_openai_embedding_driver import AzureOpenAiEmbeddingDriver
-from .embedding.amazon_sagemaker_jumpstart_embedding_driver import AmazonSageMakerJumpstartEmbeddingDriver
-from .embedding.amazon_bedrock_titan_embedding_driver import AmazonBedrockTitanEmbeddingDriver
-from .embedding.amazon_bedrock_cohere_embedding_driver import AmazonBedrockCohereEmbeddingDriver
-from .embedding.voyageai_embedding_driver import VoyageAiEmbeddingDriver
-from .embedding.huggingface_hub_embedding_driver import HuggingFaceHubEmbeddingDriver
-from .embedding.google_embedding_driver import GoogleEmbeddingDriver
-from .embedding.dummy_embedding_driver import DummyEmbeddingDriver
-from .embedding.cohere_embedding_driver import CohereEmbeddingDriver
-from .embedding.ollama_embedding_driver import OllamaEmbeddingDriver
-
-from .vector.base_vector_store_driver import BaseVectorStoreDriver
-from .vector.local_vector_store_driver import LocalVectorStoreDriver
-from .vector.pinecone_vector_store_driver import PineconeVectorStoreDriver
-from .vector.marqo_vector_store_driver import MarqoVectorStoreDriver
-from .vector.mongodb_atlas_vector_store_driver import MongoDbAtlasVectorStoreDriver
-from .vector.redis_vector_store_driver import RedisVectorStoreDriver
-from .vector.opensearch_vector_store_driver import OpenSearchVectorStoreDriver
-from .vector.amazon_opensearch_vector_store_driver import AmazonOpenSearchVectorStoreDriver
-from .vector.pgvector_vector_store_driver import PgVectorVectorStoreDriver
-from .vector.azure_mongodb_vector_store_driver import AzureMongoDbVectorStoreDriver
-from .vector.dummy_vector_store_driver import DummyVectorStoreDriver
-from .vector.qdrant_vector_store_driver import QdrantVectorStoreDriver
-from .vector.astradb_vector_store_driver import AstraDbVectorStoreDriver
-from .vector.griptape_cloud_knowledge_base_vector_store_driver import GriptapeCloudKnowledgeBaseVectorStoreDriver
-
-from .sql.base_sql_driver import BaseSqlDriver
-from .sql.amazon_redshift_sql_driver import AmazonRedshiftSqlDriver
-from .sql.snowflake_sql_driver import SnowflakeSqlDriver
-from .sql.sql_driver import SqlDriver
-
-from .image_generation_model.base_image_generation_model_driver import BaseImageGenerationModelDriver
-from .image_generation_model.bedrock_stable_diffusion_image_generation_model_driver import (
-    BedrockStableDiffusionImageGenerationModelDriver,
-)
-from .image_generation_model.bedrock_titan_image_generation_model_driver import BedrockTitanImageGenerationModelDriver
-
-from .image_generation_pipeline.base_image_generation_pipeline_driver import (
-    BaseDiffusionImageGenerationPipelineDriver,
-)
-from .image_generation_pipeline.stable_diffusion_3_image_generation_pipeline_driver import (
-    StableDiffusion3ImageGenerationPipelineDriver,
-)
-from .image_generation_pipeline.stable_diffusion_3_img_2_img_image_generation_pipeline_driver import (
-    StableDiffusion3Img2ImgImageGenerationPipelineDriver,
-)
-from .image_generation_pipeline.stable_diffusion_3_controlnet_image_generation_pipeline_driver import (
-    StableDiffusion3ControlNetImageGenerationPipelineDriver,
-)
-
-from .image_generation.base_image_generation_driver import BaseImageGenerationDriver
-from .image_generation.base_multi_model_image_generation_driver import BaseMultiModelImageGenerationDriver
-from .image_generation.openai_image_generation_driver import OpenAiImageGenerationDriver
-from .image_generation.leonardo_image_generation_driver import LeonardoImageGenerationDriver
-from .image_generation.amazon_bedrock_image_generation_driver import AmazonBedrockImageGenerationDriver
-from .image_generation.azure_openai_image_generation_driver import AzureOpenAiImageGenerationDriver
-from .image_generation.dummy_image_generation_driver import DummyImageGenerationDriver
-from .image_generation.huggingface_pipeline_image_generation_driver import (
-    HuggingFacePipelineImageGenerationDriver,
-)
-
-from .image_query_model.base_image_query_model_driver import BaseImageQueryModelDriver
-from .image_query_model.bedrock_claude_image_query_model_driver import BedrockClaudeImageQueryModelDriver
-
-from .image_query.base_image_query_driver import BaseImageQueryDriver
-from .image_query.base_multi_model_image_query_driver import BaseMultiModelImageQueryDriver
-from .image_query.dummy_image_query_driver import DummyImageQueryDriver
-from .image_query.openai_image_query_driver import OpenAiImageQueryDriver
-from .image_query.anthropic_image_query_driver import AnthropicImageQueryDriver
-from .image_query.azure_openai_image_query_driver import AzureOpenAiImageQueryDriver
-from .image_query.amazon_bedrock_image_query_driver import AmazonBedrockImageQueryDriver
-
-from .web_scraper.base_web_scraper_driver import BaseWebScraperDriver
-from .web_scraper.trafilatura_web_scraper_driver import TrafilaturaWebScraperDriver
-from .web_scraper.markdownify_web_scraper_driver import MarkdownifyWebScraperDriver
-from .web_scraper.proxy_web_scraper_driver import ProxyWebScraperDriver
-
-from .web_search.base_web_search_driver import BaseWebSearchDriver
-from .web_search.google_web_search_driver import GoogleWebSearchDriver
-from .web_search.duck_duck_go_web_search_driver import DuckDuckGoWebSearchDriver
-
-from .event_listener.base_event_listener_driver import BaseEventListenerDriver
-from .event_listener.amazon_sqs_event_listener_driver import AmazonSqsEventListenerDriver
-from .event_listener.webhook_event_listener_driver import WebhookEventListenerDriver
-from .event_listener.aws_iot_core_event_listener_driver import AwsIotCoreEventListenerDriver
-from .event_listener.griptape_cloud_event_listener_driver import GriptapeCloudEventListenerDriver
-from .event_listener.pusher_event_listener_driver import PusherEventListenerDriver
-
-from .file_manager.base_file_manager_driver import BaseFileManagerDriver
-from .file_manager.local_file_manager_driver import LocalFileManagerDriver
-from .file_manager.amazon_s3_file_manager_driver import AmazonS3FileManagerDriver
-
-from .rerank.base_rerank_driver import BaseRerankDriver
-from .rerank.cohere_rerank_driver import CohereRerankDriver
-
-from .text_to_speech.base_text_to_speech_driver import BaseTextToSpeechDriver
-from .text_to_speech.dummy_text_to_speech_driver import DummyTextToSpeechDriver
-from .text_to_speech.elevenlabs_text_to_speech_driver import ElevenLabsTextToSpeechDriver
-from .text_to_speech.openai_text_to_speech_driver import OpenAiTextToSpeechDriver
-
-from .structure_run.base_structure_run_driver import BaseStructureRunDriver
-from .structure_run.griptape_cloud_structure_run_driver import GriptapeCloudStructureRunDriver
-from .structure_run.local_structure_run_driver import LocalStructureRunDriver
-
-from .audio_transcription.base_audio_transcription_driver import BaseAudioTranscriptionDriver
-from .audio_transcription.dummy_audio_transcription_driver import DummyAudioTranscriptionDriver
-from .audio_transcription.openai_audio_transcription_driver import OpenAiAudioTranscriptionDriver
-
-from .observability.base_observability_driver import BaseObservabilityDriver
-from .observability.no_op_observability_driver import NoOpObservabilityDriver
-from .observability.open_telemetry_observability_driver import OpenTelemetryObservabilityDriver
-from .observability.griptape_cloud_observability_driver import GriptapeCloudObservabilityDriver
-from .observability.datadog_observability_driver import DatadogObservabilityDriver
-
-__all__ = [
-    "BasePromptDriver",
-    "OpenAiChatPromptDriver",
-    "AzureOpenAiChatPromptDriver",
-    "CoherePromptDriver",
-    "HuggingFacePipelinePromptDriver",
-    "HuggingFaceHubPromptDriver",
-    "AnthropicPromptDriver",
-    "AmazonSageMakerJumpstartPromptDriver",
-    "AmazonBedrockPromptDriver",
-    "GooglePromptDriver",
-    "DummyPromptDriver",
-    "OllamaPromptDriver",
-    "BaseConversationMemoryDriver",
-    "LocalConversationMemoryDriver",
-    "AmazonDynamoDbConversationMemoryDriver",
-    "RedisConversationMemoryDriver",
-    "GriptapeCloudConversationMemoryDriver",
-    "BaseEmbeddingDriver",
-    "OpenAiEmbeddingDriver",
-    "AzureOpenAiEmbeddingDriver",
-    "AmazonSageMakerJumpstartEmbeddingDriver",
-    "AmazonBedrockTitanEmbeddingDriver",
-    "AmazonBedrockCohereEmbeddingDriver",
-    "VoyageAiEmbeddingDriver",
-    "HuggingFaceHubEmbeddingDriver",
-    "GoogleEmbeddingDriver",
-    "DummyEmbeddingDriver",
-    "CohereEmbeddingDriver",
-    "OllamaEmbeddingDriver",
-    "BaseVectorStoreDriver",
-    "LocalVectorStoreDriver",
-    "PineconeVectorStoreDriver",
-    "MarqoVectorStoreDriver",
-    "MongoDbAtlasVectorStoreDriver",
-    "AzureMongoDbVectorStoreDriver",
-    "RedisVectorStoreDriver",
-    "OpenSearchVectorStoreDriver",
-    "AmazonOpenSearchVectorStoreDriver",
-    "PgVectorVectorStoreDriver",
-    "QdrantVectorStoreDriver",
-    "AstraDbVectorStoreDriver",
-    "DummyVectorStoreDriver",
-    "GriptapeCloudKnowledgeBaseVectorStoreDriver",
-    "BaseSqlDriver",
-    "AmazonRedshiftSqlDriver",
-    "SnowflakeSqlDriver",
-    "SqlDriver",
-    "BaseImageGenerationModelDriver",
-    "BedrockStableDiffusionImageGenerationModelDriver",
-    "BedrockTitanImageGenerationModelDriver",
-    "BaseDiffusionImageGenerationPipelineDriver",
-    "StableDiffusion3ImageGenerationPipelineDriver",
-    "StableDiffusion3Img2ImgImageGenerationPipelineDriver",
-    "StableDiffusion3ControlNetImageGenerationPipelineDriver",
-    "BaseImageGenerationDriver",
-    "BaseMultiModelImageGenerationDriver",
-    "OpenAiImageGenerationDriver",
-    "LeonardoImageGenerationDriver",
-    "AmazonBedrockImageGenerationDriver",
-    "AzureOpenAiImageGenerationDriver",
-    "DummyImageGenerationDriver",
-    "HuggingFacePipelineImageGenerationDriver",
-    "BaseImageQueryModelDriver",
-    "BedrockClaudeImageQueryModelDriver",
-    "BaseImageQueryDriver",
-    "OpenAiImageQueryDriver",
-    "AzureOpenAiImageQueryDriver",
-    "DummyImageQueryDriver",
-    "AnthropicImageQueryDriver",
-    "BaseMultiModelImageQueryDriver",
-    "AmazonBedrockImageQueryDriver",
-    "BaseWebScraperDriver",
-    "TrafilaturaWebScraperDriver",
-    "MarkdownifyWebScraperDriver",
-    "ProxyWebScraperDriver",
-    "BaseWebSearchDriver",
-    "GoogleWebSearchDriver",
-    "DuckDuckGoWebSearchDriver",
-    "BaseEventListenerDriver",
-    "AmazonSqsEventListenerDriver",
-    "WebhookEventListenerDriver",
-    "AwsIotCoreEventListenerDriver",
-    "GriptapeCloudEventListenerDriver",
-    "PusherEventListenerDriver",
-    "BaseFileManagerDriver",
-    "LocalFileManagerDriver",
-    "AmazonS3FileManagerDriver",
-    "BaseRerankDriver",
-    "CohereRerankDriver",
-    "BaseTextToSpeechDriver",
-    "DummyTextToSpeechDriver",
-    "ElevenLabsTextToSpeechDriver",
-    "OpenAiTextToSpeechDriver",
-    "BaseStructureRunDriver",
-    "GriptapeCloudStructureRunDriver",
-    "LocalStructureRunDriver",
-    "BaseAudioTranscriptionDriver",
-    "DummyAudioTranscriptionDriver",
-    "OpenAiAudioTranscriptionDriver",
-    "BaseObservabilityDriver",
-    "NoOpObservabilityDriver",
-    "OpenTelemetryObservabilityDriver",
-    "GriptapeCloudObservabilityDriver",
-    "DatadogObservabilityDriver",
-]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .prompt.base_prompt_driver import BasePromptDriver as BasePromptDriver
+    from .prompt.openai_chat_prompt_driver import OpenAiChatPromptDriver as OpenAiChatPromptDriver
+    from .prompt.azure_openai_chat_prompt_driver import AzureOpenAiChatPromptDriver as AzureOpenAiChatPromptDriver
+    from .prompt.cohere_prompt_driver import CoherePromptDriver as CoherePromptDriver
+    from .prompt.huggingface_pipeline_prompt_driver import (
+        HuggingFacePipelinePromptDriver as HuggingFacePipelinePromptDriver,
+    )
+    from .prompt.huggingface_hub_prompt_driver import HuggingFaceHubPromptDriver as HuggingFaceHubPromptDriver
+    from .prompt.anthropic_prompt_driver import AnthropicPromptDriver as AnthropicPromptDriver
+    from .prompt.amazon_sagemaker_jumpstart_prompt_driver import (
+        AmazonSageMakerJumpstartPromptDriver as AmazonSageMakerJumpstartPromptDriver,
+    )
+    from .prompt.amazon_bedrock_prompt_driver import AmazonBedrockPromptDriver as AmazonBedrockPromptDriver
+    from .prompt.google_prompt_driver import GooglePromptDriver as GooglePromptDriver
+    from .prompt.dummy_prompt_driver import DummyPromptDriver as DummyPromptDriver
+    from .prompt.ollama_prompt_driver import OllamaPromptDriver as OllamaPromptDriver
+
+    from .memory.conversation.base_conversation_memory_driver import (
+        BaseConversationMemoryDriver as BaseConversationMemoryDriver,
+    )
+    from .memory.conversation.local_conversation_memory_driver import (
+        LocalConversationMemoryDriver as LocalConversationMemoryDriver,
+    )
+    from .memory.conversation.amazon_dynamodb_conversation_memory_driver import (
+        AmazonDynamoDbConversationMemoryDriver as AmazonDynamoDbConversationMemoryDriver,
+    )
+    from .memory.conversation.redis_conversation_memory_driver import (
+        RedisConversationMemoryDriver as RedisConversationMemoryDriver,
+    )
+    from .memory.conversation.griptape_cloud_conversation_memory_driver import (
+        GriptapeCloudConversationMemoryDriver as GriptapeCloudConversationMemoryDriver,
+    )
+
+    from .embedding.base_embedding_driver import BaseEmbeddingDriver as BaseEmbeddingDriver
+    from .embedding.openai_embedding_driver import OpenAiEmbeddingDriver as OpenAiEmbeddingDriver
+    from .embedding.azure_openai_embedding_driver import AzureOpenAiEmbeddingDriver as AzureOpenAiEmbeddingDriver
+    from .embedding.amazon_sagemaker_jumpstart_embedding_driver import (
+        AmazonSageMakerJumpstartEmbeddingDriver as AmazonSageMakerJumpstartEmbeddingDriver,
+    )
+    from .embedding.amazon_bedrock_titan_embedding_driver import (
+        AmazonBedrockTitanEmbeddingDriver as AmazonBedrockTitanEmbeddingDriver,
+    )
+    from .embedding.amazon_bedrock_cohere_embedding_driver import (
+        AmazonBedrockCohereEmbeddingDriver as AmazonBedrockCohereEmbeddingDriver,
+    )
+    from .embedding.voyageai_embedding_driver import VoyageAiEmbeddingDriver as VoyageAiEmbeddingDriver
+    from .embedding.huggingface_hub_embedding_driver import (
+        HuggingFaceHubEmbeddingDriver as HuggingFaceHubEmbeddingDriver,
+    )
+    from .embedding.google_embedding_driver import GoogleEmbeddingDriver as GoogleEmbeddingDriver
+    from .embedding.dummy_embedding_driver import DummyEmbeddingDriver as DummyEmbeddingDriver
+    from .embedding.cohere_embedding_driver import CohereEmbeddingDriver as CohereEmbeddingDriver
+    from .embedding.ollama_embedding_driver import OllamaEmbeddingDriver as OllamaEmbeddingDriver
+    from .embedding.cached_embedding_driver import CachedEmbeddingDriver as CachedEmbeddingDriver
+
+    from .vector.base_vector_store_driver import BaseVectorStoreDriver as BaseVectorStoreDriver
+    from .vector.local_vector_store_driver import LocalVectorStoreDriver as LocalVectorStoreDriver
+    from .vector.pinecone_vector_store_driver import PineconeVectorStoreDriver as PineconeVectorStoreDriver
+    from .vector.marqo_vector_store_driver import MarqoVectorStoreDriver as MarqoVectorStoreDriver
+    from .vector.mongodb_atlas_vector_store_driver import MongoDbAtlasVectorStoreDriver as MongoDbAtlasVectorStoreDriver
+    from .vector.redis_vector_store_driver import RedisVectorStoreDriver as RedisVectorStoreDriver
+    from .vector.opensearch_vector_store_driver import OpenSearchVectorStoreDriver as OpenSearchVectorStoreDriver
+    from .vector.amazon_opensearch_vector_store_driver import (
+        AmazonOpenSearchVectorStoreDriver as AmazonOpenSearchVectorStoreDriver,
+    )
+    from .vector.pgvector_vector_store_driver import PgVectorVectorStoreDriver as PgVectorVectorStoreDriver
+    from .vector.azure_mongodb_vector_store_driver import AzureMongoDbVectorStoreDriver as AzureMongoDbVectorStoreDriver
+    from .vector.dummy_vector_store_driver import DummyVectorStoreDriver as DummyVectorStoreDriver
+    from .vector.qdrant_vector_store_driver import QdrantVectorStoreDriver as QdrantVectorStoreDriver
+    from .vector.astradb_vector_store_driver import AstraDbVectorStoreDriver as AstraDbVectorStoreDriver
+    from .vector.griptape_cloud_knowledge_base_vector_store_driver import (
+        GriptapeCloudKnowledgeBaseVectorStoreDriver as GriptapeCloudKnowledgeBaseVectorStoreDriver,
+    )
+
+    from .sql.base_sql_driver import BaseSqlDriver as BaseSqlDriver
+    from .sql.amazon_redshift_sql_driver import AmazonRedshiftSqlDriver as AmazonRedshiftSqlDriver
+    from .sql.snowflake_sql_driver import SnowflakeSqlDriver as SnowflakeSqlDriver
+    from .sql.sql_driver import SqlDriver as SqlDriver
+
+    from .image_generation_model.base_image_generation_model_driver import (
+        BaseImageGenerationModelDriver as BaseImageGenerationModelDriver,
+    )
+    from .image_generation_model.bedrock_stable_diffusion_image_generation_model_driver import (
+        BedrockStableDiffusionImageGenerationModelDriver as BedrockStableDiffusionImageGenerationModelDriver,
+    )
+    from .image_generation_model.bedrock_titan_image_generation_model_driver import (
+        BedrockTitanImageGenerationModelDriver as BedrockTitanImageGenerationModelDriver,
+    )
+
+    from .image_generation_pipeline.base_image_generation_pipeline_driver import (
+        BaseDiffusionImageGenerationPipelineDriver as BaseDiffusionImageGenerationPipelineDriver,
+    )
+    from .image_generation_pipeline.stable_diffusion_3_image_generation_pipeline_driver import (
+        StableDiffusion3ImageGenerationPipelineDriver as StableDiffusion3ImageGenerationPipelineDriver,
+    )
+    from .image_generation_pipeline.stable_diffusion_3_img_2_img_image_generation_pipeline_driver import (
+        StableDiffusion3Img2ImgImageGenerationPipelineDriver as StableDiffusion3Img2ImgImageGenerationPipelineDriver,
+    )
+    from .image_generation_pipeline.stable_diffusion_3_controlnet_image_generation_pipeline_driver import (
+        StableDiffusion3ControlNetImageGenerationPipelineDriver as StableDiffusion3ControlNetImageGenerationPipelineDriver,
+    )
+
+    from .image_generation.base_image_generation_driver import BaseImageGenerationDriver as BaseImageGenerationDriver
+    from .image_generation.base_multi_model_image_generation_driver import (
+        BaseMultiModelImageGenerationDriver as BaseMultiModelImageGenerationDriver,
+    )
+    from .image_generation.openai_image_generation_driver import (
+        OpenAiImageGenerationDriver as OpenAiImageGenerationDriver,
+    )
+    from .image_generation.leonardo_image_generation_driver import (
+        LeonardoImageGenerationDriver as LeonardoImageGenerationDriver,
+    )
+    from .image_generation.amazon_bedrock_image_generation_driver import (
+        AmazonBedrockImageGenerationDriver as AmazonBedrockImageGenerationDriver,
+    )
+    from .image_generation.azure_openai_image_generation_driver import (
+        AzureOpenAiImageGenerationDriver as AzureOpenAiImageGenerationDriver,
+    )
+    from .image_generation.dummy_image_generation_driver import DummyImageGenerationDriver as DummyImageGenerationDriver
+    from .image_generation.huggingface_pipeline_image_generation_driver import (
+        HuggingFacePipelineImageGenerationDriver as HuggingFacePipelineImageGenerationDriver,
+    )
+
+    from .image_query_model.base_image_query_model_driver import BaseImageQueryModelDriver as BaseImageQueryModelDriver
+    from .image_query_model.bedrock_claude_image_query_model_driver import (
+        BedrockClaudeImageQueryModelDriver as BedrockClaudeImageQueryModelDriver,
+    )
+
+    from .image_query.base_image_query_driver import BaseImageQueryDriver as BaseImageQueryDriver
+    from .image_query.base_multi_model_image_query_driver import (
+        BaseMultiModelImageQueryDriver as BaseMultiModelImageQueryDriver,
+    )
+    from .image_query.dummy_image_query_driver import DummyImageQueryDriver as DummyImageQueryDriver
+    from .image_query.openai_image_query_driver import OpenAiImageQueryDriver as OpenAiImageQueryDriver
+    from .image_query.anthropic_image_query_driver import AnthropicImageQueryDriver as AnthropicImageQueryDriver
+    from .image_query.azure_openai_image_query_driver import AzureOpenAiImageQueryDriver as AzureOpenAiImageQueryDriver
+    from .image_query.amazon_bedrock_image_query_driver import (
+        AmazonBedrockImageQueryDriver as AmazonBedrockImageQueryDriver,
+    )
+
+    from .web_scraper.base_web_scraper_driver import BaseWebScraperDriver as BaseWebScraperDriver
+    from .web_scraper.trafilatura_web_scraper_driver import TrafilaturaWebScraperDriver as TrafilaturaWebScraperDriver
+    from .web_scraper.markdownify_web_scraper_driver import MarkdownifyWebScraperDriver as MarkdownifyWebScraperDriver
+    from .web_scraper.proxy_web_scraper_driver import ProxyWebScraperDriver as ProxyWebScraperDriver
+
+    from .web_search.base_web_search_driver import BaseWebSearchDriver as BaseWebSearchDriver
+    from .web_search.google_web_search_driver import GoogleWebSearchDriver as GoogleWebSearchDriver
+    from .web_search.duck_duck_go_web_search_driver import DuckDuckGoWebSearchDriver as DuckDuckGoWebSearchDriver
+
+    from .event_listener.base_event_listener_driver import BaseEventListenerDriver as BaseEventListenerDriver
+    from .event_listener.amazon_sqs_event_listener_driver import (
+        AmazonSqsEventListenerDriver as AmazonSqsEventListenerDriver,
+    )
+    from .event_listener.webhook_event_listener_driver import WebhookEventListenerDriver as WebhookEventListenerDriver
+    from .event_listener.aws_iot_core_event_listener_driver import (
+        AwsIotCoreEventListenerDriver as AwsIotCoreEventListenerDriver,
+    )
+    from .event_listener.griptape_cloud_event_listener_driver import (
+        GriptapeCloudEventListenerDriver as GriptapeCloudEventListenerDriver,
+    )
+    from .event_listener.pusher_event_listener_driver import PusherEventListenerDriver as PusherEventListenerDriver
+
+    from .file_manager.base_file_manager_driver import BaseFileManagerDriver as BaseFileManagerDriver
+    from .file_manager.local_file_manager_driver import LocalFileManagerDriver as LocalFileManagerDriver
+    from .file_manager.amazon_s3_file_manager_driver import AmazonS3FileManagerDriver as AmazonS3FileManagerDriver
+
+    from .rerank.base_rerank_driver import BaseRerankDriver as BaseRerankDriver
+    from .rerank.cohere_rerank_driver import CohereRerankDriver as CohereRerankDriver
+
+    from .text_to_speech.base_text_to_speech_driver import BaseTextToSpeechDriver as BaseTextToSpeechDriver
+    from .text_to_speech.dummy_text_to_speech_driver import DummyTextToSpeechDriver as DummyTextToSpeechDriver
+    from .text_to_speech.elevenlabs_text_to_speech_driver import (
+        ElevenLabsTextToSpeechDriver as ElevenLabsTextToSpeechDriver,
+    )
+    from .text_to_speech.openai_text_to_speech_driver import OpenAiTextToSpeechDriver as OpenAiTextToSpeechDriver
+
+    from .structure_run.base_structure_run_driver import BaseStructureRunDriver as BaseStructureRunDriver
+    from .structure_run.griptape_cloud_structure_run_driver import (
+        GriptapeCloudStructureRunDriver as GriptapeCloudStructureRunDriver,
+    )
+    from .structure_run.local_structure_run_driver import LocalStructureRunDriver as LocalStructureRunDriver
+
+    from .audio_transcription.base_audio_transcription_driver import (
+        BaseAudioTranscriptionDriver as BaseAudioTranscriptionDriver,
+    )
+    from .audio_transcription.dummy_audio_transcription_driver import (
+        DummyAudioTranscriptionDriver as DummyAudioTranscriptionDriver,
+    )
+    from .audio_transcription.openai_audio_transcription_driver import (
+        OpenAiAudioTranscriptionDriver as OpenAiAudioTranscriptionDriver,
+    )
+
+    from .observability.base_observability_driver import BaseObservabilityDriver as BaseObservabilityDriver
+    from .observability.no_op_observability_driver import NoOpObservabilityDriver as NoOpObservabilityDriver
+    from .observability.open_telemetry_observability_driver import (
+        OpenTelemetryObservabilityDriver as OpenTelemetryObservabilityDriver,
+    )
+    from .observability.griptape_cloud_observability_driver import (
+        GriptapeCloudObservabilityDriver as GriptapeCloudObservabilityDriver,
+    )
+    from .observability.datadog_observability_driver import DatadogObservabilityDriver as DatadogObservabilityDriver
+
+# Drivers are imported from their modules on first access, so that importing the package doesn't import
+# every Driver and the third-party libraries that it depends on.
+_LAZY_IMPORTS = {
+    "BasePromptDriver": ".prompt.base_prompt_driver",
+    "OpenAiChatPromptDriver": ".prompt.openai_chat_prompt_driver",
+    "AzureOpenAiChatPromptDriver": ".prompt.azure_openai_chat_prompt_driver",
+    "CoherePromptDriver": ".prompt.cohere_prompt_driver",
+    "HuggingFacePipelinePromptDriver": ".prompt.huggingface_pipeline_prompt_driver",
+    "HuggingFaceHubPromptDriver": ".prompt.huggingface_hub_prompt_driver",
+    "AnthropicPromptDriver": ".prompt.anthropic_prompt_driver",
+    "AmazonSageMakerJumpstartPromptDriver": ".prompt.amazon_sagemaker_jumpstart_prompt_driver",
+    "AmazonBedrockPromptDriver": ".prompt.amazon_bedrock_prompt_driver",
+    "GooglePromptDriver": ".prompt.google_prompt_driver",
+    "DummyPromptDriver": ".prompt.dummy_prompt_driver",
+    "OllamaPromptDriver": ".prompt.ollama_prompt_driver",
+    "BaseConversationMemoryDriver": ".memory.conversation.base_conversation_memory_driver",
+    "LocalConversationMemoryDriver": ".memory.conversation.local_conversation_memory_driver",
+    "AmazonDynamoDbConversationMemoryDriver": ".memory.conversation.amazon_dynamodb_conversation_memory_driver",
+    "RedisConversationMemoryDriver": ".memory.conversation.redis_conversation_memory_driver",
+    "GriptapeCloudConversationMemoryDriver": ".memory.conversation.griptape_cloud_conversation_memory_driver",
+    "BaseEmbeddingDriver": ".embedding.base_embedding_driver",
+    "OpenAiEmbeddingDriver": ".embedding.openai_embedding_driver",
+    "AzureOpenAiEmbeddingDriver": ".embedding.azure_openai_embedding_driver",
+    "AmazonSageMakerJumpstartEmbeddingDriver": ".embedding.amazon_sagemaker_jumpstart_embedding_driver",
+    "AmazonBedrockTitanEmbeddingDriver": ".embedding.amazon_bedrock_titan_embedding_driver",
+    "AmazonBedrockCohereEmbeddingDriver": ".embedding.amazon_bedrock_cohere_embedding_driver",
+    "VoyageAiEmbeddingDriver": ".embedding.voyageai_embedding_driver",
+    "HuggingFaceHubEmbeddingDriver": ".embedding.huggingface_hub_embedding_driver",
+    "GoogleEmbeddingDriver": ".embedding.google_embedding_driver",
+    "DummyEmbeddingDriver": ".embedding.dummy_embedding_driver",
+    "CohereEmbeddingDriver": ".embedding.cohere_embedding_driver",
+    "OllamaEmbeddingDriver": ".embedding.ollama_embedding_driver",
+    "CachedEmbeddingDriver": ".embedding.cached_embedding_driver",
+    "BaseVectorStoreDriver": ".vector.base_vector_store_driver",
+    "LocalVectorStoreDriver": ".vector.local_vector_store_driver",
+    "PineconeVectorStoreDriver": ".vector.pinecone_vector_store_driver",
+    "MarqoVectorStoreDriver": ".vector.marqo_vector_store_driver",
+    "MongoDbAtlasVectorStoreDriver": ".vector.mongodb_atlas_vector_store_driver",
+    "RedisVectorStoreDriver": ".vector.redis_vector_store_driver",
+    "OpenSearchVectorStoreDriver": ".vector.opensearch_vector_store_driver",
+    "AmazonOpenSearchVectorStoreDriver": ".vector.amazon_opensearch_vector_store_driver",
+    "PgVectorVectorStoreDriver": ".vector.pgvector_vector_store_driver",
+    "AzureMongoDbVectorStoreDriver": ".vector.azure_mongodb_vector_store_driver",
+    "DummyVectorStoreDriver": ".vector.dummy_vector_store_driver",
+    "QdrantVectorStoreDriver": ".vector.qdrant_vector_store_driver",
+    "AstraDbVectorStoreDriver": ".vector.astradb_vector_store_driver",
+    "GriptapeCloudKnowledgeBaseVectorStoreDriver": ".vector.griptape_cloud_knowledge_base_vector_store_driver",
+    "BaseSqlDriver": ".sql.base_sql_driver",
+    "AmazonRedshiftSqlDriver": ".sql.amazon_redshift_sql_driver",
+    "SnowflakeSqlDriver": ".sql.snowflake_sql_driver",
+    "SqlDriver": ".sql.sql_driver",
+    "BaseImageGenerationModelDriver": ".image_generation_model.base_image_generation_model_driver",
+    "BedrockStableDiffusionImageGenerationModelDriver": ".image_generation_model.bedrock_stable_diffusion_image_generation_model_driver",
+    "BedrockTitanImageGenerationModelDriver": ".image_generation_model.bedrock_titan_image_generation_model_driver",
+    "BaseDiffusionImageGenerationPipelineDriver": ".image_generation_pipeline.base_image_generation_pipeline_driver",
+    "StableDiffusion3ImageGenerationPipelineDriver": ".image_generation_pipeline.stable_diffusion_3_image_generation_pipeline_driver",
+    "StableDiffusion3Img2ImgImageGenerationPipelineDriver": ".image_generation_pipeline.stable_diffusion_3_img_2_img_image_generation_pipeline_driver",
+    "StableDiffusion3ControlNetImageGenerationPipelineDriver": ".image_generation_pipeline.stable_diffusion_3_controlnet_image_generation_pipeline_driver",
+    "BaseImageGenerationDriver": ".image_generation.base_image_generation_driver",
+    "BaseMultiModelImageGenerationDriver": ".image_generation.base_multi_model_image_generation_driver",
+    "OpenAiImageGenerationDriver": ".image_generation.openai_image_generation_driver",
+    "LeonardoImageGenerationDriver": ".image_generation.leonardo_image_generation_driver",
+    "AmazonBedrockImageGenerationDriver": ".image_generation.amazon_bedrock_image_generation_driver",
+    "AzureOpenAiImageGenerationDriver": ".image_generation.azure_openai_image_generation_driver",
+    "DummyImageGenerationDriver": ".image_generation.dummy_image_generation_driver",
+    "HuggingFacePipelineImageGenerationDriver": ".image_generation.huggingface_pipeline_image_generation_driver",
+    "BaseImageQueryModelDriver": ".image_query_model.base_image_query_model_driver",
+    "BedrockClaudeImageQueryModelDriver": ".image_query_model.bedrock_claude_image_query_model_driver",
+    "BaseImageQueryDriver": ".image_query.base_image_query_driver",
+    "BaseMultiModelImageQueryDriver": ".image_query.base_multi_model_image_query_driver",
+    "DummyImageQueryDriver": ".image_query.dummy_image_query_driver",
+    "OpenAiImageQueryDriver": ".image_query.openai_image_query_driver",
+    "AnthropicImageQueryDriver": ".image_query.anthropic_image_query_driver",
+    "AzureOpenAiImageQueryDriver": ".image_query.azure_openai_image_query_driver",
+    "AmazonBedrockImageQueryDriver": ".image_query.amazon_bedrock_image_query_driver",
+    "BaseWebScraperDriver": ".web_scraper.base_web_scraper_driver",
+    "TrafilaturaWebScraperDriver": ".web_scraper.trafilatura_web_scraper_driver",
+    "MarkdownifyWebScraperDriver": ".web_scraper.markdownify_web_scraper_driver",
+    "ProxyWebScraperDriver": ".web_scraper.proxy_web_scraper_driver",
+    "BaseWebSearchDriver": ".web_search.base_web_search_driver",
+    "GoogleWebSearchDriver": ".web_search.google_web_search_driver",
+    "DuckDuckGoWebSearchDriver": ".web_search.duck_duck_go_web_search_driver",
+    "BaseEventListenerDriver": ".event_listener.base_event_listener_driver",
+    "AmazonSqsEventListenerDriver": ".event_listener.amazon_sqs_event_listener_driver",
+    "WebhookEventListenerDriver": ".event_listener.webhook_event_listener_driver",
+    "AwsIotCoreEventListenerDriver": ".event_listener.aws_iot_core_event_listener_driver",
+    "GriptapeCloudEventListenerDriver": ".event_listener.griptape_cloud_event_listener_driver",
+    "PusherEventListenerDriver": ".event_listener.pusher_event_listener_driver",
+    "BaseFileManagerDriver": ".file_manager.base_file_manager_driver",
+    "LocalFileManagerDriver": ".file_manager.local_file_manager_driver",
+    "AmazonS3FileManagerDriver": ".file_manager.amazon_s3_file_manager_driver",
+    "BaseRerankDriver": ".rerank.base_rerank_driver",
+    "CohereRerankDriver": ".rerank.cohere_rerank_driver",
+    "BaseTextToSpeechDriver": ".text_to_speech.base_text_to_speech_driver",
+    "DummyTextToSpeechDriver": ".text_to_speech.dummy_text_to_speech_driver",
+    "ElevenLabsTextToSpeechDriver": ".text_to_speech.elevenlabs_text_to_speech_driver",
+    "OpenAiTextToSpeechDriver": ".text_to_speech.openai_text_to_speech_driver",
+    "BaseStructureRunDriver": ".structure_run.base_structure_run_driver",
+    "GriptapeCloudStructureRunDriver": ".structure_run.griptape_cloud_structure_run_driver",
+    "LocalStructureRunDriver": ".structure_run.local_structure_run_driver",
+    "BaseAudioTranscriptionDriver": ".audio_transcription.base_audio_transcription_driver",
+    "DummyAudioTranscriptionDriver": ".audio_transcription.dummy_audio_transcription_driver",
+    "OpenAiAudioTranscriptionDriver": ".audio_transcription.openai_audio_transcription_driver",
+    "BaseObservabilityDriver": ".observability.base_observability_driver",
+    "NoOpObservabilityDriver": ".observability.no_op_observability_driver",
+    "OpenTelemetryObservabilityDriver": ".observability.open_telemetry_observability_driver",
+    "GriptapeCloudObservabilityDriver": ".observability.griptape_cloud_observability_driver",
+    "DatadogObservabilityDriver": ".observability.datadog_observability_driver",
+}
+
+# Type checkers get the exported names from the imports above, which re-export them explicitly.
+__all__ = list(_LAZY_IMPORTS)  # pyright: ignore[reportUnsupportedDunderAll]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -26,7 +26,8 @@ class BaseAudioTranscriptionDriver(SerializableMixin, ExponentialBackoffMixin, A
         for attempt in self.retrying():
             with attempt:
                 self.before_run()
-                result = self.try_run(audio, prompts)
+                with self.limit_rate():
+                    result = self.try_run(audio, prompts)
                 self.after_run()
 
                 return result
@@ -30,6 +30,7 @@ class AmazonBedrockCohereEmbeddingDriver(BaseEmbeddingDriver):
     """
 
     DEFAULT_MODEL = "cohere.embed-english-v3"
+    MAX_BATCH_SIZE = 96
 
     model: str = field(default=DEFAULT_MODEL, kw_only=True)
     input_type: str = field(default="search_query", kw_only=True)
@@ -44,7 +45,10 @@ class AmazonBedrockCohereEmbeddingDriver(BaseEmbeddingDriver):
     )
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
-        payload = {"input_type": self.input_type, "texts": [chunk]}
+        return self.try_embed_chunks([chunk])[0]
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        payload = {"input_type": self.input_type, "texts": chunks}
 
         response = self.bedrock_client.invoke_model(
             body=json.dumps(payload),
@@ -54,4 +58,4 @@ class AmazonBedrockCohereEmbeddingDriver(BaseEmbeddingDriver):
         )
         response_body = json.loads(response.get("body").read())
 
-        return response_body.get("embeddings")[0]
+        return response_body.get("embeddings")
@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Optional
 
 import numpy as np
-from attrs import define, field
+from attrs import Factory, define, field
 
 from griptape.chunkers import BaseChunker, TextChunker
 from griptape.mixins import ExponentialBackoffMixin, SerializableMixin
@@ -21,10 +21,19 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     Attributes:
         model: The name of the model to use.
         tokenizer: An instance of `BaseTokenizer` to use when calculating tokens.
+        batch_size: Maximum number of strings embedded per request by `embed_strings`. Defaults to the provider limit.
+        max_batch_tokens: Maximum number of tokens embedded per request by `embed_strings`. Requires `tokenizer`.
     """
 
+    MAX_BATCH_SIZE = 1
+    MAX_BATCH_TOKENS = None
+
     model: str = field(kw_only=True, metadata={"serializable": True})
     tokenizer: Optional[BaseTokenizer] = field(default=None, kw_only=True)
+    batch_size: int = field(default=Factory(lambda self: self.MAX_BATCH_SIZE, takes_self=True), kw_only=True)
+    max_batch_tokens: Optional[int] = field(
+        default=Factory(lambda self: self.MAX_BATCH_TOKENS, takes_self=True), kw_only=True
+    )
     chunker: Optional[BaseChunker] = field(init=False)
 
     def __attrs_post_init__(self) -> None:
@@ -39,26 +48,105 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
                 if self.tokenizer and self.tokenizer.count_tokens(string) > self.tokenizer.max_input_tokens:
                     return self._embed_long_string(string)
                 else:
-                    return self.try_embed_chunk(string)
+                    with self.limit_rate(lambda: self.tokenizer.count_tokens(string) if self.tokenizer else 0):
+                        return self.try_embed_chunk(string)
 
         else:
             raise RuntimeError("Failed to embed string.")
 
+    def embed_strings(self, strings: list[str]) -> list[list[float]]:
+        """Embeds multiple strings with as few requests as `batch_size` and `max_batch_tokens` allow.
+
+        Args:
+            strings: Strings to embed.
+
+        Returns:
+            One embedding per string, in the same order.
+        """
+        embeddings: list[Optional[list[float]]] = [None] * len(strings)
+        chunks = []
+        chunk_token_counts = []
+        chunk_indexes = []
+
+        for i, string in enumerate(strings):
+            token_count = self.tokenizer.count_tokens(string) if self.tokenizer else None
+
+            if self.tokenizer and token_count is not None and token_count > self.tokenizer.max_input_tokens:
+                for attempt in self.retrying():
+                    with attempt:
+                        embeddings[i] = self._embed_long_string(string)
+            else:
+                chunks.append(string)
+                chunk_token_counts.append(token_count)
+                chunk_indexes.append(i)
+
+        for batch in self._batch_chunks(chunk_token_counts):
+            for attempt in self.retrying():
+                with attempt, self.limit_rate(sum(chunk_token_counts[j] or 0 for j in batch)):
+                    batch_embeddings = self.try_embed_chunks([chunks[j] for j in batch])
+
+                    for j, embedding in zip(batch, batch_embeddings):
+                        embeddings[chunk_indexes[j]] = embedding
+
+        return embeddings  # pyright: ignore[reportReturnType]
+
     @abstractmethod
     def try_embed_chunk(self, chunk: str) -> list[float]: ...
 
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        """Embeds a batch of chunks. Drivers whose provider accepts multiple inputs per request should override this."""
+        return [self.try_embed_chunk(chunk) for chunk in chunks]
+
+    def _batch_chunks(self, token_counts: list[Optional[int]]) -> list[list[int]]:
+        """Packs chunks into batches that respect `batch_size` and `max_batch_tokens`.
+
+        Args:
+            token_counts: Token count of every chunk, or `None` if unknown.
+
+        Returns:
+            Chunk indexes of every batch.
+        """
+        batches = []
+        batch = []
+        batch_tokens = 0
+
+        for i, token_count in enumerate(token_counts):
+            token_count = token_count or 0
+
+            if batch and (
+                len(batch) >= self.batch_size
+                or (self.max_batch_tokens is not None and batch_tokens + token_count > self.max_batch_tokens)
+            ):
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+
+            batch.append(i)
+            batch_tokens += token_count
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
     def _embed_long_string(self, string: str) -> list[float]:
         """Embeds a string that is too long to embed in one go.
 
         Adapted from: https://github.com/openai/openai-cookbook/blob/683e5f5a71bc7a1b0e5b7a35e087f53cc55fceea/examples/Embedding_long_inputs.ipynb
         """
         chunks = self.chunker.chunk(string)
+        token_counts = [
+            self.tokenizer.count_tokens(chunk.value) if self.tokenizer and self.max_batch_tokens is not None else None
+            for chunk in chunks
+        ]
 
         embedding_chunks = []
-        length_chunks = []
-        for chunk in chunks:
-            embedding_chunks.append(self.try_embed_chunk(chunk.value))
-            length_chunks.append(len(chunk))
+        length_chunks = [len(chunk) for chunk in chunks]
+        for batch in self._batch_chunks(token_counts):
+            batch_chunks = [chunks[i].value for i in batch]
+
+            with self.limit_rate(lambda: self.__count_tokens(batch_chunks)):  # noqa: B023
+                embedding_chunks.extend(self.try_embed_chunks(batch_chunks))
 
         # generate weighted averages
         embedding_chunks = np.average(embedding_chunks, axis=0, weights=length_chunks)
@@ -67,3 +155,6 @@ class BaseEmbeddingDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         embedding_chunks = embedding_chunks / np.linalg.norm(embedding_chunks)
 
         return embedding_chunks.tolist()
+
+    def __count_tokens(self, strings: list[str]) -> int:
+        return sum(self.tokenizer.count_tokens_many(strings)) if self.tokenizer else 0
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from array import array
+from typing import Optional
+
+from attrs import Factory, define, field
+
+from griptape.drivers import BaseEmbeddingDriver
+from griptape.utils import LruCache, str_to_hash
+
+
+@define
+class CachedEmbeddingDriver(BaseEmbeddingDriver):
+    """Embedding Driver that caches the embeddings of another Embedding Driver by content.
+
+    Embeddings are keyed by the wrapped driver's model and the hash of the embedded string, so identical strings are
+    only embedded once. Recently used embeddings are kept in memory and, if `persist_file` is set, every embedding is
+    also stored in a SQLite database that outlives the process.
+
+    Attributes:
+        embedding_driver: Embedding Driver whose embeddings are cached.
+        model: Model name used in cache keys. Defaults to the model of `embedding_driver`.
+        max_cache_size: Maximum number of embeddings kept in memory.
+        persist_file: Optional path to a SQLite database used as a second cache tier.
+        cache: In-memory cache of embeddings.
+        disk_hits: Number of embeddings found in `persist_file` after missing the in-memory cache.
+        misses: Number of embeddings that had to be computed by `embedding_driver`.
+    """
+
+    embedding_driver: BaseEmbeddingDriver = field(kw_only=True, metadata={"serializable": True})
+    model: str = field(
+        default=Factory(lambda self: self.embedding_driver.model, takes_self=True),
+        kw_only=True,
+        metadata={"serializable": True},
+    )
+    max_cache_size: int = field(default=10000, kw_only=True, metadata={"serializable": True})
+    persist_file: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
+    cache: LruCache[str, list[float]] = field(
+        default=Factory(lambda self: LruCache(max_size=self.max_cache_size), takes_self=True), kw_only=True
+    )
+    disk_hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _connection: Optional[sqlite3.Connection] = field(default=None, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        super().__attrs_post_init__()
+
+        if self.persist_file is not None:
+            self._connection = sqlite3.connect(self.persist_file, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, embedding BLOB NOT NULL)"
+            )
+            self._connection.commit()
+
+    @property
+    def memory_hits(self) -> int:
+        return self.cache.hits
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    def embed_string(self, string: str) -> list[float]:
+        return self.embed_strings([string])[0]
+
+    def embed_strings(self, strings: list[str]) -> list[list[float]]:
+        keys = [self._get_cache_key(string) for string in strings]
+        embeddings = {}
+        missing = {}
+
+        # Identical strings share a key, so each distinct string is looked up and embedded at most once.
+        for key, string in zip(keys, strings):
+            if key not in embeddings and key not in missing:
+                embedding = self.cache.get(key)
+
+                if embedding is None:
+                    missing[key] = string
+                else:
+                    embeddings[key] = embedding
+
+        for key, embedding in self._load_embeddings(list(missing.keys())).items():
+            self.cache.put(key, embedding)
+            embeddings[key] = embedding
+            del missing[key]
+
+        if missing:
+            computed = dict(zip(missing.keys(), self.embedding_driver.embed_strings(list(missing.values()))))
+
+            for key, embedding in computed.items():
+                self.cache.put(key, embedding)
+                embeddings[key] = embedding
+
+            self._store_embeddings(computed)
+
+        with self._lock:
+            self.misses += len(missing)
+
+        return [embeddings[key] for key in keys]
+
+    def try_embed_chunk(self, chunk: str) -> list[float]:
+        return self.embedding_driver.try_embed_chunk(chunk)
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        return self.embedding_driver.try_embed_chunks(chunks)
+
+    def clear_cache(self) -> None:
+        self.cache.clear()
+
+        with self._lock:
+            self.disk_hits = 0
+            self.misses = 0
+
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM embeddings")
+                self._connection.commit()
+
+    def _get_cache_key(self, string: str) -> str:
+        return f"{self.model}:{str_to_hash(string)}"
+
+    def _load_embeddings(self, keys: list[str]) -> dict[str, list[float]]:
+        if self._connection is None or not keys:
+            return {}
+
+        embeddings = {}
+
+        with self._lock:
+            # Stay below SQLite's default limit on the number of query parameters.
+            for start in range(0, len(keys), 900):
+                batch = keys[start : start + 900]
+                rows = self._connection.execute(
+                    f"SELECT key, embedding FROM embeddings WHERE key IN ({','.join('?' * len(batch))})",  # noqa: S608
+                    batch,
+                ).fetchall()
+
+                for key, blob in rows:
+                    embeddings[key] = array("d", blob).tolist()
+
+            self.disk_hits += len(embeddings)
+
+        return embeddings
+
+    def _store_embeddings(self, embeddings: dict[str, list[float]]) -> None:
+        if self._connection is None or not embeddings:
+            return
+
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, embedding) VALUES (?, ?)",
+                [(key, array("d", embedding).tobytes()) for key, embedding in embeddings.items()],
+            )
+            self._connection.commit()
@@ -25,6 +25,7 @@ class CohereEmbeddingDriver(BaseEmbeddingDriver):
     """
 
     DEFAULT_MODEL = "models/embedding-001"
+    MAX_BATCH_SIZE = 96
 
     api_key: str = field(kw_only=True, metadata={"serializable": False})
     client: Client = field(
@@ -39,9 +40,12 @@ class CohereEmbeddingDriver(BaseEmbeddingDriver):
     input_type: str = field(kw_only=True, metadata={"serializable": True})
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
-        result = self.client.embed(texts=[chunk], model=self.model, input_type=self.input_type)
+        return self.try_embed_chunks([chunk])[0]
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        result = self.client.embed(texts=chunks, model=self.model, input_type=self.input_type)
 
         if isinstance(result.embeddings, list):
-            return result.embeddings[0]
+            return result.embeddings
         else:
             raise ValueError("Non-float embeddings are not supported.")
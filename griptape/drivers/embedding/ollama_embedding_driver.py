@@ -21,6 +21,8 @@ class OllamaEmbeddingDriver(BaseEmbeddingDriver):
         client: Ollama `Client`.
     """
 
+    MAX_BATCH_SIZE = 512
+
     model: str = field(kw_only=True, metadata={"serializable": True})
     host: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
     client: Client = field(
@@ -30,3 +32,6 @@ class OllamaEmbeddingDriver(BaseEmbeddingDriver):
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
         return list(self.client.embeddings(model=self.model, prompt=chunk)["embedding"])
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        return [list(embedding) for embedding in self.client.embed(model=self.model, input=chunks)["embeddings"]]
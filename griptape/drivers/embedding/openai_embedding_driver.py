@@ -28,6 +28,8 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
     """
 
     DEFAULT_MODEL = "text-embedding-3-small"
+    MAX_BATCH_SIZE = 2048
+    MAX_BATCH_TOKENS = 300000
 
     model: str = field(default=DEFAULT_MODEL, kw_only=True, metadata={"serializable": True})
     base_url: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": True})
@@ -51,5 +53,12 @@ class OpenAiEmbeddingDriver(BaseEmbeddingDriver):
             chunk = chunk.replace("\n", " ")
         return self.client.embeddings.create(**self._params(chunk)).data[0].embedding
 
-    def _params(self, chunk: str) -> dict:
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        if self.model.endswith("001"):
+            chunks = [chunk.replace("\n", " ") for chunk in chunks]
+        data = self.client.embeddings.create(**self._params(chunks)).data
+
+        return [embedding.embedding for embedding in sorted(data, key=lambda embedding: embedding.index)]
+
+    def _params(self, chunk: str | list[str]) -> dict:
         return {"input": chunk, "model": self.model}
@@ -22,6 +22,8 @@ class VoyageAiEmbeddingDriver(BaseEmbeddingDriver):
     """
 
     DEFAULT_MODEL = "voyage-large-2"
+    MAX_BATCH_SIZE = 128
+    MAX_BATCH_TOKENS = 120000
 
     model: str = field(default=DEFAULT_MODEL, kw_only=True, metadata={"serializable": True})
     api_key: Optional[str] = field(default=None, kw_only=True, metadata={"serializable": False})
@@ -38,4 +40,7 @@ class VoyageAiEmbeddingDriver(BaseEmbeddingDriver):
     input_type: str = field(default="document", kw_only=True, metadata={"serializable": True})
 
     def try_embed_chunk(self, chunk: str) -> list[float]:
-        return self.client.embed([chunk], model=self.model, input_type=self.input_type).embeddings[0]
+        return self.try_embed_chunks([chunk])[0]
+
+    def try_embed_chunks(self, chunks: list[str]) -> list[list[float]]:
+        return self.client.embed(chunks, model=self.model, input_type=self.input_type).embeddings
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from attrs import Factory, define, field
 
@@ -14,17 +14,43 @@ if TYPE_CHECKING:
 
 @define
 class AmazonSqsEventListenerDriver(BaseEventListenerDriver):
+    # SQS accepts up to 10 messages and 256 KiB per SendMessageBatch request.
+    MAX_BATCH_SIZE = 10
+
     queue_url: str = field(kw_only=True)
     session: boto3.Session = field(default=Factory(lambda: import_optional_dependency("boto3").Session()), kw_only=True)
     sqs_client: Any = field(default=Factory(lambda self: self.session.client("sqs"), takes_self=True))
+    max_batch_bytes: Optional[int] = field(default=262_144, kw_only=True)
 
     def try_publish_event_payload(self, event_payload: dict) -> None:
         self.sqs_client.send_message(QueueUrl=self.queue_url, MessageBody=json.dumps(event_payload))
 
     def try_publish_event_payload_batch(self, event_payload_batch: list[dict]) -> None:
-        entries = [
-            {"Id": str(event_payload["id"]), "MessageBody": json.dumps(event_payload)}
-            for event_payload in event_payload_batch
-        ]
-
-        self.sqs_client.send_message_batch(QueueUrl=self.queue_url, Entries=entries)
+        # Sent payloads are removed from the batch before raising, so that retries only resend the failed payloads.
+        unsent_payloads = []
+        failed = []
+        start = 0
+
+        try:
+            for start in range(0, len(event_payload_batch), self.MAX_BATCH_SIZE):
+                payloads = event_payload_batch[start : start + self.MAX_BATCH_SIZE]
+                response = self.sqs_client.send_message_batch(
+                    QueueUrl=self.queue_url,
+                    Entries=[
+                        {"Id": str(event_payload["id"]), "MessageBody": json.dumps(event_payload)}
+                        for event_payload in payloads
+                    ],
+                )
+                failed_ids = {entry["Id"] for entry in response.get("Failed", [])}
+
+                failed.extend(response.get("Failed", []))
+                unsent_payloads.extend(payload for payload in payloads if str(payload["id"]) in failed_ids)
+        except Exception:
+            event_payload_batch[:] = unsent_payloads + event_payload_batch[start:]
+
+            raise
+
+        if failed:
+            event_payload_batch[:] = unsent_payloads
+
+            raise RuntimeError(f"Failed to send {len(failed)} messages to SQS: {failed}")
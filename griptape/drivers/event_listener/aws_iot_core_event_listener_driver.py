@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from attrs import Factory, define, field
 
@@ -18,6 +18,8 @@ class AwsIotCoreEventListenerDriver(BaseEventListenerDriver):
     topic: str = field(kw_only=True)
     session: boto3.Session = field(default=Factory(lambda: import_optional_dependency("boto3").Session()), kw_only=True)
     iotdata_client: Any = field(default=Factory(lambda self: self.session.client("iot-data"), takes_self=True))
+    # IoT Core accepts payloads of up to 128 KiB.
+    max_batch_bytes: Optional[int] = field(default=131_072, kw_only=True)
 
     def try_publish_event_payload(self, event_payload: dict) -> None:
         self.iotdata_client.publish(topic=self.topic, payload=json.dumps(event_payload))
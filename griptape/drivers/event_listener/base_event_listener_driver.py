@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import json
 import logging
 import threading
+import time
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Optional
 
 from attrs import Factory, define, field
 
-from griptape.mixins import FuturesExecutorMixin
+from griptape.mixins import ExponentialBackoffMixin, FuturesExecutorMixin
 
 if TYPE_CHECKING:
     from griptape.events import BaseEvent
@@ -16,19 +19,55 @@ logger = logging.getLogger(__name__)
 
 
 @define
-class BaseEventListenerDriver(FuturesExecutorMixin, ABC):
+class BaseEventListenerDriver(FuturesExecutorMixin, ExponentialBackoffMixin, ABC):
+    """Base class for Drivers that publish Events to external services.
+
+    Published Events are queued and handed to a single background flusher, which runs on `futures_executor` while there
+    are Events to publish. The flusher serializes Events, adds them to a batch, and publishes the batch when it reaches
+    `batch_size` Events or `max_batch_bytes` bytes, when an Event is published with `flush=True`, or when its oldest
+    Event has waited for `flush_interval` seconds. Failed publishes are retried with exponential backoff, so Events are
+    delivered at least once.
+
+    Attributes:
+        batched: Whether to publish Events in batches.
+        batch_size: Maximum number of Events in a batch.
+        max_batch_bytes: Maximum size of the JSON payloads of a batch, in bytes. Not limited if `None`.
+        flush_interval: Maximum number of seconds that an Event waits in a batch before the batch is published.
+        max_attempts: Maximum number of attempts to publish an Event or a batch.
+        min_retry_delay: Minimum number of seconds to wait between attempts.
+        max_retry_delay: Maximum number of seconds to wait between attempts.
+    """
+
     batched: bool = field(default=True, kw_only=True)
     batch_size: int = field(default=10, kw_only=True)
+    max_batch_bytes: Optional[int] = field(default=None, kw_only=True)
+    flush_interval: float = field(default=1.0, kw_only=True)
+    max_attempts: int = field(default=3, kw_only=True)
+    min_retry_delay: float = field(default=0.5, kw_only=True)
+    max_retry_delay: float = field(default=5, kw_only=True)
     thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()))
 
     _batch: list[dict] = field(default=Factory(list), kw_only=True)
+    _batch_bytes: int = field(default=0, init=False)
+    _batch_started_at: Optional[float] = field(default=None, init=False)
+    _pending_events: deque[tuple[BaseEvent | dict, bool, Optional[dict]]] = field(factory=deque, init=False)
+    _pending_condition: threading.Condition = field(factory=threading.Condition, init=False)
+    _is_flusher_running: bool = field(default=False, init=False)
 
     @property
     def batch(self) -> list[dict]:
         return self._batch
 
     def publish_event(self, event: BaseEvent | dict, *, flush: bool = False) -> None:
-        self.futures_executor.submit(self._safe_try_publish_event, event, flush=flush)
+        payload_fields = self._get_payload_fields()
+
+        with self._pending_condition:
+            self._pending_events.append((event, flush, payload_fields))
+            self._pending_condition.notify()
+
+            if not self._is_flusher_running:
+                self._is_flusher_running = True
+                self.futures_executor.submit(self._run_flusher)
 
     @abstractmethod
     def try_publish_event_payload(self, event_payload: dict) -> None: ...
@@ -36,18 +75,107 @@ class BaseEventListenerDriver(FuturesExecutorMixin, ABC):
     @abstractmethod
     def try_publish_event_payload_batch(self, event_payload_batch: list[dict]) -> None: ...
 
-    def _safe_try_publish_event(self, event: BaseEvent | dict, *, flush: bool) -> None:
+    def _get_payload_fields(self) -> Optional[dict]:
+        """Returns fields to add to an Event's payload, read on the thread that publishes the Event."""
+        return None
+
+    def _run_flusher(self) -> None:
+        try:
+            while (events := self._wait_for_pending_events()) is not None:
+                if events:
+                    for event, flush, payload_fields in events:
+                        self._safe_try_publish_event(event, flush=flush, payload_fields=payload_fields)
+                else:
+                    self._safe_flush_batch()
+        except Exception as e:
+            logger.error(e)
+
+            with self._pending_condition:
+                self._is_flusher_running = False
+
+    def _wait_for_pending_events(self) -> Optional[list[tuple[BaseEvent | dict, bool, Optional[dict]]]]:
+        """Waits for Events to publish.
+
+        Returns:
+            The pending Events, an empty list if the batch's `flush_interval` has elapsed, or `None` if there is nothing
+            left to publish, in which case the flusher stops.
+        """
+        # The batch is written under `thread_lock`, so it's read under the same lock.
+        with self.thread_lock:
+            batch_started_at = self._batch_started_at
+
+        with self._pending_condition:
+            if not self._pending_events and batch_started_at is not None:
+                timeout = batch_started_at + self.flush_interval - time.monotonic()
+                self._pending_condition.wait_for(lambda: self._pending_events, timeout=max(timeout, 0))
+
+            if self._pending_events:
+                events = list(self._pending_events)
+                self._pending_events.clear()
+
+                return events
+            elif batch_started_at is not None:
+                return []
+            else:
+                self._is_flusher_running = False
+
+                return None
+
+    def _safe_try_publish_event(
+        self, event: BaseEvent | dict, *, flush: bool, payload_fields: Optional[dict] = None
+    ) -> None:
         try:
             event_payload = event if isinstance(event, dict) else event.to_dict()
 
+            if payload_fields:
+                event_payload = {**event_payload, **payload_fields}
+
             if self.batched:
                 with self.thread_lock:
-                    self._batch.append(event_payload)
-                    if len(self.batch) >= self.batch_size or flush:
-                        self.try_publish_event_payload_batch(self.batch)
-                        self._batch = []
-                return
+                    self._add_to_batch(event_payload)
+
+                if flush or len(self._batch) >= self.batch_size or self._is_batch_full():
+                    self._safe_flush_batch()
             else:
-                self.try_publish_event_payload(event_payload)
+                self._publish_with_retries(self.try_publish_event_payload, event_payload)
+        except Exception as e:
+            logger.error(e)
+
+    def _add_to_batch(self, event_payload: dict) -> None:
+        if self.max_batch_bytes is not None:
+            event_payload_bytes = len(json.dumps(event_payload, default=str)) + 1
+
+            # Publish the batch first if the Event wouldn't fit in it.
+            if self._batch and self._batch_bytes + event_payload_bytes > self.max_batch_bytes:
+                self.__flush_batch()
+
+            self._batch_bytes += event_payload_bytes
+
+        if not self._batch:
+            self._batch_started_at = time.monotonic()
+
+        self._batch.append(event_payload)
+
+    def _is_batch_full(self) -> bool:
+        return self.max_batch_bytes is not None and self._batch_bytes >= self.max_batch_bytes
+
+    def _safe_flush_batch(self) -> None:
+        try:
+            with self.thread_lock:
+                self.__flush_batch()
         except Exception as e:
             logger.error(e)
+
+    def __flush_batch(self) -> None:
+        batch = self._batch
+        self._batch = []
+        self._batch_bytes = 0
+        self._batch_started_at = None
+
+        if batch:
+            self._publish_with_retries(self.try_publish_event_payload_batch, batch)
+
+    def _publish_with_retries(self, publish: Callable, payload: dict | list[dict]) -> None:
+        for attempt in self.retrying():
+            with attempt:
+                publish(payload)
@@ -8,7 +8,6 @@ import requests
 from attrs import Attribute, Factory, define, field
 
 from griptape.drivers.event_listener.base_event_listener_driver import BaseEventListenerDriver
-from griptape.events.base_event import BaseEvent
 
 
 @define
@@ -42,23 +41,20 @@ class GriptapeCloudEventListenerDriver(BaseEventListenerDriver):
                 "structure_run_id must be set either in the constructor or as an environment variable (GT_CLOUD_STRUCTURE_RUN_ID).",
             )
 
-    def publish_event(self, event: BaseEvent | dict, *, flush: bool = False) -> None:
-        from griptape.observability.observability import Observability
-
-        event_payload = event.to_dict() if isinstance(event, BaseEvent) else event
-
-        span_id = Observability.get_span_id()
-        if span_id is not None:
-            event_payload["span_id"] = span_id
-
-        super().publish_event(event_payload, flush=flush)
-
     def try_publish_event_payload(self, event_payload: dict) -> None:
         self._post_event(self._get_event_request(event_payload))
 
     def try_publish_event_payload_batch(self, event_payload_batch: list[dict]) -> None:
         self._post_event([self._get_event_request(event_payload) for event_payload in event_payload_batch])
 
+    def _get_payload_fields(self) -> Optional[dict]:
+        from griptape.observability.observability import Observability
+
+        # The span is read when the Event is published, since the Event is serialized on another thread.
+        span_id = Observability.get_span_id()
+
+        return {"span_id": span_id} if span_id is not None else None
+
     def _get_event_request(self, event_payload: dict) -> dict:
         return {
             "payload": event_payload,
@@ -13,6 +13,9 @@ if TYPE_CHECKING:
 
 @define
 class PusherEventListenerDriver(BaseEventListenerDriver):
+    # Pusher accepts up to 10 events per batch trigger.
+    MAX_BATCH_SIZE = 10
+
     app_id: str = field(kw_only=True)
     key: str = field(kw_only=True)
     secret: str = field(kw_only=True)
@@ -39,7 +42,8 @@ class PusherEventListenerDriver(BaseEventListenerDriver):
             for event_payload in event_payload_batch
         ]
 
-        self.pusher_client.trigger_batch(data)
+        for i in range(0, len(data), self.MAX_BATCH_SIZE):
+            self.pusher_client.trigger_batch(data[i : i + self.MAX_BATCH_SIZE])
 
     def try_publish_event_payload(self, event_payload: dict) -> None:
         self.pusher_client.trigger(channels=self.channel, event_name=self.event_name, data=event_payload)
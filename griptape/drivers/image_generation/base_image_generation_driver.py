@@ -26,7 +26,8 @@ class BaseImageGenerationDriver(SerializableMixin, ExponentialBackoffMixin, ABC)
         for attempt in self.retrying():
             with attempt:
                 self.before_run(prompts, negative_prompts)
-                result = self.try_text_to_image(prompts, negative_prompts)
+                with self.limit_rate():
+                    result = self.try_text_to_image(prompts, negative_prompts)
                 self.after_run()
 
                 return result
@@ -43,7 +44,8 @@ class BaseImageGenerationDriver(SerializableMixin, ExponentialBackoffMixin, ABC)
         for attempt in self.retrying():
             with attempt:
                 self.before_run(prompts, negative_prompts)
-                result = self.try_image_variation(prompts, image, negative_prompts)
+                with self.limit_rate():
+                    result = self.try_image_variation(prompts, image, negative_prompts)
                 self.after_run()
 
                 return result
@@ -61,7 +63,8 @@ class BaseImageGenerationDriver(SerializableMixin, ExponentialBackoffMixin, ABC)
         for attempt in self.retrying():
             with attempt:
                 self.before_run(prompts, negative_prompts)
-                result = self.try_image_inpainting(prompts, image, mask, negative_prompts)
+                with self.limit_rate():
+                    result = self.try_image_inpainting(prompts, image, mask, negative_prompts)
                 self.after_run()
 
                 return result
@@ -79,7 +82,8 @@ class BaseImageGenerationDriver(SerializableMixin, ExponentialBackoffMixin, ABC)
         for attempt in self.retrying():
             with attempt:
                 self.before_run(prompts, negative_prompts)
-                result = self.try_image_outpainting(prompts, image, mask, negative_prompts)
+                with self.limit_rate():
+                    result = self.try_image_outpainting(prompts, image, mask, negative_prompts)
                 self.after_run()
 
                 return result
@@ -29,7 +29,8 @@ class BaseImageQueryDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
             with attempt:
                 self.before_run(query, images)
 
-                result = self.try_query(query, images)
+                with self.limit_rate():
+                    result = self.try_query(query, images)
 
                 self.after_run(result.value)
 
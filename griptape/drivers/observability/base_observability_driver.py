@@ -27,5 +27,12 @@ class BaseObservabilityDriver(ABC):
     @abstractmethod
     def observe(self, call: Observable.Call) -> Any: ...
 
+    async def aobserve(self, call: Observable.Call) -> Any:
+        """Observes a call to a coroutine function until it finishes.
+
+        Drivers that record spans override this method, since `observe` would only record creating the coroutine.
+        """
+        return await call()
+
     @abstractmethod
     def get_span_id(self) -> Optional[str]: ...
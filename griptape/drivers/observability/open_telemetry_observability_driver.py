@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Optional
 
 from attrs import Factory, define, field
@@ -8,6 +9,7 @@ from griptape.drivers import BaseObservabilityDriver
 from griptape.utils.import_utils import import_optional_dependency
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from types import TracebackType
 
     from opentelemetry.sdk.trace import SpanProcessor, TracerProvider
@@ -79,6 +81,15 @@ class OpenTelemetryObservabilityDriver(BaseObservabilityDriver):
         return False
 
     def observe(self, call: Observable.Call) -> Any:
+        with self._start_span(call):
+            return call()
+
+    async def aobserve(self, call: Observable.Call) -> Any:
+        with self._start_span(call):
+            return await call()
+
+    @contextmanager
+    def _start_span(self, call: Observable.Call) -> Iterator[None]:
         open_telemetry_trace = import_optional_dependency("opentelemetry.trace")
         func = call.func
         instance = call.instance
@@ -91,9 +102,8 @@ class OpenTelemetryObservabilityDriver(BaseObservabilityDriver):
                 span.set_attribute("tags", tags)
 
             try:
-                result = call()
+                yield
                 span.set_status(open_telemetry_trace.Status(open_telemetry_trace.StatusCode.OK))
-                return result
             except Exception as e:
                 span.set_status(open_telemetry_trace.Status(open_telemetry_trace.StatusCode.ERROR))
                 span.record_exception(e)
@@ -101,7 +101,12 @@ class AmazonBedrockPromptDriver(BasePromptDriver):
             "inferenceConfig": {"temperature": self.temperature, "maxTokens": self.max_tokens},
             "additionalModelRequestFields": self.additional_model_request_fields,
             **(
-                {"toolConfig": {"tools": self.__to_bedrock_tools(prompt_stack.tools), "toolChoice": self.tool_choice}}
+                {
+                    "toolConfig": {
+                        "tools": self._get_native_tools(prompt_stack.tools, self.__to_bedrock_tools),
+                        "toolChoice": self.tool_choice,
+                    }
+                }
                 if prompt_stack.tools and self.use_native_tools
                 else {}
             ),
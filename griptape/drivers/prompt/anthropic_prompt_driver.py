@@ -32,12 +32,14 @@ from griptape.common import (
 from griptape.drivers import BasePromptDriver
 from griptape.tokenizers import AnthropicTokenizer, BaseTokenizer
 from griptape.utils import import_optional_dependency
+from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
-    from anthropic import Client
-    from anthropic.types import ContentBlock, ContentBlockDeltaEvent, ContentBlockStartEvent
+    from anthropic import AsyncClient, Client
+    from anthropic.types import ContentBlock, ContentBlockDeltaEvent, ContentBlockStartEvent, RawMessageStreamEvent
+    from anthropic.types import Message as AnthropicMessage
 
     from griptape.tools.base_tool import BaseTool
 
@@ -50,6 +52,7 @@ class AnthropicPromptDriver(BasePromptDriver):
         api_key: Anthropic API key.
         model: Anthropic model name.
         client: Custom `Anthropic` client.
+        async_client: Custom `AsyncAnthropic` client, used by `arun` and `astream`. Created when it's first used.
     """
 
     api_key: Optional[str] = field(kw_only=True, default=None, metadata={"serializable": False})
@@ -61,6 +64,7 @@ class AnthropicPromptDriver(BasePromptDriver):
         ),
         kw_only=True,
     )
+    _async_client: Optional[AsyncClient] = field(default=None, kw_only=True, alias="async_client")
     tokenizer: BaseTokenizer = field(
         default=Factory(lambda self: AnthropicTokenizer(model=self.model), takes_self=True),
         kw_only=True,
@@ -71,27 +75,56 @@ class AnthropicPromptDriver(BasePromptDriver):
     use_native_tools: bool = field(default=True, kw_only=True, metadata={"serializable": True})
     max_tokens: int = field(default=1000, kw_only=True, metadata={"serializable": True})
 
+    @lazy_property()
+    def async_client(self) -> AsyncClient:
+        return import_optional_dependency("anthropic").AsyncAnthropic(api_key=self.api_key)
+
     @observable
     def try_run(self, prompt_stack: PromptStack) -> Message:
         response = self.client.messages.create(**self._base_params(prompt_stack))
 
-        return Message(
-            content=[self.__to_prompt_stack_message_content(content) for content in response.content],
-            role=Message.ASSISTANT_ROLE,
-            usage=Message.Usage(input_tokens=response.usage.input_tokens, output_tokens=response.usage.output_tokens),
-        )
+        return self.__to_message(response)
 
     @observable
     def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]:
         events = self.client.messages.create(**self._base_params(prompt_stack), stream=True)
 
         for event in events:
-            if event.type == "content_block_delta" or event.type == "content_block_start":
-                yield DeltaMessage(content=self.__to_prompt_stack_delta_message_content(event))
-            elif event.type == "message_start":
-                yield DeltaMessage(usage=DeltaMessage.Usage(input_tokens=event.message.usage.input_tokens))
-            elif event.type == "message_delta":
-                yield DeltaMessage(usage=DeltaMessage.Usage(output_tokens=event.usage.output_tokens))
+            delta_message = self.__to_delta_message(event)
+
+            if delta_message is not None:
+                yield delta_message
+
+    async def atry_run(self, prompt_stack: PromptStack) -> Message:
+        response = await self.async_client.messages.create(**self._base_params(prompt_stack))
+
+        return self.__to_message(response)
+
+    async def atry_stream(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        events = await self.async_client.messages.create(**self._base_params(prompt_stack), stream=True)
+
+        async for event in events:
+            delta_message = self.__to_delta_message(event)
+
+            if delta_message is not None:
+                yield delta_message
+
+    def __to_message(self, response: AnthropicMessage) -> Message:
+        return Message(
+            content=[self.__to_prompt_stack_message_content(content) for content in response.content],
+            role=Message.ASSISTANT_ROLE,
+            usage=Message.Usage(input_tokens=response.usage.input_tokens, output_tokens=response.usage.output_tokens),
+        )
+
+    def __to_delta_message(self, event: RawMessageStreamEvent) -> Optional[DeltaMessage]:
+        if event.type == "content_block_delta" or event.type == "content_block_start":
+            return DeltaMessage(content=self.__to_prompt_stack_delta_message_content(event))
+        elif event.type == "message_start":
+            return DeltaMessage(usage=DeltaMessage.Usage(input_tokens=event.message.usage.input_tokens))
+        elif event.type == "message_delta":
+            return DeltaMessage(usage=DeltaMessage.Usage(output_tokens=event.usage.output_tokens))
+        else:
+            return None
 
     def _base_params(self, prompt_stack: PromptStack) -> dict:
         messages = self.__to_anthropic_messages([i for i in prompt_stack.messages if not i.is_system()])
@@ -108,7 +141,10 @@ class AnthropicPromptDriver(BasePromptDriver):
             "max_tokens": self.max_tokens,
             "messages": messages,
             **(
-                {"tools": self.__to_anthropic_tools(prompt_stack.tools), "tool_choice": self.tool_choice}
+                {
+                    "tools": self._get_native_tools(prompt_stack.tools, self.__to_anthropic_tools),
+                    "tool_choice": self.tool_choice,
+                }
                 if prompt_stack.tools and self.use_native_tools
                 else {}
             ),
@@ -6,6 +6,7 @@ import openai
 from attrs import Factory, define, field
 
 from griptape.drivers import OpenAiChatPromptDriver
+from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
     from griptape.common import PromptStack
@@ -22,6 +23,7 @@ class AzureOpenAiChatPromptDriver(OpenAiChatPromptDriver):
         azure_ad_token_provider: An optional Azure Active Directory token provider.
         api_version: An Azure OpenAi API version.
         client: An `openai.AzureOpenAI` client.
+        async_client: An `openai.AsyncAzureOpenAI` client, used by `arun` and `astream`. Created when it's first used.
     """
 
     azure_deployment: str = field(
@@ -52,6 +54,18 @@ class AzureOpenAiChatPromptDriver(OpenAiChatPromptDriver):
         ),
     )
 
+    @lazy_property()
+    def async_client(self) -> openai.AsyncAzureOpenAI:
+        return openai.AsyncAzureOpenAI(
+            organization=self.organization,
+            api_key=self.api_key,
+            api_version=self.api_version,
+            azure_endpoint=self.azure_endpoint,
+            azure_deployment=self.azure_deployment,
+            azure_ad_token=self.azure_ad_token,
+            azure_ad_token_provider=self.azure_ad_token_provider,
+        )
+
     def _base_params(self, prompt_stack: PromptStack) -> dict:
         params = super()._base_params(prompt_stack)
         # TODO: Add `seed` parameter once Azure supports it.
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from attrs import Factory, define, field
 
@@ -18,11 +19,13 @@ from griptape.common import (
 )
 from griptape.events import CompletionChunkEvent, EventBus, FinishPromptEvent, StartPromptEvent
 from griptape.mixins import ExponentialBackoffMixin, SerializableMixin
+from griptape.utils import LruCache
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
     from griptape.tokenizers import BaseTokenizer
+    from griptape.tools import BaseTool
 
 
 @define(kw_only=True)
@@ -38,6 +41,7 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         tokenizer: An instance of `BaseTokenizer` to when calculating tokens.
         stream: Whether to stream the completion or not. `CompletionChunkEvent`s will be published to the `Structure` if one is provided.
         use_native_tools: Whether to use LLM's native function calling capabilities. Must be supported by the model.
+        native_tools_cache: Cache of the provider-specific tool definitions built for sets of Tools.
     """
 
     temperature: float = field(default=0.1, metadata={"serializable": True})
@@ -47,6 +51,9 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     tokenizer: BaseTokenizer
     stream: bool = field(default=False, kw_only=True, metadata={"serializable": True})
     use_native_tools: bool = field(default=False, kw_only=True, metadata={"serializable": True})
+    native_tools_cache: LruCache[tuple, Any] = field(
+        default=Factory(lambda: LruCache(max_size=32)), kw_only=True, eq=False
+    )
 
     def before_run(self, prompt_stack: PromptStack) -> None:
         EventBus.publish_event(StartPromptEvent(model=self.model, prompt_stack=prompt_stack))
@@ -67,7 +74,9 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
             with attempt:
                 self.before_run(prompt_stack)
 
-                result = self.__process_stream(prompt_stack) if self.stream else self.__process_run(prompt_stack)
+                with self.limit_rate(lambda: self.__estimate_token_count(prompt_stack)) as request:
+                    result = self.__process_stream(prompt_stack) if self.stream else self.__process_run(prompt_stack)
+                    request.token_count = self.__to_token_count(result)
 
                 self.after_run(result)
 
@@ -75,6 +84,63 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         else:
             raise Exception("prompt driver failed after all retry attempts")
 
+    @observable(tags=["PromptDriver.run()"])
+    async def arun(self, prompt_stack: PromptStack) -> Message:
+        """Runs the Prompt Driver in an asyncio event loop.
+
+        Drivers with asynchronous clients implement `atry_run` and `atry_stream`, so that many prompts can be run
+        concurrently without a thread per prompt.
+
+        Args:
+            prompt_stack: The Prompt Stack to run.
+
+        Returns:
+            The completion.
+        """
+        async for attempt in self.async_retrying():
+            with attempt:
+                self.before_run(prompt_stack)
+
+                async with self.alimit_rate(lambda: self.__estimate_token_count(prompt_stack)) as request:
+                    result = (
+                        await self.__aprocess_stream(prompt_stack) if self.stream else await self.atry_run(prompt_stack)
+                    )
+                    request.token_count = self.__to_token_count(result)
+
+                self.after_run(result)
+
+                return result
+        else:
+            raise Exception("prompt driver failed after all retry attempts")
+
+    async def astream(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        """Streams the completion of a Prompt Stack in an asyncio event loop.
+
+        Publishes the same Events as `run`. Unlike `arun`, failed streams are not retried, since their deltas have
+        already been yielded.
+
+        Args:
+            prompt_stack: The Prompt Stack to run.
+
+        Yields:
+            The deltas of the completion.
+        """
+        delta_contents: dict[int, list[BaseDeltaMessageContent]] = {}
+        usage = DeltaMessage.Usage()
+
+        self.before_run(prompt_stack)
+
+        async with self.alimit_rate(lambda: self.__estimate_token_count(prompt_stack)) as request:
+            async for message_delta in self.atry_stream(prompt_stack):
+                usage += self.__add_message_delta(delta_contents, message_delta)
+
+                yield message_delta
+
+            result = self.__build_message(list(delta_contents.values()), usage)
+            request.token_count = self.__to_token_count(result)
+
+        self.after_run(result)
+
     def prompt_stack_to_string(self, prompt_stack: PromptStack) -> str:
         """Converts a Prompt Stack to a string for token counting or model input.
 
@@ -104,9 +170,43 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
     @abstractmethod
     def try_run(self, prompt_stack: PromptStack) -> Message: ...
 
+    def _get_native_tools(self, tools: list[BaseTool], to_native_tools: Callable[[list[BaseTool]], Any]) -> Any:
+        """Returns the provider-specific definitions of Tools, building them only when a Tool's schema has changed.
+
+        Args:
+            tools: Tools to convert.
+            to_native_tools: Function that converts the Tools to the provider's tool definitions.
+        """
+        key = tuple(tool.schema_cache_key() for tool in tools)
+        native_tools = self.native_tools_cache.get(key)
+
+        if native_tools is None:
+            native_tools = to_native_tools(tools)
+            self.native_tools_cache.put(key, native_tools)
+
+        return native_tools
+
     @abstractmethod
     def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]: ...
 
+    async def atry_run(self, prompt_stack: PromptStack) -> Message:
+        """Runs `try_run` in a thread. Drivers with asynchronous clients should override this method."""
+        return await asyncio.to_thread(self.try_run, prompt_stack)
+
+    async def atry_stream(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        """Runs `try_stream` in a thread. Drivers with asynchronous clients should override this method."""
+        message_deltas = iter(self.try_stream(prompt_stack))
+
+        while (message_delta := await asyncio.to_thread(next, message_deltas, None)) is not None:
+            yield message_delta
+
+    def __estimate_token_count(self, prompt_stack: PromptStack) -> int:
+        """Estimates the tokens that a provider counts against its rate limits: the prompt and the maximum completion."""
+        return self.tokenizer.count_tokens(self.prompt_stack_to_string(prompt_stack)) + (self.max_tokens or 0)
+
+    def __to_token_count(self, result: Message) -> Optional[int]:
+        return None if result.usage.input_tokens is None else int(result.usage.total_tokens)
+
     def __process_run(self, prompt_stack: PromptStack) -> Message:
         return self.try_run(prompt_stack)
 
@@ -117,25 +217,41 @@ class BasePromptDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         # Aggregate all content deltas from the stream
         message_deltas = self.try_stream(prompt_stack)
         for message_delta in message_deltas:
-            usage += message_delta.usage
-            content = message_delta.content
-
-            if content is not None:
-                if content.index in delta_contents:
-                    delta_contents[content.index].append(content)
-                else:
-                    delta_contents[content.index] = [content]
-                if isinstance(content, TextDeltaMessageContent):
-                    EventBus.publish_event(CompletionChunkEvent(token=content.text))
-                elif isinstance(content, ActionCallDeltaMessageContent):
-                    if content.tag is not None and content.name is not None and content.path is not None:
-                        EventBus.publish_event(CompletionChunkEvent(token=str(content)))
-                    elif content.partial_input is not None:
-                        EventBus.publish_event(CompletionChunkEvent(token=content.partial_input))
+            usage += self.__add_message_delta(delta_contents, message_delta)
 
         # Build a complete content from the content deltas
         return self.__build_message(list(delta_contents.values()), usage)
 
+    async def __aprocess_stream(self, prompt_stack: PromptStack) -> Message:
+        delta_contents: dict[int, list[BaseDeltaMessageContent]] = {}
+        usage = DeltaMessage.Usage()
+
+        async for message_delta in self.atry_stream(prompt_stack):
+            usage += self.__add_message_delta(delta_contents, message_delta)
+
+        return self.__build_message(list(delta_contents.values()), usage)
+
+    def __add_message_delta(
+        self, delta_contents: dict[int, list[BaseDeltaMessageContent]], message_delta: DeltaMessage
+    ) -> DeltaMessage.Usage:
+        """Adds the content of a delta to `delta_contents`, publishes it, and returns the delta's usage."""
+        content = message_delta.content
+
+        if content is not None:
+            if content.index in delta_contents:
+                delta_contents[content.index].append(content)
+            else:
+                delta_contents[content.index] = [content]
+            if isinstance(content, TextDeltaMessageContent):
+                EventBus.publish_event(CompletionChunkEvent(token=content.text))
+            elif isinstance(content, ActionCallDeltaMessageContent):
+                if content.tag is not None and content.name is not None and content.path is not None:
+                    EventBus.publish_event(CompletionChunkEvent(token=str(content)))
+                elif content.partial_input is not None:
+                    EventBus.publish_event(CompletionChunkEvent(token=content.partial_input))
+
+        return message_delta.usage
+
     def __build_message(
         self, delta_contents: list[list[BaseDeltaMessageContent]], usage: DeltaMessage.Usage
     ) -> Message:
@@ -113,7 +113,10 @@ class CoherePromptDriver(BasePromptDriver):
             "max_tokens": self.max_tokens,
             **({"tool_results": tool_results} if tool_results else {}),
             **(
-                {"tools": self.__to_cohere_tools(prompt_stack.tools), "force_single_step": self.force_single_step}
+                {
+                    "tools": self._get_native_tools(prompt_stack.tools, self.__to_cohere_tools),
+                    "force_single_step": self.force_single_step,
+                }
                 if prompt_stack.tools and self.use_native_tools
                 else {}
             ),
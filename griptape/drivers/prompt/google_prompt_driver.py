@@ -138,7 +138,7 @@ class GooglePromptDriver(BasePromptDriver):
             ),
             **(
                 {
-                    "tools": self.__to_google_tools(prompt_stack.tools),
+                    "tools": self._get_native_tools(prompt_stack.tools, self.__to_google_tools),
                     "tool_config": {"function_calling_config": {"mode": self.tool_choice}},
                 }
                 if prompt_stack.tools and self.use_native_tools
@@ -98,7 +98,7 @@ class OllamaPromptDriver(BasePromptDriver):
             "model": self.model,
             "options": self.options,
             **(
-                {"tools": self.__to_ollama_tools(prompt_stack.tools)}
+                {"tools": self._get_native_tools(prompt_stack.tools, self.__to_ollama_tools)}
                 if prompt_stack.tools
                 and self.use_native_tools
                 and not self.stream  # Tool calling is only supported when not streaming
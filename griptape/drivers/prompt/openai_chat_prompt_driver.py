@@ -25,11 +25,13 @@ from griptape.common import (
 )
 from griptape.drivers import BasePromptDriver
 from griptape.tokenizers import BaseTokenizer, OpenAiTokenizer
+from griptape.utils.decorators import lazy_property
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
-    from openai.types.chat.chat_completion_chunk import ChoiceDelta
+    from openai.types.chat.chat_completion import ChatCompletion
+    from openai.types.chat.chat_completion_chunk import ChatCompletionChunk, ChoiceDelta
     from openai.types.chat.chat_completion_message import ChatCompletionMessage
 
     from griptape.tools import BaseTool
@@ -44,6 +46,7 @@ class OpenAiChatPromptDriver(BasePromptDriver):
         api_key: An optional OpenAi API key. If not provided, the `OPENAI_API_KEY` environment variable will be used.
         organization: An optional OpenAI organization. If not provided, the `OPENAI_ORG_ID` environment variable will be used.
         client: An `openai.OpenAI` client.
+        async_client: An `openai.AsyncOpenAI` client, used by `arun` and `astream`. Created when it's first used.
         model: An OpenAI model name.
         tokenizer: An `OpenAiTokenizer`.
         user: A user id. Can be used to track requests by user.
@@ -61,6 +64,7 @@ class OpenAiChatPromptDriver(BasePromptDriver):
             takes_self=True,
         ),
     )
+    _async_client: Optional[openai.AsyncOpenAI] = field(default=None, kw_only=True, alias="async_client")
     model: str = field(kw_only=True, metadata={"serializable": True})
     tokenizer: BaseTokenizer = field(
         default=Factory(lambda self: OpenAiTokenizer(model=self.model), takes_self=True),
@@ -89,10 +93,36 @@ class OpenAiChatPromptDriver(BasePromptDriver):
         kw_only=True,
     )
 
+    @lazy_property()
+    def async_client(self) -> openai.AsyncOpenAI:
+        return openai.AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, organization=self.organization)
+
     @observable
     def try_run(self, prompt_stack: PromptStack) -> Message:
         result = self.client.chat.completions.create(**self._base_params(prompt_stack))
 
+        return self.__to_message(result)
+
+    @observable
+    def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]:
+        result = self.client.chat.completions.create(**self._base_params(prompt_stack), stream=True)
+
+        for chunk in result:
+            yield from self.__to_delta_messages(chunk)
+
+    async def atry_run(self, prompt_stack: PromptStack) -> Message:
+        result = await self.async_client.chat.completions.create(**self._base_params(prompt_stack))
+
+        return self.__to_message(result)
+
+    async def atry_stream(self, prompt_stack: PromptStack) -> AsyncIterator[DeltaMessage]:
+        result = await self.async_client.chat.completions.create(**self._base_params(prompt_stack), stream=True)
+
+        async for chunk in result:
+            for delta_message in self.__to_delta_messages(chunk):
+                yield delta_message
+
+    def __to_message(self, result: ChatCompletion) -> Message:
         if len(result.choices) == 1:
             message = result.choices[0].message
 
@@ -107,23 +137,19 @@ class OpenAiChatPromptDriver(BasePromptDriver):
         else:
             raise Exception("Completion with more than one choice is not supported yet.")
 
-    @observable
-    def try_stream(self, prompt_stack: PromptStack) -> Iterator[DeltaMessage]:
-        result = self.client.chat.completions.create(**self._base_params(prompt_stack), stream=True)
-
-        for chunk in result:
-            if chunk.usage is not None:
-                yield DeltaMessage(
-                    usage=DeltaMessage.Usage(
-                        input_tokens=chunk.usage.prompt_tokens,
-                        output_tokens=chunk.usage.completion_tokens,
-                    ),
-                )
-            if chunk.choices:
-                choice = chunk.choices[0]
-                delta = choice.delta
+    def __to_delta_messages(self, chunk: ChatCompletionChunk) -> Iterator[DeltaMessage]:
+        if chunk.usage is not None:
+            yield DeltaMessage(
+                usage=DeltaMessage.Usage(
+                    input_tokens=chunk.usage.prompt_tokens,
+                    output_tokens=chunk.usage.completion_tokens,
+                ),
+            )
+        if chunk.choices:
+            choice = chunk.choices[0]
+            delta = choice.delta
 
-                yield DeltaMessage(content=self.__to_prompt_stack_delta_message_content(delta))
+            yield DeltaMessage(content=self.__to_prompt_stack_delta_message_content(delta))
 
     def _base_params(self, prompt_stack: PromptStack) -> dict:
         params = {
@@ -132,7 +158,10 @@ class OpenAiChatPromptDriver(BasePromptDriver):
             "user": self.user,
             "seed": self.seed,
             **(
-                {"tools": self.__to_openai_tools(prompt_stack.tools), "tool_choice": self.tool_choice}
+                {
+                    "tools": self._get_native_tools(prompt_stack.tools, self.__to_openai_tools),
+                    "tool_choice": self.tool_choice,
+                }
                 if prompt_stack.tools and self.use_native_tools
                 else {}
             ),
@@ -28,7 +28,8 @@ class BaseTextToSpeechDriver(SerializableMixin, ExponentialBackoffMixin, ABC):
         for attempt in self.retrying():
             with attempt:
                 self.before_run(prompts)
-                result = self.try_text_to_audio(prompts)
+                with self.limit_rate():
+                    result = self.try_text_to_audio(prompts)
                 self.after_run()
 
                 return result
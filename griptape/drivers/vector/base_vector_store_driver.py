@@ -13,11 +13,23 @@ from griptape.mixins import FuturesExecutorMixin, SerializableMixin
 
 if TYPE_CHECKING:
     from griptape.drivers import BaseEmbeddingDriver
+    from griptape.utils import LruCache
 
 
 @define
 class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
+    """Base Vector Store Driver.
+
+    Attributes:
+        embedding_driver: Embedding Driver used to embed text artifacts and queries.
+        entry_cache: Optional cache of the namespaces and vector ids this driver has upserted or found to exist. Text
+            upserts skip the `does_entry_exist` round trip for cached entries. Entries are not evicted by
+            `delete_vector`, so clear the cache after deleting vectors that may be upserted again.
+        upsert_batch_size: Maximum number of vectors written per request by `upsert_vectors`.
+    """
+
     DEFAULT_QUERY_COUNT = 5
+    DEFAULT_UPSERT_BATCH_SIZE = 100
 
     @dataclass
     class Entry:
@@ -35,6 +47,8 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
             return BaseArtifact.from_json(self.meta["artifact"])  # pyright: ignore[reportOptionalSubscript]
 
     embedding_driver: BaseEmbeddingDriver = field(kw_only=True, metadata={"serializable": True})
+    entry_cache: Optional[LruCache[tuple[Optional[str], str], str]] = field(default=None, kw_only=True)
+    upsert_batch_size: int = field(default=DEFAULT_UPSERT_BATCH_SIZE, kw_only=True)
 
     def upsert_text_artifacts(
         self,
@@ -43,28 +57,44 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         meta: Optional[dict] = None,
         **kwargs,
     ) -> None:
-        if isinstance(artifacts, list):
-            utils.execute_futures_list(
-                [
-                    self.futures_executor.submit(self.upsert_text_artifact, a, namespace=None, meta=meta, **kwargs)
-                    for a in artifacts
-                ],
+        namespaced_artifacts = {None: artifacts} if isinstance(artifacts, list) else artifacts
+        new_artifacts = {}
+
+        for namespace, artifact_list in namespaced_artifacts.items():
+            # Artifacts that share a namespace and vector id are only checked and upserted once.
+            pending = {self._get_artifact_vector_id(artifact): artifact for artifact in artifact_list}
+            exists = self._does_entries_exist_cached(list(pending.keys()), namespace=namespace)
+
+            new_artifacts.update(
+                {
+                    (namespace, vector_id): artifact
+                    for (vector_id, artifact), exist in zip(pending.items(), exists)
+                    if not exist
+                }
             )
-        else:
-            futures_dict = {}
 
-            for namespace, artifact_list in artifacts.items():
-                for a in artifact_list:
-                    if not futures_dict.get(namespace):
-                        futures_dict[namespace] = []
+        # Embed every distinct new value with as few embedding requests as possible.
+        values = list(
+            dict.fromkeys(str(artifact.value) for artifact in new_artifacts.values() if artifact.embedding is None)
+        )
+        embeddings = dict(zip(values, self.embedding_driver.embed_strings(values)))
 
-                    futures_dict[namespace].append(
-                        self.futures_executor.submit(
-                            self.upsert_text_artifact, a, namespace=namespace, meta=meta, **kwargs
-                        )
-                    )
+        self.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(
+                    id=vector_id,
+                    vector=artifact.embedding or embeddings[str(artifact.value)],
+                    namespace=namespace,
+                    meta={**(meta or {}), "artifact": artifact.to_json()},
+                )
+                for (namespace, vector_id), artifact in new_artifacts.items()
+            ],
+            **kwargs,
+        )
 
-            utils.execute_futures_list_dict(futures_dict)
+        if self.entry_cache is not None:
+            for key in new_artifacts:
+                self.entry_cache.put(key, key[1])
 
     def upsert_text_artifact(
         self,
@@ -78,10 +108,9 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         meta = {} if meta is None else meta
 
         if vector_id is None:
-            value = artifact.to_text() if artifact.reference is None else artifact.to_text() + str(artifact.reference)
-            vector_id = self._get_default_vector_id(value)
+            vector_id = self._get_artifact_vector_id(artifact)
 
-        if self.does_entry_exist(vector_id, namespace=namespace):
+        if self._does_entry_exist_cached(vector_id, namespace=namespace):
             return vector_id
         else:
             meta["artifact"] = artifact.to_json()
@@ -89,7 +118,12 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
             vector = artifact.embedding or artifact.generate_embedding(self.embedding_driver)
 
             if isinstance(vector, list):
-                return self.upsert_vector(vector, vector_id=vector_id, namespace=namespace, meta=meta, **kwargs)
+                vector_id = self.upsert_vector(vector, vector_id=vector_id, namespace=namespace, meta=meta, **kwargs)
+
+                if self.entry_cache is not None:
+                    self.entry_cache.put((namespace, vector_id), vector_id)
+
+                return vector_id
             else:
                 raise ValueError("Vector must be an instance of 'list'.")
 
@@ -104,10 +138,10 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
     ) -> str:
         vector_id = self._get_default_vector_id(string) if vector_id is None else vector_id
 
-        if self.does_entry_exist(vector_id, namespace=namespace):
+        if self._does_entry_exist_cached(vector_id, namespace=namespace):
             return vector_id
         else:
-            return self.upsert_vector(
+            vector_id = self.upsert_vector(
                 self.embedding_driver.embed_string(string),
                 vector_id=vector_id,
                 namespace=namespace,
@@ -115,6 +149,65 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
                 **kwargs,
             )
 
+            if self.entry_cache is not None:
+                self.entry_cache.put((namespace, vector_id), vector_id)
+
+            return vector_id
+
+    def upsert_vectors(self, entries: list[Entry], **kwargs) -> list[str]:
+        """Inserts or updates many vectors.
+
+        The default implementation upserts every chunk of `upsert_batch_size` entries concurrently with
+        `upsert_vector`. Drivers whose store has a bulk write API should override this.
+
+        Args:
+            entries: Entries to upsert. `id`, `vector`, `namespace`, and `meta` are used.
+            **kwargs: Additional arguments passed to every upsert.
+
+        Returns:
+            The ids of the upserted vectors, in the same order as `entries`.
+        """
+        vector_ids = []
+
+        for start in range(0, len(entries), self.upsert_batch_size):
+            vector_ids.extend(
+                utils.execute_futures_list(
+                    [
+                        self.futures_executor.submit(
+                            self.upsert_vector,
+                            entry.vector,  # pyright: ignore[reportArgumentType]
+                            vector_id=entry.id,
+                            namespace=entry.namespace,
+                            meta=entry.meta,
+                            **kwargs,
+                        )
+                        for entry in entries[start : start + self.upsert_batch_size]
+                    ]
+                )
+            )
+
+        return vector_ids
+
+    def does_entries_exist(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> list[bool]:
+        """Checks which of many vector ids already exist.
+
+        The default implementation calls `does_entry_exist` concurrently. Drivers whose store can look up many ids in
+        one request should override this.
+
+        Args:
+            vector_ids: Vector ids to check.
+            namespace: Optional namespace of the vectors.
+
+        Returns:
+            Whether each vector id exists, in the same order as `vector_ids`.
+        """
+        return utils.execute_futures_list(
+            [
+                self.futures_executor.submit(self.does_entry_exist, vector_id, namespace=namespace)
+                for vector_id in vector_ids
+            ]
+        )
+
     def does_entry_exist(self, vector_id: str, *, namespace: Optional[str] = None) -> bool:
         try:
             return self.load_entry(vector_id, namespace=namespace) is not None
@@ -158,5 +251,37 @@ class BaseVectorStoreDriver(SerializableMixin, FuturesExecutorMixin, ABC):
         **kwargs,
     ) -> list[Entry]: ...
 
+    def _does_entry_exist_cached(self, vector_id: str, *, namespace: Optional[str] = None) -> bool:
+        if self.entry_cache is None:
+            return self.does_entry_exist(vector_id, namespace=namespace)
+        elif self.entry_cache.get((namespace, vector_id)) is not None:
+            return True
+        elif self.does_entry_exist(vector_id, namespace=namespace):
+            self.entry_cache.put((namespace, vector_id), vector_id)
+
+            return True
+        else:
+            return False
+
+    def _does_entries_exist_cached(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> list[bool]:
+        if self.entry_cache is None:
+            return self.does_entries_exist(vector_ids, namespace=namespace) if vector_ids else []
+
+        exists = {vector_id: self.entry_cache.get((namespace, vector_id)) is not None for vector_id in vector_ids}
+        unknown = [vector_id for vector_id, exist in exists.items() if not exist]
+
+        if unknown:
+            for vector_id, exist in zip(unknown, self.does_entries_exist(unknown, namespace=namespace)):
+                if exist:
+                    self.entry_cache.put((namespace, vector_id), vector_id)
+                    exists[vector_id] = True
+
+        return [exists[vector_id] for vector_id in vector_ids]
+
     def _get_default_vector_id(self, value: str) -> str:
         return str(uuid.uuid5(uuid.NAMESPACE_OID, value))
+
+    def _get_artifact_vector_id(self, artifact: TextArtifact) -> str:
+        value = artifact.to_text() if artifact.reference is None else artifact.to_text() + str(artifact.reference)
+
+        return self._get_default_vector_id(value)
@@ -47,6 +47,15 @@ class GriptapeCloudKnowledgeBaseVectorStoreDriver(BaseVectorStoreDriver):
     ) -> str:
         raise NotImplementedError(f"{self.__class__.__name__} does not support vector upsert.")
 
+    def upsert_text_artifacts(
+        self,
+        artifacts: list[TextArtifact] | dict[str, list[TextArtifact]],
+        *,
+        meta: Optional[dict] = None,
+        **kwargs,
+    ) -> None:
+        raise NotImplementedError(f"{self.__class__.__name__} does not support text artifact upsert.")
+
     def upsert_text_artifact(
         self,
         artifact: TextArtifact,
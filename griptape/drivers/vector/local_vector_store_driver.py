@@ -4,9 +4,10 @@ import json
 import operator
 import os
 import threading
-from dataclasses import asdict
-from typing import Callable, NoReturn, Optional, TextIO
+from dataclasses import asdict, replace
+from typing import TYPE_CHECKING, Any, Callable, Literal, NoReturn, Optional, TextIO
 
+import numpy as np
 from attrs import Factory, define, field
 from numpy import dot
 from numpy.linalg import norm
@@ -14,13 +15,64 @@ from numpy.linalg import norm
 from griptape import utils
 from griptape.drivers import BaseVectorStoreDriver
 
+if TYPE_CHECKING:
+    from attrs import Attribute
+
+    from griptape.vector_indexes import BaseVectorIndex
+
+
+def cosine_relatedness(x: Any, y: Any) -> float:
+    return dot(x, y) / (norm(x) * norm(y))
+
 
 @define(kw_only=True)
 class LocalVectorStoreDriver(BaseVectorStoreDriver):
+    """Local Vector Store Driver.
+
+    Attributes:
+        entries: Entries keyed by their namespaced vector id.
+        persist_file: Optional path to a file used to persist entries.
+        persist_format: Format of `persist_file`. `json` rewrites a single JSON document on every upsert.
+            `binary` appends each upsert to a JSON Lines metadata log at `persist_file` and a raw float32 vector block
+            at `persist_file` + `.vectors`, which is memory-mapped when the store is reopened.
+        compaction_ratio: Ratio of overwritten to live rows in the `binary` vector block that triggers a compaction.
+        relatedness_fn: Function used to score an entry vector against a query vector.
+        use_matrix_index: Whether to maintain a contiguous float32 matrix of all vectors so that queries scored with
+            the default cosine `relatedness_fn` run as a single batched matrix-vector product.
+            Custom `relatedness_fn`s always fall back to scoring entries one by one.
+        vector_index: Optional approximate nearest neighbour index used for queries with a `count` and the default
+            cosine `relatedness_fn`. The index is synced with `entries` when the driver is created, which adds missing
+            entries and deletes stale keys, for instance from a persisted index, and is then kept in step by
+            `upsert_vector`.
+    """
+
     entries: dict[str, BaseVectorStoreDriver.Entry] = field(factory=dict)
     persist_file: Optional[str] = field(default=None)
-    relatedness_fn: Callable = field(default=lambda x, y: dot(x, y) / (norm(x) * norm(y)))
+    persist_format: Literal["json", "binary"] = field(default="json")
+    compaction_ratio: float = field(default=0.5)
+    relatedness_fn: Callable = field(default=cosine_relatedness)
+    use_matrix_index: bool = field(default=True)
+    vector_index: Optional[BaseVectorIndex] = field(default=None)
     thread_lock: threading.Lock = field(default=Factory(lambda: threading.Lock()))
+    _matrix: Optional[np.ndarray] = field(default=None, init=False, eq=False)
+    _matrix_norms: np.ndarray = field(factory=lambda: np.empty(0, dtype=np.float32), init=False, eq=False)
+    _matrix_namespace_codes: np.ndarray = field(factory=lambda: np.empty(0, dtype=np.int32), init=False, eq=False)
+    _matrix_keys: list[str] = field(factory=list, init=False, eq=False)
+    _matrix_rows: dict[str, int] = field(factory=dict, init=False, eq=False)
+    _matrix_namespaces: dict[Optional[str], int] = field(factory=dict, init=False, eq=False)
+    _matrix_source: Optional[dict] = field(default=None, init=False, eq=False)
+    _persisted_rows: dict[str, int] = field(factory=dict, init=False, eq=False)
+    _persisted_row_count: int = field(default=0, init=False, eq=False)
+    _persisted_dimensions: Optional[int] = field(default=None, init=False, eq=False)
+
+    @persist_format.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_persist_format(self, _: Attribute, persist_format: str) -> None:
+        if persist_format not in ("json", "binary"):
+            raise ValueError("persist_format must be either 'json' or 'binary'")
+
+    @property
+    def vectors_file(self) -> Optional[str]:
+        return None if self.persist_file is None else f"{self.persist_file}.vectors"
 
     def __attrs_post_init__(self) -> None:
         if self.persist_file is not None:
@@ -29,15 +81,21 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
             if directory and not os.path.exists(directory):
                 os.makedirs(directory)
 
-            if not os.path.isfile(self.persist_file):
-                with open(self.persist_file, "w") as file:
-                    self.__save_entries_to_file(file)
+            if self.persist_format == "binary":
+                self.__load_entries_from_binary_files()
+            else:
+                if not os.path.isfile(self.persist_file):
+                    with open(self.persist_file, "w") as file:
+                        self.__save_entries_to_file(file)
 
-            with open(self.persist_file, "r+") as file:
-                if os.path.getsize(self.persist_file) > 0:
-                    self.entries = self.load_entries_from_file(file)
-                else:
-                    self.__save_entries_to_file(file)
+                with open(self.persist_file, "r+") as file:
+                    if os.path.getsize(self.persist_file) > 0:
+                        self.entries = self.load_entries_from_file(file)
+                    else:
+                        self.__save_entries_to_file(file)
+
+        if self.vector_index is not None:
+            self.__sync_vector_index(self.vector_index)
 
     def load_entries_from_file(self, json_file: TextIO) -> dict[str, BaseVectorStoreDriver.Entry]:
         with self.thread_lock:
@@ -55,28 +113,43 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
         **kwargs,
     ) -> str:
         vector_id = vector_id or utils.str_to_hash(str(vector))
+        key = self.__namespaced_vector_id(vector_id, namespace=namespace)
 
         with self.thread_lock:
-            self.entries[self.__namespaced_vector_id(vector_id, namespace=namespace)] = self.Entry(
+            entry = self.Entry(
                 id=vector_id,
                 vector=vector,
                 meta=meta,
                 namespace=namespace,
             )
 
-        if self.persist_file is not None:
-            # TODO: optimize later since it reserializes all entries from memory and stores them in the JSON file
-            #  every time a new vector is inserted
+            if self.persist_file is not None and self.persist_format == "binary":
+                self.__append_entry_to_binary_files(key, entry)
+
+            self.entries[key] = entry
+
+            self.__upsert_matrix_row(key, entry)
+
+            if self.vector_index is not None:
+                self.vector_index.upsert(key, vector, namespace=namespace)
+
+        if self.persist_file is not None and self.persist_format == "json":
             with open(self.persist_file, "w") as file:
                 self.__save_entries_to_file(file)
 
         return vector_id
 
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
-        return self.entries.get(self.__namespaced_vector_id(vector_id, namespace=namespace), None)
+        entry = self.entries.get(self.__namespaced_vector_id(vector_id, namespace=namespace), None)
+
+        return None if entry is None else self.__with_list_vector(entry)
 
     def load_entries(self, *, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
-        return [entry for key, entry in self.entries.items() if namespace is None or entry.namespace == namespace]
+        return [
+            self.__with_list_vector(entry)
+            for key, entry in self.entries.items()
+            if namespace is None or entry.namespace == namespace
+        ]
 
     def query(
         self,
@@ -89,21 +162,30 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
     ) -> list[BaseVectorStoreDriver.Entry]:
         query_embedding = self.embedding_driver.embed_string(query)
 
-        if namespace:
-            entries = {k: v for (k, v) in self.entries.items() if k.startswith(f"{namespace}-")}
-        else:
-            entries = self.entries
+        entries_and_relatednesses = self.__query_vector_index(query_embedding, count=count, namespace=namespace)
 
-        entries_and_relatednesses = [
-            (entry, self.relatedness_fn(query_embedding, entry.vector)) for entry in list(entries.values())
-        ]
+        if entries_and_relatednesses is None:
+            entries_and_relatednesses = self.__query_matrix(query_embedding, count=count, namespace=namespace)
+
+        if entries_and_relatednesses is None:
+            entries = [entry for entry in list(self.entries.values()) if not namespace or entry.namespace == namespace]
+
+            entries_and_relatednesses = [
+                (entry, self.relatedness_fn(query_embedding, entry.vector)) for entry in entries
+            ]
 
-        entries_and_relatednesses.sort(key=operator.itemgetter(1), reverse=True)
+            entries_and_relatednesses.sort(key=operator.itemgetter(1), reverse=True)
+            entries_and_relatednesses = entries_and_relatednesses[:count]
 
         result = [
-            BaseVectorStoreDriver.Entry(id=er[0].id, vector=er[0].vector, score=er[1], meta=er[0].meta)
+            BaseVectorStoreDriver.Entry(
+                id=er[0].id,
+                vector=er[0].vector.tolist() if isinstance(er[0].vector, np.ndarray) else er[0].vector,
+                score=er[1],
+                meta=er[0].meta,
+            )
             for er in entries_and_relatednesses
-        ][:count]
+        ]
 
         if include_vectors:
             return result
@@ -116,6 +198,330 @@ class LocalVectorStoreDriver(BaseVectorStoreDriver):
     def delete_vector(self, vector_id: str) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
 
+    def compact(self) -> None:
+        """Rewrites the `binary` persist files so that they only contain the latest version of every entry."""
+        if self.persist_file is not None and self.persist_format == "binary":
+            with self.thread_lock:
+                self.__compact_binary_files()
+
+    def __load_entries_from_binary_files(self) -> None:
+        persist_file, vectors_file = self.persist_file, self.vectors_file
+
+        if persist_file is None or vectors_file is None:
+            return
+
+        if not os.path.isfile(persist_file):
+            open(persist_file, "w").close()
+
+        records = self.__read_binary_log(persist_file)
+        dimensions = self._persisted_dimensions
+
+        if not dimensions or not os.path.isfile(vectors_file):
+            return
+
+        row_count = os.path.getsize(vectors_file) // (dimensions * np.dtype(np.float32).itemsize)
+
+        if row_count == 0:
+            return
+
+        vectors = np.memmap(vectors_file, dtype=np.float32, mode="r", shape=(row_count, dimensions))
+        entries = {}
+
+        for record in records:
+            row = record["row"]
+
+            if row >= row_count:
+                break
+
+            # Vectors stay memory-mapped until they're loaded or queried, which converts them to lists.
+            entries[record["key"]] = BaseVectorStoreDriver.Entry(
+                id=record["id"],
+                vector=vectors[row],  # pyright: ignore[reportArgumentType]
+                meta=record["meta"],
+                namespace=record["namespace"],
+            )
+            self._persisted_rows[record["key"]] = row
+
+        self._persisted_row_count = row_count
+        self.entries = entries
+
+        if self.use_matrix_index and entries:
+            rows = list(self._persisted_rows.values())
+
+            if rows == list(range(row_count)):
+                # Copy-on-write so that in-place row updates never reach the file.
+                matrix = np.memmap(vectors_file, dtype=np.float32, mode="c", shape=(row_count, dimensions))
+            else:
+                matrix = vectors[rows]
+
+            self.__set_matrix(matrix)
+
+    def __read_binary_log(self, persist_file: str) -> list[dict]:
+        records = []
+
+        with open(persist_file) as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn trailing write; every complete record before it is still valid.
+                    break
+
+                if "dimensions" in record:
+                    self._persisted_dimensions = record["dimensions"]
+                else:
+                    records.append(record)
+
+        return records
+
+    def __append_entry_to_binary_files(self, key: str, entry: BaseVectorStoreDriver.Entry) -> None:
+        """Appends an entry to the `binary` persist files. Must be called under `thread_lock`."""
+        persist_file, vectors_file = self.persist_file, self.vectors_file
+
+        if persist_file is None or vectors_file is None:
+            return
+
+        vector = np.asarray(entry.vector, dtype=np.float32)
+
+        if vector.ndim != 1:
+            raise ValueError("Vector must be one-dimensional.")
+
+        if self._persisted_dimensions is None:
+            self._persisted_dimensions = vector.shape[0]
+
+            with open(persist_file, "a") as file:
+                file.write(json.dumps({"dimensions": self._persisted_dimensions}) + "\n")
+        elif vector.shape[0] != self._persisted_dimensions:
+            raise ValueError(
+                f"Vector has {vector.shape[0]} dimensions but the persist file stores {self._persisted_dimensions}."
+            )
+
+        with open(vectors_file, "ab") as file:
+            file.write(vector.tobytes())
+
+        row = self._persisted_row_count
+        self._persisted_row_count += 1
+
+        with open(persist_file, "a") as file:
+            file.write(self.__binary_record(key, entry, row) + "\n")
+
+        self._persisted_rows[key] = row
+
+        dead_rows = self._persisted_row_count - len(self._persisted_rows)
+
+        if dead_rows > 0 and dead_rows >= self.compaction_ratio * len(self._persisted_rows):
+            self.entries[key] = entry
+            self.__compact_binary_files()
+
+    def __compact_binary_files(self) -> None:
+        """Rewrites the `binary` persist files from `entries`. Must be called under `thread_lock`."""
+        persist_file, vectors_file = self.persist_file, self.vectors_file
+
+        if persist_file is None or vectors_file is None or self._persisted_dimensions is None:
+            return
+
+        rows = {}
+
+        with open(f"{vectors_file}.tmp", "wb") as vectors, open(f"{persist_file}.tmp", "w") as log:
+            log.write(json.dumps({"dimensions": self._persisted_dimensions}) + "\n")
+
+            for row, (key, entry) in enumerate(self.entries.items()):
+                vectors.write(np.asarray(entry.vector, dtype=np.float32).tobytes())
+                log.write(self.__binary_record(key, entry, row) + "\n")
+                rows[key] = row
+
+        os.replace(f"{vectors_file}.tmp", vectors_file)
+        os.replace(f"{persist_file}.tmp", persist_file)
+
+        self._persisted_rows = rows
+        self._persisted_row_count = len(rows)
+
+    def __with_list_vector(self, entry: BaseVectorStoreDriver.Entry) -> BaseVectorStoreDriver.Entry:
+        """Returns the entry with its vector as a list if it is a row of the memory-mapped `binary` vectors file."""
+        if isinstance(entry.vector, np.ndarray):
+            return replace(entry, vector=entry.vector.tolist())
+
+        return entry
+
+    def __binary_record(self, key: str, entry: BaseVectorStoreDriver.Entry, row: int) -> str:
+        return json.dumps({"key": key, "row": row, "id": entry.id, "namespace": entry.namespace, "meta": entry.meta})
+
+    def __query_vector_index(
+        self, query_embedding: list[float], *, count: Optional[int], namespace: Optional[str]
+    ) -> Optional[list[tuple[BaseVectorStoreDriver.Entry, float]]]:
+        if self.vector_index is None or count is None or self.relatedness_fn is not cosine_relatedness:
+            return None
+
+        return [
+            (self.entries[key], score)
+            for key, score in self.vector_index.query(query_embedding, count=count, namespace=namespace or None)
+        ]
+
+    def __sync_vector_index(self, vector_index: BaseVectorIndex) -> None:
+        """Adds the entries that are missing from the vector index and deletes the keys that aren't in `entries`."""
+        with self.thread_lock:
+            for key in vector_index.keys() - self.entries.keys():
+                vector_index.delete(key)
+
+            for key, entry in self.entries.items():
+                if key not in vector_index:
+                    vector_index.upsert(key, entry.vector, namespace=entry.namespace)  # pyright: ignore[reportArgumentType]
+
+    def __query_matrix(
+        self, query_embedding: list[float], *, count: Optional[int], namespace: Optional[str]
+    ) -> Optional[list[tuple[BaseVectorStoreDriver.Entry, float]]]:
+        """Scores all entries with a single matrix-vector product.
+
+        Returns:
+            Top `count` entries and their scores, or `None` if the matrix index can't be used for this query.
+        """
+        if not self.use_matrix_index or self.relatedness_fn is not cosine_relatedness:
+            return None
+
+        with self.thread_lock:
+            if not self.__ensure_matrix():
+                return None
+
+            size = len(self._matrix_keys)
+            matrix = self._matrix[:size]  # pyright: ignore[reportOptionalSubscript]
+            norms = self._matrix_norms[:size]
+            keys = self._matrix_keys
+
+            if namespace:
+                code = self._matrix_namespaces.get(namespace)
+                rows = (
+                    np.empty(0, dtype=np.intp)
+                    if code is None
+                    else np.flatnonzero(self._matrix_namespace_codes[:size] == code)
+                )
+            else:
+                rows = None
+
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
+
+        if query_vector.ndim != 1 or query_vector.shape[0] != matrix.shape[1]:
+            return None
+
+        if rows is not None:
+            matrix = matrix[rows]
+            norms = norms[rows]
+        else:
+            rows = np.arange(size)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = (matrix @ query_vector) / (norms * np.linalg.norm(query_vector))
+
+        top_count = len(scores) if count is None else max(min(count, len(scores)), 0)
+
+        if top_count == 0:
+            return []
+        elif top_count < len(scores):
+            candidates = np.argpartition(-scores, top_count - 1)[:top_count]
+        else:
+            candidates = np.arange(len(scores))
+
+        # Sort by descending score, breaking ties by insertion order like the stable sort in the fallback path.
+        order = candidates[np.lexsort((candidates, -scores[candidates]))]
+
+        return [(self.entries[keys[rows[i]]], float(scores[i])) for i in order]
+
+    def __ensure_matrix(self) -> bool:
+        """Builds the matrix index from `entries` if it's missing or out of sync. Must be called under `thread_lock`.
+
+        Returns:
+            Whether the matrix index is usable.
+        """
+        if (
+            self._matrix is not None
+            and self._matrix_source is self.entries
+            and len(self._matrix_keys) == len(self.entries)
+        ):
+            return True
+
+        self.__reset_matrix()
+
+        if not self.entries:
+            return False
+
+        vectors = [entry.vector for entry in self.entries.values()]
+
+        try:
+            matrix = np.asarray(vectors, dtype=np.float32)
+        except (TypeError, ValueError):
+            return False
+
+        if matrix.ndim != 2:
+            return False
+
+        self.__set_matrix(np.ascontiguousarray(matrix))
+
+        return True
+
+    def __set_matrix(self, matrix: np.ndarray) -> None:
+        """Sets the matrix index to `matrix`, whose rows must line up with `entries`."""
+        self.__reset_matrix()
+
+        self._matrix = matrix
+        self._matrix_norms = np.linalg.norm(matrix, axis=1).astype(np.float32)
+        self._matrix_keys = list(self.entries.keys())
+        self._matrix_rows = {key: row for row, key in enumerate(self._matrix_keys)}
+        self._matrix_namespace_codes = np.fromiter(
+            (self.__namespace_code(entry.namespace) for entry in self.entries.values()),
+            dtype=np.int32,
+            count=len(self.entries),
+        )
+        self._matrix_source = self.entries
+
+    def __upsert_matrix_row(self, key: str, entry: BaseVectorStoreDriver.Entry) -> None:
+        """Writes an entry into the matrix index. Must be called under `thread_lock`.
+
+        The index is only maintained once it has been built by a query; any entry that doesn't fit the matrix
+        invalidates it so that the next query rebuilds it or falls back to scoring entries one by one.
+        """
+        if self._matrix is None or self._matrix_source is not self.entries:
+            return
+
+        vector = np.asarray(entry.vector, dtype=np.float32)
+
+        if vector.ndim != 1 or vector.shape[0] != self._matrix.shape[1]:
+            self.__reset_matrix()
+
+            return
+
+        row = self._matrix_rows.get(key)
+
+        if row is None:
+            row = len(self._matrix_keys)
+
+            if row == len(self._matrix):
+                self.__grow_matrix(max(row * 2, 1))
+
+            self._matrix_keys.append(key)
+            self._matrix_rows[key] = row
+
+        self._matrix[row] = vector
+        self._matrix_norms[row] = np.linalg.norm(vector)
+        self._matrix_namespace_codes[row] = self.__namespace_code(entry.namespace)
+
+    def __grow_matrix(self, capacity: int) -> None:
+        matrix = np.empty((capacity, self._matrix.shape[1]), dtype=np.float32)  # pyright: ignore[reportOptionalMemberAccess]
+        matrix[: len(self._matrix)] = self._matrix  # pyright: ignore[reportArgumentType]
+        self._matrix = matrix
+        self._matrix_norms = np.resize(self._matrix_norms, capacity)
+        self._matrix_namespace_codes = np.resize(self._matrix_namespace_codes, capacity)
+
+    def __reset_matrix(self) -> None:
+        self._matrix = None
+        self._matrix_norms = np.empty(0, dtype=np.float32)
+        self._matrix_namespace_codes = np.empty(0, dtype=np.int32)
+        self._matrix_keys = []
+        self._matrix_rows = {}
+        self._matrix_namespaces = {}
+        self._matrix_source = None
+
+    def __namespace_code(self, namespace: Optional[str]) -> int:
+        return self._matrix_namespaces.setdefault(namespace, len(self._matrix_namespaces))
+
     def __save_entries_to_file(self, json_file: TextIO) -> None:
         with self.thread_lock:
             serialized_data = {k: asdict(v) for k, v in self.entries.items()}
@@ -71,6 +71,24 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
         else:
             raise ValueError(f"Failed to upsert text: {response}")
 
+    def upsert_text_artifacts(
+        self,
+        artifacts: list[TextArtifact] | dict[str, list[TextArtifact]],
+        *,
+        meta: Optional[dict] = None,
+        **kwargs,
+    ) -> None:
+        """Upsert text artifacts into the Marqo index one by one, since Marqo generates the embeddings."""
+        namespaced_artifacts = {None: artifacts} if isinstance(artifacts, list) else artifacts
+
+        utils.execute_futures_list(
+            [
+                self.futures_executor.submit(self.upsert_text_artifact, a, namespace=namespace, meta=meta, **kwargs)
+                for namespace, artifact_list in namespaced_artifacts.items()
+                for a in artifact_list
+            ]
+        )
+
     def upsert_text_artifact(
         self,
         artifact: TextArtifact,
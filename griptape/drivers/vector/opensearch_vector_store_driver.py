@@ -67,6 +67,47 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
 
         return response["_id"]
 
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Inserts or updates vectors in OpenSearch with one `_bulk` request per `upsert_batch_size` entries."""
+        vector_ids = []
+
+        for start in range(0, len(entries), self.upsert_batch_size):
+            body = []
+
+            for entry in entries[start : start + self.upsert_batch_size]:
+                doc = {"vector": entry.vector, "namespace": entry.namespace, "metadata": entry.meta}
+                doc.update(kwargs)
+
+                body.append({"index": self._get_bulk_action(entry.id or utils.str_to_hash(str(entry.vector)))})
+                body.append(doc)
+
+            response = self.client.bulk(body=body)
+
+            if response.get("errors"):
+                errors = [item["index"]["error"] for item in response["items"] if "error" in item["index"]]
+
+                raise RuntimeError(f"Failed to upsert vectors: {errors}")
+
+            vector_ids.extend(item["index"]["_id"] for item in response["items"])
+
+        return vector_ids
+
+    def does_entries_exist(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> list[bool]:
+        """Checks which vector ids exist in OpenSearch with a single `_mget` request."""
+        try:
+            response = self.client.mget(
+                index=self.index_name, body={"ids": vector_ids}, params={"_source_includes": "namespace"}
+            )
+        except Exception as e:
+            logging.exception("Error while checking entries: %s", e)
+
+            return [False] * len(vector_ids)
+
+        return [
+            doc.get("found", False) and (not namespace or doc["_source"].get("namespace") == namespace)
+            for doc in response["docs"]
+        ]
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Retrieves a specific vector entry from OpenSearch based on its identifier and optional namespace.
 
@@ -164,5 +205,8 @@ class OpenSearchVectorStoreDriver(BaseVectorStoreDriver):
             for hit in response["hits"]["hits"]
         ]
 
+    def _get_bulk_action(self, vector_id: str) -> dict:
+        return {"_index": self.index_name, "_id": vector_id}
+
     def delete_vector(self, vector_id: str) -> NoReturn:
         raise NotImplementedError(f"{self.__class__.__name__} does not support deletion.")
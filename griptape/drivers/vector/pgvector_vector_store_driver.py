@@ -102,6 +102,49 @@ class PgVectorVectorStoreDriver(BaseVectorStoreDriver):
 
             return str(getattr(obj, "id"))
 
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Inserts or updates vectors with one multi-row `INSERT ... ON CONFLICT` statement per batch."""
+        sqlalchemy_dialects_postgresql = import_optional_dependency("sqlalchemy.dialects.postgresql")
+        rows = [
+            {
+                "id": entry.id or uuid.uuid4(),
+                "vector": entry.vector,
+                "namespace": entry.namespace,
+                "meta": entry.meta,
+                **kwargs,
+            }
+            for entry in entries
+        ]
+        # A statement can't update the same row twice, so only the last entry of each id is upserted.
+        unique_rows = list({str(row["id"]): row for row in rows}.values())
+
+        with self.engine.begin() as conn:  # pyright: ignore[reportOptionalMemberAccess]
+            for start in range(0, len(unique_rows), self.upsert_batch_size):
+                batch = unique_rows[start : start + self.upsert_batch_size]
+                statement = sqlalchemy_dialects_postgresql.insert(self._model).values(batch)
+                statement = statement.on_conflict_do_update(
+                    index_elements=["id"],
+                    set_={column: statement.excluded[column] for column in batch[0] if column != "id"},
+                )
+
+                conn.execute(statement)
+
+        return [str(row["id"]) for row in rows]
+
+    def does_entries_exist(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> list[bool]:
+        """Checks which vector ids exist with a single query."""
+        sqlalchemy_orm = import_optional_dependency("sqlalchemy.orm")
+
+        try:
+            with sqlalchemy_orm.Session(self.engine) as session:
+                existing_ids = {
+                    str(row.id) for row in session.query(self._model.id).filter(self._model.id.in_(vector_ids)).all()
+                }
+        except Exception:
+            return [False] * len(vector_ids)
+
+        return [str(vector_id) in existing_ids for vector_id in vector_ids]
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> BaseVectorStoreDriver.Entry:
         """Retrieves a specific vector entry from the collection based on its identifier and optional namespace."""
         sqlalchemy_orm = import_optional_dependency("sqlalchemy.orm")
@@ -44,6 +44,34 @@ class PineconeVectorStoreDriver(BaseVectorStoreDriver):
 
         return vector_id
 
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        vector_ids = [entry.id or str_to_hash(str(entry.vector)) for entry in entries]
+        namespaced_vectors: dict[Optional[str], list[tuple]] = {}
+
+        for vector_id, entry in zip(vector_ids, entries):
+            namespaced_vectors.setdefault(entry.namespace, []).append((vector_id, entry.vector, entry.meta))
+
+        for namespace, vectors in namespaced_vectors.items():
+            params: dict[str, Any] = {"namespace": namespace} | kwargs
+
+            for start in range(0, len(vectors), self.upsert_batch_size):
+                self.index.upsert(vectors=vectors[start : start + self.upsert_batch_size], **params)
+
+        return vector_ids
+
+    def does_entries_exist(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> list[bool]:
+        existing_ids = set()
+
+        for start in range(0, len(vector_ids), self.upsert_batch_size):
+            try:
+                result = self.index.fetch(ids=vector_ids[start : start + self.upsert_batch_size], namespace=namespace)
+                existing_ids.update(result.to_dict()["vectors"].keys())
+            except Exception:
+                # Ids of a batch that can't be fetched are treated as missing, like in `does_entry_exist`.
+                continue
+
+        return [vector_id in existing_ids for vector_id in vector_ids]
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         result = self.index.fetch(ids=[vector_id], namespace=namespace).to_dict()
         vectors = list(result["vectors"].values())
@@ -164,6 +164,51 @@ class QdrantVectorStoreDriver(BaseVectorStoreDriver):
         self.client.upsert(collection_name=self.collection_name, points=points)
         return vector_id
 
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Upsert vectors into the Qdrant collection with one batch of points per `upsert_batch_size` entries.
+
+        Parameters:
+            entries (list[BaseVectorStoreDriver.Entry]): The entries to be upserted.
+
+        Returns:
+            list[str]: The IDs of the upserted vectors.
+        """
+        vector_ids = [entry.id or str(uuid.uuid5(uuid.NAMESPACE_DNS, str(entry.vector))) for entry in entries]
+
+        for start in range(0, len(entries), self.upsert_batch_size):
+            batch = entries[start : start + self.upsert_batch_size]
+            payloads = [entry.meta or {} for entry in batch]
+            points = import_optional_dependency("qdrant_client.http.models").Batch(
+                ids=vector_ids[start : start + self.upsert_batch_size],
+                vectors=[entry.vector for entry in batch],
+                payloads=payloads if any(payloads) else None,
+            )
+
+            self.client.upsert(collection_name=self.collection_name, points=points)
+
+        return vector_ids
+
+    def does_entries_exist(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> list[bool]:
+        """Check which vector IDs exist in the Qdrant collection with a single retrieve request.
+
+        Parameters:
+            vector_ids (list[str]): IDs of the vectors to check.
+            namespace (str, optional): Optional namespace of the vectors.
+
+        Returns:
+            list[bool]: Whether each vector ID exists.
+        """
+        try:
+            results = self.client.retrieve(
+                collection_name=self.collection_name, ids=vector_ids, with_payload=False, with_vectors=False
+            )
+        except Exception:
+            return [False] * len(vector_ids)
+
+        existing_ids = {str(result.id) for result in results}
+
+        return [str(vector_id) in existing_ids for vector_id in vector_ids]
+
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Load a vector entry from the Qdrant collection based on its ID.
 
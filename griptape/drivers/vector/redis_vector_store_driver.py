@@ -61,22 +61,41 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
         Metadata associated with the vector can also be provided.
         """
         vector_id = vector_id or str_to_hash(str(vector))
-        key = self._generate_key(vector_id, namespace)
-        bytes_vector = json.dumps(vector).encode("utf-8")
 
-        mapping = {}
-        mapping["vector"] = np.array(vector, dtype=np.float32).tobytes()
-        mapping["vec_string"] = bytes_vector
+        self.client.hset(self._generate_key(vector_id, namespace), mapping=self._build_mapping(vector, namespace, meta))
 
-        if namespace:
-            mapping["namespace"] = namespace
+        return vector_id
 
-        if meta:
-            mapping["metadata"] = json.dumps(meta)
+    def upsert_vectors(self, entries: list[BaseVectorStoreDriver.Entry], **kwargs) -> list[str]:
+        """Inserts or updates vectors in Redis, sending one pipeline per `upsert_batch_size` entries."""
+        vector_ids = [entry.id or str_to_hash(str(entry.vector)) for entry in entries]
 
-        self.client.hset(key, mapping=mapping)
+        for start in range(0, len(entries), self.upsert_batch_size):
+            pipeline = self.client.pipeline(transaction=False)
 
-        return vector_id
+            for vector_id, entry in zip(
+                vector_ids[start : start + self.upsert_batch_size], entries[start : start + self.upsert_batch_size]
+            ):
+                pipeline.hset(
+                    self._generate_key(vector_id, entry.namespace),
+                    mapping=self._build_mapping(entry.vector, entry.namespace, entry.meta),  # pyright: ignore[reportArgumentType]
+                )
+
+            pipeline.execute()
+
+        return vector_ids
+
+    def does_entries_exist(self, vector_ids: list[str], *, namespace: Optional[str] = None) -> list[bool]:
+        """Checks which vector ids exist in Redis with a single pipeline."""
+        pipeline = self.client.pipeline(transaction=False)
+
+        for vector_id in vector_ids:
+            pipeline.exists(self._generate_key(vector_id, namespace))
+
+        try:
+            return [bool(exists) for exists in pipeline.execute()]
+        except Exception:
+            return [False] * len(vector_ids)
 
     def load_entry(self, vector_id: str, *, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         """Retrieves a specific vector entry from Redis based on its identifier and optional namespace.
@@ -158,6 +177,19 @@ class RedisVectorStoreDriver(BaseVectorStoreDriver):
             )
         return query_results
 
+    def _build_mapping(self, vector: list[float], namespace: Optional[str], meta: Optional[dict]) -> dict:
+        mapping = {}
+        mapping["vector"] = np.array(vector, dtype=np.float32).tobytes()
+        mapping["vec_string"] = json.dumps(vector).encode("utf-8")
+
+        if namespace:
+            mapping["namespace"] = namespace
+
+        if meta:
+            mapping["metadata"] = json.dumps(meta)
+
+        return mapping
+
     def _generate_key(self, vector_id: str, namespace: Optional[str] = None) -> str:
         """Generates a Redis key using the provided vector ID and optionally a namespace."""
         return f"{namespace}:{vector_id}" if namespace else vector_id
@@ -1,8 +1,23 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
-from griptape.artifacts import TextArtifact
+if TYPE_CHECKING:
+    from griptape.artifacts import TextArtifact
 
 
 class BaseWebScraperDriver(ABC):
     @abstractmethod
     def scrape_url(self, url: str) -> TextArtifact: ...
+
+    def scrape_urls(self, urls: list[str]) -> list[TextArtifact]:
+        """Scrapes multiple URLs.
+
+        Args:
+            urls: URLs to scrape.
+
+        Returns:
+            The scraped Text Artifacts, in the same order as `urls`.
+        """
+        return [self.scrape_url(url) for url in urls]
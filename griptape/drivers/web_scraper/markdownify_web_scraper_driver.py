@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import re
-from typing import Any, Optional
+import threading
+from typing import TYPE_CHECKING, Any, Optional
 
 from attrs import Factory, define, field
 
@@ -9,6 +12,12 @@ from griptape.artifacts import TextArtifact
 from griptape.drivers import BaseWebScraperDriver
 from griptape.utils import import_optional_dependency
 
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+    from concurrent.futures import Future
+
+    from playwright.async_api import Browser, Page, Playwright, Route
+
 
 @define
 class MarkdownifyWebScraperDriver(BaseWebScraperDriver):
@@ -18,6 +27,11 @@ class MarkdownifyWebScraperDriver(BaseWebScraperDriver):
     playwright. You can do this by running: `poetry run playwright install`.
     For more details about playwright, see https://playwright.dev/python/docs/library.
 
+    The Driver launches a single headless browser the first time it scrapes a URL and keeps it running on a background
+    thread, so that later calls, including concurrent calls from other threads, reuse the browser and its pages instead
+    of launching a new browser for every URL. The browser is shut down once it has been idle for `idle_timeout` seconds,
+    or when `close()` is called.
+
     Attributes:
         include_links: If `True`, the driver will include link urls in the markdown output.
         exclude_tags: Optionally provide custom tags to exclude from the scraped content.
@@ -25,9 +39,14 @@ class MarkdownifyWebScraperDriver(BaseWebScraperDriver):
         exclude_ids: Optionally provide custom ids to exclude from the scraped content.
         timeout: Optionally provide a timeout in milliseconds for the page to continue loading after
             the browser has emitted the "load" event.
+        blocked_resource_types: Playwright resource types that pages don't load, such as "image", "font", or "media".
+        max_pages: Maximum number of pages that load URLs at the same time. Each page has its own browser context.
+        idle_timeout: Number of seconds without any scraping after which the browser is shut down. The browser keeps
+            running until `close()` is called if `None`.
     """
 
     DEFAULT_EXCLUDE_TAGS = ["script", "style", "head"]
+    DEFAULT_BLOCKED_RESOURCE_TYPES = ["image", "font", "media"]
 
     include_links: bool = field(default=True, kw_only=True)
     exclude_tags: list[str] = field(
@@ -37,12 +56,93 @@ class MarkdownifyWebScraperDriver(BaseWebScraperDriver):
     exclude_classes: list[str] = field(default=Factory(list), kw_only=True)
     exclude_ids: list[str] = field(default=Factory(list), kw_only=True)
     timeout: Optional[int] = field(default=None, kw_only=True)
+    blocked_resource_types: list[str] = field(
+        default=Factory(lambda self: self.DEFAULT_BLOCKED_RESOURCE_TYPES, takes_self=True),
+        kw_only=True,
+    )
+    max_pages: int = field(default=8, kw_only=True)
+    idle_timeout: Optional[float] = field(default=60, kw_only=True)
+
+    _browser_lock: threading.Lock = field(factory=threading.Lock, init=False, eq=False)
+    _browser_pool: Optional[_BrowserPool] = field(default=None, init=False, eq=False)
 
     def scrape_url(self, url: str) -> TextArtifact:
-        sync_playwright = import_optional_dependency("playwright.sync_api").sync_playwright
+        return self.scrape_urls([url])[0]
+
+    def scrape_urls(self, urls: list[str]) -> list[TextArtifact]:
+        """Scrapes multiple URLs, loading up to `max_pages` of them at the same time.
+
+        Args:
+            urls: URLs to scrape.
+
+        Returns:
+            The scraped Text Artifacts, in the same order as `urls`.
+        """
         bs4 = import_optional_dependency("bs4")
         markdownify = import_optional_dependency("markdownify")
 
+        with self._browser_lock:
+            if self._browser_pool is None:
+                self._browser_pool = _BrowserPool(
+                    max_pages=self.max_pages, blocked_resource_types=self.blocked_resource_types
+                )
+                self._browser_pool.start()
+
+            browser_pool = self._browser_pool
+            browser_pool.active_count += 1
+            browser_pool.activity_id += 1
+
+        contents = browser_pool.run(self.__load_contents(browser_pool, urls))
+
+        return [self.__to_artifact(content, bs4, markdownify) for content in contents]
+
+    def close(self) -> None:
+        """Shuts down the browser and its background thread.
+
+        Scrapes that are in progress fail. The browser is launched again the next time a URL is scraped.
+        """
+        with self._browser_lock:
+            browser_pool = self._browser_pool
+            self._browser_pool = None
+
+        if browser_pool is not None:
+            browser_pool.shut_down()
+
+    async def __load_contents(self, browser_pool: _BrowserPool, urls: list[str]) -> list[Optional[str]]:
+        try:
+            results = await asyncio.gather(
+                *(browser_pool.load_content(url, timeout=self.timeout) for url in urls), return_exceptions=True
+            )
+        finally:
+            with self._browser_lock:
+                browser_pool.active_count -= 1
+
+                if browser_pool.active_count == 0 and self.idle_timeout is not None:
+                    asyncio.get_running_loop().call_later(
+                        self.idle_timeout, self.__shut_down_if_idle, browser_pool, browser_pool.activity_id
+                    )
+
+        contents = []
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+            contents.append(result)
+
+        return contents
+
+    def __shut_down_if_idle(self, browser_pool: _BrowserPool, activity_id: int) -> None:
+        with self._browser_lock:
+            # Skip if the pool was closed, or was used again since it became idle.
+            if self._browser_pool is not browser_pool or browser_pool.activity_id != activity_id:
+                return
+
+            self._browser_pool = None
+
+        browser_pool.shut_down_soon()
+
+    def __to_artifact(self, content: Optional[str], bs4: Any, markdownify: Any) -> TextArtifact:
         include_links = self.include_links
 
         # Custom MarkdownConverter to optionally linked urls. If include_links is False only
@@ -53,51 +153,193 @@ class MarkdownifyWebScraperDriver(BaseWebScraperDriver):
                     return super().convert_a(el, text, convert_as_inline)
                 return text
 
-        with sync_playwright() as p, p.chromium.launch(headless=True) as browser:
-            page = browser.new_page()
+        if not content:
+            raise Exception("can't access URL")
+
+        soup = bs4.BeautifulSoup(content, "html.parser")
+
+        # Remove unwanted elements
+        exclude_selector = ",".join(
+            self.exclude_tags + [f".{c}" for c in self.exclude_classes] + [f"#{i}" for i in self.exclude_ids],
+        )
+        if exclude_selector:
+            for s in soup.select(exclude_selector):
+                s.extract()
+
+        text = OptionalLinksMarkdownConverter().convert_soup(soup)
+
+        # Remove leading and trailing whitespace from the entire text
+        text = text.strip()
+
+        # Remove trailing whitespace from each line
+        text = re.sub(r"[ \t]+$", "", text, flags=re.MULTILINE)
+
+        # Indent using 2 spaces instead of tabs
+        text = re.sub(r"(\n?\s*?)\t", r"\1  ", text)
 
-            def skip_loading_images(route: Any) -> Any:
-                if route.request.resource_type == "image":
-                    return route.abort()
-                route.continue_()
+        # Remove triple+ newlines (keep double newlines for paragraphs)
+        text = re.sub(r"\n\n+", "\n\n", text)
+
+        return TextArtifact(text)
+
+
+@define(kw_only=True)
+class _BrowserPool:
+    """Headless browser and pages that run on an event loop in a background thread.
+
+    Attributes:
+        max_pages: Maximum number of pages that load URLs at the same time.
+        blocked_resource_types: Playwright resource types that pages don't load.
+        active_count: Number of batches of URLs being scraped with the pool.
+        activity_id: Counter that is incremented whenever a batch of URLs starts being scraped.
+    """
+
+    max_pages: int = field()
+    blocked_resource_types: list[str] = field()
+    active_count: int = field(default=0)
+    activity_id: int = field(default=0)
+
+    _loop: asyncio.AbstractEventLoop = field(factory=asyncio.new_event_loop, init=False)
+    _thread: Optional[threading.Thread] = field(default=None, init=False)
+    # Coroutines are only submitted to the event loop while the pool isn't closed, so that every submitted coroutine
+    # runs before the event loop stops and can be cancelled by `__shut_down`.
+    _closed: bool = field(default=False, init=False)
+    _closed_lock: threading.Lock = field(factory=threading.Lock, init=False)
+    _playwright: Optional[Playwright] = field(default=None, init=False)
+    _browser: Optional[Browser] = field(default=None, init=False)
+    # Created on the background thread, since asyncio primitives are bound to the event loop on Python 3.9.
+    _launch_lock: asyncio.Lock = field(init=False)
+    _page_semaphore: asyncio.Semaphore = field(init=False)
+    _idle_pages: list[Page] = field(factory=list, init=False)
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self.__run_loop, daemon=True)
+        self._thread.start()
+
+    def run(self, coroutine: Coroutine) -> Any:
+        """Runs a coroutine on the event loop and waits for its result.
+
+        Raises:
+            RuntimeError: If the pool is closed.
+            concurrent.futures.CancelledError: If the pool is closed while the coroutine runs.
+        """
+        with self._closed_lock:
+            if self._closed:
+                coroutine.close()
+
+                raise RuntimeError("The browser was shut down.")
+
+            future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+        return future.result()
+
+    def shut_down(self) -> None:
+        """Cancels the coroutines that are running, shuts down the browser, and waits for the event loop to stop."""
+        future = self.__close()
+
+        if future is not None:
+            future.result()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def shut_down_soon(self) -> None:
+        """Like `shut_down`, but doesn't wait, so that it can be called from the event loop."""
+        self.__close()
+
+    def __close(self) -> Optional[Future]:
+        with self._closed_lock:
+            if self._closed:
                 return None
 
-            page.route("**/*", skip_loading_images)
+            self._closed = True
 
-            page.goto(url)
+            return asyncio.run_coroutine_threadsafe(self.__shut_down(), self._loop)
 
-            # Some websites require a delay before the content is fully loaded
-            # even after the browser has emitted "load" event.
-            if self.timeout:
-                page.wait_for_timeout(self.timeout)
+    async def load_content(self, url: str, *, timeout: Optional[int] = None) -> Optional[str]:
+        async with self._page_semaphore:
+            page = await self.__get_page()
 
-            content = page.content()
+            try:
+                await page.goto(url)
 
-            if not content:
-                raise Exception("can't access URL")
+                # Some websites require a delay before the content is fully loaded
+                # even after the browser has emitted "load" event.
+                if timeout:
+                    await page.wait_for_timeout(timeout)
 
-            soup = bs4.BeautifulSoup(content, "html.parser")
+                content = await page.content()
+            except Exception:
+                # The page may be left in an unknown state, so its context is discarded instead of reused.
+                with contextlib.suppress(Exception):
+                    await page.context.close()
 
-            # Remove unwanted elements
-            exclude_selector = ",".join(
-                self.exclude_tags + [f".{c}" for c in self.exclude_classes] + [f"#{i}" for i in self.exclude_ids],
-            )
-            if exclude_selector:
-                for s in soup.select(exclude_selector):
-                    s.extract()
+                raise
+
+            self._idle_pages.append(page)
+
+            return content
+
+    def __run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._launch_lock = asyncio.Lock()
+        self._page_semaphore = asyncio.Semaphore(self.max_pages)
+
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    async def __shut_down(self) -> None:
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+        for task in tasks:
+            task.cancel()
+
+        try:
+            # Tasks that wait for a page or for the browser to launch would otherwise never finish once the event loop
+            # stops, and neither would the threads waiting for their results.
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            for page in self._idle_pages:
+                await page.context.close()
+            if self._browser is not None:
+                await self._browser.close()
+            if self._playwright is not None:
+                await self._playwright.stop()
+        finally:
+            self._idle_pages.clear()
+            self._loop.call_soon(self._loop.stop)
+
+    async def __get_page(self) -> Page:
+        while self._idle_pages:
+            page = self._idle_pages.pop()
+
+            if not page.is_closed():
+                return page
+
+        browser = await self.__get_browser()
+        context = await browser.new_context()
+        page = await context.new_page()
+
+        if self.blocked_resource_types:
+            await page.route("**/*", self.__route)
 
-            text = OptionalLinksMarkdownConverter().convert_soup(soup)
+        return page
 
-            # Remove leading and trailing whitespace from the entire text
-            text = text.strip()
+    async def __get_browser(self) -> Browser:
+        async with self._launch_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    async_playwright = import_optional_dependency("playwright.async_api").async_playwright
 
-            # Remove trailing whitespace from each line
-            text = re.sub(r"[ \t]+$", "", text, flags=re.MULTILINE)
+                    self._playwright = await async_playwright().start()
 
-            # Indent using 2 spaces instead of tabs
-            text = re.sub(r"(\n?\s*?)\t", r"\1  ", text)
+                self._browser = await self._playwright.chromium.launch(headless=True)
 
-            # Remove triple+ newlines (keep double newlines for paragraphs)
-            text = re.sub(r"\n\n+", "\n\n", text)
+            return self._browser
 
-            return TextArtifact(text)
+    async def __route(self, route: Route) -> None:
+        if route.request.resource_type in self.blocked_resource_types:
+            await route.abort()
+        else:
+            await route.continue_()
@@ -1,44 +1,168 @@
+from __future__ import annotations
+
 import json
 import logging
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlparse
 
+import requests
 from attrs import define, field
+from requests.adapters import HTTPAdapter
 
 from griptape.artifacts import TextArtifact
 from griptape.drivers import BaseWebScraperDriver
 from griptape.utils import import_optional_dependency
+from griptape.utils.decorators import lazy_property
+
+if TYPE_CHECKING:
+    from concurrent import futures
 
 
 @define
 class TrafilaturaWebScraperDriver(BaseWebScraperDriver):
+    """Driver to scrape the main text of a webpage with Trafilatura.
+
+    Pages are downloaded through a shared `requests.Session`, so that connections are kept alive and reused across
+    calls and threads. Pages that are served with an `ETag` or `Last-Modified` header are cached along with their
+    extracted text, and downloaded again with a conditional request, so that unchanged pages aren't extracted again.
+
+    Attributes:
+        include_links: If `True`, the driver will include link urls in the extracted text.
+        timeout: Number of seconds to wait for a page to download.
+        max_connections_per_host: Maximum number of pages downloaded from the same host at the same time.
+        max_cached_pages: Maximum number of pages whose extracted text is cached. Pages aren't cached if `0`.
+        extraction_executor: Executor that extracts text from pages, such as a `ProcessPoolExecutor` to run CPU-heavy
+            extraction outside the downloading thread. Text is extracted on the calling thread if `None`.
+        request_params: Additional parameters passed to `requests.Session.get`, such as `verify` or `proxies`.
+        session: Session used to download pages.
+    """
+
     include_links: bool = field(default=True, kw_only=True)
+    timeout: Optional[float] = field(default=30, kw_only=True)
+    max_connections_per_host: int = field(default=8, kw_only=True)
+    max_cached_pages: int = field(default=1000, kw_only=True)
+    extraction_executor: Optional[futures.Executor] = field(default=None, kw_only=True)
+    request_params: dict = field(factory=dict, kw_only=True)
+    _session: Optional[requests.Session] = field(default=None, kw_only=True, alias="session")
+
+    _host_semaphores: dict[str, threading.BoundedSemaphore] = field(factory=dict, init=False, eq=False)
+    # Maps URLs to the ETag, Last-Modified, and extracted text of their last download, least recently used first.
+    _cached_pages: OrderedDict[str, tuple[Optional[str], Optional[str], str]] = field(
+        factory=OrderedDict, init=False, eq=False
+    )
+    _lock: threading.Lock = field(factory=threading.Lock, init=False, eq=False)
 
     def scrape_url(self, url: str) -> TextArtifact:
-        trafilatura = import_optional_dependency("trafilatura")
-        use_config = trafilatura.settings.use_config
+        with self._lock:
+            cached_page = self._cached_pages.get(url)
+
+        headers = {}
+        if cached_page is not None:
+            etag, last_modified, _ = cached_page
+
+            if etag is not None:
+                headers["If-None-Match"] = etag
+            if last_modified is not None:
+                headers["If-Modified-Since"] = last_modified
 
-        config = use_config()
-        page = trafilatura.fetch_url(url, no_ssl=True)
+        with self.__get_host_semaphore(url):
+            response = self.session.get(url, headers=headers, timeout=self.timeout, **self.request_params)
 
-        # This disables signal, so that trafilatura can work on any thread:
-        # More info: https://trafilatura.readthedocs.io/usage-python.html#disabling-signal
-        config.set("DEFAULT", "EXTRACTION_TIMEOUT", "0")
+        if response.status_code == 304 and cached_page is not None:
+            text = cached_page[2]
 
-        # Disable error logging in trafilatura as it sometimes logs errors from lxml, even though
-        # the end result of page parsing is successful.
-        logging.getLogger("trafilatura").setLevel(logging.FATAL)
+            with self._lock:
+                if url in self._cached_pages:
+                    self._cached_pages.move_to_end(url)
 
-        if page is None:
+            return TextArtifact(text)
+
+        if not response.ok or not response.content:
             raise Exception("can't access URL")
-        extracted_page = trafilatura.extract(
-            page,
-            include_links=self.include_links,
-            output_format="json",
-            config=config,
-        )
-
-        if not extracted_page:
+
+        if self.extraction_executor is None:
+            text = _extract_text(response.content, include_links=self.include_links)
+        else:
+            text = self.extraction_executor.submit(
+                _extract_text, response.content, include_links=self.include_links
+            ).result()
+
+        if text is None:
             raise Exception("can't extract page")
 
-        text = json.loads(extracted_page).get("text")
+        self.__cache_page(url, response, text)
 
         return TextArtifact(text)
+
+    @lazy_property()
+    def session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=self.max_connections_per_host)
+
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        return session
+
+    def __get_host_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc
+
+        with self._lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.BoundedSemaphore(self.max_connections_per_host)
+
+            return self._host_semaphores[host]
+
+    def __cache_page(self, url: str, response: requests.Response, text: str) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        if self.max_cached_pages <= 0 or (etag is None and last_modified is None):
+            return
+
+        with self._lock:
+            self._cached_pages[url] = (etag, last_modified, text)
+            self._cached_pages.move_to_end(url)
+
+            while len(self._cached_pages) > self.max_cached_pages:
+                self._cached_pages.popitem(last=False)
+
+
+def _extract_text(page: bytes | str, *, include_links: bool = True) -> Optional[str]:
+    """Extracts the main text of a page with Trafilatura.
+
+    Defined at the module level so that it can run in a `ProcessPoolExecutor`.
+
+    Args:
+        page: HTML of the page.
+        include_links: If `True`, links are included in the extracted text.
+
+    Returns:
+        The extracted text, or `None` if no text could be extracted.
+    """
+    trafilatura = import_optional_dependency("trafilatura")
+    use_config = trafilatura.settings.use_config
+
+    config = use_config()
+
+    # This disables signal, so that trafilatura can work on any thread:
+    # More info: https://trafilatura.readthedocs.io/usage-python.html#disabling-signal
+    config.set("DEFAULT", "EXTRACTION_TIMEOUT", "0")
+
+    # Disable error logging in trafilatura as it sometimes logs errors from lxml, even though
+    # the end result of page parsing is successful.
+    logging.getLogger("trafilatura").setLevel(logging.FATAL)
+
+    extracted_page = trafilatura.extract(
+        page,
+        include_links=include_links,
+        output_format="json",
+        config=config,
+    )
+
+    if not extracted_page:
+        return None
+
+    return json.loads(extracted_page).get("text")
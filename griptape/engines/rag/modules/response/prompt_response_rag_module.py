@@ -27,31 +27,68 @@ class PromptResponseRagModule(BaseResponseRagModule, RuleMixin):
 
     def run(self, context: RagContext) -> BaseArtifact:
         query = context.query
-        tokenizer = self.prompt_driver.tokenizer
-        included_chunks = []
-        system_prompt = self.generate_system_template(context, included_chunks)
+        system_prompt = self.generate_system_template(context, self.pack_text_chunks(context))
+        output = self.prompt_driver.run(self.generate_prompt_stack(system_prompt, query)).to_artifact()
 
-        for artifact in context.text_chunks:
-            included_chunks.append(artifact)
+        if isinstance(output, TextArtifact):
+            return output
+        else:
+            raise ValueError("Prompt driver did not return a TextArtifact")
 
-            system_prompt = self.generate_system_template(context, included_chunks)
-            message_token_count = self.prompt_driver.tokenizer.count_tokens(
-                self.prompt_driver.prompt_stack_to_string(self.generate_prompt_stack(system_prompt, query)),
-            )
+    def pack_text_chunks(self, context: RagContext) -> list[TextArtifact]:
+        """Returns the longest prefix of the context's text chunks that fits in the prompt driver's input tokens.
 
-            if message_token_count + self.answer_token_offset >= tokenizer.max_input_tokens:
-                included_chunks.pop()
+        Every chunk is tokenized once and the prefix is estimated by adding the chunk token counts to the token count of
+        the prompt without chunks. The estimate is verified by rendering the system template once. If the template adds
+        more tokens per chunk than estimated, the prefix is found with a binary search over rendered prompts instead.
 
-                system_prompt = self.generate_system_template(context, included_chunks)
+        Args:
+            context: Context whose text chunks are packed.
 
+        Returns:
+            The text chunks to include in the system template.
+        """
+        text_chunks = context.text_chunks
+        tokenizer = self.prompt_driver.tokenizer
+        token_budget = tokenizer.max_input_tokens - self.answer_token_offset
+
+        if not text_chunks:
+            return []
+
+        prompt_token_count = self._count_prompt_tokens(context, [])
+        chunk_token_counts = tokenizer.count_tokens_many([chunk.to_text() for chunk in text_chunks])
+        chunk_count = 0
+
+        for chunk_token_count in chunk_token_counts:
+            if prompt_token_count + chunk_token_count >= token_budget:
                 break
 
-        output = self.prompt_driver.run(self.generate_prompt_stack(system_prompt, query)).to_artifact()
+            prompt_token_count += chunk_token_count
+            chunk_count += 1
 
-        if isinstance(output, TextArtifact):
-            return output
-        else:
-            raise ValueError("Prompt driver did not return a TextArtifact")
+        if chunk_count == 0 or self._count_prompt_tokens(context, text_chunks[:chunk_count]) < token_budget:
+            return text_chunks[:chunk_count]
+
+        # The template overhead isn't additive, so find the longest prefix that fits by rendering candidate prefixes.
+        low = 0
+        high = chunk_count - 1
+
+        while low < high:
+            middle = (low + high + 1) // 2
+
+            if self._count_prompt_tokens(context, text_chunks[:middle]) < token_budget:
+                low = middle
+            else:
+                high = middle - 1
+
+        return text_chunks[:low]
+
+    def _count_prompt_tokens(self, context: RagContext, text_chunks: list[TextArtifact]) -> int:
+        system_prompt = self.generate_system_template(context, text_chunks)
+
+        return self.prompt_driver.tokenizer.count_tokens(
+            self.prompt_driver.prompt_stack_to_string(self.generate_prompt_stack(system_prompt, context.query))
+        )
 
     def default_system_template_generator(self, context: RagContext, artifacts: list[TextArtifact]) -> str:
         params: dict[str, Any] = {"text_chunks": [c.to_text() for c in artifacts]}
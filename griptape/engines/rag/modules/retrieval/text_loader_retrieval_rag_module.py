@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-import uuid
-from typing import TYPE_CHECKING, Any, Callable
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from attrs import Factory, define, field
 
@@ -16,9 +19,32 @@ if TYPE_CHECKING:
     from griptape.engines.rag import RagContext
     from griptape.loaders import BaseTextLoader
 
+logger = logging.getLogger(__name__)
+
 
 @define(kw_only=True)
 class TextLoaderRetrievalRagModule(BaseRetrievalRagModule):
+    """Loads a source into a Vector Store Driver and queries it.
+
+    Each source is loaded once into a namespace derived from its `BaseLoader.to_key` fingerprint, and later queries of
+    the same source reuse that namespace. Concurrent queries of a source that is still loading wait for the first load
+    instead of loading it again.
+
+    Expired sources are deleted from the Vector Store Driver and loaded into a new namespace, so that queries never see
+    the entries of an earlier load, even if the Vector Store Driver can't delete them.
+
+    Attributes:
+        loader: Text Loader used to load sources.
+        vector_store_driver: Vector Store Driver that loaded sources are upserted to and queried from.
+        source: Source to load, unless a `source` is set in the module's context params.
+        query_params: Parameters passed to `BaseVectorStoreDriver.query`.
+        process_query_output_fn: Function that converts query results into Text Artifacts.
+        cache_ttl: Number of seconds that a loaded source is reused before it's loaded again. Reused indefinitely if
+            `None`.
+        etag_fn: Function that returns an ETag or other version identifier of a source. A source is loaded again when
+            its identifier changes.
+    """
+
     loader: BaseTextLoader = field()
     vector_store_driver: BaseVectorStoreDriver = field()
     source: Any = field()
@@ -26,18 +52,126 @@ class TextLoaderRetrievalRagModule(BaseRetrievalRagModule):
     process_query_output_fn: Callable[[list[BaseVectorStoreDriver.Entry]], Sequence[TextArtifact]] = field(
         default=Factory(lambda: lambda es: [e.to_artifact() for e in es]),
     )
+    cache_ttl: Optional[float] = field(default=None)
+    etag_fn: Optional[Callable[[Any], Optional[str]]] = field(default=None)
+    # Maps source keys to the namespace and ETag they were loaded with, and when.
+    _loaded_sources: dict[str, tuple[str, Optional[str], float]] = field(factory=dict, init=False, eq=False)
+    _loading_sources: dict[str, tuple[str, Future]] = field(factory=dict, init=False, eq=False)
+    # Number of times each source has been loaded, which reloads use to pick a new namespace.
+    _load_counts: dict[str, int] = field(factory=dict, init=False, eq=False)
+    _sources_lock: threading.Lock = field(factory=threading.Lock, init=False, eq=False)
 
     def run(self, context: RagContext) -> Sequence[TextArtifact]:
-        namespace = uuid.uuid4().hex
         context_source = self.get_context_param(context, "source")
         source = self.source if context_source is None else context_source
 
         query_params = utils.dict_merge(self.query_params, self.get_context_param(context, "query_params"))
 
-        query_params["namespace"] = namespace
+        query_params["namespace"] = self.load_source(source)
+
+        return self.process_query_output_fn(self.vector_store_driver.query(context.query, **query_params))
 
-        loader_output = self.loader.load(source)
+    def load_source(self, source: Any) -> str:
+        """Loads a source into the Vector Store Driver unless it was already loaded and hasn't expired.
 
-        self.vector_store_driver.upsert_text_artifacts({namespace: loader_output})
+        Args:
+            source: Source to load.
 
-        return self.process_query_output_fn(self.vector_store_driver.query(context.query, **query_params))
+        Returns:
+            The namespace that the source was loaded into.
+        """
+        key = self.loader.to_key(source)
+        etag = self.etag_fn(source) if self.etag_fn is not None else None
+
+        # The Vector Store Driver is only called outside of the lock, so that slow deletes and loads of one source
+        # don't hold up queries of other sources.
+        with self._sources_lock:
+            stale_namespaces = self.__pop_stale_sources(key, etag)
+            loaded_source = self._loaded_sources.get(key)
+
+            if loaded_source is None:
+                loading_source = self._loading_sources.get(key)
+                should_load = loading_source is None
+
+                if loading_source is None:
+                    loading_source = (self.__get_new_namespace(key, etag), Future())
+                    self._loading_sources[key] = loading_source
+
+                namespace, future = loading_source
+            else:
+                namespace, future, should_load = loaded_source[0], None, False
+
+        for stale_namespace in stale_namespaces:
+            self.__delete_namespace(stale_namespace)
+
+        if future is None:
+            return namespace
+
+        if should_load:
+            try:
+                self.vector_store_driver.upsert_text_artifacts({namespace: self.loader.load(source)})
+            except Exception as e:
+                with self._sources_lock:
+                    del self._loading_sources[key]
+                future.set_exception(e)
+
+                raise
+
+            with self._sources_lock:
+                self._loaded_sources[key] = (namespace, etag, time.monotonic())
+                self._load_counts[key] = self._load_counts.get(key, 0) + 1
+                del self._loading_sources[key]
+            future.set_result(namespace)
+
+        return future.result()
+
+    def clear_sources(self) -> None:
+        """Deletes the namespaces of every loaded source from the Vector Store Driver."""
+        with self._sources_lock:
+            namespaces = [namespace for namespace, _, _ in self._loaded_sources.values()]
+
+            self._loaded_sources.clear()
+
+        for namespace in namespaces:
+            self.__delete_namespace(namespace)
+
+    def __get_new_namespace(self, key: str, etag: Optional[str]) -> str:
+        """Returns the namespace to load the source with `key` into. Must be called under `_sources_lock`."""
+        load_count = self._load_counts.get(key, 0)
+        namespace = key if etag is None else utils.str_to_hash(f"{key}-{etag}")
+
+        return namespace if load_count == 0 else utils.str_to_hash(f"{namespace}-{load_count}")
+
+    def __pop_stale_sources(self, key: str, etag: Optional[str]) -> list[str]:
+        """Forgets expired sources, and the source with `key` if its ETag changed. Must be called under `_sources_lock`.
+
+        Returns:
+            The namespaces of the forgotten sources, which the caller deletes after releasing the lock.
+        """
+        now = time.monotonic()
+        stale_namespaces = []
+
+        for loaded_key, (loaded_namespace, loaded_etag, loaded_at) in list(self._loaded_sources.items()):
+            is_expired = self.cache_ttl is not None and now - loaded_at >= self.cache_ttl
+
+            if is_expired or (loaded_key == key and loaded_etag != etag):
+                stale_namespaces.append(loaded_namespace)
+
+                del self._loaded_sources[loaded_key]
+
+        return stale_namespaces
+
+    def __delete_namespace(self, namespace: str) -> None:
+        entry_cache = self.vector_store_driver.entry_cache
+
+        try:
+            for entry in self.vector_store_driver.load_entries(namespace=namespace):
+                self.vector_store_driver.delete_vector(entry.id)
+
+                # Deleted entries would otherwise still count as upserted, and be skipped if they're upserted again.
+                if entry_cache is not None:
+                    entry_cache.pop((namespace, entry.id))
+        except NotImplementedError:
+            logger.debug("%s can't delete namespace %s", self.vector_store_driver.__class__.__name__, namespace)
+        except Exception as e:
+            logger.warning("Failed to delete namespace %s: %s", namespace, e)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextvars
 import logging
 from typing import TYPE_CHECKING
 
@@ -32,7 +33,10 @@ class ResponseRagStage(BaseRagStage):
         logging.info("ResponseRagStage: running %s retrieval modules in parallel", len(self.response_modules))
 
         results = utils.execute_futures_list(
-            [self.futures_executor.submit(r.run, context) for r in self.response_modules]
+            [
+                self.futures_executor.submit(contextvars.copy_context().run, r.run, context)
+                for r in self.response_modules
+            ]
         )
 
         context.outputs = results
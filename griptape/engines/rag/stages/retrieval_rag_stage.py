@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextvars
 import itertools
 import logging
 from typing import TYPE_CHECKING, Optional
@@ -36,7 +37,10 @@ class RetrievalRagStage(BaseRagStage):
         logging.info("RetrievalRagStage: running %s retrieval modules in parallel", len(self.retrieval_modules))
 
         results = utils.execute_futures_list(
-            [self.futures_executor.submit(r.run, context) for r in self.retrieval_modules]
+            [
+                self.futures_executor.submit(contextvars.copy_context().run, r.run, context)
+                for r in self.retrieval_modules
+            ]
         )
 
         # flatten the list of lists
@@ -11,6 +11,7 @@ from .finish_prompt_event import FinishPromptEvent
 from .start_structure_run_event import StartStructureRunEvent
 from .finish_structure_run_event import FinishStructureRunEvent
 from .completion_chunk_event import CompletionChunkEvent
+from .event_listener_metrics import EventListenerMetrics
 from .event_listener import EventListener
 from .start_image_generation_event import StartImageGenerationEvent
 from .finish_image_generation_event import FinishImageGenerationEvent
@@ -38,6 +39,7 @@ __all__ = [
     "StartStructureRunEvent",
     "FinishStructureRunEvent",
     "CompletionChunkEvent",
+    "EventListenerMetrics",
     "EventListener",
     "StartImageGenerationEvent",
     "FinishImageGenerationEvent",
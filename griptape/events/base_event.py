@@ -3,10 +3,11 @@ from __future__ import annotations
 import time
 import uuid
 from abc import ABC
-from typing import Any
+from typing import Any, Optional
 
 from attrs import Factory, define, field
 
+from griptape.events.event_bus import EventBus
 from griptape.mixins import SerializableMixin
 
 
@@ -15,3 +16,6 @@ class BaseEvent(SerializableMixin, ABC):
     id: str = field(default=Factory(lambda: uuid.uuid4().hex), kw_only=True, metadata={"serializable": True})
     timestamp: float = field(default=Factory(lambda: time.time()), kw_only=True, metadata={"serializable": True})
     meta: dict[str, Any] = field(factory=dict, kw_only=True, metadata={"serializable": True})
+    structure_id: Optional[str] = field(
+        default=Factory(lambda: EventBus.structure_id), kw_only=True, metadata={"serializable": True}
+    )
@@ -1,22 +1,63 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Optional
 
 from attrs import define, field
 
 from griptape.mixins.singleton_mixin import SingletonMixin
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from griptape.events import BaseEvent, EventListener
 
+# Ids of the Structures running in the current context, outermost first.
+_structure_ids: ContextVar[tuple[str, ...]] = ContextVar("structure_ids", default=())
+
 
 @define
 class _EventBus(SingletonMixin):
+    """Publishes Events to Event Listeners.
+
+    The Event Listeners of each Event type are looked up once and kept in a routing table until Event Listeners are
+    added or removed, so publishing an Event doesn't go through every Event Listener's `event_types`.
+
+    Event Listeners with a `structure_id` are kept in a separate routing table for each Structure, and only receive the
+    Events published while that Structure, or a Structure that it runs, is running. Publishing an Event therefore only
+    looks up the Event Listeners of the running Structures, no matter how many other Structures are being listened to.
+    """
+
     _event_listeners: list[EventListener] = field(factory=list, kw_only=True, alias="_event_listeners")
+    _routes: dict[type, list[EventListener]] = field(factory=dict, init=False)
+    # Maps Structure ids to their Event Listeners and the routing table built from them.
+    _scoped_event_listeners: dict[str, tuple[list[EventListener], dict[type, list[EventListener]]]] = field(
+        factory=dict, init=False
+    )
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
 
     @property
     def event_listeners(self) -> list[EventListener]:
-        return self._event_listeners
+        if not self._scoped_event_listeners:
+            return self._event_listeners
+
+        return [
+            *self._event_listeners,
+            *(
+                event_listener
+                for event_listeners, _ in self._scoped_event_listeners.values()
+                for event_listener in event_listeners
+            ),
+        ]
+
+    @property
+    def structure_id(self) -> Optional[str]:
+        """Id of the innermost Structure running in the current context, if any."""
+        structure_ids = _structure_ids.get()
+
+        return structure_ids[-1] if structure_ids else None
 
     def add_event_listeners(self, event_listeners: list[EventListener]) -> list[EventListener]:
         return [self.add_event_listener(event_listener) for event_listener in event_listeners]
@@ -26,21 +67,139 @@ class _EventBus(SingletonMixin):
             self.remove_event_listener(event_listener)
 
     def add_event_listener(self, event_listener: EventListener) -> EventListener:
-        if event_listener not in self._event_listeners:
-            self._event_listeners.append(event_listener)
+        structure_id = event_listener.structure_id
+
+        with self._lock:
+            if structure_id is None:
+                if event_listener not in self._event_listeners:
+                    self._event_listeners.append(event_listener)
+                    self._routes = {}
+            else:
+                event_listeners, _ = self._scoped_event_listeners.get(structure_id, ([], {}))
+
+                if event_listener not in event_listeners:
+                    # Replace the entry rather than mutating it, since other threads may be publishing to it.
+                    self._scoped_event_listeners[structure_id] = ([*event_listeners, event_listener], {})
 
         return event_listener
 
     def remove_event_listener(self, event_listener: EventListener) -> None:
-        if event_listener in self._event_listeners:
-            self._event_listeners.remove(event_listener)
+        structure_id = event_listener.structure_id
+
+        with self._lock:
+            if structure_id is None:
+                if event_listener not in self._event_listeners:
+                    return
+
+                self._event_listeners.remove(event_listener)
+                self._routes = {}
+            else:
+                event_listeners, _ = self._scoped_event_listeners.get(structure_id, ([], {}))
+
+                if event_listener not in event_listeners:
+                    return
+
+                event_listeners = [listener for listener in event_listeners if listener is not event_listener]
+
+                if event_listeners:
+                    self._scoped_event_listeners[structure_id] = (event_listeners, {})
+                else:
+                    del self._scoped_event_listeners[structure_id]
+
+        event_listener.close(wait=False)
 
     def publish_event(self, event: BaseEvent, *, flush: bool = False) -> None:
-        for event_listener in self._event_listeners:
+        event_type = type(event)
+
+        # Take a reference to the table, since adding or removing an Event Listener replaces it.
+        for event_listener in self.__get_route(self._routes, self._event_listeners, event_type):
             event_listener.publish_event(event, flush=flush)
 
+        if self._scoped_event_listeners:
+            for structure_id in self.__get_structure_ids(event):
+                scoped_event_listeners = self._scoped_event_listeners.get(structure_id)
+
+                if scoped_event_listeners is not None:
+                    event_listeners, routes = scoped_event_listeners
+
+                    for event_listener in self.__get_route(routes, event_listeners, event_type):
+                        event_listener.publish_event(event, flush=flush)
+
     def clear_event_listeners(self) -> None:
-        self._event_listeners.clear()
+        for event_listener in self.event_listeners:
+            event_listener.close(wait=False)
+
+        with self._lock:
+            self._event_listeners.clear()
+            self._routes = {}
+            self._scoped_event_listeners = {}
+
+    def refresh_routes(self) -> None:
+        """Rebuilds the routing table. Call after changing the `event_types` of an added Event Listener."""
+        with self._lock:
+            self._routes = {}
+            self._scoped_event_listeners = {
+                structure_id: (event_listeners, {})
+                for structure_id, (event_listeners, _) in self._scoped_event_listeners.items()
+            }
+
+    @contextmanager
+    def structure_scope(self, structure_id: str) -> Iterator[None]:
+        """Tags the Events published in the current context with a Structure's id.
+
+        Scopes are context-local, so they apply to the current thread or asyncio Task, and to threads that run in a copy
+        of the current context.
+
+        Args:
+            structure_id: Id of the running Structure.
+        """
+        token = _structure_ids.set((*_structure_ids.get(), structure_id))
+
+        try:
+            yield
+        finally:
+            _structure_ids.reset(token)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Waits until every Event queued by asynchronous Event Listeners has been handled.
+
+        Args:
+            timeout: Maximum number of seconds to wait for each Event Listener. Waits indefinitely if `None`.
+
+        Returns:
+            Whether every queued Event was handled before the timeout.
+        """
+        drained = True
+
+        for event_listener in list(self.event_listeners):
+            drained = event_listener.drain(timeout) and drained
+
+        return drained
+
+    def __get_route(
+        self, routes: dict[type, list[EventListener]], event_listeners: list[EventListener], event_type: type
+    ) -> list[EventListener]:
+        route = routes.get(event_type)
+
+        if route is None:
+            route = [
+                event_listener
+                for event_listener in event_listeners
+                if event_listener.event_types is None or event_type in event_listener.event_types
+            ]
+            routes[event_type] = route
+
+        return route
+
+    def __get_structure_ids(self, event: BaseEvent) -> tuple[str, ...]:
+        structure_ids = _structure_ids.get()
+
+        # Events tagged with a Structure that isn't running in the current context, for instance Events published on
+        # another thread, still reach that Structure's Event Listeners.
+        if event.structure_id is not None and event.structure_id not in structure_ids:
+            return (*structure_ids, event.structure_id)
+
+        return structure_ids
 
 
 EventBus = _EventBus()
@@ -1,28 +1,182 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Optional
+import logging
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Literal, Optional
 
-from attrs import Factory, define, field
+from attrs import Attribute, Factory, define, evolve, field
+
+from .completion_chunk_event import CompletionChunkEvent
+from .event_listener_metrics import EventListenerMetrics
 
 if TYPE_CHECKING:
     from griptape.drivers import BaseEventListenerDriver
 
     from .base_event import BaseEvent
 
+logger = logging.getLogger(__name__)
+
 
 @define
 class EventListener:
+    """Handles Events published to the Event Bus.
+
+    By default, Events are handled on the thread that publishes them. An asynchronous Event Listener instead puts Events
+    in a bounded queue that a dedicated worker thread handles, so that slow handlers or Drivers don't slow down the
+    Structure, for instance while it streams `CompletionChunkEvent`s.
+
+    Attributes:
+        handler: Function that converts an Event into the payload published to `driver`.
+        event_types: Types of Events to handle. Handles all Events if `None`.
+        structure_id: Id of the Structure whose Events to handle, including the Events of Structures that it runs.
+            Handles the Events of every Structure, and Events published outside of Structures, if `None`.
+        driver: Event Listener Driver that handled Events are published to.
+        asynchronous: Whether to handle Events on a worker thread.
+        max_queue_size: Maximum number of Events waiting to be handled by an asynchronous Event Listener.
+        overflow_policy: What to do when an Event is published to a full queue. `block` waits for the worker to make
+            room, `drop_oldest` drops the oldest queued Event, and `coalesce` merges a `CompletionChunkEvent` into the
+            last queued `CompletionChunkEvent`, and otherwise blocks. Events that the handler or driver publishes back
+            to a full queue from the worker thread are handled right away instead of blocking, ahead of queued Events.
+        metrics: Queue depth and latency counters.
+    """
+
     handler: Callable[[BaseEvent], Optional[dict]] = field(default=Factory(lambda: lambda event: event.to_dict()))
     event_types: Optional[list[type[BaseEvent]]] = field(default=None, kw_only=True)
+    structure_id: Optional[str] = field(default=None, kw_only=True)
     driver: Optional[BaseEventListenerDriver] = field(default=None, kw_only=True)
+    asynchronous: bool = field(default=False, kw_only=True)
+    max_queue_size: int = field(default=1000, kw_only=True)
+    overflow_policy: Literal["block", "drop_oldest", "coalesce"] = field(default="block", kw_only=True)
+    metrics: EventListenerMetrics = field(factory=EventListenerMetrics, kw_only=True, eq=False)
+    _queue: deque[tuple[BaseEvent, bool, float]] = field(factory=deque, init=False, eq=False)
+    _condition: threading.Condition = field(factory=threading.Condition, init=False, eq=False)
+    _worker: Optional[threading.Thread] = field(default=None, init=False, eq=False)
+    _unfinished_count: int = field(default=0, init=False, eq=False)
+    _closed: bool = field(default=False, init=False, eq=False)
+
+    @max_queue_size.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_max_queue_size(self, _: Attribute, max_queue_size: int) -> None:
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be greater than 0.")
 
     def publish_event(self, event: BaseEvent, *, flush: bool = False) -> None:
         event_types = self.event_types
 
         if event_types is None or type(event) in event_types:
-            event_payload = self.handler(event)
-            if self.driver is not None:
-                if event_payload is not None and isinstance(event_payload, dict):
-                    self.driver.publish_event(event_payload, flush=flush)
+            if self.asynchronous:
+                self._enqueue_event(event, flush=flush, published_at=time.perf_counter())
+            else:
+                self._handle_event(event, flush=flush, published_at=time.perf_counter())
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Waits until every queued Event has been handled.
+
+        Args:
+            timeout: Maximum number of seconds to wait. Waits indefinitely if `None`.
+
+        Returns:
+            Whether every queued Event was handled before the timeout.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._unfinished_count == 0, timeout=timeout)
+
+    def close(self, *, wait: bool = True) -> None:
+        """Stops the worker thread of an asynchronous Event Listener once every queued Event has been handled.
+
+        Events published after closing start a new worker thread.
+
+        Args:
+            wait: Whether to wait for the worker thread to finish.
+        """
+        with self._condition:
+            worker = self._worker
+            self._closed = True
+            self._condition.notify_all()
+
+        if wait and worker is not None and worker is not threading.current_thread():
+            worker.join()
+
+    def _handle_event(self, event: BaseEvent, *, flush: bool, published_at: float) -> None:
+        event_payload = self.handler(event)
+        if self.driver is not None:
+            if event_payload is not None and isinstance(event_payload, dict):
+                self.driver.publish_event(event_payload, flush=flush)
+            else:
+                self.driver.publish_event(event, flush=flush)
+
+        self.metrics.record_latency(time.perf_counter() - published_at)
+
+    def _enqueue_event(self, event: BaseEvent, *, flush: bool, published_at: float) -> None:
+        handle_inline = False
+
+        with self._condition:
+            if self._worker is None:
+                self._closed = False
+                self._worker = threading.Thread(target=self._run_worker, daemon=True, name="EventListenerWorker")
+                self._worker.start()
+
+            if len(self._queue) >= self.max_queue_size:
+                if self.overflow_policy == "coalesce" and self._coalesce_event(event, flush=flush):
+                    return
+                elif self.overflow_policy == "drop_oldest":
+                    self._queue.popleft()
+                    self._unfinished_count -= 1
+                    self.metrics.dropped_count += 1
+                elif self._worker is threading.current_thread():
+                    # The worker is the only thread that makes room in the queue, so a handler that publishes to its
+                    # own full queue would wait on itself forever.
+                    handle_inline = True
                 else:
-                    self.driver.publish_event(event, flush=flush)
+                    self._condition.wait_for(lambda: len(self._queue) < self.max_queue_size)
+
+            if not handle_inline:
+                self._queue.append((event, flush, published_at))
+                self._unfinished_count += 1
+                self.metrics.record_queue_depth(len(self._queue))
+                self._condition.notify_all()
+
+        if handle_inline:
+            self._handle_event(event, flush=flush, published_at=published_at)
+
+    def _coalesce_event(self, event: BaseEvent, *, flush: bool) -> bool:
+        last_event, last_flush, published_at = self._queue[-1]
+
+        if (
+            type(event) is CompletionChunkEvent
+            and type(last_event) is CompletionChunkEvent
+            and event.meta == last_event.meta
+        ):
+            self._queue[-1] = (
+                evolve(last_event, token=last_event.token + event.token),
+                last_flush or flush,
+                published_at,
+            )
+            self.metrics.coalesced_count += 1
+
+            return True
+        else:
+            return False
+
+    def _run_worker(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or self._closed)
+
+                if not self._queue:
+                    self._worker = None
+                    return
+
+                event, flush, published_at = self._queue.popleft()
+                self.metrics.record_queue_depth(len(self._queue))
+                self._condition.notify_all()
+
+            try:
+                self._handle_event(event, flush=flush, published_at=published_at)
+            except Exception as e:
+                logger.error(e)
+            finally:
+                with self._condition:
+                    self._unfinished_count -= 1
+                    self._condition.notify_all()
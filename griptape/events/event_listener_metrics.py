@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from attrs import define, field
+
+
+@define
+class EventListenerMetrics:
+    """Counters of the Events dispatched by an Event Listener.
+
+    Attributes:
+        queue_depth: Number of Events waiting in the Event Listener's queue.
+        max_queue_depth: Largest number of Events that have waited in the queue at once.
+        handled_count: Number of Events handled.
+        dropped_count: Number of Events dropped from a full queue.
+        coalesced_count: Number of `CompletionChunkEvent`s merged into a queued `CompletionChunkEvent`.
+        total_latency: Total time between publishing and handling Events, in seconds.
+        max_latency: Longest time between publishing and handling an Event, in seconds.
+    """
+
+    queue_depth: int = field(default=0, kw_only=True)
+    max_queue_depth: int = field(default=0, kw_only=True)
+    handled_count: int = field(default=0, kw_only=True)
+    dropped_count: int = field(default=0, kw_only=True)
+    coalesced_count: int = field(default=0, kw_only=True)
+    total_latency: float = field(default=0.0, kw_only=True)
+    max_latency: float = field(default=0.0, kw_only=True)
+
+    @property
+    def average_latency(self) -> float:
+        return self.total_latency / self.handled_count if self.handled_count else 0.0
+
+    def record_latency(self, latency: float) -> None:
+        self.handled_count += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    def record_queue_depth(self, queue_depth: int) -> None:
+        self.queue_depth = queue_depth
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
@@ -12,6 +12,5 @@ if TYPE_CHECKING:
 
 @define
 class FinishStructureRunEvent(BaseEvent):
-    structure_id: Optional[str] = field(kw_only=True, default=None, metadata={"serializable": True})
     output_task_input: BaseArtifact = field(kw_only=True, metadata={"serializable": True})
     output_task_output: Optional[BaseArtifact] = field(kw_only=True, metadata={"serializable": True})
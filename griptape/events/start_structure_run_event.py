@@ -12,6 +12,5 @@ if TYPE_CHECKING:
 
 @define
 class StartStructureRunEvent(BaseEvent):
-    structure_id: Optional[str] = field(kw_only=True, default=None, metadata={"serializable": True})
     input_task_input: BaseArtifact = field(kw_only=True, metadata={"serializable": True})
     input_task_output: Optional[BaseArtifact] = field(kw_only=True, metadata={"serializable": True})
@@ -1,28 +1,54 @@
-from .base_loader import BaseLoader
-from .base_text_loader import BaseTextLoader
-from .text_loader import TextLoader
-from .pdf_loader import PdfLoader
-from .web_loader import WebLoader
-from .sql_loader import SqlLoader
-from .csv_loader import CsvLoader
-from .dataframe_loader import DataFrameLoader
-from .email_loader import EmailLoader
-from .image_loader import ImageLoader
-from .audio_loader import AudioLoader
-from .blob_loader import BlobLoader
-
-
-__all__ = [
-    "BaseLoader",
-    "BaseTextLoader",
-    "TextLoader",
-    "PdfLoader",
-    "WebLoader",
-    "SqlLoader",
-    "CsvLoader",
-    "DataFrameLoader",
-    "EmailLoader",
-    "ImageLoader",
-    "AudioLoader",
-    "BlobLoader",
-]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base_loader import BaseLoader as BaseLoader
+    from .base_text_loader import BaseTextLoader as BaseTextLoader
+    from .text_loader import TextLoader as TextLoader
+    from .pdf_loader import PdfLoader as PdfLoader
+    from .web_loader import WebLoader as WebLoader
+    from .sql_loader import SqlLoader as SqlLoader
+    from .csv_loader import CsvLoader as CsvLoader
+    from .dataframe_loader import DataFrameLoader as DataFrameLoader
+    from .email_loader import EmailLoader as EmailLoader
+    from .image_loader import ImageLoader as ImageLoader
+    from .audio_loader import AudioLoader as AudioLoader
+    from .blob_loader import BlobLoader as BlobLoader
+
+# Loaders are imported from their modules on first access, so that importing the package doesn't import
+# every Loader and the third-party libraries that it depends on.
+_LAZY_IMPORTS = {
+    "BaseLoader": ".base_loader",
+    "BaseTextLoader": ".base_text_loader",
+    "TextLoader": ".text_loader",
+    "PdfLoader": ".pdf_loader",
+    "WebLoader": ".web_loader",
+    "SqlLoader": ".sql_loader",
+    "CsvLoader": ".csv_loader",
+    "DataFrameLoader": ".dataframe_loader",
+    "EmailLoader": ".email_loader",
+    "ImageLoader": ".image_loader",
+    "AudioLoader": ".audio_loader",
+    "BlobLoader": ".blob_loader",
+}
+
+# Type checkers get the exported names from the imports above, which re-export them explicitly.
+__all__ = list(_LAZY_IMPORTS)  # pyright: ignore[reportUnsupportedDunderAll]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -6,11 +6,11 @@ from typing import TYPE_CHECKING, Any, Optional
 from attrs import define, field
 
 from griptape.mixins import FuturesExecutorMixin
-from griptape.utils.futures import execute_futures_dict
+from griptape.utils.futures import execute_futures_dict, execute_futures_dict_as_completed
 from griptape.utils.hash import bytes_to_hash, str_to_hash
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Iterator, Mapping, Sequence
 
     from griptape.artifacts import BaseArtifact
 
@@ -39,6 +39,31 @@ class BaseLoader(FuturesExecutorMixin, ABC):
             },
         )
 
+    def stream_collection(
+        self,
+        sources: list[Any],
+        *args,
+        **kwargs,
+    ) -> Iterator[tuple[str, BaseArtifact | Sequence[BaseArtifact | Sequence[BaseArtifact]]]]:
+        """Loads sources concurrently like `load_collection`, but yields each source as soon as it's loaded.
+
+        Args:
+            sources: Sources to load.
+            *args: Positional arguments passed to `load`.
+            **kwargs: Keyword arguments passed to `load`.
+
+        Returns:
+            An iterator of the key and loaded Artifacts of each source, in the order that sources finish loading.
+        """
+        sources_by_key = {self.to_key(source): source for source in sources}
+
+        return execute_futures_dict_as_completed(
+            {
+                key: self.futures_executor.submit(self.load, source, *args, **kwargs)
+                for key, source in sources_by_key.items()
+            },
+        )
+
     def to_key(self, source: Any, *args, **kwargs) -> str:
         if isinstance(source, bytes):
             return bytes_to_hash(source)
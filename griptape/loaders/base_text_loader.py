@@ -11,6 +11,8 @@ from griptape.loaders import BaseLoader
 from griptape.tokenizers import OpenAiTokenizer
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from griptape.common import Reference
     from griptape.drivers import BaseEmbeddingDriver
 
@@ -47,6 +49,12 @@ class BaseTextLoader(BaseLoader, ABC):
             super().load_collection(sources, *args, **kwargs),
         )
 
+    def stream_collection(self, sources: list[Any], *args, **kwargs) -> Iterator[tuple[str, list[TextArtifact]]]:
+        return cast(
+            "Iterator[tuple[str, list[TextArtifact]]]",
+            super().stream_collection(sources, *args, **kwargs),
+        )
+
     def _text_to_artifacts(self, text: str) -> list[TextArtifact]:
         artifacts = []
 
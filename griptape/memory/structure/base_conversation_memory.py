@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -15,8 +16,24 @@ if TYPE_CHECKING:
     from griptape.memory.structure import Run
 
 
+logger = logging.getLogger(__name__)
+
+
 @define
 class BaseConversationMemory(SerializableMixin, ABC):
+    """Base class for Conversation Memory.
+
+    Attributes:
+        conversation_memory_driver: Driver used to load and store the runs.
+        runs: Runs stored in the memory.
+        meta: Metadata stored alongside the runs.
+        autoload: Whether to load runs from `conversation_memory_driver` on initialization.
+        autoprune: Whether to drop the oldest runs that don't fit in the Prompt Driver's input tokens.
+        max_runs: Optional maximum number of runs to keep.
+        last_fit_run_count: Number of runs added to the Prompt Stack by the last `add_to_prompt_stack` call.
+        last_pruned_run_count: Number of runs pruned by the last `add_to_prompt_stack` call.
+    """
+
     conversation_memory_driver: BaseConversationMemoryDriver = field(
         default=Factory(lambda: Defaults.drivers_config.conversation_memory_driver), kw_only=True
     )
@@ -25,6 +42,8 @@ class BaseConversationMemory(SerializableMixin, ABC):
     autoload: bool = field(default=True, kw_only=True)
     autoprune: bool = field(default=True, kw_only=True)
     max_runs: Optional[int] = field(default=None, kw_only=True, metadata={"serializable": True})
+    last_fit_run_count: int = field(default=0, init=False)
+    last_pruned_run_count: int = field(default=0, init=False)
 
     def __attrs_post_init__(self) -> None:
         if self.autoload:
@@ -67,31 +86,18 @@ class BaseConversationMemory(SerializableMixin, ABC):
         """
         num_runs_to_fit_in_prompt = len(self.runs)
 
-        if self.autoprune:
-            should_prune = True
-            temp_stack = PromptStack()
-
-            # Try to determine how many Conversation Memory runs we can
-            # fit into the Prompt Stack without exceeding the token limit.
-            while should_prune and num_runs_to_fit_in_prompt > 0:
-                temp_stack.messages = prompt_stack.messages.copy()
-
-                # Add n runs from Conversation Memory.
-                # Where we insert into the Prompt Stack doesn't matter here
-                # since we only care about the total token count.
-                memory_inputs = self.to_prompt_stack(num_runs_to_fit_in_prompt).messages
-                temp_stack.messages.extend(memory_inputs)
-
-                # Convert the Prompt Stack into tokens left.
-                tokens_left = prompt_driver.tokenizer.count_input_tokens_left(
-                    prompt_driver.prompt_stack_to_string(temp_stack),
-                )
-                if tokens_left > 0:
-                    # There are still tokens left, no need to prune.
-                    should_prune = False
-                else:
-                    # There were not any tokens left, prune one run and try again.
-                    num_runs_to_fit_in_prompt -= 1
+        if self.autoprune and num_runs_to_fit_in_prompt > 0:
+            num_runs_to_fit_in_prompt = self._count_runs_to_fit(prompt_driver, prompt_stack)
+
+        self.last_fit_run_count = num_runs_to_fit_in_prompt
+        self.last_pruned_run_count = len(self.runs) - num_runs_to_fit_in_prompt
+
+        if self.last_pruned_run_count:
+            logger.debug(
+                "Conversation Memory pruned %s of %s runs to fit the Prompt Stack.",
+                self.last_pruned_run_count,
+                len(self.runs),
+            )
 
         if num_runs_to_fit_in_prompt:
             memory_inputs = self.to_prompt_stack(num_runs_to_fit_in_prompt).messages
@@ -101,3 +107,69 @@ class BaseConversationMemory(SerializableMixin, ABC):
                 prompt_stack.messages[index:index] = memory_inputs
 
         return prompt_stack
+
+    def _count_runs_to_fit(self, prompt_driver: BasePromptDriver, prompt_stack: PromptStack) -> int:
+        """Returns the number of most recent runs that fit into the Prompt Stack without exceeding the token limit.
+
+        If every run fits, a single token count of the whole Prompt Stack confirms it. Otherwise, every run's tokens are
+        counted once and cached on the run. The number of runs is estimated with a sum of the token counts of the most
+        recent runs, and then verified and corrected with a binary search over token counts of the whole Prompt Stack.
+        """
+        tokenizer = prompt_driver.tokenizer
+        run_count = len(self.runs)
+
+        def fits(num_runs: int) -> bool:
+            if num_runs == 0:
+                return True
+
+            # Where we insert into the Prompt Stack doesn't matter here since we only care about the total token count.
+            temp_stack = PromptStack(messages=[*prompt_stack.messages, *self.to_prompt_stack(num_runs).messages])
+
+            return tokenizer.count_input_tokens_left(prompt_driver.prompt_stack_to_string(temp_stack)) > 0
+
+        if fits(run_count):
+            return run_count
+
+        # Every Prompt Stack string carries the same overhead, so remove it from the token count of each run.
+        overhead_token_count = tokenizer.count_tokens(prompt_driver.prompt_stack_to_string(PromptStack()))
+        token_count = tokenizer.count_tokens(prompt_driver.prompt_stack_to_string(prompt_stack))
+        estimate = 0
+
+        for run in reversed(self.runs):
+            token_count += self._count_run_tokens(prompt_driver, run) - overhead_token_count
+
+            if token_count >= tokenizer.max_input_tokens:
+                break
+
+            estimate += 1
+
+        if estimate < run_count and fits(estimate):
+            if not fits(estimate + 1):
+                return estimate
+
+            low, high = estimate + 1, run_count - 1
+        else:
+            low, high = 0, estimate - 1
+
+        while low < high:
+            middle = (low + high + 1) // 2
+
+            if fits(middle):
+                low = middle
+            else:
+                high = middle - 1
+
+        return low
+
+    def _count_run_tokens(self, prompt_driver: BasePromptDriver, run: Run) -> int:
+        key = f"{prompt_driver.__class__.__name__}:{prompt_driver.tokenizer.model}"
+        token_count = run.token_counts.get(key)
+
+        if token_count is None:
+            run_stack = PromptStack()
+            run_stack.add_user_message(run.input)
+            run_stack.add_assistant_message(run.output)
+            token_count = prompt_driver.tokenizer.count_tokens(prompt_driver.prompt_stack_to_string(run_stack))
+            run.token_counts[key] = token_count
+
+        return token_count
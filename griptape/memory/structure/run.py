@@ -13,7 +13,18 @@ if TYPE_CHECKING:
 
 @define(kw_only=True)
 class Run(SerializableMixin):
+    """A single input and output exchanged with a Structure.
+
+    Attributes:
+        id: Unique identifier of the Run.
+        meta: Optional metadata of the Run.
+        input: Input of the Run.
+        output: Output of the Run.
+        token_counts: Token counts of the Run's messages keyed by the Prompt Driver and model they were counted for.
+    """
+
     id: str = field(default=Factory(lambda: uuid.uuid4().hex), metadata={"serializable": True})
     meta: Optional[dict] = field(default=None, metadata={"serializable": True})
     input: BaseArtifact = field(metadata={"serializable": True})
     output: BaseArtifact = field(metadata={"serializable": True})
+    token_counts: dict[str, int] = field(factory=dict, init=False, eq=False)
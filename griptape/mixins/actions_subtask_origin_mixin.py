@@ -34,10 +34,11 @@ class ActionsSubtaskOriginMixin:
 
         for tool in tools:
             for activity_schema in tool.activity_schemas():
-                action_schema = activity_schema.schema
-                tag_key = Literal("tag", description="Unique tag name for action execution.")
-
-                action_schema[tag_key] = str
+                # Activity schemas are cached by the Tool, so the tag is added to a copy.
+                action_schema = {
+                    **activity_schema.schema,
+                    Literal("tag", description="Unique tag name for action execution."): str,
+                }
 
                 action_schemas.append(action_schema)
 
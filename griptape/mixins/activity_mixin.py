@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import inspect
 from copy import deepcopy
 from typing import Callable, Optional
@@ -17,11 +18,16 @@ class ActivityMixin:
         allowlist: List of Tool Activities to include in the Tool schema.
         denylist: List of Tool Activities to remove from the Tool schema.
         extra_schema_properties: Mapping of Activity name and extra properties to include in the activity's schema.
+
+    Activities are looked up once per allowlist and denylist, and Activity schemas are built once per Activity and
+    `extra_schema_properties`. Activity schemas are shared between calls, so they shouldn't be modified.
     """
 
     allowlist: Optional[list[str]] = field(default=None, kw_only=True)
     denylist: Optional[list[str]] = field(default=None, kw_only=True)
     extra_schema_properties: Optional[dict[str, dict]] = field(default=None, kw_only=True)
+    _activities_cache: dict[tuple, list[Callable]] = field(factory=dict, init=False, eq=False)
+    _activity_schema_cache: dict[tuple[str, str], Optional[Schema]] = field(factory=dict, init=False, eq=False)
 
     @allowlist.validator  # pyright: ignore[reportAttributeAccessIssue]
     def validate_allowlist(self, _: Attribute, allowlist: Optional[list[str]]) -> None:
@@ -56,16 +62,25 @@ class ActivityMixin:
     # This method has to remain a method and can't be decorated with @property because
     # of the max depth recursion issue in `inspect.getmembers`.
     def activities(self) -> list[Callable]:
-        methods = []
+        key = (
+            None if self.allowlist is None else tuple(self.allowlist),
+            None if self.denylist is None else tuple(self.denylist),
+        )
+        methods = self._activities_cache.get(key)
+
+        if methods is None:
+            methods = []
 
-        for name, method in inspect.getmembers(self, predicate=inspect.ismethod):
-            allowlist_condition = self.allowlist is None or name in self.allowlist
-            denylist_condition = self.denylist is None or name not in self.denylist
+            for name, method in inspect.getmembers(self, predicate=inspect.ismethod):
+                allowlist_condition = self.allowlist is None or name in self.allowlist
+                denylist_condition = self.denylist is None or name not in self.denylist
 
-            if getattr(method, "is_activity", False) and allowlist_condition and denylist_condition:
-                methods.append(method)
+                if getattr(method, "is_activity", False) and allowlist_condition and denylist_condition:
+                    methods.append(method)
 
-        return methods
+            self._activities_cache[key] = methods
+
+        return list(methods)
 
     def find_activity(self, name: str) -> Optional[Callable]:
         for activity in self.activities():
@@ -82,22 +97,27 @@ class ActivityMixin:
     def activity_description(self, activity: Callable) -> str:
         if activity is None or not getattr(activity, "is_activity", False):
             raise Exception("This method is not an activity.")
-        return Template(getattr(activity, "config")["description"]).render({"_self": self})
+        return _compile_description(getattr(activity, "config")["description"]).render({"_self": self})
 
     def activity_schema(self, activity: Callable) -> Optional[Schema]:
         if activity is None or not getattr(activity, "is_activity", False):
             raise Exception("This method is not an activity.")
-        if getattr(activity, "config")["schema"] is not None:
-            # Need to deepcopy to avoid modifying the original schema
-            config_schema = deepcopy(getattr(activity, "config")["schema"])
-            activity_name = self.activity_name(activity)
+        activity_name = self.activity_name(activity)
+        key = (activity_name, repr(self.extra_schema_properties))
+
+        if key not in self._activity_schema_cache:
+            if getattr(activity, "config")["schema"] is not None:
+                # Need to deepcopy to avoid modifying the original schema
+                config_schema = deepcopy(getattr(activity, "config")["schema"])
 
-            if self.extra_schema_properties is not None and activity_name in self.extra_schema_properties:
-                config_schema.schema.update(self.extra_schema_properties[activity_name])
+                if self.extra_schema_properties is not None and activity_name in self.extra_schema_properties:
+                    config_schema.schema.update(self.extra_schema_properties[activity_name])
 
-            return Schema({"values": config_schema})
-        else:
-            return None
+                self._activity_schema_cache[key] = Schema({"values": config_schema})
+            else:
+                self._activity_schema_cache[key] = None
+
+        return self._activity_schema_cache[key]
 
     def _validate_tool_activity(self, activity_name: str) -> None:
         tool = self.__class__
@@ -106,3 +126,8 @@ class ActivityMixin:
 
         if not activity or not getattr(activity, "is_activity", False):
             raise ValueError(f"activity {activity_name} is not a valid activity for {tool}")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_description(description: str) -> Template:
+    return Template(description)
@@ -2,25 +2,123 @@ from __future__ import annotations
 
 import logging
 from abc import ABC
-from typing import Callable
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
 from attrs import define, field
-from tenacity import Retrying, retry_if_not_exception_type, stop_after_attempt, wait_exponential
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+    from griptape.utils import RateLimiter
 
 
 @define(slots=False)
 class ExponentialBackoffMixin(ABC):
+    """Retries failed requests with exponential backoff, and limits the rate of requests.
+
+    A `Retry-After` header in the response of a failed request takes precedence over the exponential backoff.
+
+    Attributes:
+        min_retry_delay: Minimum number of seconds to wait between attempts.
+        max_retry_delay: Maximum number of seconds to wait between attempts.
+        max_attempts: Maximum number of attempts.
+        after_hook: Function called after each failed attempt.
+        ignored_exception_types: Types of exceptions that aren't retried.
+        rate_limiter: Rate Limiter of the requests. Defaults to the Rate Limiter in `RateLimiters` of the class and its
+            `model`, if any.
+    """
+
     min_retry_delay: float = field(default=2, kw_only=True)
     max_retry_delay: float = field(default=10, kw_only=True)
     max_attempts: int = field(default=10, kw_only=True)
     after_hook: Callable = field(default=lambda s: logging.warning(s), kw_only=True)
     ignored_exception_types: tuple[type[Exception], ...] = field(factory=tuple, kw_only=True)
+    rate_limiter: Optional[RateLimiter] = field(default=None, kw_only=True)
 
     def retrying(self) -> Retrying:
         return Retrying(
-            wait=wait_exponential(min=self.min_retry_delay, max=self.max_retry_delay),
+            wait=self._wait_retry_delay,
             retry=retry_if_not_exception_type(self.ignored_exception_types),
             stop=stop_after_attempt(self.max_attempts),
             reraise=True,
             after=self.after_hook,
         )
+
+    def async_retrying(self) -> AsyncRetrying:
+        return AsyncRetrying(
+            wait=self._wait_retry_delay,
+            retry=retry_if_not_exception_type(self.ignored_exception_types),
+            stop=stop_after_attempt(self.max_attempts),
+            reraise=True,
+            after=self.after_hook,
+        )
+
+    def get_rate_limiter(self) -> Optional[RateLimiter]:
+        from griptape.utils import RateLimiters
+
+        if self.rate_limiter is not None:
+            return self.rate_limiter
+        else:
+            model = getattr(self, "model", None)
+
+            return RateLimiters.get_rate_limiter(type(self).__name__, model=model if isinstance(model, str) else None)
+
+    @contextmanager
+    def limit_rate(self, token_count: Union[int, Callable[[], int]] = 0) -> Iterator[RateLimiter.Request]:
+        """Waits for the Rate Limiter, if any, before sending a request.
+
+        Args:
+            token_count: Estimated number of tokens used by the request, or a function that estimates it. The function
+                is only called if the Rate Limiter limits tokens.
+
+        Yields:
+            The request, whose `token_count` can be set to the actual number of tokens used.
+        """
+        from griptape.utils import RateLimiter
+
+        rate_limiter = self.get_rate_limiter()
+
+        if rate_limiter is None:
+            yield RateLimiter.Request()
+        else:
+            with rate_limiter.limit(self.__estimate_token_count(rate_limiter, token_count)) as request:
+                yield request
+
+    @asynccontextmanager
+    async def alimit_rate(self, token_count: Union[int, Callable[[], int]] = 0) -> AsyncIterator[RateLimiter.Request]:
+        """Waits for the Rate Limiter, if any, before sending a request from an asyncio event loop. See `limit_rate`."""
+        from griptape.utils import RateLimiter
+
+        rate_limiter = self.get_rate_limiter()
+
+        if rate_limiter is None:
+            yield RateLimiter.Request()
+        else:
+            async with rate_limiter.alimit(self.__estimate_token_count(rate_limiter, token_count)) as request:
+                yield request
+
+    def _wait_retry_delay(self, retry_state: RetryCallState) -> float:
+        from griptape.utils import RateLimiter
+
+        error = retry_state.outcome.exception() if retry_state.outcome is not None else None
+        retry_after = RateLimiter.get_retry_after(error) if error is not None else None
+
+        if retry_after is not None:
+            return retry_after
+        else:
+            return wait_exponential(min=self.min_retry_delay, max=self.max_retry_delay)(retry_state)
+
+    def __estimate_token_count(self, rate_limiter: RateLimiter, token_count: Union[int, Callable[[], int]]) -> int:
+        if rate_limiter.tokens_per_minute is None:
+            return 0
+        else:
+            return token_count() if callable(token_count) else token_count
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import functools
 import json
 from abc import ABC
 from importlib import import_module
-from typing import TYPE_CHECKING, Generic, Optional, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Generic, Optional, TypeVar, cast
 
 from attrs import Factory, define, field
 
 from griptape.schemas.base_schema import BaseSchema
+from griptape.schemas.schema_codec import SchemaCodec
 
 if TYPE_CHECKING:
     from marshmallow import Schema
@@ -15,8 +17,30 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound="SerializableMixin")
 
 
+@functools.lru_cache(maxsize=None)
+def _get_json_loads() -> Callable[[str], Any]:
+    from griptape.utils import import_optional_dependency, is_dependency_installed
+
+    if is_dependency_installed("orjson"):
+        orjson = import_optional_dependency("orjson")
+
+        def loads(data: str) -> Any:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # orjson is stricter than json, e.g. it rejects NaN, so let json decide.
+                return json.loads(data)
+
+        return loads
+    else:
+        return json.loads
+
+
 @define(slots=False)
 class SerializableMixin(Generic[T]):
+    # Classes found by `_import_cls_rec` keyed by the module and class name they were looked up with.
+    _imported_classes: ClassVar[dict[tuple[str, str], type]] = {}
+
     type: str = field(
         default=Factory(lambda self: self.__class__.__name__, takes_self=True),
         kw_only=True,
@@ -30,25 +54,15 @@ class SerializableMixin(Generic[T]):
         Args:
             subclass_name: An optional subclass name. Required if the class is abstract.
         """
-        if ABC in cls.__bases__:
-            if subclass_name is None:
-                raise ValueError(f"Type field is required for abstract class: {cls.__name__}")
-
-            subclass_cls = cls._import_cls_rec(cls.__module__, subclass_name)
-
-            schema_class = BaseSchema.from_attrs_cls(subclass_cls)
-        else:
-            schema_class = BaseSchema.from_attrs_cls(cls)
-
-        return schema_class()
+        return BaseSchema.from_attrs_cls(cls._get_serialized_cls(subclass_name))()
 
     @classmethod
     def from_dict(cls: type[T], data: dict) -> T:
-        return cast(T, cls.get_schema(subclass_name=data.get("type")).load(data))
+        return cast(T, SchemaCodec.from_attrs_cls(cls._get_serialized_cls(data.get("type"))).load(data))
 
     @classmethod
     def from_json(cls: type[T], data: str) -> T:
-        return cls.from_dict(json.loads(data))
+        return cls.from_dict(_get_json_loads()(data))
 
     def __str__(self) -> str:
         return json.dumps(self.to_dict())
@@ -57,9 +71,17 @@ class SerializableMixin(Generic[T]):
         return json.dumps(self.to_dict())
 
     def to_dict(self) -> dict:
-        schema = BaseSchema.from_attrs_cls(self.__class__)
+        return SchemaCodec.from_attrs_cls(self.__class__).dump(self)
 
-        return dict(schema().dump(self))
+    @classmethod
+    def _get_serialized_cls(cls, subclass_name: Optional[str] = None) -> type:
+        if ABC in cls.__bases__:
+            if subclass_name is None:
+                raise ValueError(f"Type field is required for abstract class: {cls.__name__}")
+
+            return cls._import_cls_rec(cls.__module__, subclass_name)
+        else:
+            return cls
 
     @classmethod
     def _import_cls_rec(cls, module_name: str, class_name: str) -> type:
@@ -75,6 +97,16 @@ class SerializableMixin(Generic[T]):
         Returns:
             The imported class if found. Raises `ValueError` if not found.
         """
+        imported_cls = SerializableMixin._imported_classes.get((module_name, class_name))
+
+        if imported_cls is None:
+            imported_cls = cls.__import_cls_rec(module_name, class_name)
+            SerializableMixin._imported_classes[(module_name, class_name)] = imported_cls
+
+        return imported_cls
+
+    @classmethod
+    def __import_cls_rec(cls, module_name: str, class_name: str) -> type:
         try:
             module = import_module(module_name)
             test = getattr(module, class_name, None)
@@ -87,6 +119,6 @@ class SerializableMixin(Generic[T]):
 
             if not len(module_dirs):
                 raise ValueError(f"Unable to import class: {class_name}")
-            return cls._import_cls_rec(module_name, class_name)
+            return cls.__import_cls_rec(module_name, class_name)
         else:
             return test
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC
 from collections.abc import Sequence
-from typing import Any, Literal, Union, _SpecialForm, get_args, get_origin
+from typing import Any, ClassVar, Literal, Union, _SpecialForm, get_args, get_origin
 
 import attrs
 from marshmallow import INCLUDE, Schema, fields
@@ -16,18 +16,36 @@ class BaseSchema(Schema):
 
     DATACLASS_TYPE_MAPPING = {**Schema.TYPE_MAPPING, dict: fields.Dict, bytes: Bytes, Any: fields.Raw}
 
+    # Generated Schemas keyed by the Schema class they extend and the attrs class they are generated for.
+    _schema_classes: ClassVar[dict[tuple[type, type], type]] = {}
+
     @classmethod
     def from_attrs_cls(cls, attrs_cls: type) -> type:
         """Generate a Schema from an attrs class.
 
+        Schemas are generated once per attrs class and reused by later calls.
+
         Args:
             attrs_cls: An attrs class.
         """
+        schema_class = cls._schema_classes.get((cls, attrs_cls))
+
+        if schema_class is None:
+            schema_class = cls._generate_schema(attrs_cls)
+            cls._schema_classes[(cls, attrs_cls)] = schema_class
+
+        return schema_class
+
+    @classmethod
+    def _generate_schema(cls, attrs_cls: type) -> type:
         from marshmallow import post_load
 
         from griptape.mixins import SerializableMixin
 
         class SubSchema(cls):
+            # The attrs class that the Schema loads and dumps.
+            attrs_class = attrs_cls
+
             @post_load
             def make_obj(self, data: Any, **kwargs) -> Any:
                 return attrs_cls(**data)
@@ -128,7 +146,8 @@ class BaseSchema(Schema):
         from griptape.structures import Structure
         from griptape.tokenizers import BaseTokenizer
         from griptape.tools import BaseTool
-        from griptape.utils import import_optional_dependency, is_dependency_installed
+        from griptape.utils import LruCache, RateLimiter, import_optional_dependency, is_dependency_installed
+        from griptape.vector_indexes import BaseVectorIndex
 
         attrs.resolve_types(
             attrs_cls,
@@ -155,8 +174,13 @@ class BaseSchema(Schema):
                 "Reference": Reference,
                 "Run": Run,
                 "Sequence": Sequence,
+                "LruCache": LruCache,
+                "RateLimiter": RateLimiter,
+                "BaseVectorIndex": BaseVectorIndex,
                 # Third party modules
                 "Client": import_optional_dependency("cohere").Client if is_dependency_installed("cohere") else Any,
+                # Only annotates a non-serializable field, so anthropic isn't imported to resolve it.
+                "AsyncClient": Any,
                 "GenerativeModel": import_optional_dependency("google.generativeai").GenerativeModel
                 if is_dependency_installed("google.generativeai")
                 else Any,
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import base64
+import math
+from abc import ABC
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Optional
+
+from attrs import define, field
+from marshmallow import fields, missing, utils
+
+from griptape.schemas.base_schema import BaseSchema
+from griptape.schemas.bytes_field import Bytes
+from griptape.schemas.polymorphic_schema import PolymorphicSchema
+
+if TYPE_CHECKING:
+    from marshmallow import Schema
+
+
+class _FallbackError(Exception):
+    """Raised by compiled dumpers and loaders when a value needs to go through marshmallow."""
+
+
+def _fallback(value: Any) -> Any:
+    raise _FallbackError
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _dump_bytes(value: bytes) -> str:
+    return base64.b64encode(value).decode()
+
+
+def _load_float(value: float) -> float:
+    # Marshmallow rejects NaN and infinity unless the field allows them.
+    if not math.isfinite(value):
+        raise _FallbackError
+
+    return float(value)
+
+
+# Types dumped, dump function, types loaded, and load function of the fields whose values are converted directly.
+# `None` types accept values of any type.
+_LeafCodec = tuple[Optional[tuple[type, ...]], Callable[[Any], Any], Optional[tuple[type, ...]], Callable[[Any], Any]]
+
+_LEAF_CODECS: dict[type, _LeafCodec] = {
+    fields.String: ((str,), _identity, (str,), _identity),
+    fields.Integer: ((int,), _identity, (int,), _identity),
+    fields.Float: ((float, int), float, (float, int), _load_float),
+    fields.Boolean: ((bool,), _identity, (bool,), _identity),
+    fields.Dict: ((dict,), dict, (dict,), dict),
+    fields.Raw: (None, _identity, None, _identity),
+    Bytes: ((bytes,), _dump_bytes, (str,), base64.b64decode),
+}
+
+
+@define
+class SchemaCodec:
+    """Compiled dumper and loader for a Schema generated by `BaseSchema.from_attrs_cls`.
+
+    The codec turns every field of the Schema into a plain Python function once, so that dumping and loading common
+    values (strings, numbers, booleans, dicts, bytes, lists, and nested or polymorphic attrs classes) skips
+    marshmallow's per-field machinery. Any value that the compiled functions can't handle with certainty is dumped or
+    loaded by the marshmallow Schema instead, so the output is always the same as the Schema's.
+
+    Attributes:
+        attrs_class: attrs class that the codec dumps and loads.
+        schema_class: Schema generated by `BaseSchema.from_attrs_cls` for `attrs_class`.
+        schema: Schema instance used for values the codec can't handle.
+    """
+
+    _codecs: ClassVar[dict[type, SchemaCodec]] = {}
+
+    attrs_class: type = field()
+    schema_class: type[BaseSchema] = field(init=False)
+    schema: Schema = field(init=False)
+    _dumpers: list[tuple[str, fields.Field, Callable[[Any], Any]]] = field(factory=list, init=False)
+    _loaders: dict[str, Callable[[Any], Any]] = field(factory=dict, init=False)
+    _get_value: Callable[[Any, str, Any], Any] = field(default=getattr, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        self.schema_class = BaseSchema.from_attrs_cls(self.attrs_class)
+        self.schema = self.schema_class()
+
+        # Marshmallow tries item access before attribute access on objects that support it.
+        if hasattr(self.attrs_class, "__getitem__"):
+            self._get_value = utils.get_value
+
+        for key, schema_field in self.schema.fields.items():
+            if schema_field.data_key is not None or schema_field.attribute is not None or schema_field.validators:
+                dumper = loader = _fallback
+            else:
+                dumper = self._compile_dumper(schema_field)
+                loader = self._compile_loader(schema_field)
+
+            self._dumpers.append((key, schema_field, dumper))
+            self._loaders[key] = loader
+
+    @classmethod
+    def from_attrs_cls(cls, attrs_cls: type) -> SchemaCodec:
+        """Returns the codec of the Schema generated for an attrs class. Codecs are compiled once per attrs class.
+
+        Args:
+            attrs_cls: An attrs class that implements SerializableMixin.
+        """
+        codec = cls._codecs.get(attrs_cls)
+
+        if codec is None:
+            codec = cls(attrs_cls)
+            cls._codecs[attrs_cls] = codec
+
+        return codec
+
+    def dump(self, obj: Any) -> dict:
+        result = {}
+
+        for key, schema_field, dumper in self._dumpers:
+            value = self._get_value(obj, key, missing)
+
+            try:
+                if value is missing:
+                    raise _FallbackError
+
+                value = dumper(value)
+            except _FallbackError:
+                value = schema_field.serialize(key, obj)
+
+                if value is missing:
+                    continue
+
+            result[key] = value
+
+        return result
+
+    def load(self, data: Any) -> Any:
+        try:
+            return self._load(data)
+        except (_FallbackError, TypeError, ValueError):
+            # Payloads that the compiled loaders or attrs reject are loaded by the Schema, so that they fail with the
+            # Schema's errors, such as a ValidationError, instead of an error raised while building the object.
+            return self.schema.load(data)
+
+    def _load(self, data: Any) -> Any:
+        if type(data) is not dict:
+            raise _FallbackError
+
+        loaders = self._loaders
+        kwargs = {}
+
+        for key, value in data.items():
+            loader = loaders.get(key)
+
+            # Unknown keys are passed through to the attrs class as they are.
+            kwargs[key] = value if loader is None else loader(value)
+
+        return self.attrs_class(**kwargs)
+
+    def _compile_dumper(self, schema_field: fields.Field) -> Callable[[Any], Any]:
+        leaf_codec = self.__get_leaf_codec(schema_field)
+
+        if leaf_codec is not None:
+            return self.__dumper_for_types(leaf_codec[0], leaf_codec[1])
+        elif type(schema_field) is fields.List:
+            dump_item = self._compile_dumper(schema_field.inner)
+
+            return self.__dumper_for_types((list,), lambda value: [dump_item(item) for item in value])
+        elif type(schema_field) is fields.Nested:
+            nested = schema_field.nested
+            attrs_class = getattr(nested, "attrs_class", None)
+
+            if isinstance(nested, PolymorphicSchema):
+                return self.__dumper_for_types(None, self.__dump_polymorphic)
+            elif attrs_class is not None:
+                return self.__dumper_for_types(None, lambda value: self.from_attrs_cls(attrs_class).dump(value))
+
+        return _fallback
+
+    def _compile_loader(self, schema_field: fields.Field) -> Callable[[Any], Any]:
+        leaf_codec = self.__get_leaf_codec(schema_field)
+        loader = _fallback
+
+        if leaf_codec is not None:
+            loader = self.__loader_for_types(leaf_codec[2], leaf_codec[3])
+        elif type(schema_field) is fields.List:
+            load_item = self._compile_loader(schema_field.inner)
+            loader = self.__loader_for_types((list,), lambda value: [load_item(item) for item in value])
+        elif type(schema_field) is fields.Nested:
+            nested = schema_field.nested
+            attrs_class = getattr(nested, "attrs_class", None)
+
+            if isinstance(nested, PolymorphicSchema) and ABC in nested.inner_class.__bases__:
+                inner_class = nested.inner_class
+                loader = self.__loader_for_types((dict,), lambda value: self.__load_polymorphic(inner_class, value))
+            elif attrs_class is not None:
+                loader = self.__loader_for_types((dict,), lambda value: self.from_attrs_cls(attrs_class)._load(value))
+
+        if loader is _fallback or schema_field.allow_none:
+            return loader
+        else:
+            return lambda value: _fallback(value) if value is None else loader(value)
+
+    def __get_leaf_codec(self, schema_field: fields.Field) -> Optional[_LeafCodec]:
+        # Fields that format their values, like numbers dumped as strings or dicts with typed keys, are left to
+        # marshmallow.
+        if (
+            getattr(schema_field, "as_string", False)
+            or getattr(schema_field, "key_field", None) is not None
+            or getattr(schema_field, "value_field", None) is not None
+        ):
+            return None
+        else:
+            return _LEAF_CODECS.get(type(schema_field))
+
+    def __dumper_for_types(self, types: Optional[tuple[type, ...]], dump: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        def dumper(value: Any) -> Any:
+            if value is None:
+                return None
+            elif types is None or type(value) in types:
+                return dump(value)
+            else:
+                raise _FallbackError
+
+        return dumper
+
+    def __loader_for_types(self, types: Optional[tuple[type, ...]], load: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        def loader(value: Any) -> Any:
+            if value is None:
+                return None
+            elif types is None or type(value) in types:
+                return load(value)
+            else:
+                raise _FallbackError
+
+        return loader
+
+    def __dump_polymorphic(self, value: Any) -> dict:
+        result = self.from_attrs_cls(value.__class__).dump(value)
+        result["type"] = value.__class__.__name__
+
+        return result
+
+    def __load_polymorphic(self, inner_class: Any, value: dict) -> Any:
+        value = dict(value)
+        subclass_name = value.pop("type", None)
+
+        if subclass_name is None:
+            raise _FallbackError
+
+        return self.from_attrs_cls(inner_class._import_cls_rec(inner_class.__module__, subclass_name))._load(value)
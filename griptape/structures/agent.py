@@ -83,3 +83,14 @@ class Agent(Structure):
             self.conversation_memory.add_run(run)
 
         return self
+
+    @observable
+    async def atry_run(self, *args) -> Agent:
+        await self.task.aexecute()
+
+        if self.conversation_memory and self.output is not None:
+            run = Run(input=self.input_task.input, output=self.output)
+
+            self.conversation_memory.add_run(run)
+
+        return self
@@ -60,6 +60,23 @@ class Pipeline(Structure):
 
         return self
 
+    @observable
+    async def atry_run(self, *args) -> Pipeline:
+        task = self.input_task
+
+        while task is not None:
+            if isinstance(await task.aexecute(), ErrorArtifact) and self.fail_fast:
+                break
+
+            task = next(iter(task.children), None)
+
+        if self.conversation_memory and self.output is not None:
+            run = Run(input=self.input_task.input, output=self.output)
+
+            self.conversation_memory.add_run(run)
+
+        return self
+
     def context(self, task: BaseTask) -> dict[str, Any]:
         context = super().context(task)
 
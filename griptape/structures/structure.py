@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import uuid
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Optional
@@ -17,6 +18,7 @@ if TYPE_CHECKING:
     from griptape.memory.structure import BaseConversationMemory
     from griptape.rules import Rule, Ruleset
     from griptape.tasks import BaseTask
+    from griptape.tools import BaseTool
 
 
 @define
@@ -36,6 +38,7 @@ class Structure(ABC):
     meta_memory: MetaMemory = field(default=Factory(lambda: MetaMemory()), kw_only=True)
     fail_fast: bool = field(default=True, kw_only=True)
     _execution_args: tuple = ()
+    _task_positions: dict[str, int] = field(factory=dict, init=False, eq=False)
 
     @rulesets.validator  # pyright: ignore[reportAttributeAccessIssue]
     def validate_rulesets(self, _: Attribute, rulesets: list[Ruleset]) -> None:
@@ -93,8 +96,16 @@ class Structure(ABC):
         raise ValueError(f"Task with id {task_id} doesn't exist.")
 
     def try_find_task(self, task_id: str) -> Optional[BaseTask]:
+        # Positions of Tasks are cached, and checked against `tasks` since it can be changed directly.
+        position = self._task_positions.get(task_id)
+
+        if position is not None and position < len(self.tasks) and self.tasks[position].id == task_id:
+            return self.tasks[position]
+
         for task in self.tasks:
             if task.id == task_id:
+                self._task_positions = {task.id: index for index, task in enumerate(self.tasks)}
+
                 return task
         return None
 
@@ -130,8 +141,14 @@ class Structure(ABC):
 
     @observable
     def before_run(self, args: Any) -> None:
+        from griptape.tools import BaseTool
+
         self._execution_args = args
 
+        # Installs the dependencies of every Tool that doesn't have them yet, such as Tools created with
+        # `install_dependencies_on_init=False`, with one pip invocation per install directory.
+        BaseTool.install_tools_dependencies(self.__get_tools())
+
         [task.reset() for task in self.tasks]
 
         EventBus.publish_event(
@@ -144,6 +161,19 @@ class Structure(ABC):
 
         self.resolve_relationships()
 
+    def __get_tools(self) -> list[BaseTool]:
+        from griptape.tasks import ToolkitTask, ToolTask
+
+        tools = []
+
+        for task in self.tasks:
+            if isinstance(task, ToolkitTask):
+                tools.extend(task.tools)
+            elif isinstance(task, ToolTask):
+                tools.append(task.tool)
+
+        return tools
+
     @observable
     def after_run(self) -> None:
         EventBus.publish_event(
@@ -160,13 +190,30 @@ class Structure(ABC):
 
     @observable
     def run(self, *args) -> Structure:
-        self.before_run(args)
+        with EventBus.structure_scope(self.id):
+            self.before_run(args)
 
-        result = self.try_run(*args)
+            result = self.try_run(*args)
 
-        self.after_run()
+            self.after_run()
 
         return result
 
     @abstractmethod
     def try_run(self, *args) -> Structure: ...
+
+    @observable
+    async def arun(self, *args) -> Structure:
+        """Runs the Structure in an asyncio event loop, so that one loop can run many Structures concurrently."""
+        with EventBus.structure_scope(self.id):
+            self.before_run(args)
+
+            result = await self.atry_run(*args)
+
+            self.after_run()
+
+        return result
+
+    async def atry_run(self, *args) -> Structure:
+        """Runs `try_run` in a thread. Structures that can run their Tasks with `BaseTask.aexecute` override this method."""
+        return await asyncio.to_thread(self.try_run, *args)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import concurrent.futures as futures
+import contextvars
+from collections import deque
 from typing import TYPE_CHECKING, Any, Optional
 
-from attrs import define
+from attrs import define, field
 from graphlib import TopologicalSorter
 
 from griptape.artifacts import ErrorArtifact
@@ -13,11 +16,31 @@ from griptape.mixins import FuturesExecutorMixin
 from griptape.structures import Structure
 
 if TYPE_CHECKING:
+    from attrs import Attribute
+
+    from griptape.artifacts import BaseArtifact
     from griptape.tasks import BaseTask
 
 
 @define
 class Workflow(Structure, FuturesExecutorMixin):
+    """A Structure that runs its Tasks as a directed acyclic graph.
+
+    Tasks are submitted to `futures_executor` as soon as all of their parents have finished. The order of the Tasks is
+    computed once and reused until Tasks are added or their relationships change.
+
+    Attributes:
+        max_concurrent_tasks: Maximum number of Tasks that run at the same time. Not limited if `None`.
+    """
+
+    max_concurrent_tasks: Optional[int] = field(default=None, kw_only=True)
+    _task_order_cache: Optional[tuple[tuple, list[BaseTask]]] = field(default=None, init=False, eq=False)
+
+    @max_concurrent_tasks.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_max_concurrent_tasks(self, _: Attribute, max_concurrent_tasks: Optional[int]) -> None:
+        if max_concurrent_tasks is not None and max_concurrent_tasks < 1:
+            raise ValueError("max_concurrent_tasks must be greater than 0.")
+
     @property
     def input_task(self) -> Optional[BaseTask]:
         return self.order_tasks()[0] if self.tasks else None
@@ -88,23 +111,21 @@ class Workflow(Structure, FuturesExecutorMixin):
 
     @observable
     def try_run(self, *args) -> Workflow:
-        exit_loop = False
+        # Tasks that are added while the Workflow runs are scheduled once the scheduled Tasks have finished.
+        while self.__run_ready_tasks() and any(task.can_execute() for task in self.tasks):
+            pass
 
-        while not self.is_finished() and not exit_loop:
-            futures_list = {}
-            ordered_tasks = self.order_tasks()
+        if self.conversation_memory and self.output is not None:
+            run = Run(input=self.input_task.input, output=self.output)
 
-            for task in ordered_tasks:
-                if task.can_execute():
-                    future = self.futures_executor.submit(task.execute)
-                    futures_list[future] = task
+            self.conversation_memory.add_run(run)
 
-            # Wait for all tasks to complete
-            for future in futures.as_completed(futures_list):
-                if isinstance(future.result(), ErrorArtifact) and self.fail_fast:
-                    exit_loop = True
+        return self
 
-                    break
+    @observable
+    async def atry_run(self, *args) -> Workflow:
+        while await self.__arun_ready_tasks() and any(task.can_execute() for task in self.tasks):
+            pass
 
         if self.conversation_memory and self.output is not None:
             run = Run(input=self.input_task.input, output=self.output)
@@ -128,19 +149,129 @@ class Workflow(Structure, FuturesExecutorMixin):
         return context
 
     def to_graph(self) -> dict[str, set[str]]:
-        graph: dict[str, set[str]] = {}
-
-        for key_task in self.tasks:
-            graph[key_task.id] = set()
+        graph: dict[str, set[str]] = {task.id: set() for task in self.tasks}
 
-            for value_task in self.tasks:
-                if key_task.id in value_task.child_ids:
-                    graph[key_task.id].add(value_task.id)
+        for task in self.tasks:
+            for child_id in task.child_ids:
+                if child_id in graph:
+                    graph[child_id].add(task.id)
 
         return graph
 
     def order_tasks(self) -> list[BaseTask]:
-        return [self.find_task(task_id) for task_id in TopologicalSorter(self.to_graph()).static_order()]
+        # The key changes whenever Tasks are added, removed, or linked, which invalidates the cached order.
+        key = tuple((id(task), task.id, tuple(task.child_ids)) for task in self.tasks)
+
+        if self._task_order_cache is None or self._task_order_cache[0] != key:
+            task_by_id = {task.id: task for task in self.tasks}
+            ordered_tasks = [task_by_id[task_id] for task_id in TopologicalSorter(self.to_graph()).static_order()]
+
+            self._task_order_cache = (key, ordered_tasks)
+
+        return list(self._task_order_cache[1])
+
+    def __run_ready_tasks(self) -> bool:
+        """Runs the pending Tasks, submitting each Task as soon as its parents have finished.
+
+        Returns:
+            False if a Task failed and `fail_fast` is set, True otherwise.
+        """
+        child_tasks, parent_counts, ready_tasks = self.__build_schedule()
+        running_tasks: dict[futures.Future, BaseTask] = {}
+
+        while ready_tasks or running_tasks:
+            while ready_tasks and (self.max_concurrent_tasks is None or len(running_tasks) < self.max_concurrent_tasks):
+                task = ready_tasks.popleft()
+                # Run the Task in a copy of the current context, so that its Events are tagged with this Structure.
+                running_tasks[self.futures_executor.submit(contextvars.copy_context().run, task.execute)] = task
+
+            done, _ = futures.wait(running_tasks, return_when=futures.FIRST_COMPLETED)
+
+            for future in done:
+                task = running_tasks.pop(future)
+
+                if not self.__finish_task(task, future.result(), child_tasks, parent_counts, ready_tasks):
+                    return False
+
+        return True
+
+    async def __arun_ready_tasks(self) -> bool:
+        """Runs the pending Tasks as asyncio tasks, starting each Task as soon as its parents have finished.
+
+        Returns:
+            False if a Task failed and `fail_fast` is set, True otherwise.
+        """
+        child_tasks, parent_counts, ready_tasks = self.__build_schedule()
+        running_tasks: dict[asyncio.Future, BaseTask] = {}
+
+        while ready_tasks or running_tasks:
+            while ready_tasks and (self.max_concurrent_tasks is None or len(running_tasks) < self.max_concurrent_tasks):
+                task = ready_tasks.popleft()
+                running_tasks[asyncio.ensure_future(task.aexecute())] = task
+
+            done, _ = await asyncio.wait(running_tasks, return_when=asyncio.FIRST_COMPLETED)
+
+            for future in done:
+                task = running_tasks.pop(future)
+
+                if not self.__finish_task(task, future.result(), child_tasks, parent_counts, ready_tasks):
+                    return False
+
+        return True
+
+    def __finish_task(
+        self,
+        task: BaseTask,
+        output: Optional[BaseArtifact],
+        child_tasks: dict[str, list[BaseTask]],
+        parent_counts: dict[str, int],
+        ready_tasks: deque[BaseTask],
+    ) -> bool:
+        """Adds the children of a finished Task whose parents have all finished to `ready_tasks`.
+
+        Returns:
+            False if the Task failed and `fail_fast` is set, True otherwise.
+        """
+        if isinstance(output, ErrorArtifact) and self.fail_fast:
+            return False
+
+        for child_task in child_tasks[task.id]:
+            parent_counts[child_task.id] -= 1
+
+            if parent_counts[child_task.id] == 0 and child_task.is_pending():
+                ready_tasks.append(child_task)
+
+        return True
+
+    def __build_schedule(self) -> tuple[dict[str, list[BaseTask]], dict[str, int], deque[BaseTask]]:
+        """Maps the ids of Tasks to their children, and to the number of their parents that haven't finished.
+
+        Returns:
+            The children of each Task, the number of unfinished parents of each Task, and the Tasks that are ready to run.
+        """
+        # Ordering the Tasks raises an error if they contain a cycle.
+        tasks = self.order_tasks()
+        task_by_id = {task.id: task for task in tasks}
+        child_tasks: dict[str, list[BaseTask]] = {task.id: [] for task in tasks}
+        parent_counts: dict[str, int] = {}
+
+        for task in tasks:
+            parent_counts[task.id] = 0
+
+            for parent_id in task.parent_ids:
+                parent = task_by_id.get(parent_id)
+
+                if parent is None:
+                    raise ValueError(f"Task with id {parent_id} doesn't exist.")
+
+                child_tasks[parent_id].append(task)
+
+                if not parent.is_finished():
+                    parent_counts[task.id] += 1
+
+        ready_tasks = deque(task for task in tasks if task.is_pending() and parent_counts[task.id] == 0)
+
+        return child_tasks, parent_counts, ready_tasks
 
     def __link_task_to_children(self, task: BaseTask, child_tasks: list[BaseTask]) -> None:
         for child_task in child_tasks:
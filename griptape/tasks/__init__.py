@@ -1,45 +1,72 @@
-from .base_task import BaseTask
-from .base_text_input_task import BaseTextInputTask
-from .base_multi_text_input_task import BaseMultiTextInputTask
-from .prompt_task import PromptTask
-from .actions_subtask import ActionsSubtask
-from .toolkit_task import ToolkitTask
-from .text_summary_task import TextSummaryTask
-from .tool_task import ToolTask
-from .rag_task import RagTask
-from .extraction_task import ExtractionTask
-from .base_image_generation_task import BaseImageGenerationTask
-from .code_execution_task import CodeExecutionTask
-from .prompt_image_generation_task import PromptImageGenerationTask
-from .inpainting_image_generation_task import InpaintingImageGenerationTask
-from .outpainting_image_generation_task import OutpaintingImageGenerationTask
-from .variation_image_generation_task import VariationImageGenerationTask
-from .image_query_task import ImageQueryTask
-from .base_audio_generation_task import BaseAudioGenerationTask
-from .text_to_speech_task import TextToSpeechTask
-from .structure_run_task import StructureRunTask
-from .audio_transcription_task import AudioTranscriptionTask
-
-__all__ = [
-    "BaseTask",
-    "BaseTextInputTask",
-    "BaseMultiTextInputTask",
-    "PromptTask",
-    "ActionsSubtask",
-    "ToolkitTask",
-    "TextSummaryTask",
-    "ToolTask",
-    "RagTask",
-    "ExtractionTask",
-    "BaseImageGenerationTask",
-    "CodeExecutionTask",
-    "PromptImageGenerationTask",
-    "VariationImageGenerationTask",
-    "InpaintingImageGenerationTask",
-    "OutpaintingImageGenerationTask",
-    "ImageQueryTask",
-    "BaseAudioGenerationTask",
-    "TextToSpeechTask",
-    "StructureRunTask",
-    "AudioTranscriptionTask",
-]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base_task import BaseTask as BaseTask
+    from .base_text_input_task import BaseTextInputTask as BaseTextInputTask
+    from .base_multi_text_input_task import BaseMultiTextInputTask as BaseMultiTextInputTask
+    from .prompt_task import PromptTask as PromptTask
+    from .actions_subtask import ActionsSubtask as ActionsSubtask
+    from .toolkit_task import ToolkitTask as ToolkitTask
+    from .text_summary_task import TextSummaryTask as TextSummaryTask
+    from .tool_task import ToolTask as ToolTask
+    from .rag_task import RagTask as RagTask
+    from .extraction_task import ExtractionTask as ExtractionTask
+    from .base_image_generation_task import BaseImageGenerationTask as BaseImageGenerationTask
+    from .code_execution_task import CodeExecutionTask as CodeExecutionTask
+    from .prompt_image_generation_task import PromptImageGenerationTask as PromptImageGenerationTask
+    from .inpainting_image_generation_task import InpaintingImageGenerationTask as InpaintingImageGenerationTask
+    from .outpainting_image_generation_task import OutpaintingImageGenerationTask as OutpaintingImageGenerationTask
+    from .variation_image_generation_task import VariationImageGenerationTask as VariationImageGenerationTask
+    from .image_query_task import ImageQueryTask as ImageQueryTask
+    from .base_audio_generation_task import BaseAudioGenerationTask as BaseAudioGenerationTask
+    from .text_to_speech_task import TextToSpeechTask as TextToSpeechTask
+    from .structure_run_task import StructureRunTask as StructureRunTask
+    from .audio_transcription_task import AudioTranscriptionTask as AudioTranscriptionTask
+
+# Tasks are imported from their modules on first access, so that importing the package doesn't import
+# every Task and the third-party libraries that it depends on.
+_LAZY_IMPORTS = {
+    "BaseTask": ".base_task",
+    "BaseTextInputTask": ".base_text_input_task",
+    "BaseMultiTextInputTask": ".base_multi_text_input_task",
+    "PromptTask": ".prompt_task",
+    "ActionsSubtask": ".actions_subtask",
+    "ToolkitTask": ".toolkit_task",
+    "TextSummaryTask": ".text_summary_task",
+    "ToolTask": ".tool_task",
+    "RagTask": ".rag_task",
+    "ExtractionTask": ".extraction_task",
+    "BaseImageGenerationTask": ".base_image_generation_task",
+    "CodeExecutionTask": ".code_execution_task",
+    "PromptImageGenerationTask": ".prompt_image_generation_task",
+    "InpaintingImageGenerationTask": ".inpainting_image_generation_task",
+    "OutpaintingImageGenerationTask": ".outpainting_image_generation_task",
+    "VariationImageGenerationTask": ".variation_image_generation_task",
+    "ImageQueryTask": ".image_query_task",
+    "BaseAudioGenerationTask": ".base_audio_generation_task",
+    "TextToSpeechTask": ".text_to_speech_task",
+    "StructureRunTask": ".structure_run_task",
+    "AudioTranscriptionTask": ".audio_transcription_task",
+}
+
+# Type checkers get the exported names from the imports above, which re-export them explicitly.
+__all__ = list(_LAZY_IMPORTS)  # pyright: ignore[reportUnsupportedDunderAll]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import json
 import logging
 import re
@@ -116,19 +118,24 @@ class ActionsSubtask(BaseTask):
     def run(self) -> BaseArtifact:
         try:
             if any(isinstance(a.output, ErrorArtifact) for a in self.actions):
-                errors = [a.output.value for a in self.actions if isinstance(a.output, ErrorArtifact)]
-
-                self.output = ErrorArtifact("\n\n".join(errors))
+                self.output = self.__to_errors_output()
             else:
-                results = self.execute_actions(self.actions)
+                self.output = self.__to_actions_output(self.execute_actions(self.actions))
+        except Exception as e:
+            logger.exception("Subtask %s\n%s", self.id, e)
 
-                actions_output = []
-                for result in results:
-                    tag, output = result
-                    output.name = f"{tag} output"
+            self.output = ErrorArtifact(str(e), exception=e)
+        if self.output is not None:
+            return self.output
+        else:
+            return ErrorArtifact("no tool output")
 
-                    actions_output.append(output)
-                self.output = ListArtifact(actions_output)
+    async def arun(self) -> BaseArtifact:
+        try:
+            if any(isinstance(a.output, ErrorArtifact) for a in self.actions):
+                self.output = self.__to_errors_output()
+            else:
+                self.output = self.__to_actions_output(await self.aexecute_actions(self.actions))
         except Exception as e:
             logger.exception("Subtask %s\n%s", self.id, e)
 
@@ -139,7 +146,13 @@ class ActionsSubtask(BaseTask):
             return ErrorArtifact("no tool output")
 
     def execute_actions(self, actions: list[ToolAction]) -> list[tuple[str, BaseArtifact]]:
-        return utils.execute_futures_list([self.futures_executor.submit(self.execute_action, a) for a in actions])
+        return utils.execute_futures_list(
+            [self.futures_executor.submit(contextvars.copy_context().run, self.execute_action, a) for a in actions]
+        )
+
+    async def aexecute_actions(self, actions: list[ToolAction]) -> list[tuple[str, BaseArtifact]]:
+        """Executes actions concurrently as asyncio tasks. Tool activities are synchronous, so each runs in a thread."""
+        return list(await asyncio.gather(*(asyncio.to_thread(self.execute_action, a) for a in actions)))
 
     def execute_action(self, action: ToolAction) -> tuple[str, BaseArtifact]:
         if action.tool is not None:
@@ -153,6 +166,21 @@ class ActionsSubtask(BaseTask):
 
         return action.tag, output
 
+    def __to_errors_output(self) -> ErrorArtifact:
+        errors = [a.output.value for a in self.actions if isinstance(a.output, ErrorArtifact)]
+
+        return ErrorArtifact("\n\n".join(errors))
+
+    def __to_actions_output(self, results: list[tuple[str, BaseArtifact]]) -> ListArtifact:
+        actions_output = []
+        for result in results:
+            tag, output = result
+            output.name = f"{tag} output"
+
+            actions_output.append(output)
+
+        return ListArtifact(actions_output)
+
     def after_run(self) -> None:
         response = self.output.to_text() if isinstance(self.output, BaseArtifact) else str(self.output)
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from abc import ABC, abstractmethod
@@ -177,6 +178,25 @@ class BaseTask(FuturesExecutorMixin, ABC):
 
         return self.output
 
+    async def aexecute(self) -> Optional[BaseArtifact]:
+        """Executes the Task in an asyncio event loop. See `execute`."""
+        try:
+            self.state = BaseTask.State.EXECUTING
+
+            self.before_run()
+
+            self.output = await self.arun()
+
+            self.after_run()
+        except Exception as e:
+            logger.exception("%s %s\n%s", self.__class__.__name__, self.id, e)
+
+            self.output = ErrorArtifact(str(e), exception=e)
+        finally:
+            self.state = BaseTask.State.FINISHED
+
+        return self.output
+
     def can_execute(self) -> bool:
         return self.state == BaseTask.State.PENDING and all(parent.is_finished() for parent in self.parents)
 
@@ -189,6 +209,10 @@ class BaseTask(FuturesExecutorMixin, ABC):
     @abstractmethod
     def run(self) -> BaseArtifact: ...
 
+    async def arun(self) -> BaseArtifact:
+        """Runs `run` in a thread. Tasks that call Prompt Drivers or other asynchronous code should override this method."""
+        return await asyncio.to_thread(self.run)
+
     @property
     def full_context(self) -> dict[str, Any]:
         if self.structure:
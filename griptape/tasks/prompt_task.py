@@ -82,6 +82,15 @@ class PromptTask(RuleMixin, BaseTask):
 
         return message.to_artifact()
 
+    async def arun(self) -> BaseArtifact:
+        # Subclasses that override `run` but not `arun` are run in a thread, so that they keep their behavior.
+        if type(self).run is not PromptTask.run:
+            return await super().arun()
+
+        message = await self.prompt_driver.arun(self.prompt_stack)
+
+        return message.to_artifact()
+
     def _process_task_input(
         self,
         task_input: str | tuple | list | BaseArtifact | Callable[[BaseTask], BaseArtifact],
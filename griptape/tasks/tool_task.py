@@ -15,7 +15,7 @@ from griptape.utils import J2
 if TYPE_CHECKING:
     from schema import Schema
 
-    from griptape.common import PromptStack
+    from griptape.common import Message, PromptStack
     from griptape.memory import TaskMemory
     from griptape.structures import Structure
     from griptape.tools import BaseTool
@@ -62,35 +62,63 @@ class ToolTask(PromptTask, ActionsSubtaskOriginMixin):
 
     def run(self) -> BaseArtifact:
         result = self.prompt_driver.run(prompt_stack=self.prompt_stack)
+        subtask_input = self.__to_subtask_input(result)
 
-        if self.prompt_driver.use_native_tools:
-            subtask_input = result.to_artifact()
-        else:
-            action_matches = re.findall(self.ACTION_PATTERN, result.to_text(), re.DOTALL)
+        if isinstance(subtask_input, ErrorArtifact):
+            return subtask_input
 
-            if not action_matches:
-                return ErrorArtifact("No action found in prompt output.")
-            data = action_matches[-1]
-            action_dict = json.loads(data)
+        try:
+            subtask = self.add_subtask(ActionsSubtask(subtask_input))
 
-            action_dict["tag"] = self.tool.name
-            subtask_input = J2("tasks/tool_task/subtask.j2").render(action_json=json.dumps(action_dict))
+            subtask.before_run()
+            subtask.run()
+            subtask.after_run()
+
+            self.output = self.__to_output(subtask)
+        except Exception as e:
+            self.output = ErrorArtifact(f"Error processing tool input: {e}", exception=e)
+        return self.output
+
+    async def arun(self) -> BaseArtifact:
+        result = await self.prompt_driver.arun(prompt_stack=self.prompt_stack)
+        subtask_input = self.__to_subtask_input(result)
+
+        if isinstance(subtask_input, ErrorArtifact):
+            return subtask_input
 
         try:
             subtask = self.add_subtask(ActionsSubtask(subtask_input))
 
             subtask.before_run()
-            subtask.run()
+            await subtask.arun()
             subtask.after_run()
 
-            if isinstance(subtask.output, ListArtifact):
-                self.output = subtask.output[0]
-            else:
-                self.output = InfoArtifact("No tool output")
+            self.output = self.__to_output(subtask)
         except Exception as e:
             self.output = ErrorArtifact(f"Error processing tool input: {e}", exception=e)
         return self.output
 
+    def __to_subtask_input(self, result: Message) -> str | BaseArtifact:
+        if self.prompt_driver.use_native_tools:
+            return result.to_artifact()
+        else:
+            action_matches = re.findall(self.ACTION_PATTERN, result.to_text(), re.DOTALL)
+
+            if not action_matches:
+                return ErrorArtifact("No action found in prompt output.")
+            data = action_matches[-1]
+            action_dict = json.loads(data)
+
+            action_dict["tag"] = self.tool.name
+
+            return J2("tasks/tool_task/subtask.j2").render(action_json=json.dumps(action_dict))
+
+    def __to_output(self, subtask: ActionsSubtask) -> BaseArtifact:
+        if isinstance(subtask.output, ListArtifact):
+            return subtask.output[0]
+        else:
+            return InfoArtifact("No tool output")
+
     def find_tool(self, tool_name: str) -> BaseTool:
         if self.tool.name == tool_name:
             return self.tool
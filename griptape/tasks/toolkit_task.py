@@ -15,7 +15,9 @@ from griptape.utils import J2
 if TYPE_CHECKING:
     from schema import Schema
 
+    from griptape.common import Message
     from griptape.memory import TaskMemory
+    from griptape.memory.structure import BaseConversationMemory
     from griptape.structures import Structure
     from griptape.tools import BaseTool
 
@@ -40,6 +42,13 @@ class ToolkitTask(PromptTask, ActionsSubtaskOriginMixin):
         kw_only=True,
     )
     response_stop_sequence: str = field(default=RESPONSE_STOP_SEQUENCE, kw_only=True)
+    _cache_prompt_stack: bool = field(default=False, init=False)
+    _system_message: Optional[Message] = field(default=None, init=False)
+    _system_message_key: Optional[tuple[int, ...]] = field(default=None, init=False)
+    _input_message: Optional[Message] = field(default=None, init=False)
+    _memory_messages: Optional[list[Message]] = field(default=None, init=False)
+    _subtask_messages: dict[str, list[Message]] = field(factory=dict, init=False)
+    _token_counts: dict[str, int] = field(factory=dict, init=False)
 
     def __attrs_post_init__(self) -> None:
         super().__attrs_post_init__()
@@ -70,52 +79,17 @@ class ToolkitTask(PromptTask, ActionsSubtaskOriginMixin):
         stack = PromptStack(tools=self.tools)
         memory = self.structure.conversation_memory
 
-        stack.add_system_message(self.generate_system_template(self))
-
-        stack.add_user_message(self.input)
+        stack.messages.append(self._get_system_message())
+        stack.messages.append(self._get_input_message())
 
         if self.output:
             stack.add_assistant_message(self.output.to_text())
         else:
             for s in self.subtasks:
-                if self.prompt_driver.use_native_tools:
-                    action_calls = [
-                        ToolAction(name=action.name, path=action.path, tag=action.tag, input=action.input)
-                        for action in s.actions
-                    ]
-                    action_results = [
-                        ToolAction(
-                            name=action.name,
-                            path=action.path,
-                            tag=action.tag,
-                            output=action.output if action.output is not None else s.output,
-                        )
-                        for action in s.actions
-                    ]
-
-                    stack.add_assistant_message(
-                        ListArtifact(
-                            [
-                                *([TextArtifact(s.thought)] if s.thought else []),
-                                *[ActionArtifact(a) for a in action_calls],
-                            ],
-                        ),
-                    )
-                    stack.add_user_message(
-                        ListArtifact(
-                            [
-                                *[ActionArtifact(a) for a in action_results],
-                                *([] if s.output else [TextArtifact("Please keep going")]),
-                            ],
-                        ),
-                    )
-                else:
-                    stack.add_assistant_message(self.generate_assistant_subtask_template(s))
-                    stack.add_user_message(self.generate_user_subtask_template(s))
+                stack.messages.extend(self._get_subtask_messages(s))
 
         if memory:
-            # inserting at index 1 to place memory right after system prompt
-            memory.add_to_prompt_stack(self.prompt_driver, stack, 1)
+            self._add_memory_to_prompt_stack(memory, stack)
 
         return stack
 
@@ -166,36 +140,209 @@ class ToolkitTask(PromptTask, ActionsSubtaskOriginMixin):
                     tool.output_memory = {getattr(a, "name"): [self.task_memory] for a in tool.activities()}
 
     def run(self) -> BaseArtifact:
-        from griptape.tasks import ActionsSubtask
+        self.subtasks.clear()
+        # The Prompt Stack is built incrementally while the task runs: the system, input, and Conversation Memory
+        # messages are reused across subtasks, and each subtask adds its own messages.
+        self._reset_prompt_stack_cache(enabled=True)
+
+        try:
+            return self._run_subtasks()
+        finally:
+            self._reset_prompt_stack_cache(enabled=False)
 
+    async def arun(self) -> BaseArtifact:
         self.subtasks.clear()
+        self._reset_prompt_stack_cache(enabled=True)
+
+        try:
+            return await self._arun_subtasks()
+        finally:
+            self._reset_prompt_stack_cache(enabled=False)
+
+    def _run_subtasks(self) -> BaseArtifact:
+        self._add_response_stop_sequence()
+        subtask = self._add_actions_subtask(self.prompt_driver.run(self.prompt_stack))
+
+        while (output := self._get_subtask_output(subtask)) is None:
+            subtask.before_run()
+            subtask.run()
+            subtask.after_run()
+
+            subtask = self._add_actions_subtask(self.prompt_driver.run(prompt_stack=self.prompt_stack))
+
+        self.output = output
+
+        return output
+
+    async def _arun_subtasks(self) -> BaseArtifact:
+        self._add_response_stop_sequence()
+        subtask = self._add_actions_subtask(await self.prompt_driver.arun(self.prompt_stack))
 
+        while (output := self._get_subtask_output(subtask)) is None:
+            subtask.before_run()
+            await subtask.arun()
+            subtask.after_run()
+
+            subtask = self._add_actions_subtask(await self.prompt_driver.arun(prompt_stack=self.prompt_stack))
+
+        self.output = output
+
+        return output
+
+    def _add_response_stop_sequence(self) -> None:
         if self.response_stop_sequence not in self.prompt_driver.tokenizer.stop_sequences:
             self.prompt_driver.tokenizer.stop_sequences.extend([self.response_stop_sequence])
 
-        result = self.prompt_driver.run(self.prompt_stack)
-        subtask = self.add_subtask(ActionsSubtask(result.to_artifact()))
-
-        while True:
-            if subtask.output is None:
-                if len(self.subtasks) >= self.max_subtasks:
-                    subtask.output = ErrorArtifact(f"Exceeded tool limit of {self.max_subtasks} subtasks per task")
-                elif not subtask.actions:
-                    # handle case when the LLM failed to follow the ReAct prompt and didn't return a proper action
-                    subtask.output = subtask.input
-                else:
-                    subtask.before_run()
-                    subtask.run()
-                    subtask.after_run()
-
-                    result = self.prompt_driver.run(prompt_stack=self.prompt_stack)
-                    subtask = self.add_subtask(ActionsSubtask(result.to_artifact()))
+    def _add_actions_subtask(self, result: Message) -> ActionsSubtask:
+        return self.add_subtask(ActionsSubtask(result.to_artifact()))
+
+    def _get_subtask_output(self, subtask: ActionsSubtask) -> Optional[BaseArtifact]:
+        """Returns the output of the subtask, or `None` if it has actions to run.
+
+        Sets the output of subtasks that can't run their actions.
+        """
+        if subtask.output is None:
+            if len(self.subtasks) >= self.max_subtasks:
+                subtask.output = ErrorArtifact(f"Exceeded tool limit of {self.max_subtasks} subtasks per task")
+            elif not subtask.actions:
+                # handle case when the LLM failed to follow the ReAct prompt and didn't return a proper action
+                subtask.output = subtask.input
+
+        return subtask.output
+
+    def _get_system_message(self) -> Message:
+        # Tools can add meta memory entries while the task runs, so the system message is only reused while they don't
+        # change.
+        if not self._cache_prompt_stack:
+            return PromptStack().add_system_message(self.generate_system_template(self))
+
+        key = tuple(id(entry) for entry in self.meta_memories)
+
+        if self._system_message is None or key != self._system_message_key:
+            self._system_message = PromptStack().add_system_message(self.generate_system_template(self))
+            self._system_message_key = key
+            self._token_counts.pop("system", None)
+
+        return self._system_message
+
+    def _get_input_message(self) -> Message:
+        if not self._cache_prompt_stack:
+            return PromptStack().add_user_message(self.input)
+
+        if self._input_message is None:
+            self._input_message = PromptStack().add_user_message(self.input)
+
+        return self._input_message
+
+    def _get_subtask_messages(self, subtask: ActionsSubtask) -> list[Message]:
+        messages = self._subtask_messages.get(subtask.id) if self._cache_prompt_stack else None
+
+        if messages is None:
+            stack = PromptStack()
+
+            if self.prompt_driver.use_native_tools:
+                action_calls = [
+                    ToolAction(name=action.name, path=action.path, tag=action.tag, input=action.input)
+                    for action in subtask.actions
+                ]
+                action_results = [
+                    ToolAction(
+                        name=action.name,
+                        path=action.path,
+                        tag=action.tag,
+                        output=action.output if action.output is not None else subtask.output,
+                    )
+                    for action in subtask.actions
+                ]
+
+                stack.add_assistant_message(
+                    ListArtifact(
+                        [
+                            *([TextArtifact(subtask.thought)] if subtask.thought else []),
+                            *[ActionArtifact(a) for a in action_calls],
+                        ],
+                    ),
+                )
+                stack.add_user_message(
+                    ListArtifact(
+                        [
+                            *[ActionArtifact(a) for a in action_results],
+                            *([] if subtask.output else [TextArtifact("Please keep going")]),
+                        ],
+                    ),
+                )
             else:
-                break
+                stack.add_assistant_message(self.generate_assistant_subtask_template(subtask))
+                stack.add_user_message(self.generate_user_subtask_template(subtask))
+
+            messages = stack.messages
+
+            # Subtasks don't change once they have an output, so their messages are rendered once per run.
+            if self._cache_prompt_stack and subtask.output is not None:
+                self._subtask_messages[subtask.id] = messages
+
+        return messages
+
+    def _add_memory_to_prompt_stack(self, memory: BaseConversationMemory, stack: PromptStack) -> None:
+        if self._cache_prompt_stack and self._memory_messages is not None and self._memory_fits(memory, stack):
+            stack.messages[1:1] = self._memory_messages
+
+            return
+
+        message_count = len(stack.messages)
+
+        # inserting at index 1 to place memory right after system prompt
+        memory.add_to_prompt_stack(self.prompt_driver, stack, 1)
+
+        if self._cache_prompt_stack:
+            self._memory_messages = stack.messages[1 : 1 + len(stack.messages) - message_count]
+            self._token_counts.pop("memory", None)
+
+    def _memory_fits(self, memory: BaseConversationMemory, stack: PromptStack) -> bool:
+        """Returns whether the Conversation Memory messages of an earlier step still fit into the Prompt Stack.
+
+        The token count of the Prompt Stack is kept as a running total of the token counts of its parts, so that only
+        the messages added since the last step are tokenized.
+        """
+        if not memory.autoprune or not self._memory_messages:
+            return True
+        elif any(subtask.output is None for subtask in self.subtasks):
+            return False
+
+        token_count = self._count_tokens("overhead", [])
+        token_count += self._count_tokens("system", [stack.messages[0]])
+        token_count += self._count_tokens("input", [stack.messages[1]])
+        token_count += self._count_tokens("memory", self._memory_messages)
+        token_count += sum(
+            self._count_tokens(subtask.id, self._get_subtask_messages(subtask)) for subtask in self.subtasks
+        )
+
+        return token_count < self.prompt_driver.tokenizer.max_input_tokens
+
+    def _count_tokens(self, key: str, messages: list[Message]) -> int:
+        token_count = self._token_counts.get(key)
+
+        if token_count is None:
+            token_count = self.prompt_driver.tokenizer.count_tokens(
+                self.prompt_driver.prompt_stack_to_string(PromptStack(messages=messages))
+            )
+
+            # Every Prompt Stack string carries the same overhead, so it's only counted once.
+            if messages:
+                token_count -= self._count_tokens("overhead", [])
+
+            self._token_counts[key] = token_count
 
-        self.output = subtask.output
+        return token_count
 
-        return self.output
+    def _reset_prompt_stack_cache(self, *, enabled: bool) -> None:
+        self._cache_prompt_stack = enabled
+        self._system_message = None
+        self._system_message_key = None
+        self._input_message = None
+        self._memory_messages = None
+        self._subtask_messages.clear()
+        self._token_counts.clear()
 
     def find_subtask(self, subtask_id: str) -> ActionsSubtask:
         for subtask in self.subtasks:
@@ -22,4 +22,7 @@ class AnthropicTokenizer(BaseTokenizer):
     )
 
     def count_tokens(self, text: str) -> int:
-        return self.client.count_tokens(text)
+        return self._count_tokens_cached(text, self.client.count_tokens)
+
+    def _count_tokens_many(self, texts: list[str]) -> list[int]:
+        return [len(encoding.ids) for encoding in self.client.get_tokenizer().encode_batch(texts)]
@@ -2,12 +2,29 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Callable, Optional
 
 from attrs import Factory, define, field
 
+from griptape.utils import str_to_hash
+
+if TYPE_CHECKING:
+    from griptape.utils import LruCache
+
 
 @define()
 class BaseTokenizer(ABC):
+    """Base Tokenizer.
+
+    Attributes:
+        model: The name of the model whose tokens are counted.
+        stop_sequences: Sequences that stop generation.
+        max_input_tokens: Maximum number of input tokens. Defaults to the model's limit.
+        max_output_tokens: Maximum number of output tokens. Defaults to the model's limit.
+        token_count_cache: Optional cache of token counts keyed by the hash of the counted text. Only used by
+            tokenizers that count tokens locally or with a remote API.
+    """
+
     DEFAULT_MAX_INPUT_TOKENS = 4096
     DEFAULT_MAX_OUTPUT_TOKENS = 1000
     MODEL_PREFIXES_TO_MAX_INPUT_TOKENS = {}
@@ -17,6 +34,7 @@ class BaseTokenizer(ABC):
     stop_sequences: list[str] = field(default=Factory(list), kw_only=True)
     max_input_tokens: int = field(kw_only=True, default=None)
     max_output_tokens: int = field(kw_only=True, default=None)
+    token_count_cache: Optional[LruCache[str, int]] = field(default=None, kw_only=True)
 
     def __attrs_post_init__(self) -> None:
         if hasattr(self, "model"):
@@ -45,6 +63,58 @@ class BaseTokenizer(ABC):
     @abstractmethod
     def count_tokens(self, text: str) -> int: ...
 
+    def count_tokens_many(self, texts: list[str]) -> list[int]:
+        """Counts the tokens of many texts.
+
+        Counts in `token_count_cache` are reused and every distinct text is counted once.
+
+        Args:
+            texts: Texts to count the tokens of.
+
+        Returns:
+            The token count of every text, in the same order as `texts`.
+        """
+        if self.token_count_cache is None:
+            return self._count_tokens_many(texts)
+
+        keys = [str_to_hash(text) for text in texts]
+        token_counts = {}
+        missing = {}
+
+        for key, text in zip(keys, texts):
+            if key not in token_counts and key not in missing:
+                token_count = self.token_count_cache.get(key)
+
+                if token_count is None:
+                    missing[key] = text
+                else:
+                    token_counts[key] = token_count
+
+        for key, token_count in zip(missing.keys(), self._count_tokens_many(list(missing.values()))):
+            self.token_count_cache.put(key, token_count)
+            token_counts[key] = token_count
+
+        return [token_counts[key] for key in keys]
+
+    def _count_tokens_many(self, texts: list[str]) -> list[int]:
+        """Counts the tokens of many texts without `token_count_cache`. Override to count texts in batches."""
+        return [self.count_tokens(text) for text in texts]
+
+    def _count_tokens_cached(self, text: str, count_tokens: Callable[[str], int]) -> int:
+        """Counts the tokens of a text with `count_tokens`, reusing the count in `token_count_cache` if there is one."""
+        if self.token_count_cache is None:
+            return count_tokens(text)
+
+        key = str_to_hash(text)
+        token_count = self.token_count_cache.get(key)
+
+        if token_count is None:
+            token_count = count_tokens(text)
+
+            self.token_count_cache.put(key, token_count)
+
+        return token_count
+
     def _default_max_input_tokens(self) -> int:
         tokens = next((v for k, v in self.MODEL_PREFIXES_TO_MAX_INPUT_TOKENS.items() if self.model.startswith(k)), None)
 
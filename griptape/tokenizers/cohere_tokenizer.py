@@ -18,4 +18,6 @@ class CohereTokenizer(BaseTokenizer):
     client: Client = field(kw_only=True)
 
     def count_tokens(self, text: str) -> int:
-        return len(self.client.tokenize(text=text, model=self.model).tokens)
+        return self._count_tokens_cached(
+            text, lambda text: len(self.client.tokenize(text=text, model=self.model).tokens)
+        )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from attrs import Factory, define, field
 
@@ -27,4 +27,12 @@ class HuggingFaceTokenizer(BaseTokenizer):
     max_output_tokens: int = field(default=4096, kw_only=True)
 
     def count_tokens(self, text: str) -> int:
-        return len(self.tokenizer.encode(text))
+        return self._count_tokens_cached(text, lambda text: len(self.tokenizer.encode(text)))
+
+    def _count_tokens_many(self, texts: list[str]) -> list[int]:
+        if not texts:
+            return []
+
+        batch_input_ids = cast(list[list[int]], self.tokenizer(texts)["input_ids"])
+
+        return [len(input_ids) for input_ids in batch_input_ids]
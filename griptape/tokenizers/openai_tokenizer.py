@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 from typing import Optional
 
@@ -9,6 +10,14 @@ from attrs import Factory, define, field
 from griptape.tokenizers import BaseTokenizer
 
 
+@functools.lru_cache(maxsize=None)
+def _encoding_for_model(model: str) -> Optional[tiktoken.Encoding]:
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return None
+
+
 @define()
 class OpenAiTokenizer(BaseTokenizer):
     DEFAULT_OPENAI_GPT_3_COMPLETION_MODEL = "gpt-3.5-turbo-instruct"
@@ -55,10 +64,8 @@ class OpenAiTokenizer(BaseTokenizer):
 
     @property
     def encoding(self) -> tiktoken.Encoding:
-        try:
-            return tiktoken.encoding_for_model(self.model)
-        except KeyError:
-            return tiktoken.get_encoding(self.DEFAULT_ENCODING)
+        # Encodings are resolved once per model and shared by every tokenizer in the process.
+        return _encoding_for_model(self.model) or tiktoken.get_encoding(self.DEFAULT_ENCODING)
 
     def _default_max_input_tokens(self) -> int:
         tokens = next((v for k, v in self.MODEL_PREFIXES_TO_MAX_INPUT_TOKENS.items() if self.model.startswith(k)), None)
@@ -86,9 +93,9 @@ class OpenAiTokenizer(BaseTokenizer):
         if isinstance(text, list):
             model = model or self.model
 
-            try:
-                encoding = tiktoken.encoding_for_model(model)
-            except KeyError:
+            encoding = _encoding_for_model(model)
+
+            if encoding is None:
                 logging.warning("model not found. Using cl100k_base encoding.")
 
                 encoding = tiktoken.get_encoding("cl100k_base")
@@ -139,4 +146,9 @@ class OpenAiTokenizer(BaseTokenizer):
 
             return num_tokens
         else:
-            return len(self.encoding.encode(text, allowed_special=set(self.stop_sequences)))
+            return self._count_tokens_cached(
+                text, lambda text: len(self.encoding.encode(text, allowed_special=set(self.stop_sequences)))
+            )
+
+    def _count_tokens_many(self, texts: list[str]) -> list[int]:
+        return [len(tokens) for tokens in self.encoding.encode_batch(texts, allowed_special=set(self.stop_sequences))]
@@ -1,71 +1,98 @@
-from .base_tool import BaseTool
-from .base_image_generation_tool import BaseImageGenerationTool
-from .calculator.tool import CalculatorTool
-from .web_search.tool import WebSearchTool
-from .web_scraper.tool import WebScraperTool
-from .sql.tool import SqlTool
-from .email.tool import EmailTool
-from .rest_api.tool import RestApiTool
-from .file_manager.tool import FileManagerTool
-from .vector_store.tool import VectorStoreTool
-from .date_time.tool import DateTimeTool
-from .base_aws_tool import BaseAwsTool
-from .aws_iam.tool import AwsIamTool
-from .aws_s3.tool import AwsS3Tool
-from .computer.tool import ComputerTool
-from .base_google_tool import BaseGoogleTool
-from .google_gmail.tool import GoogleGmailTool
-from .google_calendar.tool import GoogleCalendarTool
-from .google_docs.tool import GoogleDocsTool
-from .google_drive.tool import GoogleDriveTool
-from .openweather.tool import OpenWeatherTool
-from .prompt_image_generation.tool import PromptImageGenerationTool
-from .variation_image_generation.tool import VariationImageGenerationTool
-from .inpainting_image_generation.tool import InpaintingImageGenerationTool
-from .outpainting_image_generation.tool import OutpaintingImageGenerationTool
-from .griptape_cloud_knowledge_base.tool import GriptapeCloudKnowledgeBaseTool
-from .structure_run.tool import StructureRunTool
-from .image_query.tool import ImageQueryTool
-from .rag.tool import RagTool
-from .text_to_speech.tool import TextToSpeechTool
-from .audio_transcription.tool import AudioTranscriptionTool
-from .extraction.tool import ExtractionTool
-from .prompt_summary.tool import PromptSummaryTool
-from .query.tool import QueryTool
+from __future__ import annotations
 
-__all__ = [
-    "BaseTool",
-    "BaseImageGenerationTool",
-    "BaseAwsTool",
-    "AwsIamTool",
-    "AwsS3Tool",
-    "BaseGoogleTool",
-    "GoogleGmailTool",
-    "GoogleDocsTool",
-    "GoogleCalendarTool",
-    "GoogleDriveTool",
-    "CalculatorTool",
-    "WebSearchTool",
-    "WebScraperTool",
-    "SqlTool",
-    "EmailTool",
-    "RestApiTool",
-    "FileManagerTool",
-    "VectorStoreTool",
-    "DateTimeTool",
-    "ComputerTool",
-    "OpenWeatherTool",
-    "PromptImageGenerationTool",
-    "VariationImageGenerationTool",
-    "InpaintingImageGenerationTool",
-    "OutpaintingImageGenerationTool",
-    "GriptapeCloudKnowledgeBaseTool",
-    "StructureRunTool",
-    "ImageQueryTool",
-    "RagTool",
-    "TextToSpeechTool",
-    "AudioTranscriptionTool",
-    "ExtractionTool",
-    "PromptSummaryTool",
-    "QueryTool",
-]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base_tool import BaseTool as BaseTool
+    from .base_image_generation_tool import BaseImageGenerationTool as BaseImageGenerationTool
+    from .calculator.tool import CalculatorTool as CalculatorTool
+    from .web_search.tool import WebSearchTool as WebSearchTool
+    from .web_scraper.tool import WebScraperTool as WebScraperTool
+    from .sql.tool import SqlTool as SqlTool
+    from .email.tool import EmailTool as EmailTool
+    from .rest_api.tool import RestApiTool as RestApiTool
+    from .file_manager.tool import FileManagerTool as FileManagerTool
+    from .vector_store.tool import VectorStoreTool as VectorStoreTool
+    from .date_time.tool import DateTimeTool as DateTimeTool
+    from .base_aws_tool import BaseAwsTool as BaseAwsTool
+    from .aws_iam.tool import AwsIamTool as AwsIamTool
+    from .aws_s3.tool import AwsS3Tool as AwsS3Tool
+    from .computer.tool import ComputerTool as ComputerTool
+    from .base_google_tool import BaseGoogleTool as BaseGoogleTool
+    from .google_gmail.tool import GoogleGmailTool as GoogleGmailTool
+    from .google_calendar.tool import GoogleCalendarTool as GoogleCalendarTool
+    from .google_docs.tool import GoogleDocsTool as GoogleDocsTool
+    from .google_drive.tool import GoogleDriveTool as GoogleDriveTool
+    from .openweather.tool import OpenWeatherTool as OpenWeatherTool
+    from .prompt_image_generation.tool import PromptImageGenerationTool as PromptImageGenerationTool
+    from .variation_image_generation.tool import VariationImageGenerationTool as VariationImageGenerationTool
+    from .inpainting_image_generation.tool import InpaintingImageGenerationTool as InpaintingImageGenerationTool
+    from .outpainting_image_generation.tool import OutpaintingImageGenerationTool as OutpaintingImageGenerationTool
+    from .griptape_cloud_knowledge_base.tool import GriptapeCloudKnowledgeBaseTool as GriptapeCloudKnowledgeBaseTool
+    from .structure_run.tool import StructureRunTool as StructureRunTool
+    from .image_query.tool import ImageQueryTool as ImageQueryTool
+    from .rag.tool import RagTool as RagTool
+    from .text_to_speech.tool import TextToSpeechTool as TextToSpeechTool
+    from .audio_transcription.tool import AudioTranscriptionTool as AudioTranscriptionTool
+    from .extraction.tool import ExtractionTool as ExtractionTool
+    from .prompt_summary.tool import PromptSummaryTool as PromptSummaryTool
+    from .query.tool import QueryTool as QueryTool
+
+# Tools are imported from their modules on first access, so that importing the package doesn't import
+# every Tool and the third-party libraries that it depends on.
+_LAZY_IMPORTS = {
+    "BaseTool": ".base_tool",
+    "BaseImageGenerationTool": ".base_image_generation_tool",
+    "CalculatorTool": ".calculator.tool",
+    "WebSearchTool": ".web_search.tool",
+    "WebScraperTool": ".web_scraper.tool",
+    "SqlTool": ".sql.tool",
+    "EmailTool": ".email.tool",
+    "RestApiTool": ".rest_api.tool",
+    "FileManagerTool": ".file_manager.tool",
+    "VectorStoreTool": ".vector_store.tool",
+    "DateTimeTool": ".date_time.tool",
+    "BaseAwsTool": ".base_aws_tool",
+    "AwsIamTool": ".aws_iam.tool",
+    "AwsS3Tool": ".aws_s3.tool",
+    "ComputerTool": ".computer.tool",
+    "BaseGoogleTool": ".base_google_tool",
+    "GoogleGmailTool": ".google_gmail.tool",
+    "GoogleCalendarTool": ".google_calendar.tool",
+    "GoogleDocsTool": ".google_docs.tool",
+    "GoogleDriveTool": ".google_drive.tool",
+    "OpenWeatherTool": ".openweather.tool",
+    "PromptImageGenerationTool": ".prompt_image_generation.tool",
+    "VariationImageGenerationTool": ".variation_image_generation.tool",
+    "InpaintingImageGenerationTool": ".inpainting_image_generation.tool",
+    "OutpaintingImageGenerationTool": ".outpainting_image_generation.tool",
+    "GriptapeCloudKnowledgeBaseTool": ".griptape_cloud_knowledge_base.tool",
+    "StructureRunTool": ".structure_run.tool",
+    "ImageQueryTool": ".image_query.tool",
+    "RagTool": ".rag.tool",
+    "TextToSpeechTool": ".text_to_speech.tool",
+    "AudioTranscriptionTool": ".audio_transcription.tool",
+    "ExtractionTool": ".extraction.tool",
+    "PromptSummaryTool": ".prompt_summary.tool",
+    "QueryTool": ".query.tool",
+}
+
+# Type checkers get the exported names from the imports above, which re-export them explicitly.
+__all__ = list(_LAZY_IMPORTS)  # pyright: ignore[reportUnsupportedDunderAll]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -6,8 +6,9 @@ import os
 import re
 import subprocess
 import sys
+import threading
 from abc import ABC
-from typing import TYPE_CHECKING, Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Optional
 
 import schema
 import yaml
@@ -17,6 +18,7 @@ from schema import Literal, Or, Schema
 from griptape.artifacts import BaseArtifact, ErrorArtifact, InfoArtifact, TextArtifact
 from griptape.common import observable
 from griptape.mixins import ActivityMixin
+from griptape.utils import is_dependency_installed, str_to_hash
 
 if TYPE_CHECKING:
     from griptape.common import ToolAction
@@ -34,20 +36,48 @@ class BaseTool(ActivityMixin, ABC):
         output_memory: TaskMemory that activities write to be default. Gets automatically set if None.
         install_dependencies_on_init: Determines whether dependencies from the tool requirements.txt file are installed in init.
         dependencies_install_directory: Custom dependency install directory.
+        dependencies_stamp_directory: Directory of the stamp files that record installed requirements.txt files.
         verbose: Determines whether tool operations (such as dependency installation) should be verbose.
         off_prompt: Determines whether tool activity output goes to the output memory.
+
+    The Tool schema and Activity schemas are built once and rebuilt only when the key returned by `schema_cache_key`
+    changes.
+
+    Dependencies are only installed when they aren't already satisfied. Requirements are checked against the installed
+    distributions with `importlib.metadata`, and a requirements.txt file that was checked or installed is remembered for
+    the rest of the process. Requirements that can't be checked, like URLs or pip options, are remembered across processes
+    with a stamp file keyed by the hash of the requirements.txt file.
+
+    Structures install the missing dependencies of their Tools before they run, so the requirements of Tools created with
+    `install_dependencies_on_init=False` are installed together with `install_tools_dependencies`.
     """
 
     MANIFEST_FILE = "manifest.yml"
     REQUIREMENTS_FILE = "requirements.txt"
+    DEFAULT_DEPENDENCIES_STAMP_DIRECTORY = os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "griptape",
+        "tool_dependencies",
+    )
+
+    _installed_requirements: ClassVar[set[tuple[str, Optional[str]]]] = set()
+    _install_lock: ClassVar[threading.Lock] = threading.Lock()
 
     name: str = field(default=Factory(lambda self: self.__class__.__name__, takes_self=True), kw_only=True)
     input_memory: Optional[list[TaskMemory]] = field(default=None, kw_only=True)
     output_memory: Optional[dict[str, list[TaskMemory]]] = field(default=None, kw_only=True)
     install_dependencies_on_init: bool = field(default=True, kw_only=True)
     dependencies_install_directory: Optional[str] = field(default=None, kw_only=True)
+    dependencies_stamp_directory: str = field(
+        default=Factory(
+            lambda self: self.dependencies_install_directory or self.DEFAULT_DEPENDENCIES_STAMP_DIRECTORY,
+            takes_self=True,
+        ),
+        kw_only=True,
+    )
     verbose: bool = field(default=False, kw_only=True)
     off_prompt: bool = field(default=False, kw_only=True)
+    _schema_cache: dict[str, tuple[tuple, Any]] = field(factory=dict, init=False, eq=False)
 
     def __attrs_post_init__(self) -> None:
         if self.install_dependencies_on_init:
@@ -91,11 +121,42 @@ class BaseTool(ActivityMixin, ABC):
     # This method has to remain a method and can't be decorated with @property because
     # of the max depth recursion issue in `self.activities`.
     def schema(self) -> dict:
+        return self._get_cached_schema("schema", self._build_schema)
+
+    def activity_schemas(self) -> list[Schema]:
+        return list(self._get_cached_schema("activity_schemas", self._build_activity_schemas))
+
+    def schema_cache_key(self) -> tuple:
+        """Returns a key that changes whenever the Tool schema or the Activity schemas change.
+
+        The key is made of the Tool class, the Tool name, the Activities with their rendered descriptions, and
+        `extra_schema_properties`.
+        """
+        return (
+            self.__class__,
+            self.name,
+            tuple(
+                (self.activity_name(activity), self.activity_description(activity)) for activity in self.activities()
+            ),
+            repr(self.extra_schema_properties),
+        )
+
+    def _get_cached_schema(self, name: str, build: Callable[[], Any]) -> Any:
+        key = self.schema_cache_key()
+        cached = self._schema_cache.get(name)
+
+        if cached is None or cached[0] != key:
+            cached = (key, build())
+            self._schema_cache[name] = cached
+
+        return cached[1]
+
+    def _build_schema(self) -> dict:
         full_schema = Schema(Or(*self.activity_schemas()), description=f"{self.name} action schema.")
 
         return full_schema.json_schema(f"{self.name} ToolAction Schema")
 
-    def activity_schemas(self) -> list[Schema]:
+    def _build_activity_schemas(self) -> list[Schema]:
         schemas = []
 
         for activity in self.activities():
@@ -191,23 +252,93 @@ class BaseTool(ActivityMixin, ABC):
         return os.path.dirname(os.path.abspath(class_file))
 
     def install_dependencies(self, env: Optional[dict[str, str]] = None) -> None:
+        self.install_tools_dependencies([self], env)
+
+    @classmethod
+    def install_tools_dependencies(cls, tools: list[BaseTool], env: Optional[dict[str, str]] = None) -> None:
+        """Installs the missing dependencies of many Tools with one pip invocation per install directory.
+
+        Args:
+            tools: Tools whose requirements.txt files are installed, like all the Tools of a Structure.
+            env: Environment variables of the pip process.
+        """
         env = env or {}
+        requirements_paths: dict[Optional[str], dict[str, BaseTool]] = {}
 
-        command = [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"]
+        with cls._install_lock:
+            for tool in tools:
+                if not tool.are_dependencies_installed():
+                    install_directory = tool.dependencies_install_directory
 
-        if self.dependencies_install_directory is None:
-            command.extend(["-U"])
-        else:
-            command.extend(["-t", self.dependencies_install_directory])
-
-        subprocess.run(
-            command,
-            env=env,
-            cwd=self.tool_dir(),
-            stdout=None if self.verbose else subprocess.DEVNULL,
-            stderr=None if self.verbose else subprocess.DEVNULL,
+                    requirements_paths.setdefault(install_directory, {})[tool.requirements_path] = tool
+
+            for install_directory, tools_by_path in requirements_paths.items():
+                command = [sys.executable, "-m", "pip", "install"]
+
+                for requirements_path in tools_by_path:
+                    command.extend(["-r", requirements_path])
+
+                if install_directory is None:
+                    command.extend(["-U"])
+                else:
+                    command.extend(["-t", install_directory])
+
+                verbose = any(tool.verbose for tool in tools_by_path.values())
+                result = subprocess.run(
+                    command,
+                    env=env,
+                    stdout=None if verbose else subprocess.DEVNULL,
+                    stderr=None if verbose else subprocess.DEVNULL,
+                )
+
+                if result.returncode == 0:
+                    for tool in tools_by_path.values():
+                        tool._mark_dependencies_installed()
+
+    def are_dependencies_installed(self) -> bool:
+        """Returns whether the requirements in the Tool's requirements.txt file are already satisfied.
+
+        Tools without a requirements.txt file don't have any dependencies to install.
+        """
+        memo_key = (self.requirements_path, self.dependencies_install_directory)
+
+        if memo_key in self._installed_requirements or not os.path.exists(self.requirements_path):
+            return True
+
+        satisfied = _are_requirements_satisfied(
+            self._read_requirements(),
+            [self.dependencies_install_directory, *sys.path] if self.dependencies_install_directory else sys.path,
         )
 
+        if satisfied is None:
+            satisfied = os.path.exists(self._get_requirements_stamp_path())
+
+        if satisfied:
+            self._installed_requirements.add(memo_key)
+
+        return satisfied
+
+    def _mark_dependencies_installed(self) -> None:
+        self._installed_requirements.add((self.requirements_path, self.dependencies_install_directory))
+
+        try:
+            os.makedirs(self.dependencies_stamp_directory, exist_ok=True)
+
+            with open(self._get_requirements_stamp_path(), "w"):
+                pass
+        except OSError as e:
+            logging.debug("Couldn't write the dependencies stamp of %s: %s", self.name, e)
+
+    def _read_requirements(self) -> list[str]:
+        with open(self.requirements_path) as requirements_file:
+            return requirements_file.read().splitlines()
+
+    def _get_requirements_stamp_path(self) -> str:
+        requirements = "\n".join(self._read_requirements())
+        key = str_to_hash(f"{sys.executable}:{self.dependencies_install_directory}:{requirements}")
+
+        return os.path.join(self.dependencies_stamp_directory, f"{key}.stamp")
+
     def find_input_memory(self, memory_name: str) -> Optional[TaskMemory]:
         if self.input_memory:
             return next((m for m in self.input_memory if m.name == memory_name), None)
@@ -235,3 +366,40 @@ class BaseTool(ActivityMixin, ABC):
             raise ValueError("Activity name can only contain letters, numbers, and underscores.")
 
         return f"{tool_name}_{activity_name}"
+
+
+def _are_requirements_satisfied(requirements: list[str], path: list[str]) -> Optional[bool]:
+    """Returns whether requirements are satisfied by the distributions installed in `path`.
+
+    Returns `None` if any requirement can't be checked.
+    """
+    if not is_dependency_installed("packaging"):
+        return None
+
+    import importlib.metadata
+
+    from packaging.requirements import InvalidRequirement, Requirement
+
+    for line in requirements:
+        line = line.split("#", 1)[0].strip()
+
+        if not line:
+            continue
+
+        try:
+            requirement = Requirement(line)
+        except InvalidRequirement:
+            # pip options and local paths can't be checked without pip.
+            return None
+
+        if requirement.url or requirement.extras:
+            return None
+        if requirement.marker is not None and not requirement.marker.evaluate():
+            continue
+
+        distribution = next(iter(importlib.metadata.distributions(name=requirement.name, path=path)), None)
+
+        if distribution is None or not requirement.specifier.contains(distribution.version, prereleases=True):
+            return False
+
+    return True
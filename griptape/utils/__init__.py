@@ -5,7 +5,12 @@ from .manifest_validator import ManifestValidator
 from .python_runner import PythonRunner
 from .command_runner import CommandRunner
 from .chat import Chat
-from .futures import execute_futures_dict, execute_futures_list, execute_futures_list_dict
+from .futures import (
+    execute_futures_dict,
+    execute_futures_dict_as_completed,
+    execute_futures_list,
+    execute_futures_list_dict,
+)
 from .token_counter import TokenCounter
 from .dict_utils import remove_null_values_in_dict_recursively, dict_merge, remove_key_in_dict_recursively
 from .file_utils import load_file, load_files
@@ -17,6 +22,8 @@ from .load_artifact_from_memory import load_artifact_from_memory
 from .deprecation import deprecation_warn
 from .structure_visualizer import StructureVisualizer
 from .reference_utils import references_from_artifacts
+from .lru_cache import LruCache
+from .rate_limiter import RateLimiter, RateLimiterMetrics, RateLimiters
 
 
 def minify_json(value: str) -> str:
@@ -35,6 +42,7 @@ __all__ = [
     "import_optional_dependency",
     "is_dependency_installed",
     "execute_futures_dict",
+    "execute_futures_dict_as_completed",
     "execute_futures_list",
     "execute_futures_list_dict",
     "TokenCounter",
@@ -48,4 +56,8 @@ __all__ = [
     "load_files",
     "StructureVisualizer",
     "references_from_artifacts",
+    "LruCache",
+    "RateLimiter",
+    "RateLimiterMetrics",
+    "RateLimiters",
 ]
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from concurrent import futures
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
 
 T = TypeVar("T")
 
@@ -12,6 +15,21 @@ def execute_futures_dict(fs_dict: dict[str, futures.Future[T]]) -> dict[str, T]:
     return {key: future.result() for key, future in fs_dict.items()}
 
 
+def execute_futures_dict_as_completed(fs_dict: dict[str, futures.Future[T]]) -> Generator[tuple[str, T], None, None]:
+    """Yields the key and result of each future as soon as it completes.
+
+    Futures that haven't started yet are cancelled if the generator is closed early, for instance when a future raises.
+    """
+    keys_by_future = {future: key for key, future in fs_dict.items()}
+
+    try:
+        for future in futures.as_completed(keys_by_future):
+            yield keys_by_future[future], future.result()
+    finally:
+        for future in keys_by_future:
+            future.cancel()
+
+
 def execute_futures_list(fs_list: list[futures.Future[T]]) -> list[T]:
     futures.wait(fs_list, timeout=None, return_when=futures.ALL_COMPLETED)
 
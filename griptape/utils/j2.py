@@ -1,29 +1,116 @@
 from __future__ import annotations
 
-from typing import Optional
+import threading
+from typing import TYPE_CHECKING, ClassVar, Optional
+from weakref import WeakKeyDictionary
 
 from attrs import Factory, define, field
 from jinja2 import Environment, FileSystemLoader
 
+from .lru_cache import LruCache
 from .paths import abs_path
 
+if TYPE_CHECKING:
+    from jinja2 import BytecodeCache, Template
+
 
 @define(frozen=True)
 class J2:
+    """Renders Jinja templates.
+
+    J2s with the same `templates_dir` share one Jinja Environment, so templates are loaded and compiled once per process.
+    Templates rendered from strings are compiled once and kept in a bounded cache, and strings without Jinja syntax
+    aren't rendered at all.
+
+    Attributes:
+        template_name: Name of the template in `templates_dir` rendered by `render`.
+        templates_dir: Directory that templates are loaded from.
+        environment: Jinja Environment. Defaults to the Environment shared by J2s with the same `templates_dir`.
+    """
+
+    DEFAULT_TEMPLATES_DIR = abs_path("templates")
+    STRING_TEMPLATE_CACHE_SIZE = 256
+    SYNTAX_MARKERS = ("{{", "{%", "{#")
+
+    _environments: ClassVar[dict[str, Environment]] = {}
+    _string_templates: ClassVar[WeakKeyDictionary[Environment, LruCache[str, Template]]] = WeakKeyDictionary()
+    _bytecode_cache: ClassVar[Optional[BytecodeCache]] = None
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
     template_name: Optional[str] = field(default=None)
-    templates_dir: str = field(default=abs_path("templates"), kw_only=True)
+    templates_dir: str = field(default=DEFAULT_TEMPLATES_DIR, kw_only=True)
     environment: Environment = field(
-        default=Factory(
-            lambda self: Environment(loader=FileSystemLoader(self.templates_dir), trim_blocks=True, lstrip_blocks=True),
-            takes_self=True,
-        ),
+        default=Factory(lambda self: self.get_environment(self.templates_dir), takes_self=True),
         kw_only=True,
     )
 
+    @classmethod
+    def get_environment(cls, templates_dir: str) -> Environment:
+        """Returns the Jinja Environment shared by J2s that load templates from `templates_dir`.
+
+        Args:
+            templates_dir: Directory that templates are loaded from.
+        """
+        environment = cls._environments.get(templates_dir)
+
+        if environment is None:
+            with cls._lock:
+                environment = cls._environments.get(templates_dir)
+
+                if environment is None:
+                    environment = Environment(
+                        loader=FileSystemLoader(templates_dir),
+                        trim_blocks=True,
+                        lstrip_blocks=True,
+                        # Packaged templates don't change at runtime, so don't check them for changes on every render.
+                        auto_reload=templates_dir != cls.DEFAULT_TEMPLATES_DIR,
+                        bytecode_cache=cls._bytecode_cache,
+                    )
+                    cls._environments[templates_dir] = environment
+
+        return environment
+
+    @classmethod
+    def set_bytecode_cache(cls, bytecode_cache: Optional[BytecodeCache]) -> None:
+        """Sets the Jinja bytecode cache of the shared Environments.
+
+        A `jinja2.FileSystemBytecodeCache` lets new processes load compiled templates from disk instead of compiling
+        them again.
+
+        Args:
+            bytecode_cache: Bytecode cache to use, or `None` to disable bytecode caching.
+        """
+        with cls._lock:
+            cls._bytecode_cache = bytecode_cache
+
+            for environment in cls._environments.values():
+                environment.bytecode_cache = bytecode_cache
+
     def render(self, **kwargs) -> str:
         if self.template_name is None:
             raise ValueError("template_name is required.")
         return self.environment.get_template(self.template_name).render(kwargs).rstrip()
 
     def render_from_string(self, value: str, **kwargs) -> str:
-        return self.environment.from_string(value).render(kwargs)
+        if not any(marker in value for marker in self.SYNTAX_MARKERS) and "\r" not in value:
+            # Rendering text without Jinja syntax only removes a single trailing newline.
+            return value[:-1] if value.endswith("\n") else value
+
+        return self._get_string_template(value).render(kwargs)
+
+    def _get_string_template(self, value: str) -> Template:
+        string_templates = self._string_templates.get(self.environment)
+
+        if string_templates is None:
+            with self._lock:
+                string_templates = self._string_templates.setdefault(
+                    self.environment, LruCache(max_size=self.STRING_TEMPLATE_CACHE_SIZE)
+                )
+
+        template = string_templates.get(value)
+
+        if template is None:
+            template = self.environment.from_string(value)
+            string_templates.put(value, template)
+
+        return template
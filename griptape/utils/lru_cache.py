@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Generic, Optional, TypeVar
+
+from attrs import define, field
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+@define
+class LruCache(Generic[K, V]):
+    """Thread-safe least recently used cache with hit and miss counters.
+
+    Attributes:
+        max_size: Maximum number of items kept before the least recently used item is evicted.
+        hits: Number of `get` calls that found their key.
+        misses: Number of `get` calls that did not find their key.
+    """
+
+    max_size: int = field(default=1024, kw_only=True)
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _items: OrderedDict[K, V] = field(factory=OrderedDict, init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False)
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+
+                return self._items[key]
+            else:
+                self.misses += 1
+
+                return default
+
+    def put(self, key: K, value: V) -> None:
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def pop(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        with self._lock:
+            return self._items.pop(key, default)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,398 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Optional
+
+from attrs import Attribute, define, field
+
+from griptape.mixins.singleton_mixin import SingletonMixin
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+RATE_LIMIT_STATUS_CODE = 429
+RATE_LIMIT_ERROR_CODES = ("ThrottlingException", "TooManyRequestsException", "Throttling")
+
+
+@define
+class RateLimiterMetrics:
+    """Counters of the requests sent through a Rate Limiter.
+
+    Attributes:
+        request_count: Number of requests sent.
+        token_count: Number of tokens used by the requests, as reported by the provider or estimated.
+        rate_limited_count: Number of requests rejected by the provider's rate limits.
+        in_flight_count: Number of requests waiting for a response.
+        concurrency_limit: Current number of requests allowed in flight. Unlimited if `None`.
+        total_wait_time: Total time that requests waited for the Rate Limiter, in seconds.
+        max_wait_time: Longest time that a request waited for the Rate Limiter, in seconds.
+    """
+
+    request_count: int = field(default=0, kw_only=True)
+    token_count: int = field(default=0, kw_only=True)
+    rate_limited_count: int = field(default=0, kw_only=True)
+    in_flight_count: int = field(default=0, kw_only=True)
+    concurrency_limit: Optional[float] = field(default=None, kw_only=True)
+    total_wait_time: float = field(default=0.0, kw_only=True)
+    max_wait_time: float = field(default=0.0, kw_only=True)
+
+    @property
+    def average_wait_time(self) -> float:
+        return self.total_wait_time / self.request_count if self.request_count else 0.0
+
+    def record_wait_time(self, wait_time: float) -> None:
+        self.request_count += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+
+
+@define
+class RateLimiter:
+    """Client-side rate limiter for the requests sent to a provider's model.
+
+    Requests per minute and tokens per minute are limited with token buckets that hold up to a minute's quota and refill
+    continuously, so sustained throughput runs at the quota instead of alternating between bursts and rate limit errors.
+    The number of requests in flight is limited with an additive increase, multiplicative decrease (AIMD) window: every
+    rate limit error reported by the provider shrinks the window, every successful request grows it, and a `Retry-After`
+    pauses all requests until it elapses.
+
+    Attributes:
+        requests_per_minute: Maximum number of requests per minute. Not limited if `None`.
+        tokens_per_minute: Maximum number of tokens per minute. Not limited if `None`.
+        max_concurrency: Maximum number of requests in flight. Not limited until the provider rejects a request if
+            `None`.
+        min_concurrency: Number of requests in flight that rate limit errors can't shrink the window below.
+        concurrency_decrease_factor: Factor that the window is multiplied by after a rate limit error.
+        metrics: Request, token, and wait time counters.
+    """
+
+    @define
+    class Request:
+        """A request sent through a Rate Limiter.
+
+        Attributes:
+            estimated_token_count: Number of tokens reserved for the request.
+            token_count: Actual number of tokens used by the request. Set it, if known, before the request is released
+                so that the Rate Limiter corrects its estimate.
+        """
+
+        estimated_token_count: int = field(default=0, kw_only=True)
+        token_count: Optional[int] = field(default=None, kw_only=True)
+
+    requests_per_minute: Optional[int] = field(default=None, kw_only=True)
+    tokens_per_minute: Optional[int] = field(default=None, kw_only=True)
+    max_concurrency: Optional[int] = field(default=None, kw_only=True)
+    min_concurrency: int = field(default=1, kw_only=True)
+    concurrency_decrease_factor: float = field(default=0.5, kw_only=True)
+    metrics: RateLimiterMetrics = field(factory=RateLimiterMetrics, kw_only=True, eq=False)
+    _request_allowance: float = field(init=False, eq=False)
+    _token_allowance: float = field(init=False, eq=False)
+    _refilled_at: float = field(factory=time.monotonic, init=False, eq=False)
+    _paused_until: float = field(default=0.0, init=False, eq=False)
+    _condition: threading.Condition = field(factory=threading.Condition, init=False, eq=False)
+    # Events of the coroutines waiting in `alimit`, which `release` sets from whichever thread releases a request.
+    _async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = field(factory=list, init=False, eq=False)
+
+    @requests_per_minute.validator  # pyright: ignore[reportAttributeAccessIssue]
+    @tokens_per_minute.validator  # pyright: ignore[reportAttributeAccessIssue]
+    @max_concurrency.validator  # pyright: ignore[reportAttributeAccessIssue]
+    def validate_limit(self, attribute: Attribute, limit: Optional[int]) -> None:
+        if limit is not None and limit < 1:
+            raise ValueError(f"{attribute.name} must be greater than 0.")
+
+    def __attrs_post_init__(self) -> None:
+        self._request_allowance = float(self.requests_per_minute or 0)
+        self._token_allowance = float(self.tokens_per_minute or 0)
+        self.metrics.concurrency_limit = self.max_concurrency
+
+    @staticmethod
+    def is_rate_limit_error(error: BaseException) -> bool:
+        """Returns whether an exception raised by a provider's client reports a rate limit error."""
+        status_code = getattr(error, "status_code", None)
+        response = getattr(error, "response", None)
+
+        if status_code is None and response is not None:
+            status_code = getattr(response, "status_code", None)
+
+        if status_code == RATE_LIMIT_STATUS_CODE:
+            return True
+        elif isinstance(response, dict):
+            # botocore's ClientError
+            return response.get("Error", {}).get("Code") in RATE_LIMIT_ERROR_CODES
+        else:
+            return "RateLimit" in type(error).__name__ or "TooManyRequests" in type(error).__name__
+
+    @staticmethod
+    def get_retry_after(error: BaseException) -> Optional[float]:
+        """Returns the number of seconds to wait before retrying, from the `Retry-After` header of an exception's response.
+
+        Returns:
+            The number of seconds to wait, or `None` if the response has no valid `Retry-After` header.
+        """
+        headers = getattr(getattr(error, "response", None), "headers", None)
+
+        if headers is None or not hasattr(headers, "get"):
+            return None
+
+        retry_after_ms = headers.get("retry-after-ms")
+        retry_after = headers.get("retry-after")
+
+        if isinstance(retry_after_ms, str):
+            try:
+                return max(float(retry_after_ms) / 1000, 0.0)
+            except ValueError:
+                pass
+
+        if isinstance(retry_after, str):
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                except (TypeError, ValueError):
+                    return None
+
+                if retry_at.tzinfo is None:
+                    retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+                return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+        return None
+
+    @contextmanager
+    def limit(self, token_count: int = 0) -> Iterator[RateLimiter.Request]:
+        """Waits until a request can be sent, and releases it when the block exits.
+
+        Args:
+            token_count: Estimated number of tokens used by the request.
+
+        Yields:
+            The request, whose `token_count` can be set to the actual number of tokens used.
+        """
+        request = self.acquire(token_count)
+
+        try:
+            yield request
+        except BaseException as e:
+            self.release(request, rate_limited=self.is_rate_limit_error(e), retry_after=self.get_retry_after(e))
+
+            raise
+        else:
+            self.release(request)
+
+    @asynccontextmanager
+    async def alimit(self, token_count: int = 0) -> AsyncIterator[RateLimiter.Request]:
+        """Waits without blocking the event loop until a request can be sent, and releases it when the block exits.
+
+        See `limit`. Cancelling the coroutine while it waits doesn't acquire a request, and cancelling it in the block
+        releases the request.
+        """
+        request = await self.aacquire(token_count)
+
+        try:
+            yield request
+        except BaseException as e:
+            self.release(request, rate_limited=self.is_rate_limit_error(e), retry_after=self.get_retry_after(e))
+
+            raise
+        else:
+            self.release(request)
+
+    def acquire(self, token_count: int = 0) -> RateLimiter.Request:
+        """Waits until a request can be sent without exceeding the limits, and counts it.
+
+        Args:
+            token_count: Estimated number of tokens used by the request.
+
+        Returns:
+            The request, which must be passed to `release` once its response is received.
+        """
+        started_at = time.monotonic()
+
+        with self._condition:
+            while (delay := self.__get_delay(token_count)) != 0:
+                self._condition.wait(delay)
+
+            return self.__take(token_count, started_at)
+
+    async def aacquire(self, token_count: int = 0) -> RateLimiter.Request:
+        """Waits without blocking the event loop until a request can be sent, and counts it. See `acquire`."""
+        started_at = time.monotonic()
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+
+        while True:
+            with self._condition:
+                if (delay := self.__get_delay(token_count)) == 0:
+                    return self.__take(token_count, started_at)
+
+                waiter[1].clear()
+                self._async_waiters.append(waiter)
+
+            try:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(waiter[1].wait(), delay)
+            finally:
+                with self._condition:
+                    self._async_waiters.remove(waiter)
+
+    def release(
+        self, request: RateLimiter.Request, *, rate_limited: bool = False, retry_after: Optional[float] = None
+    ) -> None:
+        """Releases a request acquired with `acquire`, and adjusts the concurrency window.
+
+        Args:
+            request: The request.
+            rate_limited: Whether the provider rejected the request because of its rate limits.
+            retry_after: Number of seconds that the provider asked to wait before sending more requests.
+        """
+        with self._condition:
+            token_count = request.estimated_token_count if request.token_count is None else request.token_count
+
+            if self.tokens_per_minute is not None:
+                self._token_allowance += request.estimated_token_count - token_count
+
+            self.metrics.in_flight_count -= 1
+            self.metrics.token_count += token_count
+
+            if rate_limited:
+                self.__decrease_concurrency_limit()
+            else:
+                self.__increase_concurrency_limit()
+
+            if retry_after is not None:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+
+            self._condition.notify_all()
+
+            for loop, event in self._async_waiters:
+                if not loop.is_closed():
+                    loop.call_soon_threadsafe(event.set)
+
+    def __take(self, token_count: int, started_at: float) -> RateLimiter.Request:
+        """Counts a request that can be sent. Must be called under `_condition`."""
+        if self.requests_per_minute is not None:
+            self._request_allowance -= 1
+        if self.tokens_per_minute is not None:
+            self._token_allowance -= token_count
+
+        self.metrics.in_flight_count += 1
+        self.metrics.record_wait_time(time.monotonic() - started_at)
+
+        return RateLimiter.Request(estimated_token_count=token_count)
+
+    def __get_delay(self, token_count: int) -> Optional[float]:
+        """Returns the number of seconds to wait before a request can be sent, or `None` to wait for a release."""
+        concurrency_limit = self.metrics.concurrency_limit
+
+        if concurrency_limit is not None and self.metrics.in_flight_count >= math.floor(concurrency_limit):
+            return None
+
+        now = time.monotonic()
+        self.__refill(now)
+        delay = max(self._paused_until - now, 0.0)
+
+        if self.requests_per_minute is not None and self._request_allowance < 1:
+            delay = max(delay, (1 - self._request_allowance) * 60 / self.requests_per_minute)
+        if self.tokens_per_minute is not None:
+            # Requests larger than the bucket only wait for it to be full.
+            required_tokens = min(token_count, self.tokens_per_minute)
+
+            if self._token_allowance < required_tokens:
+                delay = max(delay, (required_tokens - self._token_allowance) * 60 / self.tokens_per_minute)
+
+        return delay
+
+    def __refill(self, now: float) -> None:
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+
+        if self.requests_per_minute is not None:
+            self._request_allowance = min(
+                self._request_allowance + elapsed * self.requests_per_minute / 60, self.requests_per_minute
+            )
+        if self.tokens_per_minute is not None:
+            self._token_allowance = min(
+                self._token_allowance + elapsed * self.tokens_per_minute / 60, self.tokens_per_minute
+            )
+
+    def __increase_concurrency_limit(self) -> None:
+        concurrency_limit = self.metrics.concurrency_limit
+
+        if concurrency_limit is not None:
+            # Grows the window by one request per window of successful requests.
+            concurrency_limit += 1 / concurrency_limit
+
+            if self.max_concurrency is not None:
+                concurrency_limit = min(concurrency_limit, self.max_concurrency)
+
+            self.metrics.concurrency_limit = concurrency_limit
+
+    def __decrease_concurrency_limit(self) -> None:
+        concurrency_limit = self.metrics.concurrency_limit
+
+        if concurrency_limit is None:
+            # The requests in flight when the first rate limit error is received are the first estimate of the window.
+            concurrency_limit = self.metrics.in_flight_count + 1
+
+        self.metrics.rate_limited_count += 1
+        self.metrics.concurrency_limit = max(concurrency_limit * self.concurrency_decrease_factor, self.min_concurrency)
+
+
+@define
+class _RateLimiters(SingletonMixin):
+    """Process-wide Rate Limiters, shared by every Driver that sends requests to the same provider and model.
+
+    Drivers look up their Rate Limiter by the name of their class and their model, falling back to the Rate Limiter of
+    their class for any model.
+    """
+
+    _rate_limiters: dict[tuple[str, Optional[str]], RateLimiter] = field(factory=dict, kw_only=True)
+    _lock: threading.Lock = field(factory=threading.Lock, kw_only=True)
+
+    @property
+    def rate_limiters(self) -> dict[tuple[str, Optional[str]], RateLimiter]:
+        return self._rate_limiters
+
+    def set_rate_limiter(self, provider: str, rate_limiter: RateLimiter, *, model: Optional[str] = None) -> RateLimiter:
+        """Sets the Rate Limiter of a provider.
+
+        Args:
+            provider: Name of the Driver class, such as `OpenAiChatPromptDriver`.
+            rate_limiter: Rate Limiter shared by the Drivers of the provider.
+            model: Model that the Rate Limiter applies to. Applies to every model without a Rate Limiter if `None`.
+
+        Returns:
+            The Rate Limiter.
+        """
+        with self._lock:
+            self._rate_limiters = {**self._rate_limiters, (provider, model): rate_limiter}
+
+        return rate_limiter
+
+    def remove_rate_limiter(self, provider: str, *, model: Optional[str] = None) -> None:
+        with self._lock:
+            self._rate_limiters = {
+                key: rate_limiter for key, rate_limiter in self._rate_limiters.items() if key != (provider, model)
+            }
+
+    def get_rate_limiter(self, provider: str, *, model: Optional[str] = None) -> Optional[RateLimiter]:
+        rate_limiters = self._rate_limiters
+
+        if model is not None and (rate_limiter := rate_limiters.get((provider, model))) is not None:
+            return rate_limiter
+        else:
+            return rate_limiters.get((provider, None))
+
+    def clear_rate_limiters(self) -> None:
+        with self._lock:
+            self._rate_limiters = {}
+
+
+RateLimiters = _RateLimiters()
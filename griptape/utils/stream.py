@@ -21,7 +21,8 @@ class Stream:
     """A wrapper for Structures that converts `CompletionChunkEvent`s into an iterator of TextArtifacts.
 
     It achieves this by running the Structure in a separate thread, listening for events from the Structure,
-    and yielding those events.
+    and yielding those events. The Event Listener is scoped to the Structure's id, so concurrent Streams only receive
+    the Events of their own Structure.
 
     See relevant Stack Overflow post: https://stackoverflow.com/questions/9968592/turn-functions-with-a-callback-into-python-generators
 
@@ -51,7 +52,9 @@ class Stream:
         while True:
             event = self._event_queue.get()
             if isinstance(event, FinishStructureRunEvent):
-                break
+                # Structures that this Structure runs finish before it does.
+                if event.structure_id == self.structure.id:
+                    break
             elif isinstance(event, FinishPromptEvent):
                 yield TextArtifact(value="\n")
             elif isinstance(event, CompletionChunkEvent):
@@ -65,9 +68,11 @@ class Stream:
         stream_event_listener = EventListener(
             handler=event_handler,
             event_types=[CompletionChunkEvent, FinishPromptEvent, FinishStructureRunEvent],
+            structure_id=self.structure.id,
         )
         EventBus.add_event_listener(stream_event_listener)
 
-        self.structure.run(*args)
-
-        EventBus.remove_event_listener(stream_event_listener)
+        try:
+            self.structure.run(*args)
+        finally:
+            EventBus.remove_event_listener(stream_event_listener)
@@ -0,0 +1,5 @@
+from .base_vector_index import BaseVectorIndex
+from .ivf_vector_index import IvfVectorIndex
+
+
+__all__ = ["BaseVectorIndex", "IvfVectorIndex"]
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional
+
+from attrs import define
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence, Set
+
+
+@define
+class BaseVectorIndex(ABC):
+    """Approximate nearest neighbour index over vectors keyed by a string.
+
+    Scores are cosine similarities, so indexes are interchangeable with the exact search in the Local Vector Store
+    Driver.
+    """
+
+    @abstractmethod
+    def upsert(self, key: str, vector: Sequence[float], *, namespace: Optional[str] = None) -> None: ...
+
+    @abstractmethod
+    def query(
+        self, vector: Sequence[float], *, count: int, namespace: Optional[str] = None
+    ) -> list[tuple[str, float]]: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def save(self) -> None: ...
+
+    @abstractmethod
+    def keys(self) -> Set[str]: ...
+
+    @abstractmethod
+    def __contains__(self, key: str) -> bool: ...
+
+    @abstractmethod
+    def __len__(self) -> int: ...
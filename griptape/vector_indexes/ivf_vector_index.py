@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+from attrs import Factory, define, field
+
+from griptape.vector_indexes import BaseVectorIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence, Set
+
+
+@define(kw_only=True)
+class IvfVectorIndex(BaseVectorIndex):
+    """Inverted file index that clusters vectors with spherical k-means and only scores the lists closest to a query.
+
+    Queries are exact until `train_size` vectors have been added. After training, new vectors are assigned to their
+    closest list as they are upserted; call `train` again to re-cluster after the data distribution has shifted.
+
+    Attributes:
+        list_count: Number of inverted lists (k-means clusters). More lists make each query scan fewer vectors.
+        probe_count: Number of closest lists scanned per query. Higher values trade latency for recall.
+        train_size: Number of vectors required before the index trains itself.
+        train_sample_size: Maximum number of vectors sampled to fit the k-means centroids.
+        iterations: Number of k-means iterations.
+        seed: Seed used to sample the initial centroids.
+        persist_file: Optional path to a `.npz` file the index is loaded from and written to by `save`.
+    """
+
+    BATCH_SIZE = 65536
+
+    list_count: int = field(default=256)
+    probe_count: int = field(default=16)
+    train_size: int = field(default=Factory(lambda self: self.list_count * 16, takes_self=True))
+    train_sample_size: int = field(default=Factory(lambda self: self.list_count * 256, takes_self=True))
+    iterations: int = field(default=10)
+    seed: int = field(default=0)
+    persist_file: Optional[str] = field(default=None)
+    thread_lock: threading.RLock = field(default=Factory(lambda: threading.RLock()))
+    _vectors: Optional[np.ndarray] = field(default=None, init=False, eq=False)
+    _alive: np.ndarray = field(factory=lambda: np.empty(0, dtype=bool), init=False, eq=False)
+    _namespace_codes: np.ndarray = field(factory=lambda: np.empty(0, dtype=np.int32), init=False, eq=False)
+    _keys: list[str] = field(factory=list, init=False, eq=False)
+    _rows: dict[str, int] = field(factory=dict, init=False, eq=False)
+    _namespaces: dict[Optional[str], int] = field(factory=dict, init=False, eq=False)
+    _centroids: Optional[np.ndarray] = field(default=None, init=False, eq=False)
+    _lists: list[list[int]] = field(factory=list, init=False, eq=False)
+    _list_arrays: list[Optional[np.ndarray]] = field(factory=list, init=False, eq=False)
+
+    def __attrs_post_init__(self) -> None:
+        if self.persist_file is not None and os.path.isfile(self.persist_file):
+            self.load()
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def upsert(self, key: str, vector: Sequence[float], *, namespace: Optional[str] = None) -> None:
+        normalized = self.__normalize(np.asarray(vector, dtype=np.float32))
+
+        with self.thread_lock:
+            if self._vectors is None:
+                self._vectors = np.empty((0, normalized.shape[0]), dtype=np.float32)
+            elif normalized.shape[0] != self._vectors.shape[1]:
+                raise ValueError(
+                    f"Vector has {normalized.shape[0]} dimensions but the index stores {self._vectors.shape[1]}."
+                )
+
+            previous_row = self._rows.get(key)
+
+            if previous_row is not None:
+                self._alive[previous_row] = False
+
+            row = len(self._keys)
+
+            if row == len(self._vectors):
+                self.__grow(max(row * 2, 1))
+
+            self._vectors[row] = normalized
+            self._alive[row] = True
+            self._namespace_codes[row] = self._namespaces.setdefault(namespace, len(self._namespaces))
+            self._keys.append(key)
+            self._rows[key] = row
+
+            if self._centroids is not None:
+                self.__add_to_list(int(np.argmax(self._centroids @ normalized)), row)
+            elif len(self._rows) >= self.train_size:
+                self.train()
+
+    def query(self, vector: Sequence[float], *, count: int, namespace: Optional[str] = None) -> list[tuple[str, float]]:
+        normalized = self.__normalize(np.asarray(vector, dtype=np.float32))
+
+        with self.thread_lock:
+            if self._vectors is None or count <= 0:
+                return []
+
+            size = len(self._keys)
+
+            if self._centroids is None:
+                candidates = np.arange(size)
+            else:
+                probe_count = min(self.probe_count, len(self._centroids))
+                probes = np.argpartition(-(self._centroids @ normalized), probe_count - 1)[:probe_count]
+                candidates = np.concatenate([self.__list_array(int(probe)) for probe in probes])
+
+            mask = self._alive[candidates]
+
+            if namespace is not None:
+                code = self._namespaces.get(namespace)
+
+                if code is None:
+                    return []
+
+                mask &= self._namespace_codes[candidates] == code
+
+            candidates = candidates[mask]
+            scores = self._vectors[candidates] @ normalized
+            keys = self._keys
+
+        top_count = min(count, len(candidates))
+
+        if top_count == 0:
+            return []
+        elif top_count < len(candidates):
+            top = np.argpartition(-scores, top_count - 1)[:top_count]
+        else:
+            top = np.arange(len(candidates))
+
+        top = top[np.lexsort((candidates[top], -scores[top]))]
+
+        return [(keys[candidates[i]], float(scores[i])) for i in top]
+
+    def delete(self, key: str) -> None:
+        """Removes a vector from the index. Its row is kept but skipped by queries and training."""
+        with self.thread_lock:
+            row = self._rows.pop(key, None)
+
+            if row is not None:
+                self._alive[row] = False
+
+    def train(self) -> None:
+        """Fits the list centroids with spherical k-means and reassigns every vector to its closest list."""
+        with self.thread_lock:
+            if self._vectors is None:
+                return
+
+            rows = np.flatnonzero(self._alive[: len(self._keys)])
+
+            if len(rows) == 0:
+                return
+
+            rng = np.random.default_rng(self.seed)
+            sample = self._vectors[rng.choice(rows, size=min(len(rows), self.train_sample_size), replace=False)]
+            list_count = min(self.list_count, len(sample))
+            centroids = sample[rng.choice(len(sample), size=list_count, replace=False)].copy()
+
+            for _ in range(self.iterations):
+                assignments = self.__assign(sample, centroids)
+                sums = np.zeros_like(centroids)
+                np.add.at(sums, assignments, sample)
+                counts = np.bincount(assignments, minlength=list_count)
+                empty = counts == 0
+
+                # Reseed empty lists with random sample vectors so that every list stays in use.
+                sums[empty] = sample[rng.choice(len(sample), size=int(empty.sum()))]
+                centroids = self.__normalize(sums)
+
+            self._centroids = centroids
+            self._lists = [[] for _ in range(list_count)]
+            self._list_arrays = [None] * list_count
+
+            for start in range(0, len(rows), self.BATCH_SIZE):
+                batch = rows[start : start + self.BATCH_SIZE]
+
+                for row, assignment in zip(batch.tolist(), self.__assign(self._vectors[batch], centroids).tolist()):
+                    self._lists[assignment].append(row)
+
+    def save(self) -> None:
+        if self.persist_file is None:
+            raise ValueError("persist_file must be set to save the index.")
+
+        with self.thread_lock:
+            size = len(self._keys)
+            tmp_file = f"{self.persist_file}.tmp.npz"
+            namespaces = sorted(self._namespaces.items(), key=lambda item: item[1])
+
+            np.savez(
+                tmp_file,
+                vectors=np.empty((0, 0), dtype=np.float32) if self._vectors is None else self._vectors[:size],
+                alive=self._alive[:size],
+                namespace_codes=self._namespace_codes[:size],
+                keys=np.array(self._keys, dtype=str),
+                namespaces=np.array(["" if n is None else n for n, _ in namespaces], dtype=str),
+                namespace_is_none=np.array([n is None for n, _ in namespaces], dtype=bool),
+                centroids=np.empty((0, 0), dtype=np.float32) if self._centroids is None else self._centroids,
+                list_assignments=self.__list_assignments(size),
+            )
+            os.replace(tmp_file, self.persist_file)
+
+    def load(self) -> None:
+        if self.persist_file is None:
+            raise ValueError("persist_file must be set to load the index.")
+
+        with self.thread_lock, np.load(self.persist_file) as data:
+            keys = data["keys"].tolist()
+
+            self._keys = keys
+            self._rows = {key: row for row, (key, alive) in enumerate(zip(keys, data["alive"].tolist())) if alive}
+            self._vectors = data["vectors"] if keys else None
+            self._alive = data["alive"]
+            self._namespace_codes = data["namespace_codes"]
+            self._namespaces = {
+                None if is_none else namespace: code
+                for code, (namespace, is_none) in enumerate(
+                    zip(data["namespaces"].tolist(), data["namespace_is_none"].tolist())
+                )
+            }
+
+            centroids = data["centroids"]
+
+            if centroids.size:
+                self._centroids = centroids
+                self._lists = [[] for _ in range(len(centroids))]
+                self._list_arrays = [None] * len(centroids)
+
+                for row, assignment in enumerate(data["list_assignments"].tolist()):
+                    if assignment >= 0:
+                        self._lists[assignment].append(row)
+            else:
+                self._centroids = None
+                self._lists = []
+                self._list_arrays = []
+
+    def keys(self) -> Set[str]:
+        return self._rows.keys()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __assign(self, vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        return np.concatenate(
+            [
+                np.argmax(vectors[start : start + self.BATCH_SIZE] @ centroids.T, axis=1)
+                for start in range(0, len(vectors), self.BATCH_SIZE)
+            ]
+        )
+
+    def __add_to_list(self, list_index: int, row: int) -> None:
+        self._lists[list_index].append(row)
+        self._list_arrays[list_index] = None
+
+    def __list_array(self, list_index: int) -> np.ndarray:
+        array = self._list_arrays[list_index]
+
+        if array is None:
+            array = np.array(self._lists[list_index], dtype=np.intp)
+            self._list_arrays[list_index] = array
+
+        return array
+
+    def __list_assignments(self, size: int) -> np.ndarray:
+        assignments = np.full(size, -1, dtype=np.int32)
+
+        for list_index, rows in enumerate(self._lists):
+            assignments[rows] = list_index
+
+        return assignments
+
+    def __grow(self, capacity: int) -> None:
+        vectors = np.empty((capacity, self._vectors.shape[1]), dtype=np.float32)  # pyright: ignore[reportOptionalMemberAccess]
+        vectors[: len(self._vectors)] = self._vectors  # pyright: ignore[reportArgumentType]
+        self._vectors = vectors
+        self._alive = np.resize(self._alive, capacity)
+        self._namespace_codes = np.resize(self._namespace_codes, capacity)
+
+    def __normalize(self, vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+
+        return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
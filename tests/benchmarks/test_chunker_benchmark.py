@@ -0,0 +1,69 @@
+import random
+import time
+
+import pytest
+from attrs import define, field
+
+from griptape.chunkers import MarkdownChunker, PdfChunker, TextChunker
+from griptape.tokenizers import BaseTokenizer
+
+
+@define
+class CountingTokenizer(BaseTokenizer):
+    tokenizer: BaseTokenizer = field(kw_only=True)
+    characters: int = field(default=0, kw_only=True)
+
+    def count_tokens(self, text: str) -> int:
+        self.characters += len(text)
+
+        return self.tokenizer.count_tokens(text)
+
+
+class TestChunkerBenchmark:
+    PAGE_COUNT = 300
+    WORDS = ["griptape", "structure", "driver", "memory", "token", "vector", "prompt", "engine", "chunk", "artifact"]
+
+    @pytest.fixture(scope="class")
+    def tokenizer(self):
+        pytest.importorskip("anthropic")
+
+        from griptape.tokenizers import AnthropicTokenizer
+
+        return AnthropicTokenizer(model="claude-3-5-sonnet-20240620")
+
+    @pytest.fixture(scope="class")
+    def document(self):
+        rng = random.Random(0)
+        pages = []
+
+        for page in range(self.PAGE_COUNT):
+            paragraphs = [f"## Page {page}"]
+
+            for _ in range(rng.randint(4, 8)):
+                sentences = [
+                    " ".join(rng.choice(self.WORDS) for _ in range(rng.randint(5, 25))).capitalize()
+                    for _ in range(rng.randint(3, 10))
+                ]
+                paragraphs.append(". ".join(sentences) + ".")
+
+            pages.append("\n\n".join(paragraphs))
+
+        return "\n\n".join(pages)
+
+    @pytest.mark.parametrize("chunker_class", [TextChunker, MarkdownChunker, PdfChunker])
+    @pytest.mark.parametrize("max_tokens", [200, 2000])
+    def test_chunk(self, tokenizer, document, chunker_class, max_tokens):
+        counting_tokenizer = CountingTokenizer(model=tokenizer.model, tokenizer=tokenizer)
+        chunker = chunker_class(tokenizer=counting_tokenizer, max_tokens=max_tokens)
+
+        start = time.perf_counter()
+        chunks = chunker.chunk(document)
+        elapsed = time.perf_counter() - start
+
+        print(  # noqa: T201
+            f"{chunker_class.__name__} max_tokens={max_tokens}: {len(chunks)} chunks in {elapsed * 1000:.0f}ms, "
+            f"tokenized {counting_tokenizer.characters / len(document):.1f}x the document"
+        )
+
+        assert all(tokenizer.count_tokens(chunk.value) <= max_tokens for chunk in chunks)
+        assert counting_tokenizer.characters <= len(document) * 6
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+
+def import_times(statement: str) -> tuple[dict[str, int], int]:
+    """Runs `statement` in a new interpreter with `-X importtime`.
+
+    Returns:
+        The cumulative import time of every imported module, and the total import time, in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    times = {}
+    total = 0
+
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line.split("|")
+
+            if cumulative.strip().isdigit():
+                times[module.strip()] = int(cumulative)
+
+                # Top-level imports are indented by a single space.
+                if len(module) - len(module.lstrip()) == 1:
+                    total += int(cumulative)
+
+    return times, total
+
+
+class TestImportBenchmark:
+    # Total import time allowed for each statement, in microseconds.
+    IMPORT_TIME_BUDGET = 1_500_000
+    # Third-party libraries that should only be imported when a Driver, Tool, or Loader that needs them is used.
+    DEFERRED_MODULES = ["openai", "tiktoken", "numpy", "boto3", "anthropic", "cohere", "google.generativeai"]
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import griptape.drivers",
+            "import griptape.tools",
+            "import griptape.loaders",
+            "import griptape.tasks",
+            "import griptape.engines",
+            "from griptape.structures import Agent",
+        ],
+    )
+    def test_import(self, statement):
+        times, total = import_times(statement)
+
+        print(f"{statement}: {total / 1000:.0f}ms")  # noqa: T201
+
+        assert not [module for module in self.DEFERRED_MODULES if module in times]
+        assert total < self.IMPORT_TIME_BUDGET
+
+    def test_lazy_import(self):
+        times, _ = import_times("from griptape.drivers import OpenAiChatPromptDriver")
+
+        assert "openai" in times
+        assert "griptape.drivers.prompt.anthropic_prompt_driver" not in times
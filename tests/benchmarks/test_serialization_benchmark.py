@@ -0,0 +1,78 @@
+import json
+import time
+
+import pytest
+
+from griptape.artifacts import BaseArtifact, ImageArtifact, ListArtifact, TextArtifact
+from griptape.common import PromptStack, Reference
+from griptape.memory.structure import Run
+from griptape.schemas import BaseSchema
+
+
+def build_prompt_stack() -> PromptStack:
+    prompt_stack = PromptStack()
+    prompt_stack.add_system_message("You are a helpful assistant.")
+
+    for i in range(10):
+        prompt_stack.add_user_message(f"question {i}")
+        prompt_stack.add_assistant_message(f"answer {i}")
+
+    return prompt_stack
+
+
+class TestSerializationBenchmark:
+    ITERATIONS = 2000
+
+    @pytest.fixture(
+        params=[
+            lambda: TextArtifact("foo bar " * 100, meta={"source": "benchmark"}, reference=Reference(title="title")),
+            lambda: ImageArtifact(b"\x00" * 1024, width=32, height=32, format="png"),
+            lambda: ListArtifact([TextArtifact(f"chunk {i}") for i in range(10)]),
+            lambda: Run(input=TextArtifact("question"), output=TextArtifact("answer")),
+            build_prompt_stack,
+        ],
+        ids=["TextArtifact", "ImageArtifact", "ListArtifact", "Run", "PromptStack"],
+    )
+    def obj(self, request):
+        return request.param()
+
+    def test_to_json(self, obj):
+        schema = BaseSchema.from_attrs_cls(obj.__class__)()
+        baseline = self.__time(lambda: schema.dump(obj))
+        elapsed = self.__time(obj.to_json)
+
+        print(  # noqa: T201
+            f"{obj.__class__.__name__}.to_json: {elapsed * 1e6:.1f}us, marshmallow dump: {baseline * 1e6:.1f}us"
+        )
+
+        assert elapsed < baseline
+
+    def test_from_json(self, obj):
+        data = obj.to_json()
+        schema = BaseSchema.from_attrs_cls(obj.__class__)()
+        baseline = self.__time(lambda: schema.load(obj.to_dict()))
+        elapsed = self.__time(lambda: obj.__class__.from_json(data))
+
+        print(  # noqa: T201
+            f"{obj.__class__.__name__}.from_json: {elapsed * 1e6:.1f}us, marshmallow load: {baseline * 1e6:.1f}us"
+        )
+
+        assert elapsed < baseline
+
+    def test_polymorphic_from_json(self):
+        data = TextArtifact("foo").to_json()
+        baseline = self.__time(lambda: BaseArtifact.get_schema("TextArtifact").load(json.loads(data)))
+        elapsed = self.__time(lambda: BaseArtifact.from_json(data))
+
+        print(f"BaseArtifact.from_json: {elapsed * 1e6:.1f}us, marshmallow load: {baseline * 1e6:.1f}us")  # noqa: T201
+
+        assert elapsed < baseline
+
+    def __time(self, func) -> float:
+        func()
+        start = time.perf_counter()
+
+        for _ in range(self.ITERATIONS):
+            func()
+
+        return (time.perf_counter() - start) / self.ITERATIONS
@@ -0,0 +1,73 @@
+import time
+
+import numpy as np
+import pytest
+
+from griptape.drivers import LocalVectorStoreDriver
+from griptape.vector_indexes import IvfVectorIndex
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+class TestVectorIndexBenchmark:
+    VECTOR_COUNT = 50000
+    DIMENSIONS = 256
+    QUERY_COUNT = 100
+    K = 10
+
+    @pytest.fixture(scope="class")
+    def vectors(self):
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(500, self.DIMENSIONS))
+
+        return (
+            centers[rng.integers(0, len(centers), self.VECTOR_COUNT)]
+            + 0.5 * rng.normal(size=(self.VECTOR_COUNT, self.DIMENSIONS))
+        ).astype(np.float32)
+
+    @pytest.fixture(scope="class")
+    def queries(self, vectors):
+        rng = np.random.default_rng(1)
+
+        return vectors[rng.integers(0, len(vectors), self.QUERY_COUNT)] + 0.1 * rng.normal(
+            size=(self.QUERY_COUNT, self.DIMENSIONS)
+        ).astype(np.float32)
+
+    @pytest.fixture(scope="class")
+    def exact_results(self, vectors, queries):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver())
+
+        for i, vector in enumerate(vectors):
+            driver.upsert_vector(vector.tolist(), vector_id=str(i))
+
+        results = []
+        start = time.perf_counter()
+
+        for query in queries:
+            driver.embedding_driver.mock_output = lambda _, query=query: query.tolist()
+            results.append({entry.id for entry in driver.query("query", count=self.K)})
+
+        print(f"exact: {(time.perf_counter() - start) / len(queries) * 1000:.2f}ms/query")  # noqa: T201
+
+        return results
+
+    @pytest.mark.parametrize("probe_count", [4, 16, 32])
+    def test_recall_at_k(self, vectors, queries, exact_results, probe_count):
+        index = IvfVectorIndex(list_count=256, probe_count=probe_count)
+
+        for i, vector in enumerate(vectors):
+            index.upsert(str(i), vector)
+
+        recall = 0
+        start = time.perf_counter()
+
+        for query, exact in zip(queries, exact_results):
+            recall += len({key for key, _ in index.query(query, count=self.K)} & exact) / self.K
+
+        recall /= len(queries)
+
+        print(  # noqa: T201
+            f"ivf probe_count={probe_count}: recall@{self.K}={recall:.3f}, "
+            f"{(time.perf_counter() - start) / len(queries) * 1000:.2f}ms/query"
+        )
+
+        assert recall >= 0.8
@@ -0,0 +1,68 @@
+import functools
+import http.server
+import threading
+import time
+
+import pytest
+
+from griptape.drivers import MarkdownifyWebScraperDriver
+
+
+class TestWebScraperBenchmark:
+    PAGE_COUNT = 40
+
+    @pytest.fixture(scope="class")
+    def _chromium(self):
+        sync_api = pytest.importorskip("playwright.sync_api")
+
+        try:
+            with sync_api.sync_playwright() as playwright:
+                playwright.chromium.launch(headless=True).close()
+        except Exception as e:
+            pytest.skip(f"Chromium can't be launched: {e}")
+
+    @pytest.fixture(scope="class")
+    def urls(self, tmp_path_factory):
+        directory = tmp_path_factory.mktemp("pages")
+
+        for page in range(self.PAGE_COUNT):
+            paragraphs = "".join(f"<p>Paragraph {i} of page {page}.</p>" for i in range(50))
+            links = "".join(f'<a href="{i}.html">Page {i}</a>' for i in range(self.PAGE_COUNT))
+            (directory / f"{page}.html").write_text(
+                f"<html><head><title>Page {page}</title></head><body><h1>Page {page}</h1>{paragraphs}{links}</body></html>"
+            )
+
+        handler = functools.partial(http.server.SimpleHTTPRequestHandler, directory=str(directory))
+        handler.log_message = lambda *args: None  # pyright: ignore[reportAttributeAccessIssue]
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        yield [f"http://127.0.0.1:{server.server_address[1]}/{page}.html" for page in range(self.PAGE_COUNT)]
+
+        server.shutdown()
+
+    @pytest.mark.usefixtures("_chromium")
+    def test_scrape_urls(self, urls):
+        # Launching a browser for every URL, as the Driver did before it pooled browsers.
+        start = time.perf_counter()
+        for url in urls:
+            web_scraper = MarkdownifyWebScraperDriver()
+            web_scraper.scrape_url(url)
+            web_scraper.close()
+        per_call_elapsed = time.perf_counter() - start
+
+        web_scraper = MarkdownifyWebScraperDriver()
+        start = time.perf_counter()
+        artifacts = web_scraper.scrape_urls(urls)
+        pooled_elapsed = time.perf_counter() - start
+        web_scraper.close()
+
+        print(  # noqa: T201
+            f"{len(urls)} pages: {per_call_elapsed * 1000:.0f}ms launching a browser per URL, "
+            f"{pooled_elapsed * 1000:.0f}ms with a pooled browser"
+        )
+
+        assert [artifact.value.splitlines()[0] for artifact in artifacts] == [
+            f"Page {page}" for page in range(self.PAGE_COUNT)
+        ]
+        assert pooled_elapsed < per_call_elapsed
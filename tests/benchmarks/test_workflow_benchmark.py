@@ -0,0 +1,47 @@
+import logging
+import time
+
+import pytest
+
+from griptape.artifacts import TextArtifact
+from griptape.configs import Defaults
+from griptape.configs.drivers import DriversConfig
+from griptape.structures import Workflow
+from griptape.tasks import CodeExecutionTask
+
+
+class TestWorkflowBenchmark:
+    # Maximum time to run a Workflow of no-op Tasks, in seconds.
+    RUN_TIME_BUDGET = 10
+
+    @pytest.fixture(autouse=True)
+    def _defaults(self):
+        drivers_config = Defaults.drivers_config
+        logger = logging.getLogger(Defaults.logging_config.logger_name)
+        level = logger.level
+        Defaults.drivers_config = DriversConfig()
+        logger.setLevel(logging.WARNING)
+
+        yield
+
+        Defaults.drivers_config = drivers_config
+        logger.setLevel(level)
+
+    @pytest.mark.parametrize("task_count", [1000, 3000])
+    def test_run_fan_out(self, task_count):
+        def run_fn(task: CodeExecutionTask) -> TextArtifact:
+            return TextArtifact(task.id)
+
+        root_task = CodeExecutionTask(run_fn=run_fn, id="root")
+        leaf_tasks = [CodeExecutionTask(run_fn=run_fn, parent_ids=["root"]) for _ in range(task_count)]
+        end_task = CodeExecutionTask(run_fn=run_fn, parent_ids=[task.id for task in leaf_tasks])
+        workflow = Workflow(tasks=[root_task, *leaf_tasks, end_task], conversation_memory=None)
+
+        start = time.perf_counter()
+        workflow.run()
+        elapsed = time.perf_counter() - start
+
+        print(f"{task_count} fan-out Tasks: {elapsed * 1000:.0f}ms")  # noqa: T201
+
+        assert workflow.is_finished()
+        assert elapsed < self.RUN_TIME_BUDGET
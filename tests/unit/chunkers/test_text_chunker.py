@@ -1,7 +1,10 @@
+from unittest.mock import patch
+
 import pytest
 
 from griptape.artifacts import TextArtifact
 from griptape.chunkers import TextChunker
+from tests.mocks.mock_tokenizer import MockTokenizer
 from tests.unit.chunkers.utils import gen_paragraph
 
 MAX_TOKENS = 50
@@ -111,3 +114,18 @@ class TestTextChunker:
     def test_chunk_with_max_tokens(self, chunker):
         with pytest.raises(ValueError):
             TextChunker(max_tokens=-1)
+
+    def test_tokenizes_each_level_once(self):
+        tokenizer = MockTokenizer(model="foo")
+        chunker = TextChunker(tokenizer=tokenizer, max_tokens=MAX_TOKENS)
+        text = "\n\n".join(gen_paragraph(MAX_TOKENS * 10, tokenizer, ". ") for _ in range(50))
+
+        with patch.object(
+            MockTokenizer, "count_tokens", autospec=True, side_effect=lambda _, text: len(text)
+        ) as count_tokens:
+            chunks = chunker.chunk(text)
+
+        assert all(len(chunk.value) <= MAX_TOKENS for chunk in chunks)
+        assert " ".join(chunk.value for chunk in chunks).split() == text.split()
+        # The document, its paragraphs, and its sentences are each tokenized about once, plus the emitted chunks.
+        assert sum(len(call.args[1]) for call in count_tokens.call_args_list) <= len(text) * 6
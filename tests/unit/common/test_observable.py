@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import call
 
 import pytest
@@ -239,3 +240,49 @@ class TestObservable:
                 ),
             ]
         )
+
+    def test_observable_method_bound_instance(self, observe_spy):
+        from griptape.common import observable
+
+        class Foo:
+            @observable
+            def bar(self):
+                return self
+
+        foo = Foo()
+        other_foo = Foo()
+        bar = foo.bar
+        other_bar = other_foo.bar
+
+        assert bar() is foo
+        assert other_bar() is other_foo
+        assert Foo.bar(foo) is foo
+
+        original_bar = bar.__wrapped__
+
+        observe_spy.assert_has_calls(
+            [
+                call(Observable.Call(func=original_bar, instance=foo)),
+                call(Observable.Call(func=original_bar, instance=other_foo)),
+                call(Observable.Call(func=original_bar, args=(foo,))),
+            ]
+        )
+
+    def test_observable_coroutine_function(self, observe_spy, mocker):
+        from griptape.common import observable
+
+        aobserve_spy = mocker.spy(observability.Observability, "aobserve")
+
+        class Foo:
+            @observable
+            async def bar(self, word: str):
+                return word
+
+        foo = Foo()
+
+        assert asyncio.run(foo.bar("a")) == "a"
+
+        original_bar = foo.bar.__wrapped__
+
+        aobserve_spy.assert_called_once_with(Observable.Call(func=original_bar, instance=foo, args=("a",)))
+        observe_spy.assert_not_called()
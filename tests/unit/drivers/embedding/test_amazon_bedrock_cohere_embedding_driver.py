@@ -8,7 +8,7 @@ from griptape.drivers import AmazonBedrockCohereEmbeddingDriver
 class TestAmazonBedrockCohereEmbeddingDriver:
     @pytest.fixture(autouse=True)
     def _mock_session(self, mocker):
-        fake_embeddings = '{"embeddings": [[0, 1, 0]] }'
+        fake_embeddings = '{"embeddings": [[0, 1, 0], [1, 0, 0]] }'
 
         mock_session_class = mocker.patch("boto3.Session")
 
@@ -26,3 +26,6 @@ class TestAmazonBedrockCohereEmbeddingDriver:
 
     def test_try_embed_chunk(self):
         assert AmazonBedrockCohereEmbeddingDriver().try_embed_chunk("foobar") == [0, 1, 0]
+
+    def test_try_embed_chunks(self):
+        assert AmazonBedrockCohereEmbeddingDriver().try_embed_chunks(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
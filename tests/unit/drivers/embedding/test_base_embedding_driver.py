@@ -41,3 +41,43 @@ class TestBaseEmbeddingDriver:
             driver.embed_string("foobar")
 
         assert e.value.args[0] == "nope"
+
+    def test_embed_strings(self, driver):
+        driver.batch_size = 2
+
+        with patch.object(driver, "try_embed_chunks", side_effect=lambda chunks: [[len(c), 1] for c in chunks]) as mock:
+            embeddings = driver.embed_strings(["foo", "foobar", "fo", "f", "foobarbaz"])
+
+        assert embeddings == [[3, 1], [6, 1], [2, 1], [1, 1], [9, 1]]
+        assert [call.args[0] for call in mock.call_args_list] == [["foo", "foobar"], ["fo", "f"], ["foobarbaz"]]
+
+    def test_embed_strings_max_batch_tokens(self, driver):
+        driver.batch_size = 10
+        driver.max_batch_tokens = 8
+
+        with patch.object(driver, "try_embed_chunks", side_effect=lambda chunks: [[0, 1] for _ in chunks]) as mock:
+            driver.embed_strings(["foo", "foobar", "fo", "f", "foobarbaz"])
+
+        assert [call.args[0] for call in mock.call_args_list] == [["foo"], ["foobar", "fo"], ["f"], ["foobarbaz"]]
+
+    def test_embed_strings_long_string(self, driver):
+        driver.batch_size = 10
+
+        with patch.object(driver, "try_embed_chunks", side_effect=lambda chunks: [[0, 1] for _ in chunks]) as mock:
+            embeddings = driver.embed_strings(["foo", "foobar " * 1000, "bar"])
+
+        assert embeddings == [[0, 1], [0, 1], [0, 1]]
+        assert len(mock.call_args_list) == 2
+        assert mock.call_args_list[1].args[0] == ["foo", "bar"]
+
+    def test_embed_strings_empty(self, driver):
+        assert driver.embed_strings([]) == []
+
+    @patch.object(MockEmbeddingDriver, "try_embed_chunk")
+    def test_embed_strings_throws_when_retries_exhausted(self, try_embed_chunk, driver):
+        try_embed_chunk.side_effect = Exception("nope")
+
+        with pytest.raises(Exception) as e:
+            driver.embed_strings(["foobar"])
+
+        assert e.value.args[0] == "nope"
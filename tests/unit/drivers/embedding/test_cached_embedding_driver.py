@@ -0,0 +1,83 @@
+import os
+import tempfile
+from unittest.mock import Mock
+
+import pytest
+
+from griptape.drivers import CachedEmbeddingDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+class TestCachedEmbeddingDriver:
+    @pytest.fixture()
+    def embedding_driver(self):
+        return MockEmbeddingDriver(mock_output=Mock(side_effect=lambda chunk: [len(chunk), 1.5]))
+
+    @pytest.fixture()
+    def driver(self, embedding_driver):
+        return CachedEmbeddingDriver(embedding_driver=embedding_driver)
+
+    @pytest.fixture()
+    def persist_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield os.path.join(temp_dir, "embeddings.db")
+
+    def test_init(self, driver):
+        assert driver.model == "foo"
+
+    def test_embed_string(self, driver, embedding_driver):
+        assert driver.embed_string("foo") == [3, 1.5]
+        assert driver.embed_string("foo") == [3, 1.5]
+        assert embedding_driver.mock_output.call_count == 1
+        assert driver.hits == 1
+        assert driver.misses == 1
+
+    def test_embed_strings(self, driver, embedding_driver):
+        driver.embed_string("foo")
+
+        assert driver.embed_strings(["foo", "foobar", "foobar", "fo"]) == [[3, 1.5], [6, 1.5], [6, 1.5], [2, 1.5]]
+        assert [call.args[0] for call in embedding_driver.mock_output.call_args_list] == ["foo", "foobar", "fo"]
+        assert driver.memory_hits == 1
+        assert driver.misses == 3
+
+    def test_cache_key_includes_model(self, embedding_driver):
+        CachedEmbeddingDriver(embedding_driver=embedding_driver, model="foo").embed_string("foo")
+        CachedEmbeddingDriver(embedding_driver=embedding_driver, model="bar").embed_string("foo")
+
+        assert embedding_driver.mock_output.call_count == 2
+
+    def test_max_cache_size(self, embedding_driver):
+        driver = CachedEmbeddingDriver(embedding_driver=embedding_driver, max_cache_size=1)
+
+        driver.embed_strings(["foo", "bar", "foo"])
+        driver.embed_string("bar")
+        driver.embed_string("foo")
+
+        assert embedding_driver.mock_output.call_count == 3
+
+    def test_persist_file(self, embedding_driver, persist_file):
+        CachedEmbeddingDriver(embedding_driver=embedding_driver, persist_file=persist_file).embed_strings(
+            ["foo", "foobar"]
+        )
+        driver = CachedEmbeddingDriver(embedding_driver=embedding_driver, persist_file=persist_file)
+
+        assert driver.embed_strings(["foo", "foobar", "fo"]) == [[3, 1.5], [6, 1.5], [2, 1.5]]
+        assert driver.embed_string("foo") == [3, 1.5]
+        assert embedding_driver.mock_output.call_count == 3
+        assert driver.disk_hits == 2
+        assert driver.memory_hits == 1
+        assert driver.misses == 1
+
+    def test_clear_cache(self, embedding_driver, persist_file):
+        driver = CachedEmbeddingDriver(embedding_driver=embedding_driver, persist_file=persist_file)
+
+        driver.embed_string("foo")
+        driver.clear_cache()
+        driver.embed_string("foo")
+
+        assert embedding_driver.mock_output.call_count == 2
+        assert driver.misses == 1
+
+    def test_try_embed_chunk(self, driver, embedding_driver):
+        assert driver.try_embed_chunk("foo") == [3, 1.5]
+        assert driver.try_embed_chunks(["foo", "fo"]) == [[3, 1.5], [2, 1.5]]
@@ -9,6 +9,7 @@ class TestOllamaEmbeddingDriver:
         mock_client = mocker.patch("ollama.Client")
 
         mock_client.return_value.embeddings.return_value = {"embedding": [0, 1, 0]}
+        mock_client.return_value.embed.return_value = {"embeddings": [[0, 1, 0], [1, 0, 0]]}
 
         return mock_client
 
@@ -17,3 +18,7 @@ class TestOllamaEmbeddingDriver:
 
     def test_try_embed_chunk(self):
         assert OllamaEmbeddingDriver(model="foo").try_embed_chunk("foobar") == [0, 1, 0]
+
+    def test_try_embed_chunks(self, mock_client):
+        assert OllamaEmbeddingDriver(model="foo").try_embed_chunks(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
+        assert mock_client.return_value.embed.call_args.kwargs["input"] == ["foo", "bar"]
@@ -4,6 +4,7 @@ import pytest
 
 from griptape.drivers import OpenAiEmbeddingDriver
 from griptape.tokenizers import OpenAiTokenizer
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 
 class TestOpenAiEmbeddingDriver:
@@ -13,6 +14,7 @@ class TestOpenAiEmbeddingDriver:
 
         mock_embedding = Mock()
         mock_embedding.embedding = [0, 1, 0]
+        mock_embedding.index = 0
         mock_response = Mock()
         mock_response.data = [mock_embedding]
 
@@ -30,3 +32,18 @@ class TestOpenAiEmbeddingDriver:
     def test_try_embed_chunk_replaces_newlines_in_older_ada_models(self, model, mock_openai):
         OpenAiEmbeddingDriver(model=model).try_embed_chunk("foo\nbar")
         assert mock_openai.call_args.kwargs["input"] == "foo bar" if model.endswith("001") else "foo\nbar"
+
+    def test_try_embed_chunks(self, mock_openai):
+        mock_openai.return_value.data = [Mock(embedding=[1, 0, 0], index=1), Mock(embedding=[0, 1, 0], index=0)]
+
+        assert OpenAiEmbeddingDriver().try_embed_chunks(["foo", "bar"]) == [[0, 1, 0], [1, 0, 0]]
+        assert mock_openai.call_args.kwargs["input"] == ["foo", "bar"]
+
+    def test_embed_strings(self, mock_openai):
+        mock_openai.side_effect = lambda **kwargs: Mock(
+            data=[Mock(embedding=[i, 0, 0], index=i) for i in range(len(kwargs["input"]))]
+        )
+        driver = OpenAiEmbeddingDriver(batch_size=2, tokenizer=MockTokenizer(model="foo"))
+
+        assert driver.embed_strings(["foo", "bar", "baz"]) == [[0, 0, 0], [1, 0, 0], [0, 0, 0]]
+        assert mock_openai.call_count == 2
@@ -1,3 +1,5 @@
+from unittest.mock import Mock
+
 import boto3
 import pytest
 from moto import mock_sqs
@@ -33,3 +35,49 @@ class TestAmazonSqsEventListenerDriver:
 
     def test_try_publish_event_payload_batch(self, driver):
         driver.try_publish_event_payload_batch([MockEvent().to_dict() for _ in range(3)])
+
+    def test_try_publish_event_payload_batch_chunks(self, driver):
+        driver.try_publish_event_payload_batch([MockEvent().to_dict() for _ in range(25)])
+
+        messages = driver.sqs_client.receive_message(QueueUrl=driver.queue_url, MaxNumberOfMessages=10)["Messages"]
+        attributes = driver.sqs_client.get_queue_attributes(
+            QueueUrl=driver.queue_url, AttributeNames=["ApproximateNumberOfMessages"]
+        )["Attributes"]
+
+        assert len(messages) + int(attributes["ApproximateNumberOfMessages"]) == 25
+
+    def test_try_publish_event_payload_batch_failed(self, driver):
+        driver.sqs_client = Mock()
+        driver.sqs_client.send_message_batch.return_value = {"Failed": [{"Id": "foo", "SenderFault": False}]}
+
+        with pytest.raises(RuntimeError, match="Failed to send 1 messages to SQS"):
+            driver.try_publish_event_payload_batch([MockEvent().to_dict()])
+
+    def test_publish_batch_retries_failed_entries(self, driver):
+        event_payloads = [MockEvent().to_dict() for _ in range(3)]
+        driver.min_retry_delay = 0
+        driver.max_retry_delay = 0
+        driver.sqs_client = Mock()
+        driver.sqs_client.send_message_batch.side_effect = [
+            {"Failed": [{"Id": event_payloads[1]["id"], "SenderFault": False}]},
+            {},
+        ]
+
+        driver._publish_with_retries(driver.try_publish_event_payload_batch, list(event_payloads))
+
+        retried_entries = driver.sqs_client.send_message_batch.call_args_list[1].kwargs["Entries"]
+        assert [entry["Id"] for entry in retried_entries] == [event_payloads[1]["id"]]
+
+    def test_publish_batch_retries_unsent_chunks(self, driver):
+        event_payloads = [MockEvent().to_dict() for _ in range(12)]
+        driver.min_retry_delay = 0
+        driver.max_retry_delay = 0
+        driver.sqs_client = Mock()
+        driver.sqs_client.send_message_batch.side_effect = [{}, Exception("error"), {}]
+
+        driver._publish_with_retries(driver.try_publish_event_payload_batch, list(event_payloads))
+
+        retried_entries = driver.sqs_client.send_message_batch.call_args_list[2].kwargs["Entries"]
+        assert [entry["Id"] for entry in retried_entries] == [
+            event_payload["id"] for event_payload in event_payloads[10:]
+        ]
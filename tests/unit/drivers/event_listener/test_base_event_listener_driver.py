@@ -1,10 +1,18 @@
+import json
+import time
 from unittest.mock import MagicMock
 
+import pytest
+
 from tests.mocks.mock_event import MockEvent
 from tests.mocks.mock_event_listener_driver import MockEventListenerDriver
 
 
 class TestBaseEventListenerDriver:
+    @pytest.fixture()
+    def mock_publish_batch(self, mocker):
+        return mocker.patch.object(MockEventListenerDriver, "try_publish_event_payload_batch")
+
     def test_publish_event(self):
         executor = MagicMock()
         executor.__enter__.return_value = executor
@@ -14,6 +22,15 @@ class TestBaseEventListenerDriver:
 
         executor.submit.assert_called_once()
 
+    def test_publish_event_single_flusher(self):
+        executor = MagicMock()
+        driver = MockEventListenerDriver(futures_executor_fn=lambda: executor)
+
+        for _ in range(100):
+            driver.publish_event(MockEvent())
+
+        executor.submit.assert_called_once_with(driver._run_flusher)
+
     def test__safe_try_publish_event(self):
         driver = MockEventListenerDriver(batched=False)
 
@@ -34,3 +51,66 @@ class TestBaseEventListenerDriver:
         for _ in range(0, 3):
             driver._safe_try_publish_event(MockEvent().to_dict(), flush=True)
         assert len(driver.batch) == 0
+
+    def test_flush_on_batch_size(self, mock_publish_batch):
+        driver = MockEventListenerDriver(batch_size=3, flush_interval=60)
+        events = [MockEvent() for _ in range(7)]
+
+        for event in events:
+            driver.publish_event(event)
+        driver.publish_event(events[-1], flush=True)
+        driver.futures_executor.shutdown(wait=True)
+
+        assert [len(call.args[0]) for call in mock_publish_batch.call_args_list] == [3, 3, 2]
+        assert mock_publish_batch.call_args_list[0].args[0] == [event.to_dict() for event in events[:3]]
+
+    def test_flush_on_max_batch_bytes(self, mock_publish_batch):
+        event_payload = MockEvent().to_dict()
+        driver = MockEventListenerDriver(batch_size=100, max_batch_bytes=(len(json.dumps(event_payload)) + 1) * 2)
+
+        for _ in range(5):
+            driver._safe_try_publish_event(event_payload, flush=False)
+
+        assert [len(call.args[0]) for call in mock_publish_batch.call_args_list] == [2, 2]
+        assert len(driver.batch) == 1
+
+    def test_flush_on_flush_interval(self, mock_publish_batch):
+        driver = MockEventListenerDriver(batch_size=100, flush_interval=0.1)
+
+        start = time.monotonic()
+        driver.publish_event(MockEvent())
+        driver.futures_executor.shutdown(wait=True)
+
+        assert time.monotonic() - start >= 0.1
+        mock_publish_batch.assert_called_once()
+        assert driver.batch == []
+        assert not driver._is_flusher_running
+
+    def test_flusher_restarts(self, mock_publish_batch):
+        driver = MockEventListenerDriver(flush_interval=0)
+
+        driver.publish_event(MockEvent(), flush=True)
+        while driver._is_flusher_running:
+            time.sleep(0.01)
+        driver.publish_event(MockEvent(), flush=True)
+        driver.futures_executor.shutdown(wait=True)
+
+        assert mock_publish_batch.call_count == 2
+
+    def test_publish_with_retries(self, mock_publish_batch):
+        mock_publish_batch.side_effect = [Exception("error"), None]
+        driver = MockEventListenerDriver(min_retry_delay=0, max_retry_delay=0)
+
+        driver._safe_try_publish_event(MockEvent().to_dict(), flush=True)
+
+        assert mock_publish_batch.call_count == 2
+        assert driver.batch == []
+
+    def test_publish_with_retries_exhausted(self, mock_publish_batch):
+        mock_publish_batch.side_effect = Exception("error")
+        driver = MockEventListenerDriver(min_retry_delay=0, max_retry_delay=0, max_attempts=2)
+
+        driver._safe_try_publish_event(MockEvent().to_dict(), flush=True)
+
+        assert mock_publish_batch.call_count == 2
+        assert driver.batch == []
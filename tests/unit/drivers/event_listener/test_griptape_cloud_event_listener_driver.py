@@ -46,6 +46,7 @@ class TestGriptapeCloudEventListenerDriver:
     def test_publish_event_without_span_id(self, mock_post, driver):
         event = MockEvent()
         driver.publish_event(event, flush=True)
+        driver.futures_executor.shutdown(wait=True)
 
         mock_post.assert_called_with(
             url="https://cloud123.griptape.ai/api/structure-runs/bar baz/events",
@@ -60,6 +61,7 @@ class TestGriptapeCloudEventListenerDriver:
 
         with Observability(observability_driver=observability_driver):
             driver.publish_event(event, flush=True)
+        driver.futures_executor.shutdown(wait=True)
 
         mock_post.assert_called_with(
             url="https://cloud123.griptape.ai/api/structure-runs/bar baz/events",
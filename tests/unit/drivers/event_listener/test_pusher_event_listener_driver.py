@@ -42,3 +42,9 @@ class TestPusherEventListenerDriver:
         driver.pusher_client.trigger_batch.assert_called_with(
             [{"channel": "test-channel", "name": "test-event", "data": data[i]} for i in range(3)]
         )
+
+    def test_try_publish_event_payload_batch_chunks(self, driver):
+        data = [MockEvent().to_dict() for _ in range(25)]
+        driver.try_publish_event_payload_batch(data)
+
+        assert [len(call.args[0]) for call in driver.pusher_client.trigger_batch.call_args_list] == [10, 10, 5]
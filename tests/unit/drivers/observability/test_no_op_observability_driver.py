@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from griptape.common.observable import Observable
@@ -30,3 +32,9 @@ class TestNoOpObservabilityDriver:
 
         with driver:
             assert driver.get_span_id() is None
+
+    def test_aobserve(self, driver):
+        async def func(word: str):
+            return word + " you"
+
+        assert asyncio.run(driver.aobserve(Observable.Call(func=func, instance=None, args=("Hi",)))) == "Hi you"
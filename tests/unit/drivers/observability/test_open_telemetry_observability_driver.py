@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
@@ -176,6 +177,45 @@ class TestOpenTelemetryObservabilityDriver:
         mock_span_exporter.export.assert_called_with(expected_spans)
         mock_span_exporter.export.reset_mock()
 
+    def test_observability_agent_async(self, driver, mock_span_exporter):
+        expected_spans = ExpectedSpans(
+            spans=[
+                ExpectedSpan(name="main", parent=None, status_code=StatusCode.OK),
+                ExpectedSpan(name="Agent.arun()", parent="main", status_code=StatusCode.OK),
+                ExpectedSpan(name="Agent.before_run()", parent="Agent.arun()", status_code=StatusCode.OK),
+                ExpectedSpan(name="Agent.atry_run()", parent="Agent.arun()", status_code=StatusCode.OK),
+                ExpectedSpan(name="MockPromptDriver.arun()", parent="Agent.atry_run()", status_code=StatusCode.OK),
+                ExpectedSpan(name="Agent.after_run()", parent="Agent.arun()", status_code=StatusCode.OK),
+            ]
+        )
+
+        with Observability(observability_driver=driver):
+            agent = Agent()
+            asyncio.run(agent.arun("Hi"))
+
+        assert mock_span_exporter.export.call_count == 1
+        mock_span_exporter.export.assert_called_with(expected_spans)
+        mock_span_exporter.export.reset_mock()
+
+    def test_context_manager_aobserve_exception(self, driver, mock_span_exporter):
+        expected_spans = ExpectedSpans(
+            spans=[
+                ExpectedSpan(name="main", parent=None, status_code=StatusCode.ERROR, exception=Exception("Boom func")),
+                ExpectedSpan(
+                    name="func()", parent="main", status_code=StatusCode.ERROR, exception=Exception("Boom func")
+                ),
+            ]
+        )
+
+        async def func(word: str):
+            raise Exception("Boom func")
+
+        with pytest.raises(Exception, match="Boom func"), driver:
+            asyncio.run(driver.aobserve(Observable.Call(func=func, instance=None, args=("Hi",))))
+
+        assert mock_span_exporter.export.call_count == 1
+        mock_span_exporter.export.assert_called_with(expected_spans)
+
     def test_context_manager_observe_adds_tags_attribute(self, driver, mock_span_exporter):
         expected_spans = ExpectedSpans(
             spans=[
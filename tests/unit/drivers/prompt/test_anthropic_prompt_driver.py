@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -192,6 +193,28 @@ class TestAnthropicPromptDriver:
 
         return mock_stream_client
 
+    @pytest.fixture()
+    def mock_async_client(self, mocker, mock_client):
+        mock_async_client = mocker.patch("anthropic.AsyncAnthropic")
+        mock_async_client.return_value.messages.create = AsyncMock(
+            return_value=mock_client.return_value.messages.create.return_value
+        )
+
+        return mock_async_client
+
+    @pytest.fixture()
+    def mock_async_stream_client(self, mocker, mock_stream_client):
+        events = list(mock_stream_client.return_value.messages.create.return_value)
+
+        async def stream():
+            for event in events:
+                yield event
+
+        mock_async_stream_client = mocker.patch("anthropic.AsyncAnthropic")
+        mock_async_stream_client.return_value.messages.create = AsyncMock(side_effect=lambda **_: stream())
+
+        return mock_async_stream_client
+
     @pytest.fixture(params=[True, False])
     def prompt_stack(self, request):
         prompt_stack = PromptStack()
@@ -414,3 +437,48 @@ class TestAnthropicPromptDriver:
 
         event = next(stream)
         assert event.usage.output_tokens == 10
+
+    def test_atry_run(self, mock_async_client, prompt_stack, messages):
+        # Given
+        driver = AnthropicPromptDriver(model="claude-3-haiku", api_key="api-key", use_native_tools=True)
+
+        # When
+        message = asyncio.run(driver.atry_run(prompt_stack))
+
+        # Then
+        mock_async_client.return_value.messages.create.assert_awaited_once_with(
+            messages=messages,
+            stop_sequences=[],
+            model=driver.model,
+            max_tokens=1000,
+            temperature=0.1,
+            top_p=0.999,
+            top_k=250,
+            **{"system": "system-input"} if prompt_stack.system_messages else {},
+            tools=self.ANTHROPIC_TOOLS,
+            tool_choice=driver.tool_choice,
+        )
+        assert message.value[0].value == "model-output"
+        assert message.value[1].value.name == "MockTool"
+        assert message.usage.input_tokens == 5
+        assert message.usage.output_tokens == 10
+
+    def test_atry_stream(self, mock_async_stream_client, prompt_stack):
+        # Given
+        driver = AnthropicPromptDriver(model="claude-3-haiku", api_key="api-key", stream=True)
+
+        async def collect():
+            return [delta async for delta in driver.atry_stream(prompt_stack)]
+
+        # When
+        deltas = asyncio.run(collect())
+
+        # Then
+        mock_async_stream_client.return_value.messages.create.assert_awaited_once()
+        assert deltas[0].usage.input_tokens == 5
+        assert isinstance(deltas[1].content, TextDeltaMessageContent)
+        assert deltas[1].content.text == "model-output"
+        assert isinstance(deltas[3].content, ActionCallDeltaMessageContent)
+        assert deltas[3].content.tag == "mock-id"
+        assert deltas[4].content.partial_input == '{"foo": "bar"}'
+        assert deltas[5].usage.output_tokens == 10
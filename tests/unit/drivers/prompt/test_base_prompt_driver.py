@@ -1,6 +1,10 @@
+import asyncio
+
+import pytest
+
 from griptape.artifacts import ErrorArtifact, TextArtifact
-from griptape.common import Message, PromptStack
-from griptape.events import FinishPromptEvent, StartPromptEvent
+from griptape.common import DeltaMessage, Message, PromptStack
+from griptape.events import CompletionChunkEvent, FinishPromptEvent, StartPromptEvent
 from griptape.events.event_bus import _EventBus
 from griptape.structures import Pipeline
 from griptape.tasks import PromptTask, ToolkitTask
@@ -64,3 +68,59 @@ class TestBasePromptDriver:
         output = pipeline.run().output_task.output
         assert isinstance(output, TextArtifact)
         assert output.value == "mock output"
+
+    def test_get_native_tools(self, mocker):
+        driver = MockPromptDriver()
+        tools = [MockTool()]
+        to_native_tools = mocker.Mock(side_effect=lambda tools: [tool.name for tool in tools])
+
+        assert driver._get_native_tools(tools, to_native_tools) == ["MockTool"]
+        assert driver._get_native_tools(tools, to_native_tools) == ["MockTool"]
+        assert to_native_tools.call_count == 1
+
+        tools[0].name = "OtherTool"
+
+        assert driver._get_native_tools(tools, to_native_tools) == ["OtherTool"]
+        assert to_native_tools.call_count == 2
+
+    def test_arun(self):
+        result = asyncio.run(MockPromptDriver().arun(PromptStack(messages=[])))
+
+        assert isinstance(result, Message)
+        assert result.value == "mock output"
+
+    def test_arun_with_stream(self):
+        result = asyncio.run(MockPromptDriver(stream=True).arun(PromptStack(messages=[])))
+
+        assert isinstance(result, Message)
+        assert result.value == "mock output"
+
+    def test_arun_retries(self):
+        driver = MockFailingPromptDriver(max_failures=1, max_attempts=2, min_retry_delay=0, max_retry_delay=0)
+
+        result = asyncio.run(driver.arun(PromptStack(messages=[])))
+
+        assert result.value == "success"
+        assert driver.current_attempt == 1
+
+    def test_arun_failure(self):
+        driver = MockFailingPromptDriver(max_failures=2, max_attempts=1)
+
+        with pytest.raises(Exception, match="failed attempt"):
+            asyncio.run(driver.arun(PromptStack(messages=[])))
+
+    def test_astream(self, mocker):
+        mock_publish_event = mocker.patch.object(_EventBus, "publish_event")
+        driver = MockPromptDriver(stream=True)
+
+        async def collect():
+            return [delta async for delta in driver.astream(PromptStack(messages=[]))]
+
+        deltas = asyncio.run(collect())
+
+        assert all(isinstance(delta, DeltaMessage) for delta in deltas)
+        events = [call_args[0][0] for call_args in mock_publish_event.call_args_list]
+        assert isinstance(events[0], StartPromptEvent)
+        assert isinstance(events[-1], FinishPromptEvent)
+        assert events[-1].result == "mock output"
+        assert "".join(event.token for event in events if isinstance(event, CompletionChunkEvent)) == "mock output"
@@ -1,4 +1,5 @@
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -212,6 +213,26 @@ class TestOpenAiChatPromptDriverFixtureMixin:
         )
         return mock_chat_create
 
+    @pytest.fixture()
+    def mock_async_chat_completion_create(self, mocker, mock_chat_completion_create):
+        mock_async_chat_create = AsyncMock(return_value=mock_chat_completion_create.return_value)
+        mocker.patch("openai.AsyncOpenAI").return_value.chat.completions.create = mock_async_chat_create
+
+        return mock_async_chat_create
+
+    @pytest.fixture()
+    def mock_async_chat_completion_stream_create(self, mocker, mock_chat_completion_stream_create):
+        chunks = list(mock_chat_completion_stream_create.return_value)
+
+        async def stream():
+            for chunk in chunks:
+                yield chunk
+
+        mock_async_chat_create = AsyncMock(side_effect=lambda **_: stream())
+        mocker.patch("openai.AsyncOpenAI").return_value.chat.completions.create = mock_async_chat_create
+
+        return mock_async_chat_create
+
     @pytest.fixture()
     def prompt_stack(self):
         prompt_stack = PromptStack()
@@ -408,6 +429,68 @@ class TestOpenAiChatPromptDriver(TestOpenAiChatPromptDriverFixtureMixin):
         assert isinstance(event.content, TextDeltaMessageContent)
         assert event.content.text == ""
 
+    @pytest.mark.parametrize("use_native_tools", [True, False])
+    def test_atry_run(self, mock_async_chat_completion_create, prompt_stack, messages, use_native_tools):
+        # Given
+        driver = OpenAiChatPromptDriver(
+            model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, use_native_tools=use_native_tools
+        )
+
+        # When
+        message = asyncio.run(driver.atry_run(prompt_stack))
+
+        # Then
+        mock_async_chat_completion_create.assert_awaited_once_with(
+            model=driver.model,
+            temperature=driver.temperature,
+            user=driver.user,
+            messages=messages,
+            seed=driver.seed,
+            **{"tools": self.OPENAI_TOOLS, "tool_choice": driver.tool_choice} if use_native_tools else {},
+        )
+        assert message.value[0].value == "model-output"
+        assert message.usage.input_tokens == 5
+        assert message.usage.output_tokens == 10
+
+    def test_atry_stream(self, mock_async_chat_completion_stream_create, prompt_stack, messages):
+        # Given
+        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL, stream=True)
+
+        async def collect():
+            return [delta async for delta in driver.atry_stream(prompt_stack)]
+
+        # When
+        deltas = asyncio.run(collect())
+
+        # Then
+        mock_async_chat_completion_stream_create.assert_awaited_once_with(
+            model=driver.model,
+            temperature=driver.temperature,
+            user=driver.user,
+            stream=True,
+            messages=messages,
+            seed=driver.seed,
+            stream_options={"include_usage": True},
+            tools=self.OPENAI_TOOLS,
+            tool_choice=driver.tool_choice,
+        )
+        assert isinstance(deltas[0].content, TextDeltaMessageContent)
+        assert deltas[0].content.text == "model-output"
+        assert isinstance(deltas[1].content, ActionCallDeltaMessageContent)
+        assert deltas[1].content.name == "MockTool"
+        assert deltas[2].content.partial_input == '{"foo": "bar"}'
+        assert deltas[3].usage.input_tokens == 5
+        assert deltas[3].usage.output_tokens == 10
+
+    def test_arun(self, mock_async_chat_completion_create, mock_chat_completion_create, prompt_stack):
+        driver = OpenAiChatPromptDriver(model=OpenAiTokenizer.DEFAULT_OPENAI_GPT_3_CHAT_MODEL)
+
+        message = asyncio.run(driver.arun(prompt_stack))
+
+        assert message.value[0].value == "model-output"
+        mock_async_chat_completion_create.assert_awaited_once()
+        mock_chat_completion_create.assert_not_called()
+
     def test_try_run_with_max_tokens(self, mock_chat_completion_create, prompt_stack, messages):
         # Given
         driver = OpenAiChatPromptDriver(
@@ -1,7 +1,13 @@
+from typing import NoReturn
+from unittest.mock import patch
+
+import numpy as np
 import pytest
 
 from griptape.artifacts import TextArtifact
-from griptape.drivers import LocalVectorStoreDriver
+from griptape.drivers import BaseVectorStoreDriver, LocalVectorStoreDriver
+from griptape.utils import LruCache
+from griptape.vector_indexes import IvfVectorIndex
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 from tests.unit.drivers.vector.test_base_local_vector_store_driver import BaseLocalVectorStoreDriver
 
@@ -23,6 +29,83 @@ class TestLocalVectorStoreDriver(BaseLocalVectorStoreDriver):
         assert len(driver.load_artifacts(namespace="foo")) == 0
         assert len(driver.load_artifacts()) == 2
 
+    def test_upsert_text_artifacts_batches_embeddings(self, driver):
+        driver.upsert_text_artifact(TextArtifact("foo"), namespace="foo")
+
+        with patch.object(
+            driver.embedding_driver, "embed_strings", wraps=driver.embedding_driver.embed_strings
+        ) as embed_strings:
+            driver.upsert_text_artifacts(
+                {"foo": [TextArtifact("foo"), TextArtifact("bar")], "bar": [TextArtifact("baz")]}
+            )
+
+        embed_strings.assert_called_once_with(["bar", "baz"])
+        assert len(driver.load_entries(namespace="foo")) == 2
+        assert len(driver.load_entries(namespace="bar")) == 1
+
+    def test_upsert_text_artifacts_collapses_duplicates(self, driver):
+        with patch.object(
+            driver.embedding_driver, "embed_strings", wraps=driver.embedding_driver.embed_strings
+        ) as embed_strings:
+            driver.upsert_text_artifacts(
+                {"foo": [TextArtifact("foo"), TextArtifact("foo")], "bar": [TextArtifact("foo")]}
+            )
+
+        embed_strings.assert_called_once_with(["foo"])
+        assert len(driver.load_entries(namespace="foo")) == 1
+        assert len(driver.load_entries(namespace="bar")) == 1
+
+    def test_upsert_text_artifacts_entry_cache(self, driver):
+        driver.entry_cache = LruCache()
+
+        driver.upsert_text_artifacts({"foo": [TextArtifact("foo")]})
+        driver.upsert_text_artifact(TextArtifact("bar"), namespace="foo")
+        driver.upsert_text("baz", namespace="foo")
+
+        with patch.object(driver, "does_entry_exist") as does_entry_exist:
+            driver.upsert_text_artifacts({"foo": [TextArtifact("foo"), TextArtifact("bar")]})
+            driver.upsert_text_artifact(TextArtifact("foo"), namespace="foo")
+            driver.upsert_text("baz", namespace="foo")
+
+        does_entry_exist.assert_not_called()
+        assert len(driver.load_entries(namespace="foo")) == 3
+
+    def test_upsert_vectors(self, driver):
+        driver.upsert_batch_size = 2
+
+        assert driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[0, 1], namespace="foo"),
+                BaseVectorStoreDriver.Entry(id="bar", vector=[1, 0], meta={"foo": "bar"}),
+                BaseVectorStoreDriver.Entry(id="baz", vector=[1, 1]),
+            ]
+        ) == ["foo", "bar", "baz"]
+        assert driver.load_entry("foo", namespace="foo").vector == [0, 1]
+        assert driver.load_entry("bar").meta == {"foo": "bar"}
+
+    def test_does_entries_exist(self, driver):
+        driver.upsert_vector([0, 1], vector_id="foo", namespace="foo")
+
+        assert driver.does_entries_exist(["foo", "bar"], namespace="foo") == [True, False]
+        assert driver.does_entries_exist(["foo"]) == [False]
+
+    def test_upsert_text_artifacts_checks_existence_in_bulk(self, driver):
+        with patch.object(driver, "does_entries_exist", wraps=driver.does_entries_exist) as does_entries_exist:
+            driver.upsert_text_artifacts(
+                {"foo": [TextArtifact("foo"), TextArtifact("bar")], "bar": [TextArtifact("baz")]}
+            )
+
+        assert does_entries_exist.call_count == 2
+
+    def test_upsert_text_artifacts_meta(self, driver):
+        meta = {"foo": "bar"}
+
+        driver.upsert_text_artifacts([TextArtifact("foo"), TextArtifact("bar")], meta=meta)
+
+        assert [entry.to_artifact().value for entry in driver.load_entries()] == ["foo", "bar"]
+        assert all(entry.meta["foo"] == "bar" for entry in driver.load_entries())
+        assert meta == {"foo": "bar"}
+
     def test_upsert_text_artifacts_stress_test(self, driver):
         driver.upsert_text_artifacts(
             {
@@ -35,3 +118,126 @@ class TestLocalVectorStoreDriver(BaseLocalVectorStoreDriver):
         assert len(driver.query("foo", namespace="test1")) == 1000
         assert len(driver.query("foo", namespace="test2")) == 1000
         assert len(driver.query("foo", namespace="test3")) == 1000
+
+    def test_query_matrix_index_matches_relatedness_fn(self):
+        vectors = {
+            f"foo-{i}": [float(v) for v in vector] for i, vector in enumerate(np.random.default_rng(0).random((50, 8)))
+        }
+        embedding_driver = MockEmbeddingDriver(mock_output=lambda chunk: vectors.get(chunk, [1.0] * 8))
+        matrix_driver = LocalVectorStoreDriver(embedding_driver=embedding_driver)
+        fallback_driver = LocalVectorStoreDriver(embedding_driver=embedding_driver, use_matrix_index=False)
+
+        for driver in [matrix_driver, fallback_driver]:
+            for i, (key, vector) in enumerate(vectors.items()):
+                driver.upsert_vector(vector, vector_id=key, namespace="even" if i % 2 == 0 else "odd")
+
+        for count in [None, 1, 5, 50, 100]:
+            for namespace in [None, "even", "odd", "missing"]:
+                matrix_result = matrix_driver.query("bar", count=count, namespace=namespace)
+                fallback_result = fallback_driver.query("bar", count=count, namespace=namespace)
+
+                assert [r.id for r in matrix_result] == [r.id for r in fallback_result]
+                assert [r.score for r in matrix_result] == pytest.approx([r.score for r in fallback_result])
+
+    def test_query_matrix_index_incremental_upsert(self, driver):
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        assert [r.id for r in driver.query("foo")] == ["foo"]
+
+        driver.upsert_vector([0.0, 1.0], vector_id="bar")
+        driver.upsert_vector([0.0, 1.0], vector_id="baz", namespace="qux")
+
+        assert [r.id for r in driver.query("foo")] == ["bar", "baz", "foo"]
+        assert [r.id for r in driver.query("foo", namespace="qux")] == ["baz"]
+
+        driver.upsert_vector([-1.0, 0.0], vector_id="bar")
+
+        assert [r.id for r in driver.query("foo")] == ["baz", "foo", "bar"]
+
+    def test_query_custom_relatedness_fn(self):
+        driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), relatedness_fn=lambda x, y: y[0])
+        driver.upsert_vector([1.0, 1.0], vector_id="foo")
+        driver.upsert_vector([2.0, 1.0], vector_id="bar")
+
+        assert [r.id for r in driver.query("foo")] == ["bar", "foo"]
+
+    def test_query_vector_index(self):
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            entries={"qux": BaseVectorStoreDriver.Entry(id="qux", vector=[0.5, 1.0])},
+            vector_index=IvfVectorIndex(list_count=2, train_size=3),
+        )
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        driver.upsert_vector([0.0, 1.0], vector_id="bar", namespace="baz")
+
+        result = driver.query("foo", count=2)
+
+        assert len(driver.vector_index) == 3
+        assert [r.id for r in result] == ["bar", "qux"]
+        assert result[0].score == pytest.approx(1.0)
+        assert [r.id for r in driver.query("foo", count=2, namespace="baz")] == ["bar"]
+
+    def test_query_vector_index_with_stale_keys(self):
+        vector_index = IvfVectorIndex(list_count=2, train_size=3)
+        vector_index.upsert("foo", [1.0, 0.0])
+        vector_index.upsert("bar", [0.0, 1.0])
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(),
+            entries={
+                "baz": BaseVectorStoreDriver.Entry(id="baz", vector=[0.0, 1.0]),
+                "qux": BaseVectorStoreDriver.Entry(id="qux", vector=[1.0, 1.0]),
+            },
+            vector_index=vector_index,
+        )
+
+        assert vector_index.keys() == {"baz", "qux"}
+        assert [r.id for r in driver.query("foo", count=2)] == ["baz", "qux"]
+
+    def test_query_vector_index_does_not_scan_entries(self):
+        class UnscannableDict(dict):
+            def __iter__(self) -> NoReturn:
+                raise AssertionError("entries were scanned")
+
+            def keys(self) -> NoReturn:
+                raise AssertionError("entries were scanned")
+
+            def values(self) -> NoReturn:
+                raise AssertionError("entries were scanned")
+
+            def items(self) -> NoReturn:
+                raise AssertionError("entries were scanned")
+
+        driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), vector_index=IvfVectorIndex(list_count=2, train_size=3)
+        )
+        driver.upsert_vector([1.0, 0.0], vector_id="foo")
+        driver.upsert_vector([0.0, 1.0], vector_id="bar")
+        driver.entries = UnscannableDict(driver.entries)
+
+        assert [r.id for r in driver.query("foo", count=1)] == ["bar"]
+
+    def test_query_overlapping_namespaces(self):
+        drivers = [
+            LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), use_matrix_index=False),
+            LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver()),
+            LocalVectorStoreDriver(
+                embedding_driver=MockEmbeddingDriver(), vector_index=IvfVectorIndex(list_count=2, train_size=3)
+            ),
+        ]
+
+        for driver in drivers:
+            driver.upsert_vector([1.0, 0.0], vector_id="foo", namespace="ns")
+            driver.upsert_vector([0.0, 1.0], vector_id="bar", namespace="ns-foo")
+            driver.upsert_vector([1.0, 1.0], vector_id="baz", namespace="ns-foo")
+
+        for driver in drivers:
+            assert [r.id for r in driver.query("foo", count=3, namespace="ns")] == ["foo"]
+            assert [r.id for r in driver.query("foo", count=3, namespace="ns-foo")] == ["bar", "baz"]
+
+    def test_eq_with_matrix_index(self, driver):
+        driver.upsert_text_artifact(TextArtifact("foo"))
+        driver.query("foo")
+
+        assert driver == driver
+
+    def test_to_dict(self, driver):
+        assert driver.to_dict()["type"] == "LocalVectorStoreDriver"
@@ -1,9 +1,10 @@
-from unittest.mock import Mock, create_autospec, patch
+from unittest.mock import MagicMock, Mock, create_autospec, patch
 
 import numpy as np
 import pytest
 
-from griptape.drivers import OpenSearchVectorStoreDriver
+from griptape.drivers import BaseVectorStoreDriver, OpenSearchVectorStoreDriver
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
 class TestOpenSearchVectorStoreDriver:
@@ -50,3 +51,58 @@ class TestOpenSearchVectorStoreDriver:
             results = driver.query(query_string, count=5, namespace="company")
             assert len(results) == 1, "Expected results from the query"
             assert results[0].id == "query_result", "Expected a result id"
+
+    def test_upsert_vectors(self):
+        client = MagicMock()
+        client.bulk.side_effect = lambda body: {
+            "errors": False,
+            "items": [{"index": {"_id": action["index"]["_id"]}} for action in body[::2]],
+        }
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost",
+            index_name="foo",
+            client=client,
+            embedding_driver=MockEmbeddingDriver(),
+            upsert_batch_size=2,
+        )
+
+        assert driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2], namespace="company"),
+                BaseVectorStoreDriver.Entry(id="bar", vector=[0.3, 0.4], meta={"foo": "bar"}),
+                BaseVectorStoreDriver.Entry(id="baz", vector=[0.5, 0.6]),
+            ]
+        ) == ["foo", "bar", "baz"]
+        assert client.bulk.call_args_list[0].kwargs["body"] == [
+            {"index": {"_index": "foo", "_id": "foo"}},
+            {"vector": [0.1, 0.2], "namespace": "company", "metadata": None},
+            {"index": {"_index": "foo", "_id": "bar"}},
+            {"vector": [0.3, 0.4], "namespace": None, "metadata": {"foo": "bar"}},
+        ]
+        assert client.bulk.call_count == 2
+
+    def test_upsert_vectors_raises_on_errors(self):
+        client = MagicMock()
+        client.bulk.return_value = {"errors": True, "items": [{"index": {"_id": "foo", "error": "nope"}}]}
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="foo", client=client, embedding_driver=MockEmbeddingDriver()
+        )
+
+        with pytest.raises(RuntimeError, match="nope"):
+            driver.upsert_vectors([BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2])])
+
+    def test_does_entries_exist(self):
+        client = MagicMock()
+        client.mget.return_value = {
+            "docs": [
+                {"_id": "foo", "found": True, "_source": {"namespace": "company"}},
+                {"_id": "bar", "found": False},
+                {"_id": "baz", "found": True, "_source": {"namespace": "other"}},
+            ]
+        }
+        driver = OpenSearchVectorStoreDriver(
+            host="localhost", index_name="foo", client=client, embedding_driver=MockEmbeddingDriver()
+        )
+
+        assert driver.does_entries_exist(["foo", "bar", "baz"], namespace="company") == [True, False, False]
+        assert driver.does_entries_exist(["foo", "bar", "baz"]) == [True, False, True]
@@ -29,3 +29,83 @@ class TestPersistentLocalVectorStoreDriver(BaseLocalVectorStoreDriver):
         new_driver = LocalVectorStoreDriver(embedding_driver=MockEmbeddingDriver(), persist_file=persist_file)
 
         assert new_driver.query("persistent foobar")[0].to_artifact().value == "persistent foobar"
+
+
+class TestBinaryPersistentLocalVectorStoreDriver(BaseLocalVectorStoreDriver):
+    @pytest.fixture()
+    def temp_dir(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield temp_dir
+
+    @pytest.fixture()
+    def persist_file(self, temp_dir):
+        return os.path.join(temp_dir, "store.log")
+
+    @pytest.fixture()
+    def driver(self, persist_file):
+        return LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="binary"
+        )
+
+    def test_persistence(self, driver, persist_file):
+        driver.upsert_text_artifact(TextArtifact("persistent foobar"))
+        driver.upsert_text_artifact(TextArtifact("persistent foobaz"), namespace="foo")
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="binary"
+        )
+
+        assert len(new_driver.entries) == 2
+        assert new_driver.query("persistent foobar")[0].to_artifact().value == "persistent foobar"
+        assert new_driver.query("persistent foobar", namespace="foo")[0].to_artifact().value == "persistent foobaz"
+        assert new_driver.query("persistent foobar", include_vectors=True)[0].vector == [0, 1]
+
+    def test_upsert_appends(self, driver, persist_file):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+        driver.upsert_vector([1.0, 0.0], vector_id="bar")
+
+        assert os.path.getsize(driver.vectors_file) == 2 * 2 * 4
+
+        with open(persist_file) as file:
+            assert len(file.readlines()) == 3
+
+    def test_compaction(self, driver, persist_file):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+        driver.upsert_vector([1.0, 0.0], vector_id="bar")
+        driver.upsert_vector([1.0, 1.0], vector_id="foo")
+
+        assert os.path.getsize(driver.vectors_file) == 2 * 2 * 4
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="binary"
+        )
+
+        assert new_driver.load_entry("foo").vector == [1.0, 1.0]
+        assert new_driver.load_entry("bar").vector == [1.0, 0.0]
+        assert [entry.vector for entry in new_driver.load_entries()] == [[1.0, 1.0], [1.0, 0.0]]
+
+    def test_torn_write(self, driver, persist_file):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+
+        with open(persist_file, "a") as file:
+            file.write('{"key": "bar", "row"')
+
+        new_driver = LocalVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="binary"
+        )
+
+        assert list(new_driver.entries.keys()) == ["foo"]
+
+    def test_mismatched_dimensions(self, driver):
+        driver.upsert_vector([0.0, 1.0], vector_id="foo")
+
+        with pytest.raises(ValueError):
+            driver.upsert_vector([0.0, 1.0, 2.0], vector_id="bar")
+
+        assert driver.load_entry("bar") is None
+
+    def test_invalid_persist_format(self, persist_file):
+        with pytest.raises(ValueError):
+            LocalVectorStoreDriver(
+                embedding_driver=MockEmbeddingDriver(), persist_file=persist_file, persist_format="foo"
+            )
@@ -5,7 +5,7 @@ from unittest.mock import MagicMock, Mock
 import pytest
 from sqlalchemy import create_engine
 
-from griptape.drivers import PgVectorVectorStoreDriver
+from griptape.drivers import BaseVectorStoreDriver, PgVectorVectorStoreDriver
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
@@ -156,3 +156,51 @@ class TestPgVectorVectorStoreDriver:
         assert result[0].vector == test_vecs[0]
         assert result[0].namespace == test_namespaces[0]
         assert result[0].meta == test_metas[0]
+
+    def test_upsert_vectors(self, mock_engine):
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name, upsert_batch_size=2
+        )
+        conn = mock_engine.begin.return_value.__enter__.return_value
+
+        assert driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2], namespace="foo"),
+                BaseVectorStoreDriver.Entry(id="bar", vector=[0.3, 0.4], meta={"foo": "bar"}),
+                BaseVectorStoreDriver.Entry(id="baz", vector=[0.5, 0.6]),
+            ]
+        ) == ["foo", "bar", "baz"]
+        assert conn.execute.call_count == 2
+        assert "ON CONFLICT (id) DO UPDATE" in str(conn.execute.call_args_list[0].args[0])
+
+    def test_upsert_vectors_with_duplicate_ids(self, mock_engine):
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name
+        )
+        conn = mock_engine.begin.return_value.__enter__.return_value
+
+        assert driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2]),
+                BaseVectorStoreDriver.Entry(id="bar", vector=[0.3, 0.4]),
+                BaseVectorStoreDriver.Entry(id="foo", vector=[0.5, 0.6]),
+            ]
+        ) == ["foo", "bar", "foo"]
+        assert conn.execute.call_count == 1
+        assert conn.execute.call_args.args[0].compile().params["vector_m0"] == [0.5, 0.6]
+
+    def test_does_entries_exist(self, mock_session, mock_engine):
+        mock_session.query.return_value.filter.return_value.all.return_value = [Mock(id="bar")]
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name
+        )
+
+        assert driver.does_entries_exist(["foo", "bar"]) == [False, True]
+
+    def test_does_entries_exist_with_error(self, mock_session, mock_engine):
+        mock_session.query.side_effect = Exception("foo")
+        driver = PgVectorVectorStoreDriver(
+            embedding_driver=MockEmbeddingDriver(), engine=mock_engine, table_name=self.table_name
+        )
+
+        assert driver.does_entries_exist(["foo", "bar"]) == [False, False]
@@ -1,7 +1,9 @@
+from unittest.mock import Mock
+
 import pytest
 
 from griptape.artifacts import TextArtifact
-from griptape.drivers import PineconeVectorStoreDriver
+from griptape.drivers import BaseVectorStoreDriver, PineconeVectorStoreDriver
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
@@ -43,3 +45,32 @@ class TestPineconeVectorStorageDriver:
 
         assert results[0].vector == [0, 1, 0]
         assert results[0].id == "foo"
+
+    def test_upsert_vectors(self, driver):
+        driver.upsert_batch_size = 2
+
+        assert driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[0, 1], namespace="foo"),
+                BaseVectorStoreDriver.Entry(id="bar", vector=[1, 0], namespace="bar", meta={"foo": "bar"}),
+                BaseVectorStoreDriver.Entry(id="baz", vector=[1, 1], namespace="foo"),
+                BaseVectorStoreDriver.Entry(id="qux", vector=[0, 0], namespace="foo"),
+            ]
+        ) == ["foo", "bar", "baz", "qux"]
+        assert [call.kwargs for call in driver.index.upsert.call_args_list] == [
+            {"vectors": [("foo", [0, 1], None), ("baz", [1, 1], None)], "namespace": "foo"},
+            {"vectors": [("qux", [0, 0], None)], "namespace": "foo"},
+            {"vectors": [("bar", [1, 0], {"foo": "bar"})], "namespace": "bar"},
+        ]
+
+    def test_does_entries_exist(self, driver):
+        driver.index.fetch.return_value.to_dict.return_value = {"vectors": {"bar": {}}, "namespace": "foo"}
+
+        assert driver.does_entries_exist(["foo", "bar"], namespace="foo") == [False, True]
+        driver.index.fetch.assert_called_once_with(ids=["foo", "bar"], namespace="foo")
+
+    def test_does_entries_exist_with_error(self, driver):
+        driver.upsert_batch_size = 1
+        driver.index.fetch.side_effect = [Exception("foo"), Mock(to_dict=Mock(return_value={"vectors": {"bar": {}}}))]
+
+        assert driver.does_entries_exist(["foo", "bar"], namespace="foo") == [False, True]
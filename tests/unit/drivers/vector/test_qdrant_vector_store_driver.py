@@ -3,7 +3,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from griptape.drivers import QdrantVectorStoreDriver
+from griptape.drivers import BaseVectorStoreDriver, QdrantVectorStoreDriver
 from griptape.utils import import_optional_dependency
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
@@ -171,3 +171,42 @@ class TestQdrantVectorStoreDriver:
             assert results[1].id == "id2"
             assert results[1].vector == [0.4, 0.5, 0.6]
             assert results[1].meta == {"key2": "value2"}
+
+    def test_upsert_vectors(self, driver):
+        entries = [
+            BaseVectorStoreDriver.Entry(id="foo", vector=[0.1, 0.2], meta={"foo": "bar"}),
+            BaseVectorStoreDriver.Entry(id="bar", vector=[0.3, 0.4]),
+            BaseVectorStoreDriver.Entry(id="baz", vector=[0.5, 0.6]),
+        ]
+        driver.upsert_batch_size = 2
+        driver.client = MagicMock()
+
+        with patch("griptape.drivers.vector.qdrant_vector_store_driver.import_optional_dependency") as mock_import:
+            assert driver.upsert_vectors(entries) == ["foo", "bar", "baz"]
+
+            assert mock_import.return_value.Batch.call_args_list[0].kwargs == {
+                "ids": ["foo", "bar"],
+                "vectors": [[0.1, 0.2], [0.3, 0.4]],
+                "payloads": [{"foo": "bar"}, {}],
+            }
+            assert mock_import.return_value.Batch.call_args_list[1].kwargs == {
+                "ids": ["baz"],
+                "vectors": [[0.5, 0.6]],
+                "payloads": None,
+            }
+        assert driver.client.upsert.call_count == 2
+
+    def test_does_entries_exist(self, driver):
+        driver.client = MagicMock()
+        driver.client.retrieve.return_value = [MagicMock(id="bar")]
+
+        assert driver.does_entries_exist(["foo", "bar"]) == [False, True]
+        driver.client.retrieve.assert_called_once_with(
+            collection_name=driver.collection_name, ids=["foo", "bar"], with_payload=False, with_vectors=False
+        )
+
+    def test_does_entries_exist_with_error(self, driver):
+        driver.client = MagicMock()
+        driver.client.retrieve.side_effect = Exception("foo")
+
+        assert driver.does_entries_exist(["foo", "bar"]) == [False, False]
@@ -2,7 +2,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from griptape.drivers import RedisVectorStoreDriver
+from griptape.drivers import BaseVectorStoreDriver, RedisVectorStoreDriver
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
@@ -97,3 +97,34 @@ class TestRedisVectorStorageDriver:
         assert results[0].score == 0.456198036671
         assert results[0].meta == {"foo": "bar"}
         assert results[0].vector == [1.0, 2.0, 3.0]
+
+    def test_upsert_vectors(self, driver, mock_client):
+        pipeline = mock_client.pipeline.return_value
+        driver.upsert_batch_size = 2
+
+        assert driver.upsert_vectors(
+            [
+                BaseVectorStoreDriver.Entry(id="foo", vector=[1.0, 2.0], namespace="some_namespace"),
+                BaseVectorStoreDriver.Entry(id="bar", vector=[3.0, 4.0], meta={"foo": "bar"}),
+                BaseVectorStoreDriver.Entry(id="baz", vector=[5.0, 6.0]),
+            ]
+        ) == ["foo", "bar", "baz"]
+        assert [call.args[0] for call in pipeline.hset.call_args_list] == ["some_namespace:foo", "bar", "baz"]
+        assert pipeline.hset.call_args_list[1].kwargs["mapping"]["metadata"] == '{"foo": "bar"}'
+        assert pipeline.execute.call_count == 2
+        mock_client.hset.assert_not_called()
+
+    def test_does_entries_exist(self, driver, mock_client):
+        pipeline = mock_client.pipeline.return_value
+        pipeline.execute.return_value = [1, 0]
+
+        assert driver.does_entries_exist(["foo", "bar"], namespace="some_namespace") == [True, False]
+        assert [call.args[0] for call in pipeline.exists.call_args_list] == [
+            "some_namespace:foo",
+            "some_namespace:bar",
+        ]
+
+    def test_does_entries_exist_with_error(self, driver, mock_client):
+        mock_client.pipeline.return_value.execute.side_effect = Exception("foo")
+
+        assert driver.does_entries_exist(["foo", "bar"]) == [False, False]
@@ -1,4 +1,9 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
 from textwrap import dedent
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -6,19 +11,52 @@ from griptape.drivers.web_scraper.markdownify_web_scraper_driver import Markdown
 
 
 class TestMarkdownifyWebScraperDriver:
+    @pytest.fixture()
+    def mock_page(self):
+        mock_page = MagicMock()
+        mock_page.is_closed.return_value = False
+        mock_page.goto = AsyncMock()
+        mock_page.route = AsyncMock()
+        mock_page.wait_for_timeout = AsyncMock()
+        mock_page.content = AsyncMock()
+        mock_page.context.close = AsyncMock()
+
+        return mock_page
+
+    @pytest.fixture()
+    def mock_browser(self, mock_page):
+        mock_browser = MagicMock()
+        mock_browser.is_connected.return_value = True
+        mock_browser.new_context = AsyncMock()
+        mock_browser.new_context.return_value.new_page = AsyncMock(return_value=mock_page)
+        mock_browser.close = AsyncMock()
+
+        return mock_browser
+
     @pytest.fixture(autouse=True)
-    def mock_playwright(self, mocker):
-        return mocker.patch("playwright.sync_api.sync_playwright").return_value
+    def mock_playwright(self, mocker, mock_browser):
+        mock_playwright = MagicMock()
+        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
+        mock_playwright.stop = AsyncMock()
+        mocker.patch("playwright.async_api.async_playwright").return_value.start = AsyncMock(
+            return_value=mock_playwright
+        )
+
+        return mock_playwright
 
     @pytest.fixture(autouse=True)
-    def mock_content(self, mock_playwright):
-        mock_content = mock_playwright.__enter__.return_value.chromium.launch.return_value.__enter__.return_value.new_page.return_value.content
+    def mock_content(self, mock_page):
+        mock_content = mock_page.content
         mock_content.return_value = '<html><a href="foobar.com">foobar</a></html>'
         return mock_content
 
     @pytest.fixture()
     def web_scraper(self):
-        return MarkdownifyWebScraperDriver()
+        web_scraper = MarkdownifyWebScraperDriver()
+
+        yield web_scraper
+
+        web_scraper.close()
 
     def test_scrape_url(self, web_scraper):
         artifact = web_scraper.scrape_url("https://example.com/")
@@ -88,3 +126,144 @@ class TestMarkdownifyWebScraperDriver:
 
         with pytest.raises(Exception, match="can't access URL"):
             web_scraper.scrape_url("https://example.com/")
+
+    def test_scrape_url_reuses_browser(self, web_scraper, mock_playwright, mock_browser):
+        web_scraper.scrape_url("https://example.com/")
+        web_scraper.scrape_url("https://example.com/")
+
+        mock_playwright.chromium.launch.assert_awaited_once_with(headless=True)
+        mock_browser.new_context.assert_awaited_once()
+
+    def test_scrape_url_from_threads(self, web_scraper, mock_playwright):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            artifacts = list(executor.map(web_scraper.scrape_url, ["https://example.com/"] * 16))
+
+        assert [artifact.value for artifact in artifacts] == ["[foobar](foobar.com)"] * 16
+        mock_playwright.chromium.launch.assert_awaited_once()
+
+    def test_scrape_url_with_timeout(self, mock_page):
+        web_scraper = MarkdownifyWebScraperDriver(timeout=100)
+
+        web_scraper.scrape_url("https://example.com/")
+        web_scraper.close()
+
+        mock_page.wait_for_timeout.assert_awaited_once_with(100)
+
+    def test_scrape_url_discards_failed_page(self, web_scraper, mock_page, mock_browser):
+        mock_page.goto.side_effect = [Exception("navigation failed"), None]
+
+        with pytest.raises(Exception, match="navigation failed"):
+            web_scraper.scrape_url("https://example.com/")
+        web_scraper.scrape_url("https://example.com/")
+
+        mock_page.context.close.assert_awaited_once()
+        assert mock_browser.new_context.await_count == 2
+
+    def test_scrape_urls(self, web_scraper, mock_content):
+        mock_content.side_effect = [f"<html>{i}</html>" for i in range(3)]
+
+        artifacts = web_scraper.scrape_urls([f"https://example.com/{i}" for i in range(3)])
+
+        assert [artifact.value for artifact in artifacts] == ["0", "1", "2"]
+
+    def test_scrape_urls_max_pages(self, mock_page, mock_browser):
+        web_scraper = MarkdownifyWebScraperDriver(max_pages=2)
+        page_count = 0
+        max_page_count = 0
+
+        async def goto(url):
+            nonlocal page_count, max_page_count
+            page_count += 1
+            max_page_count = max(max_page_count, page_count)
+            await asyncio.sleep(0.01)
+            page_count -= 1
+
+        mock_page.goto.side_effect = goto
+
+        artifacts = web_scraper.scrape_urls([f"https://example.com/{i}" for i in range(6)])
+        web_scraper.close()
+
+        assert len(artifacts) == 6
+        assert max_page_count == 2
+        assert mock_browser.new_context.await_count == 2
+
+    def test_scrape_urls_raises(self, web_scraper, mock_content):
+        mock_content.side_effect = ["<html>foo</html>", Exception("error")]
+
+        with pytest.raises(Exception, match="error"):
+            web_scraper.scrape_urls(["https://example.com/1", "https://example.com/2"])
+
+    @pytest.mark.parametrize(
+        ("resource_type", "blocked"), [("image", True), ("font", True), ("media", True), ("document", False)]
+    )
+    def test_blocked_resource_types(self, web_scraper, mock_page, resource_type, blocked):
+        web_scraper.scrape_url("https://example.com/")
+        route_handler = mock_page.route.await_args.args[1]
+        mock_route = MagicMock(abort=AsyncMock(), continue_=AsyncMock())
+        mock_route.request.resource_type = resource_type
+
+        asyncio.run(route_handler(mock_route))
+
+        assert mock_route.abort.await_count == int(blocked)
+        assert mock_route.continue_.await_count == int(not blocked)
+
+    def test_no_blocked_resource_types(self, mock_page):
+        web_scraper = MarkdownifyWebScraperDriver(blocked_resource_types=[])
+
+        web_scraper.scrape_url("https://example.com/")
+        web_scraper.close()
+
+        mock_page.route.assert_not_awaited()
+
+    def test_idle_timeout(self, mock_playwright, mock_browser):
+        web_scraper = MarkdownifyWebScraperDriver(idle_timeout=0.05)
+
+        web_scraper.scrape_url("https://example.com/")
+        time.sleep(0.3)
+
+        mock_browser.close.assert_awaited_once()
+        mock_playwright.stop.assert_awaited_once()
+
+        web_scraper.scrape_url("https://example.com/")
+        web_scraper.close()
+
+        assert mock_playwright.chromium.launch.await_count == 2
+
+    def test_close(self, web_scraper, mock_playwright, mock_browser, mock_page):
+        web_scraper.scrape_url("https://example.com/")
+        web_scraper.close()
+
+        mock_page.context.close.assert_awaited_once()
+        mock_browser.close.assert_awaited_once()
+        mock_playwright.stop.assert_awaited_once()
+
+    @pytest.mark.parametrize("max_pages", [1, 2])
+    def test_close_cancels_scrapes(self, mock_page, mock_browser, max_pages):
+        web_scraper = MarkdownifyWebScraperDriver(max_pages=max_pages)
+        started = threading.Event()
+
+        async def goto(url):
+            started.set()
+            await asyncio.sleep(10)
+
+        mock_page.goto.side_effect = goto
+
+        with ThreadPoolExecutor() as executor:
+            future = executor.submit(web_scraper.scrape_urls, ["https://example.com/1", "https://example.com/2"])
+            assert started.wait(timeout=5)
+            web_scraper.close()
+
+            with pytest.raises(CancelledError):
+                future.result(timeout=5)
+
+        mock_browser.close.assert_awaited_once()
+
+    def test_closed_browser_pool(self, web_scraper):
+        web_scraper.scrape_url("https://example.com/")
+        browser_pool = web_scraper._browser_pool
+        web_scraper.close()
+
+        with pytest.raises(RuntimeError, match="The browser was shut down."):
+            browser_pool.run(asyncio.sleep(0))
+
+        browser_pool.shut_down()
@@ -1,3 +1,8 @@
+import threading
+import time
+from concurrent import futures
+from unittest.mock import Mock
+
 import pytest
 
 from griptape.drivers.web_scraper.trafilatura_web_scraper_driver import TrafilaturaWebScraperDriver
@@ -5,18 +10,22 @@ from griptape.drivers.web_scraper.trafilatura_web_scraper_driver import Trafilat
 
 class TestTrafilaturaWebScraperDriver:
     @pytest.fixture(autouse=True)
-    def _mock_fetch_url(self, mocker):
+    def mock_get(self, mocker):
         # Through trial and error, I've found that include_links in trafilatura's extract does not work
         # if the body of the page is not long enough, which is why I'm adding an arbitrary number of
         # characters to the body.
-        mocker.patch(
-            "trafilatura.fetch_url"
-        ).return_value = f'<!DOCTYPE html><html>{"x" * 243}<a href="foobar.com">foobar</a></html>'
+        return mocker.patch(
+            "requests.Session.get",
+            return_value=self.mock_response(f'<!DOCTYPE html><html>{"x" * 243}<a href="foobar.com">foobar</a></html>'),
+        )
 
     @pytest.fixture()
     def web_scraper(self):
         return TrafilaturaWebScraperDriver(include_links=True)
 
+    def mock_response(self, content: str, status_code: int = 200, headers=None) -> Mock:
+        return Mock(status_code=status_code, ok=status_code < 400, content=content.encode(), headers=headers or {})
+
     def test_scrape_url(self, web_scraper):
         artifact = web_scraper.scrape_url("https://example.com/")
         assert "[foobar](foobar.com)" in artifact.value
@@ -38,3 +47,95 @@ class TestTrafilaturaWebScraperDriver:
 
         with pytest.raises(Exception, match="can't extract page"):
             web_scraper.scrape_url("https://example.com/")
+
+    def test_scrape_url_raises_when_response_fails(self, web_scraper, mock_get):
+        mock_get.return_value = self.mock_response("", status_code=404)
+
+        with pytest.raises(Exception, match="can't access URL"):
+            web_scraper.scrape_url("https://example.com/")
+
+    def test_scrape_url_reuses_session(self, web_scraper, mock_get):
+        web_scraper.scrape_url("https://example.com/")
+        web_scraper.scrape_url("https://example.com/")
+
+        assert web_scraper.session is web_scraper.session
+        mock_get.assert_called_with("https://example.com/", headers={}, timeout=30)
+
+    def test_scrape_url_with_request_params(self, mock_get):
+        web_scraper = TrafilaturaWebScraperDriver(timeout=5, request_params={"verify": False})
+
+        web_scraper.scrape_url("https://example.com/")
+
+        mock_get.assert_called_once_with("https://example.com/", headers={}, timeout=5, verify=False)
+
+    def test_scrape_url_conditional_request(self, web_scraper, mock_get, mocker):
+        import trafilatura
+
+        extract = mocker.spy(trafilatura, "extract")
+        response = mock_get.return_value
+        response.headers = {"ETag": '"foo"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+
+        artifact = web_scraper.scrape_url("https://example.com/")
+        mock_get.return_value = self.mock_response("", status_code=304)
+        cached_artifact = web_scraper.scrape_url("https://example.com/")
+
+        mock_get.assert_called_with(
+            "https://example.com/",
+            headers={"If-None-Match": '"foo"', "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"},
+            timeout=30,
+        )
+        assert cached_artifact.value == artifact.value
+        assert extract.call_count == 1
+
+    def test_scrape_url_without_validators(self, web_scraper, mock_get):
+        web_scraper.scrape_url("https://example.com/")
+        web_scraper.scrape_url("https://example.com/")
+
+        mock_get.assert_called_with("https://example.com/", headers={}, timeout=30)
+
+    def test_max_cached_pages(self, mock_get):
+        web_scraper = TrafilaturaWebScraperDriver(max_cached_pages=1)
+        mock_get.return_value.headers = {"ETag": '"foo"'}
+
+        web_scraper.scrape_url("https://example.com/1")
+        web_scraper.scrape_url("https://example.com/2")
+        web_scraper.scrape_url("https://example.com/1")
+
+        mock_get.assert_called_with("https://example.com/1", headers={}, timeout=30)
+
+    def test_extraction_executor(self, mocker):
+        with futures.ThreadPoolExecutor() as executor:
+            submit = mocker.spy(executor, "submit")
+            web_scraper = TrafilaturaWebScraperDriver(extraction_executor=executor)
+
+            artifact = web_scraper.scrape_url("https://example.com/")
+
+        assert "[foobar](foobar.com)" in artifact.value
+        submit.assert_called_once()
+
+    def test_max_connections_per_host(self, mock_get):
+        web_scraper = TrafilaturaWebScraperDriver(max_connections_per_host=2)
+        response = mock_get.return_value
+        lock = threading.Lock()
+        connection_counts = {}
+        max_connection_counts = {}
+
+        def get(url, **kwargs):
+            host = url.split("/")[2]
+
+            with lock:
+                connection_counts[host] = connection_counts.get(host, 0) + 1
+                max_connection_counts[host] = max(max_connection_counts.get(host, 0), connection_counts[host])
+            time.sleep(0.01)
+            with lock:
+                connection_counts[host] -= 1
+
+            return response
+
+        mock_get.side_effect = get
+
+        with futures.ThreadPoolExecutor(max_workers=8) as executor:
+            urls = [f"https://{host}/{i}" for host in ["foo.com", "bar.com"] for i in range(8)]
+            list(executor.map(web_scraper.scrape_url, urls))
+
+        assert max_connection_counts == {"foo.com": 2, "bar.com": 2}
@@ -4,6 +4,7 @@ from griptape.artifacts import TextArtifact
 from griptape.common import Reference
 from griptape.engines.rag import RagContext
 from griptape.engines.rag.modules import FootnotePromptResponseRagModule
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 
 class TestFootnotePromptResponseRagModule:
@@ -31,3 +32,29 @@ class TestFootnotePromptResponseRagModule:
         assert "*TEXT SEGMENT 3*" in system_message
         assert "source 1" in system_message
         assert "source 2" in system_message
+
+    @pytest.mark.parametrize("max_input_tokens", [4096, 1500, 500, 10])
+    def test_pack_text_chunks(self, module, max_input_tokens):
+        module.prompt_driver.tokenizer = MockTokenizer(model="test-model", max_input_tokens=max_input_tokens)
+        context = RagContext(query="test", text_chunks=[TextArtifact(f"chunk {i} " * (i + 1)) for i in range(30)])
+        expected = []
+
+        for artifact in context.text_chunks:
+            system_prompt = module.generate_system_template(context, [*expected, artifact])
+            prompt = module.prompt_driver.prompt_stack_to_string(module.generate_prompt_stack(system_prompt, "test"))
+
+            if len(prompt) + module.answer_token_offset >= max_input_tokens:
+                break
+
+            expected.append(artifact)
+
+        assert module.pack_text_chunks(context) == expected
+
+    def test_pack_text_chunks_renders_few_templates(self, module, mocker):
+        generate_system_template = mocker.spy(module, "generate_system_template")
+        context = RagContext(query="test", text_chunks=[TextArtifact(f"chunk {i}") for i in range(100)])
+
+        module.prompt_driver.tokenizer = MockTokenizer(model="test-model", max_input_tokens=1500)
+
+        assert 0 < len(module.pack_text_chunks(context)) < 100
+        assert generate_system_template.call_count <= 10
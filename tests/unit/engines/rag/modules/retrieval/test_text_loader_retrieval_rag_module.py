@@ -1,18 +1,29 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
 import pytest
 
+from griptape.artifacts import TextArtifact
+from griptape.chunkers import TextChunker
 from griptape.drivers import LocalVectorStoreDriver
 from griptape.engines.rag import RagContext
 from griptape.engines.rag.modules import TextLoaderRetrievalRagModule
-from griptape.loaders import WebLoader
+from griptape.loaders import TextLoader, WebLoader
+from griptape.utils import LruCache
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+from tests.mocks.mock_tokenizer import MockTokenizer
 
 MAX_TOKENS = 50
 
 
 class TestTextLoaderRetrievalRagModule:
     @pytest.fixture(autouse=True)
-    def _mock_trafilatura_fetch_url(self, mocker):
-        mocker.patch("trafilatura.fetch_url", return_value="<html>foobar</html>")
+    def _mock_get(self, mocker):
+        mocker.patch(
+            "requests.Session.get",
+            return_value=Mock(status_code=200, ok=True, content=b"<html>foobar</html>", headers={}),
+        )
 
     def test_run(self):
         embedding_driver = MockEmbeddingDriver()
@@ -24,3 +35,140 @@ class TestTextLoaderRetrievalRagModule:
         )
 
         assert module.run(RagContext(query="foo"))[0].value == "foobar"
+
+
+class TestTextLoaderRetrievalRagModuleCache:
+    @pytest.fixture()
+    def embedding_driver(self):
+        return MockEmbeddingDriver()
+
+    @pytest.fixture()
+    def loader(self, embedding_driver):
+        return TextLoader(
+            chunker=TextChunker(tokenizer=MockTokenizer(model="foo bar"), max_tokens=MAX_TOKENS),
+            embedding_driver=embedding_driver,
+        )
+
+    @pytest.fixture()
+    def vector_store_driver(self, embedding_driver):
+        return LocalVectorStoreDriver(embedding_driver=embedding_driver)
+
+    def test_run_reuses_loaded_source(self, mocker, loader, vector_store_driver):
+        load_spy = mocker.spy(loader, "load")
+        module = TextLoaderRetrievalRagModule(loader=loader, vector_store_driver=vector_store_driver, source="foobar")
+
+        assert module.run(RagContext(query="foo"))[0].value == "foobar"
+        assert module.run(RagContext(query="bar"))[0].value == "foobar"
+        assert load_spy.call_count == 1
+        assert {entry.namespace for entry in vector_store_driver.load_entries()} == {loader.to_key("foobar")}
+
+    def test_run_with_context_source(self, mocker, loader, vector_store_driver):
+        load_spy = mocker.spy(loader, "load")
+        module = TextLoaderRetrievalRagModule(loader=loader, vector_store_driver=vector_store_driver, source="foobar")
+        context = RagContext(query="foo", module_configs={module.name: {"source": "bazqux"}})
+
+        assert module.run(context)[0].value == "bazqux"
+        assert module.run(RagContext(query="foo"))[0].value == "foobar"
+        assert load_spy.call_count == 2
+
+    def test_run_with_cache_ttl(self, mocker, loader, vector_store_driver):
+        load_spy = mocker.spy(loader, "load")
+        delete_vector = mocker.patch.object(LocalVectorStoreDriver, "delete_vector")
+        module = TextLoaderRetrievalRagModule(
+            loader=loader, vector_store_driver=vector_store_driver, source="foobar", cache_ttl=0
+        )
+
+        module.run(RagContext(query="foo"))
+        module.run(RagContext(query="foo"))
+
+        assert load_spy.call_count == 2
+        delete_vector.assert_called_once_with(vector_store_driver.load_entries()[0].id)
+
+    def test_run_with_cache_ttl_reloads_deleted_entries(self, mocker, loader, embedding_driver):
+        entry_cache = LruCache()
+        vector_store_driver = LocalVectorStoreDriver(embedding_driver=embedding_driver, entry_cache=entry_cache)
+
+        def delete_vector(vector_id):
+            assert not module._sources_lock.locked()
+
+            vector_store_driver.entries = {
+                key: entry for key, entry in vector_store_driver.entries.items() if entry.id != vector_id
+            }
+
+        mocker.patch.object(LocalVectorStoreDriver, "delete_vector", side_effect=delete_vector)
+        module = TextLoaderRetrievalRagModule(
+            loader=loader, vector_store_driver=vector_store_driver, source="foobar", cache_ttl=0
+        )
+
+        assert module.run(RagContext(query="foo"))[0].value == "foobar"
+        (entry,) = vector_store_driver.load_entries()
+
+        assert module.run(RagContext(query="foo"))[0].value == "foobar"
+        assert len(vector_store_driver.load_entries()) == 1
+        assert (entry.namespace, entry.id) not in entry_cache
+
+    def test_run_with_cache_ttl_without_deletion(self, mocker, loader, vector_store_driver):
+        mocker.patch.object(loader, "load", side_effect=[[TextArtifact("foo")], [TextArtifact("bar")]])
+        module = TextLoaderRetrievalRagModule(
+            loader=loader, vector_store_driver=vector_store_driver, source="foobar", cache_ttl=0
+        )
+
+        assert [artifact.value for artifact in module.run(RagContext(query="foo"))] == ["foo"]
+        assert [artifact.value for artifact in module.run(RagContext(query="foo"))] == ["bar"]
+        assert len({entry.namespace for entry in vector_store_driver.load_entries()}) == 2
+
+    def test_run_with_etag_fn(self, mocker, loader, vector_store_driver):
+        etags = iter(["1", "1", "2"])
+        load_spy = mocker.spy(loader, "load")
+        module = TextLoaderRetrievalRagModule(
+            loader=loader, vector_store_driver=vector_store_driver, source="foobar", etag_fn=lambda _: next(etags)
+        )
+
+        namespaces = [module.load_source("foobar") for _ in range(3)]
+
+        assert namespaces[0] == namespaces[1]
+        assert namespaces[1] != namespaces[2]
+        assert load_spy.call_count == 2
+
+    def test_load_source_deduplicates_concurrent_loads(self, mocker, loader, vector_store_driver):
+        load = loader.load
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_load(source):
+            started.set()
+            release.wait()
+
+            return load(source)
+
+        load_mock = mocker.patch.object(loader, "load", side_effect=slow_load)
+        module = TextLoaderRetrievalRagModule(loader=loader, vector_store_driver=vector_store_driver, source="foobar")
+
+        with ThreadPoolExecutor() as executor:
+            first = executor.submit(module.load_source, "foobar")
+            started.wait()
+            others = [executor.submit(module.load_source, "foobar") for _ in range(4)]
+            release.set()
+
+            namespaces = {future.result() for future in [first, *others]}
+
+        assert namespaces == {loader.to_key("foobar")}
+        assert load_mock.call_count == 1
+
+    def test_load_source_failure(self, mocker, loader, vector_store_driver):
+        mocker.patch.object(loader, "load", side_effect=[Exception("failed"), [TextArtifact("foobar")]])
+        module = TextLoaderRetrievalRagModule(loader=loader, vector_store_driver=vector_store_driver, source="foobar")
+
+        with pytest.raises(Exception, match="failed"):
+            module.load_source("foobar")
+
+        assert module.load_source("foobar") == loader.to_key("foobar")
+
+    def test_clear_sources(self, mocker, loader, vector_store_driver):
+        delete_vector = mocker.patch.object(LocalVectorStoreDriver, "delete_vector")
+        module = TextLoaderRetrievalRagModule(loader=loader, vector_store_driver=vector_store_driver, source="foobar")
+
+        module.load_source("foobar")
+        module.clear_sources()
+
+        assert delete_vector.call_count == 1
@@ -6,6 +6,7 @@ from griptape.artifacts.base_artifact import BaseArtifact
 from griptape.events import (
     BaseEvent,
     CompletionChunkEvent,
+    EventBus,
     FinishActionsSubtaskEvent,
     FinishPromptEvent,
     FinishStructureRunEvent,
@@ -28,6 +29,13 @@ class TestBaseEvent:
     def test_to_dict(self):
         assert "timestamp" in MockEvent().to_dict()
 
+    def test_structure_id(self):
+        assert MockEvent().structure_id is None
+        assert MockEvent(structure_id="foo").structure_id == "foo"
+
+        with EventBus.structure_scope("foo"), EventBus.structure_scope("bar"):
+            assert MockEvent().structure_id == "bar"
+
     def test_start_prompt_event_from_dict(self):
         dict_value = {
             "type": "StartPromptEvent",
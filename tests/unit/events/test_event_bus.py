@@ -1,6 +1,6 @@
 from unittest.mock import Mock
 
-from griptape.events import EventBus, EventListener
+from griptape.events import CompletionChunkEvent, EventBus, EventListener
 from tests.mocks.mock_event import MockEvent
 
 
@@ -48,3 +48,147 @@ class TestEventBus:
 
         # Then
         mock_handler.assert_called_once_with(mock_event)
+
+    def test_publish_event_routes_by_type(self):
+        mock_handler = Mock()
+        typed_handler = Mock()
+        EventBus.add_event_listeners(
+            [EventListener(handler=mock_handler), EventListener(handler=typed_handler, event_types=[MockEvent])]
+        )
+
+        EventBus.publish_event(MockEvent())
+        EventBus.publish_event(CompletionChunkEvent(token="foo"))
+
+        assert mock_handler.call_count == 2
+        assert typed_handler.call_count == 1
+        assert len(EventBus._routes[MockEvent]) == 2
+        assert len(EventBus._routes[CompletionChunkEvent]) == 1
+
+    def test_routes_reset_on_change(self):
+        mock_handler = Mock()
+        EventBus.publish_event(MockEvent())
+        listener = EventBus.add_event_listener(EventListener(handler=mock_handler))
+
+        EventBus.publish_event(MockEvent())
+        EventBus.remove_event_listener(listener)
+        EventBus.publish_event(MockEvent())
+
+        mock_handler.assert_called_once()
+
+    def test_refresh_routes(self):
+        mock_handler = Mock()
+        listener = EventBus.add_event_listener(EventListener(handler=mock_handler, event_types=[MockEvent]))
+        EventBus.publish_event(CompletionChunkEvent(token="foo"))
+
+        listener.event_types = [CompletionChunkEvent]
+        EventBus.refresh_routes()
+        EventBus.publish_event(CompletionChunkEvent(token="foo"))
+
+        mock_handler.assert_called_once()
+
+    def test_drain(self):
+        mock_handler = Mock()
+        EventBus.add_event_listener(EventListener(handler=mock_handler, asynchronous=True))
+
+        EventBus.publish_event(MockEvent())
+
+        assert EventBus.drain(timeout=5)
+        mock_handler.assert_called_once()
+
+    def test_structure_scope(self):
+        assert EventBus.structure_id is None
+
+        with EventBus.structure_scope("foo"):
+            assert EventBus.structure_id == "foo"
+
+            with EventBus.structure_scope("bar"):
+                assert EventBus.structure_id == "bar"
+
+            assert EventBus.structure_id == "foo"
+
+        assert EventBus.structure_id is None
+
+    def test_publish_event_to_scoped_event_listeners(self):
+        mock_handler = Mock()
+        foo_handler = Mock()
+        bar_handler = Mock()
+        EventBus.add_event_listeners(
+            [
+                EventListener(handler=mock_handler),
+                EventListener(handler=foo_handler, structure_id="foo"),
+                EventListener(handler=bar_handler, structure_id="bar"),
+            ]
+        )
+
+        EventBus.publish_event(MockEvent())
+        with EventBus.structure_scope("foo"):
+            EventBus.publish_event(MockEvent())
+        with EventBus.structure_scope("baz"):
+            EventBus.publish_event(MockEvent())
+
+        assert mock_handler.call_count == 3
+        assert foo_handler.call_count == 1
+        bar_handler.assert_not_called()
+
+    def test_publish_event_to_parent_scoped_event_listeners(self):
+        foo_handler = Mock()
+        bar_handler = Mock()
+        EventBus.add_event_listeners(
+            [
+                EventListener(handler=foo_handler, structure_id="foo"),
+                EventListener(handler=bar_handler, structure_id="bar"),
+            ]
+        )
+
+        with EventBus.structure_scope("foo"), EventBus.structure_scope("bar"):
+            EventBus.publish_event(MockEvent())
+        with EventBus.structure_scope("foo"):
+            EventBus.publish_event(MockEvent())
+
+        assert foo_handler.call_count == 2
+        assert bar_handler.call_count == 1
+
+    def test_publish_event_with_structure_id_outside_scope(self):
+        foo_handler = Mock()
+        EventBus.add_event_listener(EventListener(handler=foo_handler, structure_id="foo"))
+
+        EventBus.publish_event(MockEvent(structure_id="foo"))
+
+        foo_handler.assert_called_once()
+
+    def test_publish_event_to_scoped_event_listeners_routes_by_type(self):
+        foo_handler = Mock()
+        EventBus.add_event_listener(EventListener(handler=foo_handler, structure_id="foo", event_types=[MockEvent]))
+
+        with EventBus.structure_scope("foo"):
+            EventBus.publish_event(MockEvent())
+            EventBus.publish_event(CompletionChunkEvent(token="foo"))
+
+        foo_handler.assert_called_once()
+        assert EventBus._scoped_event_listeners["foo"][1] == {
+            MockEvent: EventBus.event_listeners,
+            CompletionChunkEvent: [],
+        }
+
+    def test_add_and_remove_scoped_event_listeners(self):
+        listener = EventListener(structure_id="foo")
+        other_listener = EventListener(structure_id="foo")
+        EventBus.add_event_listeners([EventListener(), listener, other_listener])
+
+        assert len(EventBus.event_listeners) == 3
+
+        EventBus.remove_event_listener(listener)
+
+        assert EventBus.event_listeners[1:] == [other_listener]
+
+        EventBus.remove_event_listener(other_listener)
+
+        assert len(EventBus.event_listeners) == 1
+        assert EventBus._scoped_event_listeners == {}
+
+    def test_clear_scoped_event_listeners(self):
+        EventBus.add_event_listeners([EventListener(), EventListener(structure_id="foo")])
+
+        EventBus.clear_event_listeners()
+
+        assert EventBus.event_listeners == []
@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import Mock
 
 import pytest
@@ -135,3 +136,152 @@ class TestEventListener:
         event_listener.publish_event(mock_event)
 
         mock_event_listener_driver.publish_event.assert_called_once_with({"event": mock_event.to_dict()}, flush=False)
+
+    def test_publish_event_asynchronous(self):
+        mock_event_listener_driver = Mock()
+        thread_names = []
+
+        def event_handler(event: BaseEvent):
+            thread_names.append(threading.current_thread().name)
+
+            return {"event": event.to_dict()}
+
+        mock_event = MockEvent()
+        event_listener = EventListener(event_handler, driver=mock_event_listener_driver, asynchronous=True)
+        event_listener.publish_event(mock_event, flush=True)
+
+        assert event_listener.drain(timeout=5)
+        assert thread_names == ["EventListenerWorker"]
+        mock_event_listener_driver.publish_event.assert_called_once_with({"event": mock_event.to_dict()}, flush=True)
+        assert event_listener.metrics.handled_count == 1
+        assert event_listener.metrics.max_queue_depth == 1
+        assert event_listener.metrics.queue_depth == 0
+        assert event_listener.metrics.max_latency > 0
+        assert event_listener.metrics.average_latency == event_listener.metrics.total_latency
+
+        event_listener.close()
+
+    @pytest.fixture()
+    def blocked_event_listener(self, request):
+        # The worker handles the first Event and then waits for `unblock` before handling the queued Events.
+        unblock = threading.Event()
+        handled = threading.Event()
+        events = []
+
+        def event_handler(event: BaseEvent) -> None:
+            events.append(event)
+            handled.set()
+            unblock.wait(timeout=5)
+
+        event_listener = EventListener(
+            event_handler, asynchronous=True, max_queue_size=2, overflow_policy=request.param
+        )
+        event_listener.publish_event(CompletionChunkEvent(token="a"))
+        assert handled.wait(timeout=5)
+
+        yield event_listener, events, unblock
+
+        unblock.set()
+        event_listener.close()
+
+    @pytest.mark.parametrize("blocked_event_listener", ["drop_oldest"], indirect=True)
+    def test_overflow_drop_oldest(self, blocked_event_listener):
+        event_listener, events, unblock = blocked_event_listener
+
+        for token in ["b", "c", "d"]:
+            event_listener.publish_event(CompletionChunkEvent(token=token))
+        unblock.set()
+
+        assert event_listener.drain(timeout=5)
+        assert [event.token for event in events] == ["a", "c", "d"]
+        assert event_listener.metrics.dropped_count == 1
+        assert event_listener.metrics.max_queue_depth == 2
+
+    @pytest.mark.parametrize("blocked_event_listener", ["coalesce"], indirect=True)
+    def test_overflow_coalesce(self, blocked_event_listener):
+        event_listener, events, unblock = blocked_event_listener
+
+        for token in ["b", "c", "d", "e"]:
+            event_listener.publish_event(CompletionChunkEvent(token=token))
+        unblock.set()
+
+        assert event_listener.drain(timeout=5)
+        assert [event.token for event in events] == ["a", "b", "cde"]
+        assert event_listener.metrics.coalesced_count == 2
+        assert event_listener.metrics.handled_count == 3
+
+    @pytest.mark.parametrize("blocked_event_listener", ["coalesce"], indirect=True)
+    def test_overflow_coalesce_blocks_other_events(self, blocked_event_listener):
+        event_listener, events, unblock = blocked_event_listener
+
+        for token in ["b", "c"]:
+            event_listener.publish_event(CompletionChunkEvent(token=token))
+        threading.Timer(0.1, unblock.set).start()
+        event_listener.publish_event(MockEvent())
+
+        assert event_listener.drain(timeout=5)
+        assert [type(event) for event in events] == [CompletionChunkEvent] * 3 + [MockEvent]
+        assert event_listener.metrics.coalesced_count == 0
+
+    @pytest.mark.parametrize("blocked_event_listener", ["block"], indirect=True)
+    def test_overflow_block(self, blocked_event_listener):
+        event_listener, events, unblock = blocked_event_listener
+
+        for token in ["b", "c"]:
+            event_listener.publish_event(CompletionChunkEvent(token=token))
+        threading.Timer(0.1, unblock.set).start()
+        event_listener.publish_event(CompletionChunkEvent(token="d"))
+
+        assert event_listener.drain(timeout=5)
+        assert [event.token for event in events] == ["a", "b", "c", "d"]
+        assert event_listener.metrics.dropped_count == 0
+
+    def test_overflow_block_reentrant(self):
+        events = []
+
+        def event_handler(event: BaseEvent) -> None:
+            events.append(event)
+            if isinstance(event, CompletionChunkEvent) and event.token == "a":
+                event_listener.publish_event(CompletionChunkEvent(token="b"))
+                event_listener.publish_event(CompletionChunkEvent(token="c"))
+
+        event_listener = EventListener(event_handler, asynchronous=True, max_queue_size=1, overflow_policy="block")
+        event_listener.publish_event(CompletionChunkEvent(token="a"))
+
+        assert event_listener.drain(timeout=5)
+        assert [event.token for event in events] == ["a", "c", "b"]
+
+        event_listener.close()
+
+    def test_asynchronous_handler_error(self):
+        def event_handler(_: BaseEvent) -> None:
+            raise ValueError("error")
+
+        event_listener = EventListener(event_handler, asynchronous=True)
+        event_listener.publish_event(MockEvent())
+
+        assert event_listener.drain(timeout=5)
+        assert event_listener.metrics.handled_count == 0
+
+        event_listener.close()
+
+    def test_close(self):
+        mock_handler = Mock()
+        event_listener = EventListener(mock_handler, asynchronous=True)
+        event_listener.publish_event(MockEvent())
+
+        event_listener.close()
+
+        assert event_listener._worker is None
+        mock_handler.assert_called_once()
+
+        event_listener.publish_event(MockEvent())
+
+        assert event_listener.drain(timeout=5)
+        assert mock_handler.call_count == 2
+
+        event_listener.close()
+
+    def test_validate_max_queue_size(self):
+        with pytest.raises(ValueError, match="max_queue_size must be greater than 0."):
+            EventListener(max_queue_size=0)
@@ -45,3 +45,11 @@ class TestTextLoader:
         else:
             assert artifact.encoding == loader.encoding
             assert artifact.to_text().startswith("foobar foobar foobar")
+
+    def test_stream_collection(self, loader, create_source):
+        sources = [create_source(resource_path) for resource_path in ["test.txt", "foobar-many.txt"]]
+
+        collection = dict(loader.stream_collection(sources))
+
+        assert collection.keys() == {loader.to_key(source) for source in sources}
+        assert all(isinstance(artifact, BlobArtifact) for artifact in collection.values())
@@ -1,3 +1,5 @@
+from unittest.mock import Mock
+
 import pytest
 
 from griptape.loaders import WebLoader
@@ -8,8 +10,11 @@ MAX_TOKENS = 50
 
 class TestWebLoader:
     @pytest.fixture(autouse=True)
-    def _mock_trafilatura_fetch_url(self, mocker):
-        mocker.patch("trafilatura.fetch_url", return_value="<html>foobar</html>")
+    def mock_get(self, mocker):
+        return mocker.patch(
+            "requests.Session.get",
+            return_value=Mock(status_code=200, ok=True, content=b"<html>foobar</html>", headers={}),
+        )
 
     @pytest.fixture()
     def loader(self):
@@ -23,8 +28,8 @@ class TestWebLoader:
 
         assert artifacts[0].embedding == [0, 1]
 
-    def test_load_exception(self, mocker, loader):
-        mocker.patch("trafilatura.fetch_url", side_effect=Exception("error"))
+    def test_load_exception(self, mock_get, loader):
+        mock_get.side_effect = Exception("error")
         source = "https://github.com/griptape-ai/griptape"
         with pytest.raises(Exception, match="error"):
             loader.load(source)
@@ -42,6 +47,20 @@ class TestWebLoader:
 
         assert list(artifacts.values())[0][0].embedding == [0, 1]
 
+    def test_stream_collection(self, loader, mock_get):
+        sources = ["https://github.com/griptape-ai/griptape", "https://github.com/griptape-ai/griptape-docs"]
+
+        artifacts = dict(loader.stream_collection(sources))
+
+        assert artifacts.keys() == {loader.to_key(source) for source in sources}
+        assert all("foobar" in artifact_list[0].value.lower() for artifact_list in artifacts.values())
+
+    def test_stream_collection_exception(self, loader, mock_get):
+        mock_get.side_effect = Exception("error")
+
+        with pytest.raises(Exception, match="error"):
+            list(loader.stream_collection(["https://github.com/griptape-ai/griptape"]))
+
     def test_empty_page_string_response(self, loader, mocker):
         mocker.patch("trafilatura.extract", return_value="")
 
@@ -177,3 +177,61 @@ class TestConversationMemory:
         assert prompt_stack.messages[2].content[0].artifact.value == "bar2"
         assert prompt_stack.messages[-2].content[0].artifact.value == "foo"
         assert prompt_stack.messages[-1].content[0].artifact.value == "bar"
+
+    def test_add_to_prompt_stack_autopruning_matches_linear_pruning(self):
+        runs = [Run(input=TextArtifact(f"foo{i}" * (i % 7 + 1)), output=TextArtifact(f"bar{i}")) for i in range(50)]
+        memory = ConversationMemory(autoprune=True, runs=runs)
+
+        for max_input_tokens in [0, 10, 50, 333, 1000, 5000]:
+            prompt_driver = MockPromptDriver(tokenizer=MockTokenizer(model="foo", max_input_tokens=max_input_tokens))
+            prompt_stack = PromptStack()
+            prompt_stack.add_system_message("fizz")
+            expected = len(runs)
+
+            while expected > 0:
+                temp_stack = PromptStack(messages=[*prompt_stack.messages, *memory.to_prompt_stack(expected).messages])
+
+                if (
+                    prompt_driver.tokenizer.count_input_tokens_left(prompt_driver.prompt_stack_to_string(temp_stack))
+                    > 0
+                ):
+                    break
+
+                expected -= 1
+
+            memory.add_to_prompt_stack(prompt_driver, prompt_stack)
+
+            assert len(prompt_stack.messages) == 1 + expected * 2
+            assert memory.last_fit_run_count == expected
+            assert memory.last_pruned_run_count == len(runs) - expected
+
+    def test_add_to_prompt_stack_autopruning_caches_run_token_counts(self, mocker):
+        prompt_driver = MockPromptDriver(tokenizer=MockTokenizer(model="foo", max_input_tokens=200))
+        count_tokens = mocker.spy(MockTokenizer, "count_tokens")
+        memory = ConversationMemory(
+            autoprune=True,
+            runs=[Run(input=TextArtifact(f"foo{i}"), output=TextArtifact(f"bar{i}")) for i in range(100)],
+        )
+
+        memory.add_to_prompt_stack(prompt_driver, PromptStack())
+        first_call_count = count_tokens.call_count
+        memory.add_to_prompt_stack(prompt_driver, PromptStack())
+
+        assert all(run.token_counts for run in memory.runs[-memory.last_fit_run_count :])
+        assert count_tokens.call_count - first_call_count < first_call_count
+        assert count_tokens.call_count - first_call_count <= 10
+        assert memory.last_pruned_run_count > 0
+
+    def test_add_to_prompt_stack_autopruning_counts_tokens_once_when_runs_fit(self, mocker):
+        prompt_driver = MockPromptDriver()
+        count_tokens = mocker.spy(MockTokenizer, "count_tokens")
+        memory = ConversationMemory(
+            autoprune=True,
+            runs=[Run(input=TextArtifact(f"foo{i}"), output=TextArtifact(f"bar{i}")) for i in range(10)],
+        )
+
+        memory.add_to_prompt_stack(prompt_driver, PromptStack())
+
+        assert count_tokens.call_count == 1
+        assert memory.last_fit_run_count == 10
+        assert memory.last_pruned_run_count == 0
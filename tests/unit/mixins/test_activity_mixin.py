@@ -1,3 +1,5 @@
+import inspect
+
 import pytest
 from schema import Literal, Optional, Schema
 
@@ -73,6 +75,30 @@ class TestActivityMixin:
 
         assert len(tool.activities()) > 0
 
+    def test_activities_cache(self, tool, mocker):
+        spy = mocker.spy(inspect, "getmembers")
+
+        assert tool.activities() == tool.activities()
+        assert spy.call_count == 1
+
+        tool.allowlist = ["test"]
+
+        assert [activity.name for activity in tool.activities()] == ["test"]
+        assert spy.call_count == 2
+
+    def test_activity_schema_cache(self, tool):
+        activity_schema = tool.activity_schema(tool.test)
+
+        assert tool.activity_schema(tool.test) is activity_schema
+
+        tool.extra_schema_properties = {"test": {Literal("new_property"): str}}
+
+        assert tool.activity_schema(tool.test) is not activity_schema
+        assert (
+            "new_property"
+            in tool.activity_schema(tool.test).json_schema("InputSchema")["properties"]["values"]["properties"]
+        )
+
     def test_extra_schema_properties(self):
         tool = MockTool(
             test_field="hello",
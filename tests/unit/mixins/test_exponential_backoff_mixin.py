@@ -0,0 +1,80 @@
+from unittest.mock import Mock
+
+import pytest
+
+from griptape.common import Message, PromptStack
+from griptape.utils import RateLimiter, RateLimiters
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+from tests.mocks.mock_failing_prompt_driver import MockFailingPromptDriver
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+
+
+class TestExponentialBackoffMixin:
+    @pytest.fixture(autouse=True)
+    def _clear_rate_limiters(self):
+        yield
+
+        RateLimiters.clear_rate_limiters()
+
+    def test_get_rate_limiter(self):
+        rate_limiter = RateLimiter()
+        driver_rate_limiter = RateLimiter()
+
+        RateLimiters.set_rate_limiter("MockPromptDriver", rate_limiter, model="mock-model")
+
+        assert MockPromptDriver(model="mock-model").get_rate_limiter() is rate_limiter
+        assert MockPromptDriver(model="other-model").get_rate_limiter() is None
+        assert MockPromptDriver(rate_limiter=driver_rate_limiter).get_rate_limiter() is driver_rate_limiter
+
+    def test_prompt_driver_rate_limiter(self):
+        rate_limiter = RateLimiter(requests_per_minute=10, tokens_per_minute=10_000)
+        driver = MockPromptDriver(rate_limiter=rate_limiter, max_tokens=100)
+
+        driver.run(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)]))
+
+        assert rate_limiter.metrics.request_count == 1
+        assert rate_limiter.metrics.in_flight_count == 0
+        assert rate_limiter.metrics.token_count == 200
+
+    def test_prompt_driver_rate_limiter_with_stream(self):
+        rate_limiter = RateLimiter(requests_per_minute=10)
+        driver = MockPromptDriver(rate_limiter=rate_limiter, stream=True)
+
+        driver.run(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)]))
+
+        assert rate_limiter.metrics.request_count == 1
+        assert rate_limiter.metrics.in_flight_count == 0
+
+    def test_prompt_driver_rate_limiter_with_failures(self):
+        rate_limiter = RateLimiter()
+        driver = MockFailingPromptDriver(
+            max_failures=2, max_attempts=3, min_retry_delay=0, max_retry_delay=0, rate_limiter=rate_limiter
+        )
+
+        driver.run(PromptStack(messages=[Message("foo", role=Message.USER_ROLE)]))
+
+        assert rate_limiter.metrics.request_count == 3
+        assert rate_limiter.metrics.in_flight_count == 0
+
+    def test_embedding_driver_rate_limiter(self):
+        rate_limiter = RateLimiter(requests_per_minute=10)
+        driver = MockEmbeddingDriver(rate_limiter=rate_limiter)
+
+        driver.embed_string("foo")
+        driver.embed_strings(["foo", "bar"])
+
+        assert rate_limiter.metrics.request_count == 3
+
+    def test_retrying_honors_retry_after(self):
+        driver = MockPromptDriver(min_retry_delay=10, max_retry_delay=10)
+        error = Exception("rate limited")
+        error.response = Mock(headers={"retry-after": "0.25"})  # pyright: ignore[reportAttributeAccessIssue]
+        retry_state = Mock(outcome=Mock(exception=Mock(return_value=error)))
+
+        assert driver.retrying().wait(retry_state) == 0.25
+
+    def test_retrying_without_retry_after(self):
+        driver = MockPromptDriver(min_retry_delay=3, max_retry_delay=10)
+        retry_state = Mock(attempt_number=1, outcome=Mock(exception=Mock(return_value=Exception())))
+
+        assert driver.retrying().wait(retry_state) == 3
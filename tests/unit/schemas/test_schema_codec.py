@@ -0,0 +1,102 @@
+import json
+
+import pytest
+from marshmallow import ValidationError
+
+from griptape.artifacts import (
+    ActionArtifact,
+    BlobArtifact,
+    ErrorArtifact,
+    ImageArtifact,
+    JsonArtifact,
+    ListArtifact,
+    TextArtifact,
+)
+from griptape.common import PromptStack, Reference, ToolAction
+from griptape.memory.structure import Run
+from griptape.schemas import BaseSchema, SchemaCodec
+from tests.mocks.mock_serializable import MockSerializable
+
+
+def build_prompt_stack() -> PromptStack:
+    prompt_stack = PromptStack()
+    prompt_stack.add_system_message("system")
+    prompt_stack.add_user_message(ListArtifact([TextArtifact("foo"), TextArtifact("bar")]))
+    prompt_stack.add_assistant_message(TextArtifact("baz", reference=Reference(title="title", authors=["author"])))
+
+    return prompt_stack
+
+
+class TestSchemaCodec:
+    @pytest.fixture(
+        params=[
+            lambda: TextArtifact("foo", meta={"bar": [1, None, {"baz": 1.5}]}),
+            lambda: TextArtifact("foo", reference=Reference(title="title", authors=["author"], year="2024")),
+            lambda: ErrorArtifact("foo"),
+            lambda: JsonArtifact({"foo": [1, None]}),
+            lambda: BlobArtifact(b"\x00\x01foo"),
+            lambda: ImageArtifact(b"foo", width=100, height=200, format="png"),
+            lambda: ListArtifact([TextArtifact("foo"), ErrorArtifact("bar")]),
+            lambda: ActionArtifact(ToolAction(tag="foo", name="bar", path="baz", input={"values": {"a": 1}})),
+            lambda: Run(input=TextArtifact("foo"), output=TextArtifact("bar")),
+            lambda: MockSerializable(bar="bar", baz=[1, 2], nested=MockSerializable.NestedMockSerializable()),
+            build_prompt_stack,
+        ]
+    )
+    def obj(self, request):
+        return request.param()
+
+    def test_from_attrs_cls(self):
+        codec = SchemaCodec.from_attrs_cls(TextArtifact)
+
+        assert codec is SchemaCodec.from_attrs_cls(TextArtifact)
+        assert codec.schema_class is BaseSchema.from_attrs_cls(TextArtifact)
+
+    def test_dump(self, obj):
+        expected = BaseSchema.from_attrs_cls(obj.__class__)().dump(obj)
+
+        assert json.dumps(SchemaCodec.from_attrs_cls(obj.__class__).dump(obj)) == json.dumps(expected)
+
+    def test_load(self, obj):
+        schema = BaseSchema.from_attrs_cls(obj.__class__)()
+        data = json.loads(json.dumps(schema.dump(obj)))
+        loaded = SchemaCodec.from_attrs_cls(obj.__class__).load(data)
+
+        assert type(loaded) is type(obj)
+        assert schema.dump(loaded) == schema.dump(schema.load(data))
+
+    def test_dump_falls_back_to_schema(self):
+        codec = SchemaCodec.from_attrs_cls(MockSerializable)
+
+        assert codec.dump(MockSerializable(foo=1, baz=(1, 2))) == {  # pyright: ignore[reportArgumentType]
+            "type": "MockSerializable",
+            "foo": "1",
+            "bar": None,
+            "baz": [1, 2],
+            "nested": None,
+        }
+
+    def test_load_falls_back_to_schema(self):
+        codec = SchemaCodec.from_attrs_cls(MockSerializable)
+
+        assert codec.load({"foo": "foo", "baz": ["1", 2]}).baz == [1, 2]
+
+        with pytest.raises(ValidationError):
+            codec.load({"foo": None})
+        with pytest.raises(ValidationError):
+            codec.load({"foo": 1})
+        with pytest.raises(ValidationError):
+            codec.load({"nested": {"foo": ["bar"]}})
+
+    def test_load_falls_back_to_schema_errors(self, mocker):
+        codec = SchemaCodec.from_attrs_cls(MockSerializable)
+        schema_load = mocker.patch.object(codec.schema, "load", side_effect=ValidationError("foo"))
+
+        with pytest.raises(ValidationError):
+            codec.load({"foo": "foo", "unknown": "foo"})
+
+        schema_load.assert_called_once_with({"foo": "foo", "unknown": "foo"})
+
+    def test_load_includes_unknown_keys(self):
+        with pytest.raises(TypeError):
+            SchemaCodec.from_attrs_cls(MockSerializable).load({"unknown": "foo"})
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from griptape.memory import TaskMemory
@@ -6,6 +8,7 @@ from griptape.memory.task.storage import TextArtifactStorage
 from griptape.rules import Rule, Ruleset
 from griptape.structures import Agent
 from griptape.tasks import BaseTask, PromptTask, ToolkitTask
+from griptape.tools import BaseTool
 from tests.mocks.mock_prompt_driver import MockPromptDriver
 from tests.mocks.mock_tool.tool import MockTool
 
@@ -191,6 +194,18 @@ class TestAgent:
         assert "mock output" in result.output_task.output.to_text()
         assert task.state == BaseTask.State.FINISHED
 
+    def test_arun(self):
+        task = PromptTask("test")
+        agent = Agent(prompt_driver=MockPromptDriver())
+        agent.add_task(task)
+
+        result = asyncio.run(agent.arun("foo"))
+
+        assert result is agent
+        assert task.output.to_text() == "mock output"
+        assert task.state == BaseTask.State.FINISHED
+        assert len(agent.conversation_memory.runs) == 1
+
     def test_run_with_args(self):
         task = PromptTask("{{ args[0] }}-{{ args[1] }}")
         agent = Agent(prompt_driver=MockPromptDriver())
@@ -237,3 +252,34 @@ class TestAgent:
     def test_fail_fast(self):
         with pytest.raises(ValueError):
             Agent(prompt_driver=MockPromptDriver(), fail_fast=True)
+
+    def test_run_installs_tools_dependencies(self, tmp_path, mocker):
+        requirements_file = tmp_path / "requirements.txt"
+        other_requirements_file = tmp_path / "other_requirements.txt"
+        requirements_file.write_text("griptape-missing-package==1.0\n")
+        other_requirements_file.write_text("griptape-other-missing-package\n")
+        mocker.patch.object(BaseTool, "_installed_requirements", set())
+        mocker.patch.object(
+            MockTool,
+            "requirements_path",
+            new=property(lambda self: str(other_requirements_file if self.name == "Other" else requirements_file)),
+        )
+        mock_subprocess_run = mocker.patch("subprocess.run", return_value=mocker.Mock(returncode=0))
+        stamp_directory = str(tmp_path / "stamps")
+        tools = [
+            MockTool(install_dependencies_on_init=False, dependencies_stamp_directory=stamp_directory),
+            MockTool(name="Other", install_dependencies_on_init=False, dependencies_stamp_directory=stamp_directory),
+        ]
+        agent = Agent(prompt_driver=MockPromptDriver(), tools=tools)
+
+        agent.run("hello")
+        agent.run("hello")
+
+        mock_subprocess_run.assert_called_once()
+        assert mock_subprocess_run.call_args.args[0][4:] == [
+            "-r",
+            str(requirements_file),
+            "-r",
+            str(other_requirements_file),
+            "-U",
+        ]
@@ -1,3 +1,4 @@
+import asyncio
 import time
 
 import pytest
@@ -360,6 +361,27 @@ class TestPipeline:
 
         assert pipeline.output is not None
 
+    def test_arun(self):
+        first_task = PromptTask("test1")
+        second_task = PromptTask("test2")
+        pipeline = Pipeline(tasks=[first_task, second_task])
+
+        result = asyncio.run(pipeline.arun())
+
+        assert result is pipeline
+        assert first_task.state == BaseTask.State.FINISHED
+        assert second_task.state == BaseTask.State.FINISHED
+        assert pipeline.output.to_text() == "mock output"
+        assert len(pipeline.conversation_memory.runs) == 1
+
+    def test_arun_with_error_artifact(self, error_artifact_task, waiting_task):
+        end_task = PromptTask("end")
+        pipeline = Pipeline(tasks=[waiting_task, error_artifact_task, end_task])
+        asyncio.run(pipeline.arun())
+
+        assert pipeline.output is None
+        assert end_task.state == BaseTask.State.PENDING
+
     def test_add_duplicate_task(self):
         task = PromptTask("test")
         pipeline = Pipeline()
@@ -1,8 +1,11 @@
+import asyncio
+import threading
 import time
 
 import pytest
 
 from griptape.artifacts import ErrorArtifact, TextArtifact
+from griptape.events import EventBus, EventListener
 from griptape.memory.structure import ConversationMemory
 from griptape.rules import Rule, Ruleset
 from griptape.structures import Workflow
@@ -762,6 +765,173 @@ class TestWorkflow:
 
         assert workflow.output is not None
 
+    def test_run_schedules_children_when_parents_finish(self):
+        events = []
+
+        def fn(name, delay):
+            def run(task):
+                events.append(f"start {name}")
+                time.sleep(delay)
+                events.append(f"finish {name}")
+
+                return TextArtifact(name)
+
+            return run
+
+        slow_task = CodeExecutionTask(run_fn=fn("slow", 0.5), id="slow")
+        fast_task = CodeExecutionTask(run_fn=fn("fast", 0), id="fast")
+        child_task = CodeExecutionTask(run_fn=fn("child", 0), id="child", parent_ids=["fast"])
+        Workflow(tasks=[slow_task, fast_task, child_task]).run()
+
+        # The child of the fast task doesn't wait for the slow task, which has no relationship with it.
+        assert events.index("finish child") < events.index("finish slow")
+
+    def test_run_with_max_concurrent_tasks(self):
+        lock = threading.Lock()
+        running_counts = []
+        running_count = 0
+
+        def fn(task):
+            nonlocal running_count
+
+            with lock:
+                running_count += 1
+                running_counts.append(running_count)
+            time.sleep(0.05)
+            with lock:
+                running_count -= 1
+
+            return TextArtifact("done")
+
+        tasks = [CodeExecutionTask(run_fn=fn) for _ in range(8)]
+        workflow = Workflow(tasks=tasks, max_concurrent_tasks=2)
+        workflow.run()
+
+        assert all(task.is_finished() for task in tasks)
+        assert max(running_counts) == 2
+
+    def test_arun(self):
+        task1 = PromptTask("test1")
+        task2 = PromptTask("test2")
+        task3 = PromptTask("test3")
+        end_task = PromptTask("end")
+        end_task.add_parents([task1, task2, task3])
+        workflow = Workflow(tasks=[task1, task2, task3, end_task])
+
+        result = asyncio.run(workflow.arun())
+
+        assert result is workflow
+        assert all(task.state == BaseTask.State.FINISHED for task in workflow.tasks)
+        assert workflow.output.to_text() == "mock output"
+        assert len(workflow.conversation_memory.runs) == 1
+
+    def test_arun_with_max_concurrent_tasks(self):
+        lock = threading.Lock()
+        running_counts = []
+        running_count = 0
+
+        def fn(task):
+            nonlocal running_count
+
+            with lock:
+                running_count += 1
+                running_counts.append(running_count)
+            time.sleep(0.05)
+            with lock:
+                running_count -= 1
+
+            return TextArtifact("done")
+
+        tasks = [CodeExecutionTask(run_fn=fn) for _ in range(8)]
+        workflow = Workflow(tasks=tasks, max_concurrent_tasks=2)
+        asyncio.run(workflow.arun())
+
+        assert all(task.is_finished() for task in tasks)
+        assert max(running_counts) == 2
+
+    def test_arun_with_error_artifact(self, error_artifact_task, waiting_task):
+        end_task = PromptTask("end")
+        end_task.add_parents([error_artifact_task, waiting_task])
+        workflow = Workflow(tasks=[waiting_task, error_artifact_task, end_task])
+        asyncio.run(workflow.arun())
+
+        assert workflow.output is None
+        assert end_task.state == BaseTask.State.PENDING
+
+    def test_run_tags_events_with_structure_id(self):
+        events = []
+        EventBus.add_event_listener(EventListener(handler=events.append))
+        workflow = Workflow(tasks=[PromptTask("test1"), PromptTask("test2")])
+
+        workflow.run()
+        asyncio.run(workflow.arun())
+
+        assert len(events) > 0
+        assert all(event.structure_id == workflow.id for event in events)
+
+    def test_max_concurrent_tasks_validation(self):
+        with pytest.raises(ValueError, match="max_concurrent_tasks must be greater than 0."):
+            Workflow(max_concurrent_tasks=0)
+
+    def test_run_tasks_added_while_running(self):
+        workflow = Workflow()
+        added_task = PromptTask("added")
+
+        def fn(task):
+            workflow.add_task(added_task)
+            added_task.add_parent(task)
+
+            return TextArtifact("done")
+
+        workflow.add_task(CodeExecutionTask(run_fn=fn))
+        workflow.run()
+
+        assert added_task.is_finished()
+
+    def test_order_tasks_cache(self, mocker):
+        task1 = PromptTask("prompt1", id="task1")
+        task2 = PromptTask("prompt2", id="task2")
+        workflow = Workflow(tasks=[task1, task2])
+        spy = mocker.spy(workflow, "to_graph")
+
+        assert workflow.order_tasks() == workflow.order_tasks()
+        assert workflow.input_task == task1
+        assert spy.call_count == 1
+
+        task2.add_child(task1)
+
+        assert workflow.order_tasks() == [task2, task1]
+        assert spy.call_count == 2
+
+        task3 = workflow.add_task(PromptTask("prompt3", id="task3", parent_ids=["task1"]))
+        task1.child_ids.append("task3")
+
+        assert workflow.output_task == task3
+        assert spy.call_count == 3
+
+    def test_find_task_after_tasks_change(self):
+        task1 = PromptTask("prompt1", id="task1")
+        task2 = PromptTask("prompt2", id="task2")
+        workflow = Workflow(tasks=[task1, task2])
+
+        assert workflow.find_task("task2") is task2
+
+        workflow.insert_task([task1], PromptTask("prompt3", id="task3"), [task2])
+        workflow.tasks.remove(task1)
+        replacement_task = PromptTask("prompt4", id="task2")
+        workflow.tasks[workflow.tasks.index(task2)] = replacement_task
+
+        assert workflow.find_task("task2") is replacement_task
+        assert workflow.find_task("task3").id == "task3"
+        assert workflow.try_find_task("task1") is None
+
+    def test_order_tasks_returns_copy(self):
+        workflow = Workflow(tasks=[PromptTask("prompt1"), PromptTask("prompt2")])
+
+        workflow.order_tasks().clear()
+
+        assert len(workflow.order_tasks()) == 2
+
     @staticmethod
     def _validate_topology_1(workflow) -> None:
         assert len(workflow.tasks) == 4
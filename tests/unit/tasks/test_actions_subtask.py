@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 from griptape.artifacts import ActionArtifact, ListArtifact, TextArtifact
@@ -193,3 +194,21 @@ class TestActionsSubtask:
         assert isinstance(subtask.output, ListArtifact)
         assert isinstance(subtask.output.value[0], ErrorArtifact)
         assert subtask.output.value[0].value == "error value"
+
+    def test_aexecute_tool(self):
+        valid_input = (
+            "Thought: need to test\n"
+            'Actions:[{"tag": "foo", "name": "MockTool","path": "test","input": {"values": {"test": "value"}}}, '
+            '{"tag": "bar", "name": "MockTool","path": "test_exception","input": {"values": {"test": "value"}}}]'
+        )
+
+        task = ToolkitTask(tools=[MockTool()])
+        Agent().add_task(task)
+        subtask = task.add_subtask(ActionsSubtask(valid_input))
+        asyncio.run(subtask.aexecute())
+
+        assert isinstance(subtask.output, ListArtifact)
+        assert subtask.output.value[0].value == "ack value"
+        assert subtask.output.value[0].name == "foo output"
+        assert isinstance(subtask.output.value[1], ErrorArtifact)
+        assert subtask.output.value[1].name == "bar output"
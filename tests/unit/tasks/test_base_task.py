@@ -1,8 +1,9 @@
+import asyncio
 from unittest.mock import Mock
 
 import pytest
 
-from griptape.artifacts import TextArtifact
+from griptape.artifacts import ErrorArtifact, TextArtifact
 from griptape.events import EventBus
 from griptape.events.event_listener import EventListener
 from griptape.structures import Agent, Workflow
@@ -152,3 +153,19 @@ class TestBaseTask:
         assert child.id in task.child_ids
         assert task.id in child.parent_ids
         assert added_task == child
+
+    def test_aexecute_publish_events(self, task):
+        output = asyncio.run(task.aexecute())
+
+        assert output.value == "foobar"
+        assert task.is_finished()
+        assert EventBus.event_listeners[0].handler.call_count == 2
+
+    def test_aexecute_error(self, task, mocker):
+        mocker.patch.object(MockTask, "run", side_effect=Exception("error"))
+
+        output = asyncio.run(task.aexecute())
+
+        assert isinstance(output, ErrorArtifact)
+        assert output.value == "error"
+        assert task.is_finished()
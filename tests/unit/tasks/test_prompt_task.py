@@ -1,3 +1,5 @@
+import asyncio
+
 from griptape.artifacts.image_artifact import ImageArtifact
 from griptape.artifacts.list_artifact import ListArtifact
 from griptape.artifacts.text_artifact import TextArtifact
@@ -144,3 +146,12 @@ class TestPromptTask:
         assert task.prompt_stack.messages[1].to_text() == "output"
         assert task.prompt_stack.messages[2].is_user()
         assert task.prompt_stack.messages[2].to_text() == "test value"
+
+    def test_arun(self, mocker):
+        prompt_driver = MockPromptDriver()
+        spy = mocker.spy(prompt_driver, "arun")
+        task = PromptTask("test", prompt_driver=prompt_driver)
+        Pipeline().add_task(task)
+
+        assert asyncio.run(task.arun()).to_text() == "mock output"
+        spy.assert_called_once()
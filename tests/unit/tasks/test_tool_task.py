@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 import pytest
@@ -213,3 +214,13 @@ class TestToolTask:
         Agent().add_task(task)
 
         assert task.actions_schema().json_schema("Actions Schema") == self.TARGET_TOOLS_SCHEMA
+
+    def test_arun(self, agent):
+        task = ToolTask(tool=MockTool())
+
+        agent.add_task(task)
+
+        output = asyncio.run(task.arun())
+
+        assert output.name == "MockTool output"
+        assert output.value == "ack foobar"
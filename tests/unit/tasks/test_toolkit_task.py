@@ -1,7 +1,14 @@
+import asyncio
+
+import pytest
+
 from griptape.artifacts import ErrorArtifact, TextArtifact
 from griptape.common import ToolAction
+from griptape.memory.structure import ConversationMemory, Run
 from griptape.structures import Agent
 from griptape.tasks import ActionsSubtask, PromptTask, ToolkitTask
+from tests.mocks.mock_prompt_driver import MockPromptDriver
+from tests.mocks.mock_tokenizer import MockTokenizer
 from tests.mocks.mock_tool.tool import MockTool
 from tests.utils import defaults
 
@@ -352,3 +359,95 @@ class TestToolkitSubtask:
         Agent().add_task(task)
 
         assert task.actions_schema().json_schema("Actions Schema") == self.TARGET_TOOLS_SCHEMA
+
+    @pytest.mark.parametrize("use_native_tools", [True, False])
+    def test_run_builds_prompt_stack_incrementally(self, use_native_tools):
+        output = 'Actions: [{"tag": "foo", "name": "MockTool", "path": "test", "input": {"values": {"test": "value"}}}]'
+        prompt_stacks = []
+        system_template_calls = []
+        subtask_template_calls = []
+
+        def generate_system_template(task: PromptTask) -> str:
+            system_template_calls.append(task)
+
+            return task.default_system_template_generator(task)
+
+        def generate_assistant_subtask_template(subtask: ActionsSubtask) -> str:
+            subtask_template_calls.append(subtask)
+
+            return task.default_assistant_subtask_template_generator(subtask)
+
+        def mock_output(prompt_stack):
+            prompt_stacks.append(prompt_driver.prompt_stack_to_string(prompt_stack))
+
+            return output
+
+        prompt_driver = MockPromptDriver(mock_output=mock_output, use_native_tools=use_native_tools)
+        task = ToolkitTask(
+            "test",
+            tools=[MockTool()],
+            max_subtasks=4,
+            prompt_driver=prompt_driver,
+            generate_system_template=generate_system_template,
+            generate_assistant_subtask_template=generate_assistant_subtask_template,
+        )
+        Agent().add_task(task)
+
+        task.run()
+
+        assert len(prompt_stacks) == len(task.subtasks)
+        assert len(system_template_calls) == 1
+        assert len(subtask_template_calls) == (0 if use_native_tools else len(task.subtasks) - 1)
+
+        # Every Prompt Stack of the run matches a Prompt Stack built from scratch for the same subtasks.
+        task.output = None
+        task._reset_prompt_stack_cache(enabled=False)
+
+        for i in reversed(range(len(task.subtasks))):
+            task.subtasks.pop()
+
+            assert prompt_driver.prompt_stack_to_string(task.prompt_stack) == prompt_stacks[i]
+
+    def test_run_prunes_conversation_memory(self):
+        output = 'Actions: [{"tag": "foo", "name": "MockTool", "path": "test", "input": {"values": {"test": "value"}}}]'
+        prompt_stacks = []
+        fresh_prompt_stacks = []
+        memory = ConversationMemory(
+            runs=[
+                Run(input=TextArtifact(f"input {i}" * 20), output=TextArtifact(f"output {i}" * 20)) for i in range(10)
+            ]
+        )
+
+        def mock_output(prompt_stack):
+            prompt_stacks.append(prompt_driver.prompt_stack_to_string(prompt_stack))
+
+            task._cache_prompt_stack = False
+            fresh_prompt_stacks.append(prompt_driver.prompt_stack_to_string(task.prompt_stack))
+            task._cache_prompt_stack = True
+
+            return output
+
+        prompt_driver = MockPromptDriver(
+            mock_output=mock_output,
+            tokenizer=MockTokenizer(model="test-model", max_input_tokens=6000, max_output_tokens=4096),
+        )
+        task = ToolkitTask("test", tools=[MockTool()], max_subtasks=10, prompt_driver=prompt_driver)
+        Agent(conversation_memory=memory).add_task(task)
+
+        task.run()
+
+        assert prompt_stacks == fresh_prompt_stacks
+        assert prompt_stacks[0].count("input ") > prompt_stacks[-1].count("input ")
+
+    def test_arun(self, mock_config):
+        output = 'Actions: [{"tag": "foo", "name": "Tool1", "path": "test", "input": {"values": {"test": "value"}}}]'
+        mock_config.drivers_config.prompt_driver.mock_output = output
+
+        task = ToolkitTask("test", tools=[MockTool(name="Tool1")], max_subtasks=3)
+        Agent().add_task(task)
+
+        asyncio.run(task.aexecute())
+
+        assert len(task.subtasks) == 3
+        assert task.subtasks[0].output.value[0].value == "ack value"
+        assert isinstance(task.output, ErrorArtifact)
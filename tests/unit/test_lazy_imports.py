@@ -0,0 +1,41 @@
+import ast
+import importlib
+import inspect
+
+import pytest
+
+
+class TestLazyImports:
+    @pytest.fixture(
+        params=[
+            "griptape.configs.drivers",
+            "griptape.drivers",
+            "griptape.engines",
+            "griptape.loaders",
+            "griptape.tasks",
+            "griptape.tools",
+        ]
+    )
+    def package(self, request):
+        return importlib.import_module(request.param)
+
+    def test_type_checking_imports(self, package):
+        tree = ast.parse(inspect.getsource(package))
+        type_checking_block = next(
+            node for node in tree.body if isinstance(node, ast.If) and ast.unparse(node.test) == "TYPE_CHECKING"
+        )
+        type_checking_imports = {
+            alias.name: f"{'.' * node.level}{node.module}"
+            for node in type_checking_block.body
+            if isinstance(node, ast.ImportFrom)
+            for alias in node.names
+            if alias.asname == alias.name
+        }
+
+        assert type_checking_imports == package._LAZY_IMPORTS
+
+    def test_getattr(self, package):
+        name = next(iter(package._LAZY_IMPORTS))
+
+        assert getattr(package, name).__name__ == name
+        assert package.__all__ == list(package._LAZY_IMPORTS)
@@ -1,6 +1,7 @@
 import pytest
 
 from griptape.tokenizers import AnthropicTokenizer
+from griptape.utils import LruCache
 
 
 class TestAnthropicTokenizer:
@@ -43,3 +44,18 @@ class TestAnthropicTokenizer:
     )
     def test_output_tokens_left(self, tokenizer, expected):
         assert tokenizer.count_output_tokens_left("foo bar huzzah") == expected
+
+    @pytest.mark.parametrize("tokenizer", ["claude-3-haiku"], indirect=["tokenizer"])
+    def test_count_tokens_many(self, tokenizer):
+        texts = ["foo bar huzzah", "", "The quick brown fox jumps over the lazy dog."]
+
+        assert tokenizer.count_tokens_many(texts) == [tokenizer.count_tokens(text) for text in texts]
+
+    def test_count_tokens_with_cache(self, mocker):
+        tokenizer = AnthropicTokenizer(model="claude-3-haiku", token_count_cache=LruCache())
+        count_tokens = mocker.spy(tokenizer.client, "count_tokens")
+
+        assert tokenizer.count_tokens("foo bar huzzah") == 5
+        assert tokenizer.count_tokens("foo bar huzzah") == 5
+        assert count_tokens.call_count == 1
+        assert tokenizer.token_count_cache.hits == 1
@@ -1,5 +1,6 @@
 import logging
 
+from griptape.utils import LruCache
 from tests.mocks.mock_tokenizer import MockTokenizer
 
 
@@ -12,3 +13,19 @@ class TestBaseTokenizer:
             assert tokenizer.max_output_tokens == 1000
 
             assert "gpt2 not found" in caplog.text
+
+    def test_count_tokens_many(self):
+        tokenizer = MockTokenizer(model="foo")
+
+        assert tokenizer.count_tokens_many(["foo", "ba", ""]) == [3, 2, 0]
+
+    def test_count_tokens_many_with_cache(self, mocker):
+        count_tokens = mocker.patch.object(
+            MockTokenizer, "count_tokens", autospec=True, side_effect=lambda _, t: len(t)
+        )
+        tokenizer = MockTokenizer(model="foo", token_count_cache=LruCache())
+
+        assert tokenizer.count_tokens_many(["foo", "ba", "foo"]) == [3, 2, 3]
+        assert tokenizer.count_tokens_many(["ba", "quux"]) == [2, 4]
+        assert [call.args[1] for call in count_tokens.call_args_list] == ["foo", "ba", "quux"]
+        assert len(tokenizer.token_count_cache) == 3
@@ -2,6 +2,7 @@ import cohere
 import pytest
 
 from griptape.tokenizers import CohereTokenizer
+from griptape.utils import LruCache
 
 
 class TestCohereTokenizer:
@@ -23,3 +24,10 @@ class TestCohereTokenizer:
 
     def test_output_tokens_left(self, tokenizer):
         assert tokenizer.count_output_tokens_left("foo bar") == 4094
+
+    def test_count_tokens_with_cache(self):
+        tokenizer = CohereTokenizer(model="command", client=cohere.Client("foobar"), token_count_cache=LruCache())
+
+        assert tokenizer.count_tokens("foo bar") == 2
+        assert tokenizer.count_tokens("foo bar") == 2
+        assert tokenizer.client.tokenize.call_count == 1
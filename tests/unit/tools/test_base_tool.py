@@ -1,5 +1,6 @@
 import inspect
 import os
+import sys
 
 import pytest
 import yaml
@@ -7,6 +8,7 @@ from schema import Or, Schema, SchemaMissingKeyError
 
 from griptape.common import ToolAction
 from griptape.tasks import ActionsSubtask, ToolkitTask
+from griptape.tools import BaseTool
 from tests.mocks.mock_tool.tool import MockTool
 from tests.utils import defaults
 
@@ -249,6 +251,145 @@ class TestBaseTool:
 
         assert tool_schema == self.TARGET_TOOL_SCHEMA
 
+    def test_schema_cache(self, mocker):
+        tool = MockTool()
+        spy = mocker.spy(MockTool, "_build_schema")
+
+        assert tool.schema() is tool.schema()
+        assert spy.call_count == 1
+
+        tool.name = "OtherTool"
+
+        assert tool.schema()["$id"] == "OtherTool ToolAction Schema"
+        assert spy.call_count == 2
+
+        tool.allowlist = ["test"]
+
+        assert "anyOf" not in tool.schema()
+        assert spy.call_count == 3
+
+    def test_activity_schemas_cache(self):
+        tool = MockTool()
+        activity_schemas = tool.activity_schemas()
+
+        assert [s.schema for s in tool.activity_schemas()] == [s.schema for s in activity_schemas]
+        assert all(a is b for a, b in zip(tool.activity_schemas(), activity_schemas))
+
+        tool.disable_activities()
+
+        assert tool.activity_schemas() == []
+
+    def test_schema_cache_key(self):
+        tool = MockTool()
+        key = tool.schema_cache_key()
+
+        assert tool.schema_cache_key() == key
+
+        tool.name = "OtherTool"
+
+        assert tool.schema_cache_key() != key
+
+    @pytest.fixture()
+    def requirements_file(self, tmp_path, mocker):
+        mocker.patch.object(BaseTool, "_installed_requirements", set())
+        mocker.patch.object(
+            MockTool,
+            "requirements_path",
+            new_callable=mocker.PropertyMock,
+            return_value=str(tmp_path / "requirements.txt"),
+        )
+
+        return tmp_path / "requirements.txt"
+
+    @pytest.fixture()
+    def mock_subprocess_run(self, mocker):
+        return mocker.patch("subprocess.run", return_value=mocker.Mock(returncode=0))
+
+    def test_install_dependencies_satisfied(self, requirements_file, mock_subprocess_run, tmp_path):
+        requirements_file.write_text("pyyaml\nschema>=0.1 # comment\nfoo; python_version < '3'\n")
+        tool = MockTool(install_dependencies_on_init=False, dependencies_stamp_directory=str(tmp_path / "stamps"))
+
+        tool.install_dependencies()
+
+        assert tool.are_dependencies_installed()
+        mock_subprocess_run.assert_not_called()
+
+    def test_install_dependencies_missing(self, requirements_file, mock_subprocess_run, tmp_path):
+        requirements_file.write_text("griptape-missing-package==1.0\n")
+        tool = MockTool(install_dependencies_on_init=False, dependencies_stamp_directory=str(tmp_path / "stamps"))
+
+        assert not tool.are_dependencies_installed()
+
+        tool.install_dependencies()
+        tool.install_dependencies()
+
+        mock_subprocess_run.assert_called_once()
+        assert mock_subprocess_run.call_args.args[0] == [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "-r",
+            str(requirements_file),
+            "-U",
+        ]
+        assert tool.are_dependencies_installed()
+
+    def test_install_dependencies_failed(self, requirements_file, mock_subprocess_run, tmp_path):
+        requirements_file.write_text("griptape-missing-package==1.0\n")
+        mock_subprocess_run.return_value.returncode = 1
+        tool = MockTool(install_dependencies_on_init=False, dependencies_stamp_directory=str(tmp_path / "stamps"))
+
+        tool.install_dependencies()
+        tool.install_dependencies()
+
+        assert mock_subprocess_run.call_count == 2
+        assert not tool.are_dependencies_installed()
+
+    def test_install_dependencies_stamp(self, requirements_file, mock_subprocess_run, tmp_path):
+        requirements_file.write_text("git+https://example.com/foo.git#egg=foo\n")
+        stamp_directory = str(tmp_path / "stamps")
+
+        MockTool(dependencies_stamp_directory=stamp_directory)
+        BaseTool._installed_requirements.clear()
+        MockTool(dependencies_stamp_directory=stamp_directory)
+
+        mock_subprocess_run.assert_called_once()
+        assert len(os.listdir(stamp_directory)) == 1
+
+        requirements_file.write_text("git+https://example.com/bar.git#egg=bar\n")
+        BaseTool._installed_requirements.clear()
+        MockTool(dependencies_stamp_directory=stamp_directory)
+
+        assert mock_subprocess_run.call_count == 2
+
+    def test_install_tools_dependencies(self, requirements_file, mock_subprocess_run, tmp_path, mocker):
+        other_requirements_file = tmp_path / "other_requirements.txt"
+        requirements_file.write_text("griptape-missing-package==1.0\n")
+        other_requirements_file.write_text("griptape-other-missing-package\n")
+        mocker.patch.object(
+            MockTool,
+            "requirements_path",
+            new=property(lambda self: str(other_requirements_file if self.name == "Other" else requirements_file)),
+        )
+        stamp_directory = str(tmp_path / "stamps")
+        tools = [
+            MockTool(install_dependencies_on_init=False, dependencies_stamp_directory=stamp_directory),
+            MockTool(name="Other", install_dependencies_on_init=False, dependencies_stamp_directory=stamp_directory),
+        ]
+
+        BaseTool.install_tools_dependencies(tools)
+
+        mock_subprocess_run.assert_called_once()
+        assert mock_subprocess_run.call_args.args[0][4:] == [
+            "-r",
+            str(requirements_file),
+            "-r",
+            str(other_requirements_file),
+            "-U",
+        ]
+        assert all(tool.are_dependencies_installed() for tool in tools)
+
     def test_to_native_tool_name(self, tool, mocker):
         tool = MockTool()
 
@@ -1,3 +1,4 @@
+import threading
 from concurrent import futures
 
 from griptape import utils
@@ -13,6 +14,40 @@ class TestFutures:
             assert result["foo"] == "foo-bar"
             assert result["baz"] == "baz-bar"
 
+    def test_execute_futures_dict_as_completed(self):
+        event = threading.Event()
+
+        with futures.ThreadPoolExecutor() as executor:
+            results = utils.execute_futures_dict_as_completed(
+                {"foo": executor.submit(self.wait_foobar, event, "foo"), "baz": executor.submit(self.foobar, "baz")}
+            )
+
+            assert next(results) == ("baz", "baz-bar")
+
+            event.set()
+
+            assert next(results) == ("foo", "foo-bar")
+
+    def test_execute_futures_dict_as_completed_cancels_pending_futures(self):
+        event = threading.Event()
+
+        with futures.ThreadPoolExecutor(max_workers=1) as executor:
+            fs_dict = {
+                "foo": executor.submit(self.foobar, "foo"),
+                "bar": executor.submit(self.wait_foobar, event, "bar"),
+                "baz": executor.submit(self.foobar, "baz"),
+            }
+            results = utils.execute_futures_dict_as_completed(fs_dict)
+
+            try:
+                assert next(results) == ("foo", "foo-bar")
+
+                results.close()
+
+                assert fs_dict["baz"].cancelled()
+            finally:
+                event.set()
+
     def test_execute_futures_list(self):
         with futures.ThreadPoolExecutor() as executor:
             result = utils.execute_futures_list(
@@ -37,3 +72,8 @@ class TestFutures:
 
     def foobar(self, foo):
         return f"{foo}-bar"
+
+    def wait_foobar(self, event, foo):
+        event.wait()
+
+        return self.foobar(foo)
@@ -0,0 +1,59 @@
+import pytest
+from jinja2 import Environment, FileSystemBytecodeCache
+
+from griptape.utils import J2
+
+
+class TestJ2:
+    @pytest.fixture(autouse=True)
+    def _reset_bytecode_cache(self):
+        yield
+
+        J2.set_bytecode_cache(None)
+
+    def test_shares_environment(self, tmp_path):
+        assert J2().environment is J2("rulesets/rulesets.j2").environment
+        assert J2(templates_dir=str(tmp_path)).environment is J2(templates_dir=str(tmp_path)).environment
+        assert J2(templates_dir=str(tmp_path)).environment is not J2().environment
+
+    def test_render(self):
+        assert "foo" in J2("engines/rag/modules/response/prompt/system.j2").render(text_chunks=["foo"])
+
+        with pytest.raises(ValueError):
+            J2().render()
+
+    def test_render_from_string(self):
+        assert J2().render_from_string("Hello {{ name }}!\n", name="foo") == "Hello foo!"
+
+    @pytest.mark.parametrize("value", ["", "\n", "foo", "foo\n", "foo\n\n", "  foo \n bar\n", "100% {done}", "a\r\nb"])
+    def test_render_from_string_without_syntax(self, value):
+        expected = Environment(trim_blocks=True, lstrip_blocks=True).from_string(value).render()
+
+        assert J2().render_from_string(value) == expected
+
+    def test_render_from_string_compiles_once(self, mocker):
+        from_string = mocker.spy(Environment, "from_string")
+        value = "{{ foo }} is cached in test_render_from_string_compiles_once"
+
+        assert J2().render_from_string(value, foo="bar") == "bar is cached in test_render_from_string_compiles_once"
+        assert J2().render_from_string(value, foo="baz") == "baz is cached in test_render_from_string_compiles_once"
+        assert from_string.call_count == 1
+
+    def test_render_from_string_skips_text_without_syntax(self, mocker):
+        from_string = mocker.spy(Environment, "from_string")
+
+        assert J2().render_from_string("foo bar\n") == "foo bar"
+        assert from_string.call_count == 0
+
+    def test_set_bytecode_cache(self, tmp_path):
+        (tmp_path / "templates").mkdir()
+        (tmp_path / "templates" / "foo.j2").write_text("{{ foo }}")
+        bytecode_cache = FileSystemBytecodeCache(str(tmp_path / "cache"))
+        environment = J2(templates_dir=str(tmp_path / "templates")).environment
+
+        (tmp_path / "cache").mkdir()
+        J2.set_bytecode_cache(bytecode_cache)
+
+        assert environment.bytecode_cache is bytecode_cache
+        assert J2("foo.j2", templates_dir=str(tmp_path / "templates")).render(foo="bar") == "bar"
+        assert list((tmp_path / "cache").iterdir())
@@ -0,0 +1,49 @@
+from griptape.utils import LruCache
+
+
+class TestLruCache:
+    def test_get_and_put(self):
+        cache = LruCache(max_size=2)
+
+        cache.put("foo", 1)
+
+        assert cache.get("foo") == 1
+        assert cache.get("bar") is None
+        assert cache.get("bar", 2) == 2
+        assert cache.hits == 1
+        assert cache.misses == 2
+
+    def test_evicts_least_recently_used(self):
+        cache = LruCache(max_size=2)
+
+        cache.put("foo", 1)
+        cache.put("bar", 2)
+        cache.get("foo")
+        cache.put("baz", 3)
+
+        assert "foo" in cache
+        assert "bar" not in cache
+        assert "baz" in cache
+        assert len(cache) == 2
+
+    def test_zero_max_size(self):
+        cache = LruCache(max_size=0)
+
+        cache.put("foo", 1)
+
+        assert len(cache) == 0
+
+    def test_pop_and_clear(self):
+        cache = LruCache()
+
+        cache.put("foo", 1)
+        cache.put("bar", 2)
+        cache.get("foo")
+
+        assert cache.pop("foo") == 1
+        assert "foo" not in cache
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.hits == 0
@@ -0,0 +1,241 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from griptape.utils import RateLimiter, RateLimiters
+
+
+class MockRateLimitError(Exception):
+    def __init__(self, headers: dict) -> None:
+        super().__init__("rate limited")
+        self.status_code = 429
+        self.response = Mock(status_code=429, headers=headers)
+
+
+class TestRateLimiter:
+    @pytest.fixture(autouse=True)
+    def _clear_rate_limiters(self):
+        yield
+
+        RateLimiters.clear_rate_limiters()
+
+    def test_limit(self):
+        rate_limiter = RateLimiter(requests_per_minute=10, tokens_per_minute=100)
+
+        with rate_limiter.limit(token_count=20) as request:
+            assert rate_limiter.metrics.in_flight_count == 1
+            request.token_count = 15
+
+        assert rate_limiter.metrics.in_flight_count == 0
+        assert rate_limiter.metrics.request_count == 1
+        assert rate_limiter.metrics.token_count == 15
+
+    def test_validation(self):
+        with pytest.raises(ValueError, match="requests_per_minute must be greater than 0."):
+            RateLimiter(requests_per_minute=0)
+        with pytest.raises(ValueError, match="max_concurrency must be greater than 0."):
+            RateLimiter(max_concurrency=0)
+
+    def test_requests_per_minute(self):
+        rate_limiter = RateLimiter(requests_per_minute=600)
+
+        for _ in range(600):
+            rate_limiter.release(rate_limiter.acquire())
+
+        started_at = time.monotonic()
+        rate_limiter.release(rate_limiter.acquire())
+
+        # A request is added to the bucket every 0.1 seconds.
+        assert 0.05 < time.monotonic() - started_at < 1
+        assert rate_limiter.metrics.max_wait_time > 0.05
+
+    def test_tokens_per_minute(self):
+        rate_limiter = RateLimiter(tokens_per_minute=6000)
+        rate_limiter.release(rate_limiter.acquire(token_count=6000))
+
+        started_at = time.monotonic()
+        rate_limiter.release(rate_limiter.acquire(token_count=10))
+
+        assert 0.05 < time.monotonic() - started_at < 1
+
+    def test_tokens_per_minute_corrects_estimate(self):
+        rate_limiter = RateLimiter(tokens_per_minute=6000)
+
+        with rate_limiter.limit(token_count=6000) as request:
+            request.token_count = 10
+
+        started_at = time.monotonic()
+        rate_limiter.release(rate_limiter.acquire(token_count=5000))
+
+        assert time.monotonic() - started_at < 0.05
+        assert rate_limiter.metrics.token_count == 5010
+
+    def test_max_concurrency(self):
+        rate_limiter = RateLimiter(max_concurrency=2)
+        request = rate_limiter.acquire()
+        rate_limiter.acquire()
+
+        threading.Timer(0.1, lambda: rate_limiter.release(request)).start()
+        started_at = time.monotonic()
+        rate_limiter.acquire()
+
+        assert time.monotonic() - started_at > 0.05
+        assert rate_limiter.metrics.in_flight_count == 2
+
+    def test_concurrency_limit_aimd(self):
+        rate_limiter = RateLimiter(min_concurrency=1)
+        requests = [rate_limiter.acquire() for _ in range(7)]
+
+        assert rate_limiter.metrics.concurrency_limit is None
+
+        rate_limiter.release(requests[0], rate_limited=True)
+
+        assert rate_limiter.metrics.concurrency_limit == 3.5
+        assert rate_limiter.metrics.rate_limited_count == 1
+
+        rate_limiter.release(requests[1], rate_limited=True)
+
+        assert rate_limiter.metrics.concurrency_limit == 1.75
+
+        for request in requests[2:]:
+            rate_limiter.release(request)
+
+        assert 1.75 < rate_limiter.metrics.concurrency_limit < 5
+
+    def test_concurrency_limit_aimd_bounds(self):
+        rate_limiter = RateLimiter(max_concurrency=2, min_concurrency=1)
+
+        for _ in range(5):
+            rate_limiter.release(rate_limiter.acquire(), rate_limited=True)
+
+        assert rate_limiter.metrics.concurrency_limit == 1
+
+        for _ in range(10):
+            rate_limiter.release(rate_limiter.acquire())
+
+        assert rate_limiter.metrics.concurrency_limit == 2
+
+    def test_retry_after_pauses_requests(self):
+        rate_limiter = RateLimiter()
+
+        with pytest.raises(MockRateLimitError), rate_limiter.limit():
+            raise MockRateLimitError({"retry-after": "0.1"})
+
+        started_at = time.monotonic()
+        rate_limiter.release(rate_limiter.acquire())
+
+        assert time.monotonic() - started_at > 0.05
+        assert rate_limiter.metrics.rate_limited_count == 1
+
+    def test_alimit(self):
+        rate_limiter = RateLimiter(requests_per_minute=10)
+
+        async def run():
+            async with rate_limiter.alimit() as request:
+                request.token_count = 5
+
+        asyncio.run(run())
+
+        assert rate_limiter.metrics.request_count == 1
+        assert rate_limiter.metrics.token_count == 5
+        assert rate_limiter.metrics.in_flight_count == 0
+
+    def test_alimit_waits_for_release(self):
+        rate_limiter = RateLimiter(max_concurrency=1)
+        request = rate_limiter.acquire()
+
+        async def run():
+            threading.Timer(0.05, rate_limiter.release, args=(request,)).start()
+
+            async with rate_limiter.alimit():
+                assert rate_limiter.metrics.in_flight_count == 1
+
+        asyncio.run(run())
+
+        assert rate_limiter.metrics.request_count == 2
+        assert rate_limiter.metrics.in_flight_count == 0
+        assert rate_limiter._async_waiters == []
+
+    def test_alimit_cancelled_while_waiting(self):
+        rate_limiter = RateLimiter(max_concurrency=1)
+        request = rate_limiter.acquire()
+
+        async def run():
+            async with rate_limiter.alimit():
+                pass
+
+        async def cancel():
+            task = asyncio.create_task(run())
+            await asyncio.sleep(0.05)
+            task.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel())
+        rate_limiter.release(request)
+
+        assert rate_limiter.metrics.in_flight_count == 0
+        assert rate_limiter._async_waiters == []
+
+    def test_alimit_cancelled_in_block(self):
+        rate_limiter = RateLimiter(max_concurrency=1)
+
+        async def run():
+            async with rate_limiter.alimit():
+                await asyncio.sleep(5)
+
+        async def cancel():
+            task = asyncio.create_task(run())
+            await asyncio.sleep(0.05)
+            task.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel())
+
+        assert rate_limiter.metrics.in_flight_count == 0
+
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (MockRateLimitError({}), True),
+            (type("RateLimitError", (Exception,), {})(), True),
+            (type("ClientError", (Exception,), {"response": {"Error": {"Code": "ThrottlingException"}}})(), True),
+            (Exception(), False),
+        ],
+    )
+    def test_is_rate_limit_error(self, error, expected):
+        assert RateLimiter.is_rate_limit_error(error) is expected
+
+    @pytest.mark.parametrize(
+        ("headers", "expected"),
+        [
+            ({"retry-after": "2"}, 2.0),
+            ({"retry-after-ms": "500", "retry-after": "2"}, 0.5),
+            ({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0.0),
+            ({"retry-after": "soon"}, None),
+            ({}, None),
+        ],
+    )
+    def test_get_retry_after(self, headers, expected):
+        assert RateLimiter.get_retry_after(MockRateLimitError(headers)) == expected
+
+    def test_rate_limiters(self):
+        rate_limiter = RateLimiter()
+        model_rate_limiter = RateLimiter()
+
+        RateLimiters.set_rate_limiter("MockPromptDriver", rate_limiter)
+        RateLimiters.set_rate_limiter("MockPromptDriver", model_rate_limiter, model="mock-model")
+
+        assert RateLimiters.get_rate_limiter("MockPromptDriver", model="mock-model") is model_rate_limiter
+        assert RateLimiters.get_rate_limiter("MockPromptDriver", model="other-model") is rate_limiter
+        assert RateLimiters.get_rate_limiter("OtherDriver") is None
+
+        RateLimiters.remove_rate_limiter("MockPromptDriver", model="mock-model")
+
+        assert RateLimiters.get_rate_limiter("MockPromptDriver", model="mock-model") is rate_limiter
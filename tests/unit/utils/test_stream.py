@@ -1,9 +1,11 @@
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 from griptape.structures import Agent, Pipeline
 from griptape.utils import Stream
+from tests.mocks.mock_prompt_driver import MockPromptDriver
 
 
 class TestStream:
@@ -33,3 +35,13 @@ class TestStream:
 
         with pytest.raises(ValueError):
             Stream(pipeline)
+
+    def test_run_concurrently(self):
+        agents = [Agent(prompt_driver=MockPromptDriver(mock_output=f"output {i}"), stream=True) for i in range(8)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            outputs = list(
+                executor.map(lambda agent: "".join(artifact.value for artifact in Stream(agent).run()), agents)
+            )
+
+        assert outputs == [f"output {i}\n" for i in range(8)]
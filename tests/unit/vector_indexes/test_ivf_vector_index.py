@@ -0,0 +1,108 @@
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+from griptape.vector_indexes import IvfVectorIndex
+
+
+class TestIvfVectorIndex:
+    @pytest.fixture()
+    def vectors(self):
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(8, 16))
+
+        return (centers[rng.integers(0, 8, 500)] + 0.1 * rng.normal(size=(500, 16))).astype(np.float32)
+
+    @pytest.fixture()
+    def index(self, vectors):
+        index = IvfVectorIndex(list_count=8, probe_count=2, train_size=400)
+
+        for i, vector in enumerate(vectors):
+            index.upsert(f"foo-{i}", vector, namespace="even" if i % 2 == 0 else "odd")
+
+        return index
+
+    def test_query_before_training(self):
+        index = IvfVectorIndex(list_count=8)
+        index.upsert("foo", [1.0, 0.0])
+        index.upsert("bar", [0.0, 1.0])
+        index.upsert("baz", [1.0, 1.0])
+
+        assert not index.is_trained
+        assert [key for key, _ in index.query([1.0, 0.1], count=2)] == ["foo", "baz"]
+        assert index.query([1.0, 0.0], count=1)[0][1] == pytest.approx(1.0)
+        assert index.query([1.0, 0.0], count=0) == []
+
+    def test_train(self, index):
+        assert index.is_trained
+        assert len(index) == 500
+        assert "foo-0" in index
+        assert "bar" not in index
+
+    def test_query_recall(self, index, vectors):
+        normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        recall = 0
+
+        for i in range(0, 50):
+            exact = np.argsort(-(normalized @ normalized[i]))[:10]
+            result = index.query(vectors[i], count=10)
+
+            recall += len({key for key, _ in result} & {f"foo-{j}" for j in exact}) / 10
+
+        assert recall / 50 >= 0.9
+
+    def test_query_namespace(self, index, vectors):
+        assert all(int(key.split("-")[1]) % 2 == 0 for key, _ in index.query(vectors[0], count=10, namespace="even"))
+        assert index.query(vectors[0], count=10, namespace="missing") == []
+
+    def test_upsert_existing_key(self, index):
+        index.upsert("foo-0", [0.0] * 15 + [1.0])
+
+        assert len(index) == 500
+        assert index.query([0.0] * 15 + [1.0], count=1, namespace="odd")[0][0] != "foo-0"
+        assert index.query([0.0] * 15 + [1.0], count=1)[0] == ("foo-0", pytest.approx(1.0))
+
+    def test_upsert_mismatched_dimensions(self, index):
+        with pytest.raises(ValueError):
+            index.upsert("bar", [1.0, 0.0])
+
+    def test_save_and_load(self, index, vectors):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index.persist_file = os.path.join(temp_dir, "index.npz")
+            index.save()
+
+            new_index = IvfVectorIndex(list_count=8, probe_count=2, persist_file=index.persist_file)
+
+            assert new_index.is_trained
+            assert len(new_index) == len(index)
+            assert new_index.query(vectors[1], count=5, namespace="odd") == index.query(
+                vectors[1], count=5, namespace="odd"
+            )
+
+            new_index.upsert("bar", vectors[1])
+
+            assert new_index.query(vectors[1], count=2)[1][0] in ("bar", "foo-1")
+
+    def test_save_without_persist_file(self, index):
+        with pytest.raises(ValueError):
+            index.save()
+
+    def test_keys(self):
+        index = IvfVectorIndex(list_count=8)
+        index.upsert("foo", [1.0, 0.0])
+        index.upsert("bar", [0.0, 1.0])
+
+        assert index.keys() == {"foo", "bar"}
+
+    def test_delete(self, index, vectors):
+        index.delete("foo-0")
+        index.delete("missing")
+
+        assert len(index) == 499
+        assert "foo-0" not in index
+        assert all(key != "foo-0" for key, _ in index.query(vectors[0], count=10))
+
+    def test_eq(self, index):
+        assert index == index